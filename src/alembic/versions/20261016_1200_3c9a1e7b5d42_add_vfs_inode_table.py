@@ -0,0 +1,33 @@
+"""Add VFSInode table
+
+Revision ID: 3c9a1e7b5d42
+Revises: b1345f835923
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3c9a1e7b5d42"
+down_revision: Union[str, None] = "b1345f835923"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "VFSInode",
+        sa.Column("path", sa.String(), nullable=False),
+        sa.Column("inode", sa.BigInteger(), nullable=False),
+        sa.PrimaryKeyConstraint("path"),
+        sa.UniqueConstraint("inode"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("VFSInode")
@@ -0,0 +1,50 @@
+"""Add QueuedEvent table
+
+Revision ID: 7f2d4c8e9a61
+Revises: 3c9a1e7b5d42
+Create Date: 2026-10-16 18:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "7f2d4c8e9a61"
+down_revision: Union[str, None] = "3c9a1e7b5d42"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "QueuedEvent",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("item_id", sa.Integer(), nullable=False),
+        sa.Column("emitted_by", sa.String(), nullable=False),
+        sa.Column("item_state", sa.String(), nullable=True),
+        sa.Column("priority", sa.Integer(), nullable=False),
+        sa.Column("run_at", sa.DateTime(), nullable=False),
+        sa.Column("overrides", sa.JSON(), nullable=True),
+        sa.Column("attempts", sa.Integer(), nullable=False),
+        sa.Column("claimed_by", sa.String(), nullable=True),
+        sa.Column("claimed_at", sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(["item_id"], ["MediaItem.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_queuedevent_item_id", "QueuedEvent", ["item_id"], unique=False)
+    op.create_index(
+        "ix_queuedevent_dequeue",
+        "QueuedEvent",
+        ["claimed_by", "priority", "run_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_queuedevent_dequeue", table_name="QueuedEvent")
+    op.drop_index("ix_queuedevent_item_id", table_name="QueuedEvent")
+    op.drop_table("QueuedEvent")
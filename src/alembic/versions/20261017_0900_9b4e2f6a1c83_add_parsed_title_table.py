@@ -0,0 +1,34 @@
+"""Add ParsedTitle table
+
+Revision ID: 9b4e2f6a1c83
+Revises: 7f2d4c8e9a61
+Create Date: 2026-10-17 09:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "9b4e2f6a1c83"
+down_revision: Union[str, None] = "7f2d4c8e9a61"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "ParsedTitle",
+        sa.Column("title_hash", sa.String(length=40), nullable=False),
+        sa.Column("parser_version", sa.String(), nullable=False),
+        sa.Column("data", sa.JSON(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("title_hash"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("ParsedTitle")
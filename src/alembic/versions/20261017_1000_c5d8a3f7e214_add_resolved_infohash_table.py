@@ -0,0 +1,40 @@
+"""Add ResolvedInfohash table
+
+Revision ID: c5d8a3f7e214
+Revises: 9b4e2f6a1c83
+Create Date: 2026-10-17 10:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c5d8a3f7e214"
+down_revision: Union[str, None] = "9b4e2f6a1c83"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "ResolvedInfohash",
+        sa.Column("url_hash", sa.String(length=40), nullable=False),
+        sa.Column("infohash", sa.String(length=40), nullable=True),
+        sa.Column("resolved_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("url_hash"),
+    )
+    op.create_index(
+        "ix_resolvedinfohash_resolved_at",
+        "ResolvedInfohash",
+        ["resolved_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_resolvedinfohash_resolved_at", table_name="ResolvedInfohash")
+    op.drop_table("ResolvedInfohash")
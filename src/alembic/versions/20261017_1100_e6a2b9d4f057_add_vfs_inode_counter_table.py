@@ -0,0 +1,38 @@
+"""Add VFSInodeCounter table
+
+Revision ID: e6a2b9d4f057
+Revises: c5d8a3f7e214
+Create Date: 2026-10-17 11:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e6a2b9d4f057"
+down_revision: Union[str, None] = "c5d8a3f7e214"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "VFSInodeCounter",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("next_inode", sa.BigInteger(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+
+    # Start above every inode assigned so far
+    op.execute(
+        'INSERT INTO "VFSInodeCounter" (id, next_inode) '
+        'SELECT 1, COALESCE(MAX(inode), 1) + 1 FROM "VFSInode"'
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("VFSInodeCounter")
@@ -1,156 +1,162 @@
-from collections.abc import Awaitable, Callable
-import contextlib
-import signal
-import sys
-import threading
-import time
-from types import FrameType
-
-from kink import di
-import uvicorn
-from dotenv import load_dotenv
-
-load_dotenv()  # import required here to support SETTINGS_FILENAME
-
-from program.utils.proxy_client import ProxyClient
-from program.utils.async_client import AsyncClient
-
-from fastapi import FastAPI, Response
-from fastapi.middleware.cors import CORSMiddleware
-from loguru import logger
-from scalar_fastapi import (
-    get_scalar_api_reference,  # pyright: ignore[reportUnknownVariableType]
-)
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
-
-from program.program import Program, riven
-from program.settings.models import get_version
-from program.settings import settings_manager
-from program.utils.cli import handle_args
-from routers import app_router
-
-
-class LoguruMiddleware(BaseHTTPMiddleware):
-    async def dispatch(
-        self,
-        request: Request,
-        call_next: Callable[[Request], Awaitable[Response]],
-    ) -> Response:
-        start_time = time.time()
-        response = None
-
-        try:
-            response = await call_next(request)
-
-            return response
-        except Exception as e:
-            logger.exception(f"Exception during request processing: {e}")
-            raise
-        finally:
-            process_time = time.time() - start_time
-
-            logger.log(
-                "API",
-                f"{request.method} {request.url.path} - {response.status_code if response else '500'} - {process_time:.2f}s",
-            )
-
-
-args = handle_args()
-
-
-@contextlib.asynccontextmanager
-async def lifespan(_: FastAPI):
-    di[AsyncClient] = AsyncClient()
-
-    proxy_url = settings_manager.settings.downloaders.proxy_url
-
-    if proxy_url:
-        di[ProxyClient] = ProxyClient(proxy_url=proxy_url)
-
-    yield
-
-    await di[AsyncClient].aclose()
-
-    if ProxyClient in di:
-        await di[ProxyClient].aclose()
-
-
-app = FastAPI(
-    title="Riven",
-    summary="A media management system.",
-    version=get_version(),
-    redoc_url=None,
-    license_info={
-        "name": "GPL-3.0",
-        "url": "https://www.gnu.org/licenses/gpl-3.0.en.html",
-    },
-    lifespan=lifespan,
-)
-
-
-@app.get("/scalar", include_in_schema=False)
-async def scalar_html():
-    return get_scalar_api_reference(
-        openapi_url=app.openapi_url,
-        title=app.title,
-    )
-
-
-di[Program] = riven
-
-app.add_middleware(LoguruMiddleware)
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
-
-app.include_router(app_router)
-
-
-class Server(uvicorn.Server):
-    def install_signal_handlers(self):
-        pass
-
-    @contextlib.contextmanager
-    def run_in_thread(self):
-        thread = threading.Thread(target=self.run, name="Riven")
-        thread.start()
-
-        try:
-            while not self.started:
-                time.sleep(1e-3)
-            yield
-        except Exception:
-            logger.exception("Error in server thread")
-            raise
-        finally:
-            self.should_exit = True
-            sys.exit(0)
-
-
-def signal_handler(signum: int, frame: FrameType | None):
-    logger.log("PROGRAM", "Exiting Gracefully.")
-    di[Program].stop()
-    sys.exit(0)
-
-
-signal.signal(signal.SIGINT, signal_handler)
-signal.signal(signal.SIGTERM, signal_handler)
-
-config = uvicorn.Config(app, host="0.0.0.0", port=args.port, log_config=None)
-server = Server(config=config)
-
-
-with server.run_in_thread():
-    try:
-        di[Program].start()
-        di[Program].run()
-    except Exception:
-        logger.exception("Error in main thread")
-    finally:
-        logger.critical("Server has been stopped")
-        sys.exit(0)
+import contextlib
+import signal
+import sys
+import threading
+import time
+from collections.abc import Awaitable, Callable
+from types import FrameType
+
+import uvicorn
+from dotenv import load_dotenv
+from fastapi import FastAPI, Response
+from fastapi.middleware.cors import CORSMiddleware
+from kink import di
+from loguru import logger
+from scalar_fastapi import (
+    get_scalar_api_reference,  # pyright: ignore[reportUnknownVariableType]
+)
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+
+
+class LoguruMiddleware(BaseHTTPMiddleware):
+    async def dispatch(
+        self,
+        request: Request,
+        call_next: Callable[[Request], Awaitable[Response]],
+    ) -> Response:
+        start_time = time.time()
+        response = None
+
+        try:
+            response = await call_next(request)
+
+            return response
+        except Exception as e:
+            logger.exception(f"Exception during request processing: {e}")
+            raise
+        finally:
+            process_time = time.time() - start_time
+
+            logger.log(
+                "API",
+                f"{request.method} {request.url.path} - {response.status_code if response else '500'} - {process_time:.2f}s",
+            )
+
+
+class Server(uvicorn.Server):
+    def install_signal_handlers(self):
+        pass
+
+    @contextlib.contextmanager
+    def run_in_thread(self):
+        thread = threading.Thread(target=self.run, name="Riven")
+        thread.start()
+
+        try:
+            while not self.started:
+                time.sleep(1e-3)
+            yield
+        except Exception:
+            logger.exception("Error in server thread")
+            raise
+        finally:
+            self.should_exit = True
+            sys.exit(0)
+
+
+def main() -> None:
+    """
+    Start the API server and the program.
+
+    Worker processes (see `ProcessPool`) import this module as their main module,
+    so everything with side effects happens here rather than at import time.
+    """
+
+    load_dotenv()  # import required here to support SETTINGS_FILENAME
+
+    # The program loads its settings on import, so it can only be imported once the
+    # environment is loaded, and worker processes must not import it at all
+    from program.program import Program, riven  # noqa: PLC0415
+    from program.settings import settings_manager  # noqa: PLC0415
+    from program.settings.models import get_version  # noqa: PLC0415
+    from program.utils.async_client import AsyncClient  # noqa: PLC0415
+    from program.utils.cli import handle_args  # noqa: PLC0415
+    from program.utils.proxy_client import ProxyClient  # noqa: PLC0415
+    from routers import app_router  # noqa: PLC0415
+
+    args = handle_args()
+
+    @contextlib.asynccontextmanager
+    async def lifespan(_: FastAPI):
+        di[AsyncClient] = AsyncClient()
+
+        proxy_url = settings_manager.settings.downloaders.proxy_url
+
+        if proxy_url:
+            di[ProxyClient] = ProxyClient(proxy_url=proxy_url)
+
+        yield
+
+        await di[AsyncClient].aclose()
+
+        if ProxyClient in di:
+            await di[ProxyClient].aclose()
+
+    app = FastAPI(
+        title="Riven",
+        summary="A media management system.",
+        version=get_version(),
+        redoc_url=None,
+        license_info={
+            "name": "GPL-3.0",
+            "url": "https://www.gnu.org/licenses/gpl-3.0.en.html",
+        },
+        lifespan=lifespan,
+    )
+
+    async def scalar_html():
+        return get_scalar_api_reference(
+            openapi_url=app.openapi_url,
+            title=app.title,
+        )
+
+    app.add_api_route("/scalar", scalar_html, include_in_schema=False)
+
+    di[Program] = riven
+
+    app.add_middleware(LoguruMiddleware)
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=["*"],
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
+
+    app.include_router(app_router)
+
+    def signal_handler(signum: int, frame: FrameType | None):
+        logger.log("PROGRAM", "Exiting Gracefully.")
+        di[Program].stop()
+        sys.exit(0)
+
+    signal.signal(signal.SIGINT, signal_handler)
+    signal.signal(signal.SIGTERM, signal_handler)
+
+    config = uvicorn.Config(app, host="0.0.0.0", port=args.port, log_config=None)
+    server = Server(config=config)
+
+    with server.run_in_thread():
+        try:
+            di[Program].start()
+            di[Program].run()
+        except Exception:
+            logger.exception("Error in main thread")
+        finally:
+            logger.critical("Server has been stopped")
+            sys.exit(0)
+
+
+if __name__ == "__main__":
+    main()
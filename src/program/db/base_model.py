@@ -18,6 +18,11 @@ def get_base_metadata() -> MetaData:
         StreamRelation,  # pyright: ignore[reportUnusedImport]
         StreamBlacklistRelation,  # pyright: ignore[reportUnusedImport]
         Stream,  # pyright: ignore[reportUnusedImport]
+        VFSInode,  # pyright: ignore[reportUnusedImport]
+        VFSInodeCounter,  # pyright: ignore[reportUnusedImport]
+        QueuedEvent,  # pyright: ignore[reportUnusedImport]
+        ParsedTitle,  # pyright: ignore[reportUnusedImport]
+        ResolvedInfohash,  # pyright: ignore[reportUnusedImport]
     )
     from program.scheduling import (
         ScheduledTask,  # pyright: ignore[reportUnusedImport]
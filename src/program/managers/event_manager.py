@@ -3,37 +3,71 @@ from enum import Enum
 import json
 import threading
 import traceback
+from collections.abc import Sequence
 from concurrent.futures import Future, ThreadPoolExecutor
-from datetime import datetime
-from queue import Empty
+from datetime import datetime, timedelta
 from threading import Lock
 from typing import TYPE_CHECKING
 
-import sqlalchemy.orm
+import sqlalchemy
 from loguru import logger
 from pydantic import BaseModel
 
 from program.db import db_functions
 from program.db.db import db_session
+from program.managers.event_queue import EventIndex, EventQueue
+from program.managers.event_store import EventStore
+from program.managers.item_hierarchy import ItemHierarchy
 from program.managers.sse_manager import sse_manager
 from program.media.item import MediaItem
-from program.types import Event, Service
 from program.media.state import States
+from program.settings import settings_manager
+from program.types import Event, Service
+from program.utils.concurrency import provider_limiter
 
 if TYPE_CHECKING:
     from program.program import Program
 
 
+# Services whose jobs are reported in event updates
+EVENT_UPDATE_TYPES = (
+    "Scraping",
+    "Downloader",
+    "Symlinker",
+    "Updater",
+    "PostProcessing",
+)
+
+
 class EventUpdate(BaseModel):
     item_id: int
     emitted_by: str
     run_at: str
 
 
+class ServiceWorkerStats(BaseModel):
+    max_workers: int
+    queued: int
+    in_flight: int
+
+
+class ProviderStats(BaseModel):
+    limit: int
+    in_flight: int
+    waiting: int
+
+
+class WorkerStats(BaseModel):
+    queued_events: int
+    services: dict[str, ServiceWorkerStats]
+    providers: dict[str, ProviderStats]
+
+
 @dataclass
 class ServiceExecutor:
     service_name: str
     executor: ThreadPoolExecutor
+    max_workers: int
 
 
 @dataclass(frozen=True)
@@ -41,6 +75,7 @@ class FutureWithEvent:
     future: Future[int | tuple[int, datetime] | None]
     event: Event | None
     cancellation_event: threading.Event
+    service_name: str = ""
 
 
 class EventType(Enum):
@@ -59,14 +94,26 @@ class EventManager:
     def __init__(self):
         self._executors = list[ServiceExecutor]()
         self._futures = list[FutureWithEvent]()
-        self._queued_events = list[Event]()
-        self._running_events = list[Event]()
+        self._queued_events = EventQueue()
+        self._running_events = EventIndex()
+        self._store = EventStore()
+        self._hierarchy = ItemHierarchy()
         self.mutex = Lock()
+        # Guards `_futures` changes together with the sequence number of the event update they publish
+        self._event_updates_lock = Lock()
+        self._event_update_sequence = 0
+
+        sse_manager.set_snapshot_provider(
+            "event_update", self._get_event_update_snapshot
+        )
 
     def _find_or_create_executor(self, service_cls: Service) -> ThreadPoolExecutor:
         """
         Finds or creates a ThreadPoolExecutor for the given service class.
 
+        The executor is sized from `settings.workers`; if the configured size changed,
+        a new executor is created and the old one is shut down once its jobs finish.
+
         Args:
             service_cls (Service): The service class for which to find or create an executor.
 
@@ -75,26 +122,51 @@ class EventManager:
         """
 
         service_name = service_cls.__class__.__name__
+        max_workers = self._get_max_workers(service_name)
 
         for service_executor in self._executors:
             if service_executor.service_name == service_name:
-                logger.debug(f"Executor for {service_name} found.")
+                if service_executor.max_workers == max_workers:
+                    return service_executor.executor
+
+                logger.debug(
+                    f"Resizing executor for {service_name} from {service_executor.max_workers} to {max_workers} workers"
+                )
+
+                self._executors.remove(service_executor)
+                service_executor.executor.shutdown(wait=False)
 
-                return service_executor.executor
+                break
 
         _executor = ThreadPoolExecutor(
             thread_name_prefix=service_name,
-            max_workers=1,
+            max_workers=max_workers,
         )
 
         self._executors.append(
-            ServiceExecutor(service_name=service_name, executor=_executor)
+            ServiceExecutor(
+                service_name=service_name,
+                executor=_executor,
+                max_workers=max_workers,
+            )
         )
 
-        logger.debug(f"Created executor for {service_name}")
+        logger.debug(f"Created executor for {service_name} with {max_workers} workers")
 
         return _executor
 
+    @staticmethod
+    def _get_max_workers(service_name: str) -> int:
+        """Get the configured number of concurrent jobs for a service."""
+
+        workers = settings_manager.settings.workers
+
+        return {
+            "IndexerService": workers.indexer,
+            "Scraping": workers.scraping,
+            "Downloader": workers.downloader,
+        }.get(service_name, workers.default)
+
     def _process_future(self, future_with_event: FutureWithEvent, service: Service):
         """
         Processes the result of a future once it is completed.
@@ -105,6 +177,9 @@ class EventManager:
         """
 
         if future_with_event.future.cancelled():
+            self._discard_future(future_with_event)
+            self._complete_persisted(future_with_event)
+
             if future_with_event.event:
                 logger.debug(
                     f"Future for {future_with_event.event.log_message} was cancelled."
@@ -116,12 +191,7 @@ class EventManager:
         try:
             result = future_with_event.future.result()
 
-            if future_with_event in self._futures:
-                self._futures.remove(future_with_event)
-
-            sse_manager.publish_event(
-                "event_update", json.dumps(self.get_event_updates())
-            )
+            self._discard_future(future_with_event)
 
             if isinstance(result, tuple):
                 item_id, timestamp = result
@@ -140,6 +210,7 @@ class EventManager:
                     logger.debug(
                         f"Future with Item ID: {item_id} was cancelled; discarding results..."
                     )
+                    self._complete_persisted(future_with_event)
 
                     return
 
@@ -154,7 +225,12 @@ class EventManager:
                         overrides=event_overrides
                     )
                 )
+
+            self._complete_persisted(future_with_event)
         except Exception as e:
+            self._discard_future(future_with_event)
+            self._complete_persisted(future_with_event)
+
             logger.error(f"Error in future for {future_with_event}: {e}")
             logger.exception(traceback.format_exc())
 
@@ -168,6 +244,44 @@ class EventManager:
 
         logger.debug(log_message)
 
+    def _discard_future(self, future_with_event: FutureWithEvent) -> None:
+        """Stop tracking a finished future, if it is still tracked."""
+
+        with self._event_updates_lock:
+            try:
+                self._futures.remove(future_with_event)
+            except ValueError:
+                return
+
+            self._publish_event_update(future_with_event.event, removed=True)
+
+    def _complete_persisted(self, future_with_event: FutureWithEvent) -> None:
+        """Delete the persisted copy of a finished job's event, if any."""
+
+        if future_with_event.event:
+            self._store.remove([future_with_event.event])
+
+    def complete_event(self, event: Event) -> None:
+        """
+        Mark a dequeued event as handled, deleting its persisted copy.
+
+        Args:
+            event (Event): The event returned by `next`, once its jobs have been submitted.
+        """
+
+        self._store.remove([event])
+
+    def restore_queue(self) -> None:
+        """Queue the events persisted by previous runs, if the durable event queue is enabled."""
+
+        events = self._store.restore()
+
+        for event in events:
+            self._queued_events.put(event)
+
+        if events:
+            logger.debug(f"Restored {len(events)} events from the persisted queue.")
+
     def add_event_to_queue(self, event: Event, log_message: bool = True):
         """
         Adds an event to the queue.
@@ -176,44 +290,85 @@ class EventManager:
             event (Event): The event to add to the queue.
         """
 
-        with self.mutex:
+        states = self._get_item_states([event]) if event.item_id else {}
+
+        if states is not None and self._should_queue(event, states):
+            self._put(event, log_message)
+
+    def _put(self, event: Event, log_message: bool = True) -> None:
+        """Put an event that passed all checks in the queue."""
+
+        # Persisted before it can be dequeued, so a worker never claims an event without its row;
+        # the queue has its own lock, so the database round-trip doesn't hold up other workers
+        self._store.add(event)
+        self._queued_events.put(event)
+
+        if log_message:
+            logger.debug(f"Added {event.log_message} to the queue.")
+
+    def _get_item_states(
+        self,
+        events: Sequence[Event],
+    ) -> dict[int, States | None] | None:
+        """
+        Get the states of the events' items and of their parents, in a single query.
+
+        Returns:
+            dict[int, States | None] | None: The state of each item found, or None if the query failed.
+        """
+
+        item_ids = set[int]()
+
+        for event in events:
             if event.item_id:
-                with db_session() as session:
-                    try:
-                        # Query just the columns we need, avoiding relationship loading entirely
-                        item = (
-                            session.query(MediaItem)
-                            .filter_by(id=event.item_id)
-                            .options(
-                                sqlalchemy.orm.load_only(
-                                    MediaItem.id, MediaItem.last_state
-                                )
-                            )
-                            .one_or_none()
-                        )
-                    except Exception as e:
-                        logger.error(f"Error getting item from database: {e}")
-                        return
+                item_ids.add(event.item_id)
+                item_ids.update(self._hierarchy.ancestor_ids(event.item_id))
 
-                    if not item and not event.content_item:
-                        logger.error(f"No item found from event: {event.log_message}")
-                        return
+        try:
+            with db_session() as session:
+                rows = session.execute(
+                    sqlalchemy.select(MediaItem.id, MediaItem.last_state).where(
+                        MediaItem.id.in_(item_ids)
+                    )
+                ).all()
+        except Exception as e:
+            logger.error(f"Error getting items from database: {e}")
+            return None
 
-                    if item:
-                        if item.is_parent_blocked():
-                            logger.debug(
-                                f"Not queuing {item.log_string}: Item is {item.last_state}"
-                            )
-                            return
+        return {item_id: last_state for item_id, last_state in rows}
 
-                        # Cache the item state in the event for efficient priority sorting
-                        if item.last_state:
-                            event.item_state = item.last_state
+    def _should_queue(
+        self,
+        event: Event,
+        states: dict[int, States | None],
+    ) -> bool:
+        """
+        Check that an event's item exists and neither it nor its parents are paused.
+
+        Caches the item's state on the event for efficient priority sorting.
+        """
 
-            self._queued_events.append(event)
+        if not event.item_id:
+            return True
 
-            if log_message:
-                logger.debug(f"Added {event.log_message} to the queue.")
+        if event.item_id not in states:
+            if not event.content_item:
+                logger.error(f"No item found from event: {event.log_message}")
+                return False
+
+            return True
+
+        for item_id in [event.item_id, *self._hierarchy.ancestor_ids(event.item_id)]:
+            if (state := states.get(item_id)) == States.Paused:
+                logger.debug(
+                    f"Not queuing {event.log_message}: Item {item_id} is {state}"
+                )
+                return False
+
+        if last_state := states[event.item_id]:
+            event.item_state = last_state
+
+        return True
 
     def remove_event_from_queue(self, event: Event):
         """
@@ -223,8 +378,8 @@ class EventManager:
             event (Event): The event to remove from the queue.
         """
 
-        with self.mutex:
-            self._queued_events.remove(event)
+        if self._queued_events.remove(event):
+            self._store.remove([event])
             logger.debug(f"Removed {event.log_message} from the queue.")
 
     def remove_event_from_running(self, event: Event):
@@ -236,8 +391,7 @@ class EventManager:
         """
 
         with self.mutex:
-            if event in self._running_events:
-                self._running_events.remove(event)
+            if self._running_events.discard(event):
                 logger.debug(f"Removed {event.log_message} from running events.")
 
     def remove_id_from_queue(self, item_id: int):
@@ -248,9 +402,12 @@ class EventManager:
             item (MediaItem): The event item to remove from the queue.
         """
 
-        for event in self._queued_events:
-            if event.item_id == item_id:
-                self.remove_event_from_queue(event)
+        events = self._queued_events.remove_item_id(item_id)
+
+        self._store.remove(events)
+
+        for event in events:
+            logger.debug(f"Removed {event.log_message} from the queue.")
 
     def add_event_to_running(self, event: Event):
         """
@@ -261,7 +418,7 @@ class EventManager:
         """
 
         with self.mutex:
-            self._running_events.append(event)
+            self._running_events.add(event)
             logger.debug(f"Added {event.log_message} to running events.")
 
     def remove_id_from_running(self, item_id: int):
@@ -272,9 +429,11 @@ class EventManager:
             item (MediaItem): The event item to remove from the running events.
         """
 
-        for event in self._running_events:
-            if event.item_id == item_id:
-                self.remove_event_from_running(event)
+        with self.mutex:
+            events = self._running_events.with_item_id(item_id)
+
+        for event in events:
+            self.remove_event_from_running(event)
 
     def remove_id_from_queues(self, item_id: int):
         """
@@ -312,6 +471,10 @@ class EventManager:
 
         cancellation_event = threading.Event()
 
+        if event:
+            # Persisted as claimed, so an interrupted job is queued again after a restart
+            self._store.add(event, claimed=True)
+
         executor = self._find_or_create_executor(service)
 
         assert program.services
@@ -331,14 +494,12 @@ class EventManager:
             future=future,
             event=event,
             cancellation_event=cancellation_event,
+            service_name=service.__class__.__name__,
         )
 
-        self._futures.append(future_with_event)
-
-        sse_manager.publish_event(
-            "event_update",
-            json.dumps(self.get_event_updates()),
-        )
+        with self._event_updates_lock:
+            self._futures.append(future_with_event)
+            self._publish_event_update(event)
 
         future.add_done_callback(
             lambda f: self._process_future(future_with_event, service),
@@ -353,41 +514,40 @@ class EventManager:
             suppress_logs (bool): If True, suppresses debug logging for this operation.
         """
 
-        with db_session() as session:
-            item_id, related_ids = db_functions.get_item_ids(session, item_id)
-            ids_to_cancel = set([item_id] + related_ids)
+        related_ids = self._hierarchy.related_ids(item_id)
+        ids_to_cancel = set([item_id] + related_ids)
 
-            future_map = dict[int, list[FutureWithEvent]]()
+        future_map = dict[int, list[FutureWithEvent]]()
 
-            for future_with_event in self._futures:
-                if future_with_event.event and future_with_event.event.item_id:
-                    future_item_id = future_with_event.event.item_id
-                    future_map.setdefault(future_item_id, []).append(future_with_event)
+        for future_with_event in self._futures:
+            if future_with_event.event and future_with_event.event.item_id:
+                future_item_id = future_with_event.event.item_id
+                future_map.setdefault(future_item_id, []).append(future_with_event)
 
-            for fid in ids_to_cancel:
-                if fid in future_map:
-                    for future_with_event in future_map[fid]:
-                        self.remove_id_from_queues(fid)
+        for fid in ids_to_cancel:
+            if fid in future_map:
+                for future_with_event in future_map[fid]:
+                    self.remove_id_from_queues(fid)
 
-                        if (
-                            not future_with_event.future.done()
-                            and not future_with_event.future.cancelled()
-                        ):
-                            try:
-                                future_with_event.cancellation_event.set()
-                                future_with_event.future.cancel()
+                    if (
+                        not future_with_event.future.done()
+                        and not future_with_event.future.cancelled()
+                    ):
+                        try:
+                            future_with_event.cancellation_event.set()
+                            future_with_event.future.cancel()
 
-                                logger.debug(f"Canceled job for Item ID {fid}")
-                            except Exception as e:
-                                if not suppress_logs:
-                                    logger.error(
-                                        f"Error cancelling future for {fid}: {str(e)}"
-                                    )
+                            logger.debug(f"Canceled job for Item ID {fid}")
+                        except Exception as e:
+                            if not suppress_logs:
+                                logger.error(
+                                    f"Error cancelling future for {fid}: {str(e)}"
+                                )
 
-            for fid in ids_to_cancel:
-                self.remove_id_from_queues(fid)
+        for fid in ids_to_cancel:
+            self.remove_id_from_queues(fid)
 
-    def next(self) -> Event:
+    def next(self, timeout: float | None = 0) -> Event:
         """
         Get the next event in the queue, prioritizing items closest to completion.
 
@@ -399,64 +559,39 @@ class EventManager:
         4. Items in Indexed state
         5. All other states
 
-        Within each priority level, events are sorted by run_at timestamp.
+        Within each priority level, events are ordered by run_at timestamp.
 
-        Performance: Uses cached item_state from Event object to avoid database queries.
+        Performance: Events are kept in heaps keyed on cached item_state and run_at,
+        so this is O(log n). Only persisted events query the database, to claim them.
+
+        Once the event's jobs have been submitted, call `complete_event` with it.
+
+        Args:
+            timeout: Seconds to wait for an event to become due. None waits indefinitely, 0 doesn't wait.
 
         Raises:
-            Empty: If the queue is empty or no events are ready to run.
+            Empty: If no event is ready to run within the timeout.
 
         Returns:
             Event: The next event in the queue.
         """
 
         while True:
-            if self._queued_events:
-                with self.mutex:
-                    now = datetime.now()
-
-                    # Filter events that are ready to run (run_at <= now)
-                    ready_events = [
-                        event for event in self._queued_events if event.run_at <= now
-                    ]
-
-                    if not ready_events:
-                        raise Empty
-
-                    # Define state priority (lower number = higher priority)
-                    state_priority = dict[States, int](
-                        {
-                            States.Completed: 0,
-                            States.PartiallyCompleted: 1,
-                            States.Symlinked: 2,
-                            States.Downloaded: 3,
-                            States.Scraped: 4,
-                            States.Indexed: 5,
-                        }
-                    )
-
-                    def get_event_priority(event: Event) -> tuple[int, datetime]:
-                        """
-                        Returns a tuple for sorting: (state_priority, run_at)
-                        Items with higher priority states come first, then sorted by run_at.
-                        Uses cached item_state to avoid database queries.
-                        """
-                        if event.item_state:
-                            priority = state_priority.get(event.item_state, 999)
-                            return (priority, event.run_at)
+            event = self._queued_events.get(timeout)
+            claimed = self._store.claim(event)
 
-                        # Default priority for items without state or content-only events
-                        return (0, event.run_at)
+            if claimed:
+                return event
 
-                    # Sort by priority (state first, then run_at)
-                    ready_events.sort(key=get_event_priority)
-
-                    # Get the highest priority event
-                    event = ready_events[0]
-                    self._queued_events.remove(event)
+            if claimed is None:
+                # Another worker may hold it; try again once the database is reachable
+                event.run_at = datetime.now() + timedelta(seconds=10)
+                self._queued_events.put(event)
+                continue
 
-                    return event
-            raise Empty
+            logger.debug(
+                f"{event.log_message} was claimed by another worker, skipping."
+            )
 
     def _id_in_queue(self, _id: int) -> bool:
         """
@@ -469,7 +604,7 @@ class EventManager:
             bool: True if the item is in the queue, False otherwise.
         """
 
-        return any(event.item_id == _id for event in self._queued_events)
+        return self._queued_events.contains_item_id(_id)
 
     def _id_in_running_events(self, _id: int) -> bool:
         """
@@ -482,14 +617,15 @@ class EventManager:
             bool: True if the item is in the running events, False otherwise.
         """
 
-        return any(event.item_id == _id for event in self._running_events)
+        with self.mutex:
+            return self._running_events.contains_item_id(_id)
 
     def add_event(self, event: Event) -> bool:
         """
         Adds an event to the queue if it is not already present in the queue or running events.
 
         - If the event has a DB-backed item_id, we keep your existing parent/child
-        dedupe logic based on item_id + related ids.
+        dedupe logic based on item_id + related ids, taken from the in-memory item hierarchy.
         - If the event is content-only (no item_id), we now dedupe using *all* known ids
         (tmdb/tvdb/imdb) against both queued and running events with a single-pass check.
 
@@ -497,24 +633,51 @@ class EventManager:
             True if queued; False if deduped away.
         """
 
-        item_id = None
-        related_ids = []
+        return self.add_events([event]) == 1
 
-        # Check if the event's item is a show and its seasons or episodes are in the queue or running
-        with db_session() as session:
-            if event.item_id:
-                item_id, related_ids = db_functions.get_item_ids(session, event.item_id)
+    def add_events(self, events: Sequence[Event]) -> int:
+        """
+        Adds events to the queue, skipping those already present in the queue or running events.
+
+        Parents and children come from the in-memory item hierarchy and the states of all items
+        are fetched in a single query, so a batch costs one database round-trip regardless of its size.
+
+        Returns:
+            int: The number of events queued.
+        """
+
+        states: dict[int, States | None] = {}
 
-        if item_id:
+        if any(event.item_id for event in events):
+            if (item_states := self._get_item_states(events)) is None:
+                return 0
+
+            states = item_states
+
+        queued = 0
+
+        for event in events:
+            if self._is_duplicate(event) or not self._should_queue(event, states):
+                continue
+
+            self._put(event)
+            queued += 1
+
+        return queued
+
+    def _is_duplicate(self, event: Event) -> bool:
+        """Check whether an event's item, or one of its seasons or episodes, is already queued or running."""
+
+        if item_id := event.item_id:
             if self._id_in_queue(item_id):
                 logger.debug(f"Item ID {item_id} is already in the queue, skipping.")
-                return False
+                return True
 
             if self._id_in_running_events(item_id):
                 logger.debug(f"Item ID {item_id} is already running, skipping.")
-                return False
+                return True
 
-            for related_id in related_ids:
+            for related_id in self._hierarchy.related_ids(item_id):
                 if self._id_in_queue(related_id) or self._id_in_running_events(
                     related_id
                 ):
@@ -522,12 +685,12 @@ class EventManager:
                         f"Child of Item ID {item_id} is already in the queue or running, skipping."
                     )
 
-                    return False
+                    return True
         else:
             # Content-only
             if (content_item := event.content_item) is None:
                 logger.debug("Event has neither item_id nor content_item; skipping.")
-                return False
+                return True
 
             # Single-pass checks: queued and running
             if self.item_exists_in_queue(
@@ -541,11 +704,9 @@ class EventManager:
                     f"Content Item with {content_item.log_string} is already queued or running, skipping."
                 )
 
-                return False
-
-        self.add_event_to_queue(event)
+                return True
 
-        return True
+        return False
 
     def add_item(
         self,
@@ -584,68 +745,152 @@ class EventManager:
             dict[str, list[int]]: A dictionary with the event types as keys and a list of item IDs as values.
         """
 
-        events = [future.event for future in self._futures if future.event]
-        event_types = [
-            "Scraping",
-            "Downloader",
-            "Symlinker",
-            "Updater",
-            "PostProcessing",
-        ]
+        events = [future.event for future in list(self._futures) if future.event]
 
-        updates = {event_type: list[int]() for event_type in event_types}
+        updates = {event_type: list[int]() for event_type in EVENT_UPDATE_TYPES}
 
         for event in events:
-            if isinstance(event.emitted_by, str):
-                key = event.emitted_by
-            else:
-                key = event.emitted_by.__class__.__name__
+            if (key := self._get_event_update_type(event)) and event.item_id:
+                updates[key].append(event.item_id)
 
-            table = updates.get(key, None)
+        return updates
 
-            if table is not None and event.item_id:
-                table.append(event.item_id)
+    @staticmethod
+    def _get_event_update_type(event: Event | None) -> str | None:
+        """Get the event update type a job's event is reported under, if any."""
 
-        return updates
+        if not event or not event.item_id:
+            return None
+
+        if isinstance(event.emitted_by, str):
+            key = event.emitted_by
+        else:
+            key = event.emitted_by.__class__.__name__
+
+        return key if key in EVENT_UPDATE_TYPES else None
+
+    def _get_event_update_snapshot(self) -> tuple[str, int]:
+        """Get the event updates snapshot sent to new subscribers, and the sequence number of the last delta it includes."""
+
+        with self._event_updates_lock:
+            return (
+                json.dumps(
+                    {
+                        "type": "snapshot",
+                        "seq": self._event_update_sequence,
+                        "events": self.get_event_updates(),
+                    }
+                ),
+                self._event_update_sequence,
+            )
 
-    def item_exists_in_queue(self, item: MediaItem, queue: list[Event]) -> bool:
+    def _publish_event_update(self, event: Event | None, removed: bool = False) -> None:
         """
-        Check in a single pass whether any of the item's identifying ids (id, tmdb_id,
-        tvdb_id, imdb_id) is already represented in the given event queue.
+        Publish the change a submitted or finished job makes to the event updates.
 
-        This avoids building temporary sets (lower allocs) and returns early on first match.
-        Worst-case O(n), typically faster in practice.
+        Subscribers get a snapshot when they subscribe, then only these deltas:
+        `{"type": "delta", "seq": n, "added": {service: [item_id]}, "removed": {service: [item_id]}}`.
+        An item is only added by its first job for a service, and removed once its last one finishes.
+        Does nothing when nobody is subscribed. Callers must hold `_event_updates_lock`.
+        """
 
-        Args:
-            item: The media item to check. Only non-None ids are considered.
-            queue: The event list to search.
+        if not sse_manager.has_subscribers("event_update"):
+            return
 
-        Returns:
-            True if a match is found; otherwise False.
+        if not (key := self._get_event_update_type(event)):
+            return
+
+        assert event and event.item_id
+
+        running = sum(
+            1
+            for future in self._futures
+            if future.event
+            and future.event.item_id == event.item_id
+            and self._get_event_update_type(future.event) == key
+        )
+
+        # Other jobs for the item and service are still running
+        if running > (0 if removed else 1):
+            return
+
+        change = {key: [event.item_id]}
+
+        self._event_update_sequence += 1
+
+        sse_manager.publish_event(
+            "event_update",
+            json.dumps(
+                {
+                    "type": "delta",
+                    "seq": self._event_update_sequence,
+                    "added": {} if removed else change,
+                    "removed": change if removed else {},
+                }
+            ),
+            sequence=self._event_update_sequence,
+        )
+
+    def get_worker_stats(self) -> WorkerStats:
         """
+        Get live concurrency metrics for the worker pools.
 
-        item_id = item.id
-        tmdb_id = item.tmdb_id
-        tvdb_id = item.tvdb_id
-        imdb_id = item.imdb_id
+        Returns:
+            WorkerStats: The number of queued events, the queued and in-flight jobs of each service
+            and the in-flight and waiting requests of each provider.
+        """
 
-        if not (item_id or tmdb_id or tvdb_id or imdb_id):
-            return False
+        services = {
+            service_executor.service_name: ServiceWorkerStats(
+                max_workers=service_executor.max_workers,
+                queued=0,
+                in_flight=0,
+            )
+            for service_executor in list(self._executors)
+        }
 
-        for ev in queue:
-            if item_id and ev.item_id == item_id:
-                return True
+        for future_with_event in list(self._futures):
+            future = future_with_event.future
+            stats = services.get(future_with_event.service_name)
 
-            if (content_item := ev.content_item) is None:
+            if not stats or future.done():
                 continue
 
-            if tmdb_id and content_item.tmdb_id == tmdb_id:
-                return True
+            if future.running():
+                stats.in_flight += 1
+            else:
+                stats.queued += 1
+
+        return WorkerStats(
+            queued_events=len(self._queued_events),
+            services=services,
+            providers={
+                provider: ProviderStats(**stats)
+                for provider, stats in provider_limiter.stats().items()
+            },
+        )
 
-            if tvdb_id and content_item.tvdb_id == tvdb_id:
-                return True
+    def item_exists_in_queue(
+        self,
+        item: MediaItem,
+        queue: EventQueue | EventIndex,
+    ) -> bool:
+        """
+        Check whether any of the item's identifying ids (id, tmdb_id, tvdb_id, imdb_id)
+        is already represented in the given events.
 
-            if imdb_id and content_item.imdb_id == imdb_id:
-                return True
+        Uses the queue's indexes, so this is O(1) regardless of queue size.
 
-        return False
+        Args:
+            item: The media item to check. Only non-None ids are considered.
+            queue: The events to search.
+
+        Returns:
+            True if a match is found; otherwise False.
+        """
+
+        if isinstance(queue, EventIndex):
+            with self.mutex:
+                return queue.contains_item(item)
+
+        return queue.contains_item(item)
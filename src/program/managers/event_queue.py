@@ -0,0 +1,294 @@
+import heapq
+import itertools
+import threading
+import time
+from collections.abc import Iterator
+from datetime import datetime
+from queue import Empty
+from typing import TYPE_CHECKING, Any
+
+from program.media.state import States
+from program.types import Event
+
+if TYPE_CHECKING:
+    from program.media.item import MediaItem
+
+
+# Lower number = higher priority; items closest to completion are processed first
+STATE_PRIORITY = dict[States, int](
+    {
+        States.Completed: 0,
+        States.PartiallyCompleted: 1,
+        States.Symlinked: 2,
+        States.Downloaded: 3,
+        States.Scraped: 4,
+        States.Indexed: 5,
+    }
+)
+
+# External ID of a content item, e.g. ("tmdb", "603")
+type ExternalId = tuple[str, str]
+
+
+def get_event_priority(event: Event) -> int:
+    """
+    Get the state priority of an event.
+
+    Uses the item state cached on the event to avoid database queries.
+    """
+
+    if event.item_state:
+        return STATE_PRIORITY.get(event.item_state, 999)
+
+    # Default priority for items without state or content-only events
+    return 0
+
+
+def get_external_ids(item: "MediaItem") -> list[ExternalId]:
+    """Get the external IDs an item can be identified by."""
+
+    return [
+        (name, value)
+        for name, value in (
+            ("tmdb", item.tmdb_id),
+            ("tvdb", item.tvdb_id),
+            ("imdb", item.imdb_id),
+        )
+        if value
+    ]
+
+
+class EventIndex:
+    """
+    Set of events, indexed by item ID and by the external IDs of their content items.
+
+    Makes dedupe checks O(1) instead of a scan over every queued or running event.
+    Events are tracked by identity. Not thread-safe; callers synchronize access.
+    """
+
+    def __init__(self) -> None:
+        self._events = dict[int, Event]()
+        self._by_item_id = dict[int, dict[int, Event]]()
+        self._by_external_id = dict[ExternalId, dict[int, Event]]()
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    def __iter__(self) -> Iterator[Event]:
+        return iter(list(self._events.values()))
+
+    def __contains__(self, event: Event) -> bool:
+        return id(event) in self._events
+
+    def add(self, event: Event) -> None:
+        key = id(event)
+
+        if key in self._events:
+            return
+
+        self._events[key] = event
+
+        for bucket in self._buckets(event, create=True):
+            bucket[key] = event
+
+    def discard(self, event: Event) -> bool:
+        """Remove an event, returning whether it was present."""
+
+        key = id(event)
+
+        if self._events.pop(key, None) is None:
+            return False
+
+        for bucket in self._buckets(event, create=False):
+            bucket.pop(key, None)
+
+        if event.item_id and not self._by_item_id.get(event.item_id, True):
+            del self._by_item_id[event.item_id]
+
+        if event.content_item:
+            for external_id in get_external_ids(event.content_item):
+                if not self._by_external_id.get(external_id, True):
+                    del self._by_external_id[external_id]
+
+        return True
+
+    def with_item_id(self, item_id: int) -> list[Event]:
+        return list(self._by_item_id.get(item_id, {}).values())
+
+    def contains_item_id(self, item_id: int) -> bool:
+        return bool(self._by_item_id.get(item_id))
+
+    def contains_item(self, item: "MediaItem") -> bool:
+        """Check whether any event targets the item, by its ID or any of its external IDs."""
+
+        if item.id and self.contains_item_id(item.id):
+            return True
+
+        return any(
+            self._by_external_id.get(external_id)
+            for external_id in get_external_ids(item)
+        )
+
+    def _buckets(self, event: Event, *, create: bool) -> list[dict[int, Event]]:
+        # Keyed by item ID or external ID; both map event identity to event
+        keys = list[tuple[dict[Any, dict[int, Event]], int | ExternalId]]()
+
+        if event.item_id:
+            keys.append((self._by_item_id, event.item_id))
+
+        if event.content_item:
+            keys.extend(
+                (self._by_external_id, external_id)
+                for external_id in get_external_ids(event.content_item)
+            )
+
+        buckets = list[dict[int, Event]]()
+
+        for index, key in keys:
+            if create:
+                buckets.append(index.setdefault(key, {}))
+            elif (bucket := index.get(key)) is not None:
+                buckets.append(bucket)
+
+        return buckets
+
+
+class EventQueue:
+    """
+    Thread-safe queue of events, dequeued by state priority then run_at.
+
+    Events wait in a heap keyed on run_at until they are due, then move to a heap
+    keyed on (state priority, run_at), so enqueuing and dequeuing are O(log n).
+    Consumers block until the next event is due instead of polling.
+
+    Removal is lazy: removed events are skipped when they reach the top of a heap,
+    and the heaps are compacted once mostly stale.
+    """
+
+    def __init__(self) -> None:
+        self._condition = threading.Condition()
+        self._sequence = itertools.count()
+        self._index = EventIndex()
+
+        # Sequence number of each queued event's live heap entry, keyed by event identity
+        self._live = dict[int, int]()
+
+        self._scheduled = list[tuple[datetime, int, Event]]()
+        self._ready = list[tuple[int, datetime, int, Event]]()
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __iter__(self) -> Iterator[Event]:
+        with self._condition:
+            return iter(self._index)
+
+    def put(self, event: Event) -> None:
+        with self._condition:
+            sequence = next(self._sequence)
+
+            self._index.add(event)
+            self._live[id(event)] = sequence
+
+            heapq.heappush(self._scheduled, (event.run_at, sequence, event))
+
+            self._condition.notify()
+
+    def get(self, timeout: float | None = None) -> Event:
+        """
+        Remove and return the highest priority event that is due.
+
+        Args:
+            timeout: Seconds to wait for an event to become due. None waits indefinitely, 0 doesn't wait.
+
+        Raises:
+            Empty: If no event became due within the timeout.
+        """
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        with self._condition:
+            while True:
+                now = datetime.now()
+
+                self._promote_due(now)
+
+                while self._ready:
+                    _, _, sequence, event = heapq.heappop(self._ready)
+
+                    if self._is_live(event, sequence):
+                        self._discard(event)
+
+                        return event
+
+                wait = None if deadline is None else deadline - time.monotonic()
+
+                if wait is not None and wait <= 0:
+                    raise Empty
+
+                if self._scheduled:
+                    # Sleep exactly until the next event is due
+                    until_due = (self._scheduled[0][0] - now).total_seconds()
+                    wait = until_due if wait is None else min(wait, until_due)
+
+                self._condition.wait(wait)
+
+    def remove(self, event: Event) -> bool:
+        """Remove an event, returning whether it was queued."""
+
+        with self._condition:
+            return self._discard(event)
+
+    def remove_item_id(self, item_id: int) -> list[Event]:
+        """Remove all events for an item ID, returning the removed events."""
+
+        with self._condition:
+            events = self._index.with_item_id(item_id)
+
+            for event in events:
+                self._discard(event)
+
+            return events
+
+    def contains_item_id(self, item_id: int) -> bool:
+        with self._condition:
+            return self._index.contains_item_id(item_id)
+
+    def contains_item(self, item: "MediaItem") -> bool:
+        with self._condition:
+            return self._index.contains_item(item)
+
+    def _is_live(self, event: Event, sequence: int) -> bool:
+        return self._live.get(id(event)) == sequence
+
+    def _discard(self, event: Event) -> bool:
+        if not self._index.discard(event):
+            return False
+
+        del self._live[id(event)]
+
+        if len(self._scheduled) + len(self._ready) > 2 * len(self._live) + 64:
+            self._compact()
+
+        return True
+
+    def _promote_due(self, now: datetime) -> None:
+        while self._scheduled and self._scheduled[0][0] <= now:
+            run_at, sequence, event = heapq.heappop(self._scheduled)
+
+            if self._is_live(event, sequence):
+                heapq.heappush(
+                    self._ready,
+                    (get_event_priority(event), run_at, sequence, event),
+                )
+
+    def _compact(self) -> None:
+        self._scheduled = [
+            entry for entry in self._scheduled if self._is_live(entry[2], entry[1])
+        ]
+        self._ready = [
+            entry for entry in self._ready if self._is_live(entry[3], entry[2])
+        ]
+
+        heapq.heapify(self._scheduled)
+        heapq.heapify(self._ready)
@@ -0,0 +1,216 @@
+import socket
+from collections.abc import Iterable
+from datetime import datetime
+
+import psutil
+from loguru import logger
+from sqlalchemy import delete, insert, select, update
+
+from program.db.db import db_session
+from program.managers.event_queue import get_event_priority
+from program.media.queued_event import QueuedEvent
+from program.media.state import States
+from program.settings import settings_manager
+from program.types import Event
+
+
+class EventStore:
+    """
+    Durable copy of the event queue, kept in the QueuedEvent table.
+
+    Events are written when they are queued or submitted, claimed by a worker when
+    they are dequeued, and deleted once the work they started has finished. On startup,
+    the events left over from a previous run are restored, so nothing has to be rediscovered.
+
+    Claims are made with `SELECT ... FOR UPDATE SKIP LOCKED`, so an event is only ever
+    processed by one worker, even if several Riven processes share the table.
+
+    Only events for items in the database are persisted; content-only events have no item
+    to reference and stay in memory. Database errors are logged and the event manager
+    carries on with its in-memory queue.
+    """
+
+    def __init__(self) -> None:
+        self.host = socket.gethostname()
+        # The process start time tells a live process apart from a restarted one that reused its PID
+        self.worker_id = self._process_id(psutil.Process())
+
+    @property
+    def enabled(self) -> bool:
+        return settings_manager.settings.database.persistent_event_queue
+
+    def add(self, event: Event, claimed: bool = False) -> None:
+        """
+        Persist an event, storing its row ID on the event.
+
+        Args:
+            event: The event to persist.
+            claimed: Whether this worker is already processing the event.
+        """
+
+        if not self.enabled or not event.item_id or event.queue_id is not None:
+            return
+
+        if isinstance(event.emitted_by, str):
+            emitted_by = event.emitted_by
+        else:
+            emitted_by = event.emitted_by.__class__.__name__
+
+        try:
+            with db_session() as session:
+                event.queue_id = session.execute(
+                    insert(QueuedEvent)
+                    .values(
+                        item_id=event.item_id,
+                        emitted_by=emitted_by,
+                        item_state=event.item_state.value if event.item_state else None,
+                        priority=get_event_priority(event),
+                        run_at=event.run_at,
+                        overrides=event.overrides,
+                        attempts=1 if claimed else 0,
+                        claimed_by=self.worker_id if claimed else None,
+                        claimed_at=datetime.now() if claimed else None,
+                    )
+                    .returning(QueuedEvent.id)
+                ).scalar_one()
+                session.commit()
+        except Exception as e:
+            logger.warning(f"Failed to persist {event.log_message}: {e}")
+
+    def claim(self, event: Event) -> bool | None:
+        """
+        Claim a persisted event for this worker.
+
+        Returns:
+            False if another worker claimed the event or it was removed,
+            None if the database couldn't be reached, otherwise True.
+        """
+
+        if event.queue_id is None:
+            return True
+
+        try:
+            with db_session() as session:
+                row = session.execute(
+                    select(QueuedEvent)
+                    .where(
+                        QueuedEvent.id == event.queue_id,
+                        QueuedEvent.claimed_by.is_(None),
+                    )
+                    .with_for_update(skip_locked=True)
+                ).scalar_one_or_none()
+
+                if row is None:
+                    return False
+
+                row.claimed_by = self.worker_id
+                row.claimed_at = datetime.now()
+                row.attempts += 1
+
+                session.commit()
+        except Exception as e:
+            logger.warning(f"Failed to claim {event.log_message}: {e}")
+            return None
+
+        return True
+
+    def remove(self, events: Iterable[Event]) -> None:
+        """Delete the persisted copies of events that finished or were removed."""
+
+        queue_ids = list[int]()
+
+        for event in events:
+            if event.queue_id is not None:
+                queue_ids.append(event.queue_id)
+                event.queue_id = None
+
+        if not queue_ids:
+            return
+
+        try:
+            with db_session() as session:
+                session.execute(
+                    delete(QueuedEvent).where(QueuedEvent.id.in_(queue_ids))
+                )
+                session.commit()
+        except Exception as e:
+            logger.warning(f"Failed to remove {len(queue_ids)} persisted events: {e}")
+
+    def restore(self) -> list[Event]:
+        """
+        Load the events left over from previous runs.
+
+        Events claimed by processes on this host that are no longer running were interrupted
+        by a restart, so their claims are released and they are queued again.
+        Claims held by live workers are left alone.
+
+        Returns:
+            list[Event]: The unclaimed events, due immediately if their run_at has passed.
+        """
+
+        if not self.enabled:
+            return []
+
+        try:
+            with db_session() as session:
+                claimants = session.execute(
+                    select(QueuedEvent.claimed_by)
+                    .where(
+                        QueuedEvent.claimed_by.is_not(None),
+                        QueuedEvent.claimed_by.like(f"{self.host}:%"),
+                    )
+                    .distinct()
+                ).scalars()
+
+                if stale := [
+                    claimant
+                    for claimant in claimants
+                    if claimant is not None and not self._is_running(claimant)
+                ]:
+                    session.execute(
+                        update(QueuedEvent)
+                        .where(QueuedEvent.claimed_by.in_(stale))
+                        .values(claimed_by=None, claimed_at=None)
+                    )
+                    session.commit()
+
+                rows = (
+                    session.execute(
+                        select(QueuedEvent)
+                        .where(QueuedEvent.claimed_by.is_(None))
+                        .order_by(QueuedEvent.priority, QueuedEvent.run_at)
+                    )
+                    .scalars()
+                    .all()
+                )
+        except Exception as e:
+            logger.warning(f"Failed to restore persisted events: {e}")
+            return []
+
+        return [
+            Event(
+                emitted_by=row.emitted_by,
+                item_id=row.item_id,
+                run_at=row.run_at,
+                item_state=States(row.item_state) if row.item_state else None,
+                overrides=row.overrides,
+                queue_id=row.id,
+            )
+            for row in rows
+        ]
+
+    def _process_id(self, process: psutil.Process) -> str:
+        return f"{self.host}:{process.pid}:{int(process.create_time())}"
+
+    def _is_running(self, worker_id: str) -> bool:
+        """Whether the worker that made a claim on this host is still running."""
+
+        if worker_id == self.worker_id:
+            return True
+
+        try:
+            pid = int(worker_id.split(":")[-2])
+
+            return self._process_id(psutil.Process(pid)) == worker_id
+        except (ValueError, IndexError, psutil.Error):
+            return False
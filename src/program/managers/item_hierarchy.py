@@ -0,0 +1,153 @@
+import contextlib
+import threading
+import weakref
+from typing import Any
+
+from loguru import logger
+from sqlalchemy import event, select, union_all
+from sqlalchemy.orm import Session
+
+from program.db.db import db_session
+from program.media.item import Episode, Season
+
+
+class ItemHierarchy:
+    """
+    In-memory index of the seasons of each show and the episodes of each season.
+
+    Lets the event manager find an item's parents and children without querying the
+    database for every event. Loaded in bulk on first use, then kept current from the
+    seasons and episodes inserted or deleted by committed sessions of this process.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._loaded = False
+        self._children = dict[int, list[int]]()
+        self._parents = dict[int, int]()
+
+        _hierarchies.add(self)
+
+    def related_ids(self, item_id: int) -> list[int]:
+        """
+        Get the descendant IDs of an item, like `db_functions.get_item_ids`.
+
+        For a show, these are the episode IDs of its seasons followed by the season IDs.
+        For a season, these are its episode IDs. Other items have none.
+        """
+
+        with self._lock:
+            self._ensure_loaded()
+
+            children = self._children.get(item_id, [])
+            grandchildren = [
+                grandchild
+                for child in children
+                for grandchild in self._children.get(child, [])
+            ]
+
+            return grandchildren + children
+
+    def ancestor_ids(self, item_id: int) -> list[int]:
+        """Get the IDs of an item's parent and grandparent, closest first."""
+
+        with self._lock:
+            self._ensure_loaded()
+
+            ancestors = list[int]()
+            parent = self._parents.get(item_id)
+
+            while parent is not None:
+                ancestors.append(parent)
+                parent = self._parents.get(parent)
+
+            return ancestors
+
+    def _ensure_loaded(self) -> None:
+        if self._loaded:
+            return
+
+        with db_session() as session:
+            rows = session.execute(
+                union_all(
+                    select(Season.__table__.c.id, Season.__table__.c.parent_id),
+                    select(Episode.__table__.c.id, Episode.__table__.c.parent_id),
+                )
+            ).all()
+
+        for child_id, parent_id in rows:
+            self._link(child_id, parent_id)
+
+        self._loaded = True
+
+        logger.debug(f"Loaded item hierarchy with {len(rows)} seasons and episodes")
+
+    def _link(self, child_id: int, parent_id: int) -> None:
+        if self._parents.get(child_id) == parent_id:
+            return
+
+        self._parents[child_id] = parent_id
+        self._children.setdefault(parent_id, []).append(child_id)
+
+    def _unlink(self, item_id: int) -> None:
+        parent_id = self._parents.pop(item_id, None)
+
+        if parent_id is not None and (siblings := self._children.get(parent_id)):
+            with contextlib.suppress(ValueError):
+                siblings.remove(item_id)
+
+        for child_id in self._children.pop(item_id, []):
+            self._parents.pop(child_id, None)
+
+    def _apply(self, added: list[tuple[int, int]], deleted: list[int]) -> None:
+        """Apply the seasons and episodes a committed session inserted or deleted."""
+
+        with self._lock:
+            if not self._loaded:
+                return
+
+            for item_id in deleted:
+                self._unlink(item_id)
+
+            for child_id, parent_id in added:
+                self._link(child_id, parent_id)
+
+
+# Every index in this process, kept current by the session listeners below.
+# The listeners are registered once, rather than per index, so indexes don't leak them.
+_hierarchies = weakref.WeakSet[ItemHierarchy]()
+
+_changes_key = "item_hierarchy_changes"
+
+
+@event.listens_for(Session, "after_flush")
+def _on_flush(session: Session, _flush_context: Any) -> None:
+    """Record the seasons and episodes a flush inserted or deleted, to apply on commit."""
+
+    added, deleted = session.info.setdefault(_changes_key, ([], []))
+
+    for obj in session.new:
+        if isinstance(obj, (Season, Episode)) and obj.id and obj.parent_id:
+            added.append((obj.id, obj.parent_id))
+
+    for obj in session.deleted:
+        if obj.id:
+            deleted.append(obj.id)
+
+
+@event.listens_for(Session, "after_commit")
+def _on_commit(session: Session) -> None:
+    changes = session.info.pop(_changes_key, None)
+
+    if not changes:
+        return
+
+    added, deleted = changes
+
+    for hierarchy in list(_hierarchies):
+        hierarchy._apply(added, deleted)
+
+
+@event.listens_for(Session, "after_rollback")
+def _on_rollback(session: Session) -> None:
+    session.info.pop(_changes_key, None)
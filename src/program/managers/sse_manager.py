@@ -1,14 +1,34 @@
 import asyncio
+from collections.abc import Callable
 from typing import Any
 
 
 class ServerSentEventManager:
     def __init__(self):
-        # Store active subscriber queues by event type
-        self.subscribers = dict[str, list[asyncio.Queue[Any]]]()
+        # Store active subscriber queues by event type, holding each event's data and sequence number
+        self.subscribers = dict[str, list[asyncio.Queue[tuple[Any, int | None]]]]()
+        self._snapshot_providers = dict[str, Callable[[], tuple[Any, int]]]()
         self._loop: asyncio.AbstractEventLoop | None = None
 
-    def _dispatch(self, event_type: str, data: Any):
+    def has_subscribers(self, event_type: str) -> bool:
+        """Check whether anyone is subscribed to an event type, so publishers can skip building the payload."""
+
+        return bool(self.subscribers.get(event_type))
+
+    def set_snapshot_provider(
+        self, event_type: str, provider: Callable[[], tuple[Any, int]]
+    ):
+        """
+        Register a function returning the current state of an event type,
+        and the sequence number of the last change it includes.
+
+        New subscribers receive the snapshot first, so publishers only need to send changes.
+        Changes published with a sequence number the snapshot already includes are skipped.
+        """
+
+        self._snapshot_providers[event_type] = provider
+
+    def _dispatch(self, event_type: str, data: Any, sequence: int | None = None):
         """Internal method to dispatch events on the event loop."""
         if not data:
             return
@@ -18,11 +38,11 @@ class ServerSentEventManager:
             return
 
         # Send to all active subscribers for this event type
-        dead_queues = list[asyncio.Queue[Any]]()
+        dead_queues = list[asyncio.Queue[tuple[Any, int | None]]]()
 
         for queue in self.subscribers[event_type]:
             try:
-                queue.put_nowait(data)
+                queue.put_nowait((data, sequence))
             except asyncio.QueueFull:
                 # Queue is full, mark for removal
                 dead_queues.append(queue)
@@ -32,10 +52,13 @@ class ServerSentEventManager:
             if dead_queue in self.subscribers[event_type]:
                 self.subscribers[event_type].remove(dead_queue)
 
-    def publish_event(self, event_type: str, data: Any):
+    def publish_event(self, event_type: str, data: Any, sequence: int | None = None):
         """
         Publish an event to all active subscribers.
         Thread-safe: schedules the dispatch on the event loop if called from a thread.
+
+        Args:
+            sequence: Sequence number of the change, for event types with a snapshot provider.
         """
         if self._loop is None:
             return
@@ -43,14 +66,14 @@ class ServerSentEventManager:
         try:
             # If we're already in the loop, execute directly
             if asyncio.get_running_loop() == self._loop:
-                self._dispatch(event_type, data)
+                self._dispatch(event_type, data, sequence)
                 return
         except RuntimeError:
             # Not in a loop (e.g. called from a thread)
             pass
 
         # Schedule execution on the event loop
-        self._loop.call_soon_threadsafe(self._dispatch, event_type, data)
+        self._loop.call_soon_threadsafe(self._dispatch, event_type, data, sequence)
 
     async def subscribe(self, event_type: str):
         """
@@ -62,7 +85,7 @@ class ServerSentEventManager:
             self._loop = asyncio.get_running_loop()
 
         # Create a queue for this subscriber
-        queue = asyncio.Queue[Any](maxsize=100)
+        queue = asyncio.Queue[tuple[Any, int | None]](maxsize=100)
 
         # Register this subscriber
         if event_type not in self.subscribers:
@@ -71,10 +94,26 @@ class ServerSentEventManager:
         self.subscribers[event_type].append(queue)
 
         try:
+            # Taken after registering, so changes made meanwhile are either
+            # in the snapshot or queued with a later sequence number
+            snapshot_sequence = None
+
+            if provider := self._snapshot_providers.get(event_type):
+                snapshot, snapshot_sequence = provider()
+                yield f"data: {snapshot}\n\n"
+
             while True:
                 try:
                     # Wait for events with a timeout to send keepalive
-                    data = await asyncio.wait_for(queue.get(), timeout=30.0)
+                    data, sequence = await asyncio.wait_for(queue.get(), timeout=30.0)
+
+                    if (
+                        snapshot_sequence is not None
+                        and sequence is not None
+                        and sequence <= snapshot_sequence
+                    ):
+                        continue
+
                     yield f"data: {data}\n\n"
                 except asyncio.TimeoutError:
                     # Send keepalive comment to prevent connection timeout
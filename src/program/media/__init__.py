@@ -3,6 +3,10 @@ from .state import States
 from .filesystem_entry import FilesystemEntry
 from .media_entry import MediaEntry
 from .subtitle_entry import SubtitleEntry
+from .vfs_inode import VFSInode, VFSInodeCounter
+from .queued_event import QueuedEvent
+from .parsed_title import ParsedTitle
+from .resolved_infohash import ResolvedInfohash
 from .stream import (
     StreamBlacklistRelation,
     Stream,
@@ -19,6 +23,11 @@ __all__ = [
     "FilesystemEntry",
     "MediaEntry",
     "SubtitleEntry",
+    "VFSInode",
+    "VFSInodeCounter",
+    "QueuedEvent",
+    "ParsedTitle",
+    "ResolvedInfohash",
     "StreamRelation",
     "Stream",
     "StreamBlacklistRelation",
@@ -0,0 +1,27 @@
+"""Model for cached torrent title parses"""
+
+from datetime import datetime
+from typing import Any
+
+import sqlalchemy
+from sqlalchemy.orm import Mapped, mapped_column
+
+from program.db.base_model import Base
+
+
+class ParsedTitle(Base):
+    """
+    The parse of a raw torrent title, keyed by a hash of the title.
+
+    Parsing a title doesn't depend on the item being scraped or the ranking settings,
+    so the same titles returned by every scrape of a show are only parsed once.
+    """
+
+    __tablename__ = "ParsedTitle"
+
+    title_hash: Mapped[str] = mapped_column(sqlalchemy.String(40), primary_key=True)
+    parser_version: Mapped[str] = mapped_column(sqlalchemy.String, nullable=False)
+    data: Mapped[dict[str, Any]] = mapped_column(sqlalchemy.JSON, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        sqlalchemy.DateTime, nullable=False, default=datetime.now
+    )
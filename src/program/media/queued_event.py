@@ -0,0 +1,46 @@
+"""Model for persisted event queue entries"""
+
+from datetime import datetime
+from typing import Any
+
+import sqlalchemy
+from sqlalchemy.orm import Mapped, mapped_column
+
+from program.db.base_model import Base
+
+
+class QueuedEvent(Base):
+    """
+    An event waiting in, or claimed from, the durable event queue.
+
+    Claimed entries stay in the table until the work they started has finished,
+    so events that were queued or being processed survive a restart.
+    """
+
+    __tablename__ = "QueuedEvent"
+
+    id: Mapped[int] = mapped_column(
+        sqlalchemy.Integer, primary_key=True, autoincrement=True
+    )
+    item_id: Mapped[int] = mapped_column(
+        sqlalchemy.Integer,
+        sqlalchemy.ForeignKey("MediaItem.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    emitted_by: Mapped[str] = mapped_column(sqlalchemy.String, nullable=False)
+    item_state: Mapped[str | None] = mapped_column(sqlalchemy.String, nullable=True)
+    priority: Mapped[int] = mapped_column(sqlalchemy.Integer, nullable=False)
+    run_at: Mapped[datetime] = mapped_column(sqlalchemy.DateTime, nullable=False)
+    overrides: Mapped[dict[str, Any] | None] = mapped_column(
+        sqlalchemy.JSON, nullable=True
+    )
+    attempts: Mapped[int] = mapped_column(sqlalchemy.Integer, nullable=False, default=0)
+    claimed_by: Mapped[str | None] = mapped_column(sqlalchemy.String, nullable=True)
+    claimed_at: Mapped[datetime | None] = mapped_column(
+        sqlalchemy.DateTime, nullable=True
+    )
+
+    __table_args__ = (
+        sqlalchemy.Index("ix_queuedevent_item_id", "item_id"),
+        sqlalchemy.Index("ix_queuedevent_dequeue", "claimed_by", "priority", "run_at"),
+    )
@@ -0,0 +1,29 @@
+"""Model for infohashes resolved from indexer download URLs"""
+
+from datetime import datetime
+
+import sqlalchemy
+from sqlalchemy.orm import Mapped, mapped_column
+
+from program.db.base_model import Base
+
+
+class ResolvedInfohash(Base):
+    """
+    The infohash an indexer's torrent download URL resolved to, keyed by a hash of the URL.
+
+    A null infohash records a URL that was fetched but didn't lead to a torrent,
+    so it isn't downloaded again until the negative result expires.
+    """
+
+    __tablename__ = "ResolvedInfohash"
+
+    url_hash: Mapped[str] = mapped_column(sqlalchemy.String(40), primary_key=True)
+    infohash: Mapped[str | None] = mapped_column(sqlalchemy.String(40), nullable=True)
+    resolved_at: Mapped[datetime] = mapped_column(
+        sqlalchemy.DateTime, nullable=False, default=datetime.now
+    )
+
+    __table_args__ = (
+        sqlalchemy.Index("ix_resolvedinfohash_resolved_at", "resolved_at"),
+    )
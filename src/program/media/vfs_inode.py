@@ -0,0 +1,30 @@
+"""Model for persisted VFS inode assignments"""
+
+import sqlalchemy
+from sqlalchemy.orm import Mapped, mapped_column
+
+from program.db.base_model import Base
+
+
+class VFSInode(Base):
+    """Inode number assigned to a VFS path, so the path keeps its inode across restarts and syncs."""
+
+    __tablename__ = "VFSInode"
+
+    path: Mapped[str] = mapped_column(sqlalchemy.String, primary_key=True)
+    inode: Mapped[int] = mapped_column(
+        sqlalchemy.BigInteger, nullable=False, unique=True
+    )
+
+
+class VFSInodeCounter(Base):
+    """
+    Single row holding the next inode to assign.
+
+    Kept apart from the VFSInode rows, so inodes of pruned paths are never handed to new ones.
+    """
+
+    __tablename__ = "VFSInodeCounter"
+
+    id: Mapped[int] = mapped_column(sqlalchemy.Integer, primary_key=True)
+    next_inode: Mapped[int] = mapped_column(sqlalchemy.BigInteger, nullable=False)
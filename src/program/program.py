@@ -22,6 +22,7 @@ from program.services.indexers import IndexerService
 from program.services.notifications import NotificationService
 from program.services.post_processing import PostProcessing
 from program.services.scrapers import Scraping
+from program.services.scrapers.scrape_loop import scrape_loop
 from program.services.updaters import Updater
 from program.settings import settings_manager
 from program.settings.models import get_version
@@ -228,6 +229,9 @@ class Program(threading.Thread):
 
         self.initialize_services()
 
+        # Resume the events that were queued or running when Riven last stopped
+        self.em.restore_queue()
+
         with db_session() as session:
             from sqlalchemy import exists
 
@@ -325,7 +329,8 @@ class Program(threading.Thread):
                 continue
 
             try:
-                event = self.em.next()
+                # Sleeps until the next event is due, waking early when one is queued
+                event = self.em.next(timeout=1)
 
                 if self.enable_trace:
                     self.dump_tracemalloc()
@@ -333,7 +338,6 @@ class Program(threading.Thread):
                 if self.enable_trace:
                     self.dump_tracemalloc()
 
-                time.sleep(0.1)
                 continue
 
             if event.item_id:
@@ -362,21 +366,24 @@ class Program(threading.Thread):
                     else:
                         # We are in the database, pass on id.
                         if item_to_submit.id:
-                            event = Event(
+                            job_event = Event(
                                 next_service,
                                 item_id=item_to_submit.id,
                                 overrides=processed_event.overrides,
                             )
                         # We are not, lets pass the MediaItem
                         else:
-                            event = Event(
+                            job_event = Event(
                                 next_service,
                                 content_item=item_to_submit,
                                 overrides=processed_event.overrides,
                             )
 
                         # Event will be added to running when job actually starts in submit_job
-                        self.em.submit_job(next_service, self, event)
+                        self.em.submit_job(next_service, self, job_event)
+
+            # Its jobs are persisted on their own, so the event itself is done
+            self.em.complete_event(event)
 
     def stop(self):
         if not self.initialized:
@@ -387,6 +394,8 @@ class Program(threading.Thread):
         if self.services:
             self.services.filesystem.close()
 
+        scrape_loop.close()
+
         logger.log("PROGRAM", "Riven has been stopped.")
 
 
@@ -163,8 +163,9 @@ class ProgramScheduler:
 
         item_ids = db_functions.retry_library()
 
-        for item_id in item_ids:
-            self.program.em.add_event(Event(emitted_by="RetryLibrary", item_id=item_id))
+        self.program.em.add_events(
+            [Event(emitted_by="RetryLibrary", item_id=item_id) for item_id in item_ids]
+        )
 
         if item_ids:
             logger.log(
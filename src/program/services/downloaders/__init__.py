@@ -29,6 +29,7 @@ from program.services.downloaders.shared import (
     parse_filename,
 )
 from program.settings import settings_manager
+from program.utils.concurrency import provider_limiter
 from program.utils.request import CircuitBreakerOpen
 from program.core.runner import MediaItemGenerator, Runner, RunnerResult
 
@@ -131,40 +132,43 @@ class Downloader(Runner[None, DownloaderBase]):
                     download_result: DownloadedTorrent | None = None
 
                     try:
-                        # Validate stream on this specific service
-                        container = self.validate_stream_on_service(
-                            stream,
-                            item,
-                            service,
-                        )
-
-                        if not container:
-                            logger.debug(
-                                f"Stream {stream.infohash} not available on {service.key}"
+                        with provider_limiter.limit(service.key):
+                            # Validate stream on this specific service
+                            container = self.validate_stream_on_service(
+                                stream,
+                                item,
+                                service,
                             )
-                            continue
 
-                        # Try to download using this service
-                        download_result = self.download_cached_stream_on_service(
-                            stream,
-                            container,
-                            service,
-                        )
+                            if not container:
+                                logger.debug(
+                                    f"Stream {stream.infohash} not available on {service.key}"
+                                )
+                                continue
 
-                        if self.update_item_attributes(item, download_result, service):
-                            logger.log(
-                                "DEBRID",
-                                f"Downloaded {item.log_string} from '{stream.raw_title}' [{stream.infohash}] using {service.key}",
+                            # Try to download using this service
+                            download_result = self.download_cached_stream_on_service(
+                                stream,
+                                container,
+                                service,
                             )
 
-                            download_success = True
-                            stream_failed_on_all_services = False
+                            if self.update_item_attributes(
+                                item, download_result, service
+                            ):
+                                logger.log(
+                                    "DEBRID",
+                                    f"Downloaded {item.log_string} from '{stream.raw_title}' [{stream.infohash}] using {service.key}",
+                                )
 
-                            break
-                        else:
-                            raise NoMatchingFilesException(
-                                f"No valid files found for {item.log_string} ({item.id})"
-                            )
+                                download_success = True
+                                stream_failed_on_all_services = False
+
+                                break
+                            else:
+                                raise NoMatchingFilesException(
+                                    f"No valid files found for {item.log_string} ({item.id})"
+                                )
                     except CircuitBreakerOpen as e:
                         # This specific service hit circuit breaker, set cooldown and try next service
                         cooldown_duration = timedelta(minutes=1)
@@ -82,6 +82,9 @@ class FilesystemService(Runner[FilesystemModel]):
 
             logger.debug(f"Registered {item.log_string} with RivenVFS")
 
+            # Fetch the header and footer ahead of the first probe by a media server
+            self.riven_vfs.prewarm(episode_or_movie)
+
         logger.info(f"Filesystem processing complete for {item.log_string}")
 
         # Yield the original item for state transition
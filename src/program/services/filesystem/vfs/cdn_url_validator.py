@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+
+import trio
+from loguru import logger
+
+from program.utils.debrid_cdn_url import DebridCDNUrl
+
+
+@dataclass(frozen=True)
+class CDNUrlValidation:
+    url: str | None
+    expires_at: float
+
+
+class CDNUrlValidator:
+    """
+    Validates debrid CDN URLs for media files, remembering the outcome for a while.
+
+    Media servers open the same files many times during library scans,
+    so successful validations are reused for `ttl_seconds`, and failed ones
+    (where the URL could neither be reached nor refreshed) for `negative_ttl_seconds`.
+    Concurrent validations of the same file share a single request.
+
+    Dead links raise DebridServiceLinkUnavailable and are never cached.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: int,
+        negative_ttl_seconds: int,
+        max_entries: int = 10_000,
+    ) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.negative_ttl_seconds = negative_ttl_seconds
+        self.max_entries = max_entries
+
+        self._validations = dict[str, CDNUrlValidation]()
+        self._in_flight = dict[str, trio.Event]()
+
+    async def validate(self, original_filename: str) -> str | None:
+        """Get the validated CDN URL for a file, or None if it couldn't be validated."""
+
+        while True:
+            validation = self._validations.get(original_filename)
+
+            if validation and validation.expires_at > time.monotonic():
+                return validation.url
+
+            in_flight = self._in_flight.get(original_filename)
+
+            if in_flight is None:
+                break
+
+            # Another open is already validating this file; use its result
+            await in_flight.wait()
+
+        done = self._in_flight[original_filename] = trio.Event()
+
+        try:
+            cdn_url = await trio.to_thread.run_sync(
+                DebridCDNUrl.from_filename, original_filename
+            )
+            url = await cdn_url.validate_async()
+
+            self._store(original_filename, url)
+
+            if url is None:
+                logger.debug(
+                    f"Could not validate CDN URL for {original_filename}; "
+                    f"not retrying for {self.negative_ttl_seconds}s"
+                )
+
+            return url
+        finally:
+            del self._in_flight[original_filename]
+            done.set()
+
+    def invalidate(self, original_filename: str) -> None:
+        """Forget the validation for a file, e.g. after its stream failed to connect."""
+
+        self._validations.pop(original_filename, None)
+
+    def _store(self, original_filename: str, url: str | None) -> None:
+        now = time.monotonic()
+        ttl = self.ttl_seconds if url else self.negative_ttl_seconds
+
+        if ttl <= 0:
+            return
+
+        if len(self._validations) >= self.max_entries:
+            self._validations = {
+                key: validation
+                for key, validation in self._validations.items()
+                if validation.expires_at > now
+            }
+
+            if len(self._validations) >= self.max_entries:
+                # Still full of live entries; drop the oldest (first inserted)
+                self._validations.pop(next(iter(self._validations)))
+
+        self._validations[original_filename] = CDNUrlValidation(
+            url=url,
+            expires_at=now + ttl,
+        )
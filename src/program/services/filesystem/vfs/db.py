@@ -38,6 +38,7 @@ class GetEntryByOriginalFilenameResult(BaseModel):
     provider: str | None
     provider_download_id: str | None
     size: int | None
+    bitrate: int | None = None
     created: str | None
     modified: str | None
     entry_type: Literal["media", "subtitle"]
@@ -231,6 +232,9 @@ class VFSDatabase:
                     provider=entry.provider,
                     provider_download_id=entry.provider_download_id,
                     size=entry.file_size,
+                    bitrate=(
+                        entry.media_metadata.bitrate if entry.media_metadata else None
+                    ),
                     created=(entry.created_at.isoformat()),
                     modified=(entry.updated_at.isoformat()),
                     entry_type="media",
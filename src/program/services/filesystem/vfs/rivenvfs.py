@@ -76,8 +76,8 @@ from program.services.streaming.exceptions import (
     DebridServiceLinkUnavailable,
     MediaStreamKilledException,
 )
-from program.utils.debrid_cdn_url import DebridCDNUrl
 from program.db.db import db_session
+from program.services.filesystem.vfs.cdn_url_validator import CDNUrlValidator
 
 from ...streaming import (
     Cache,
@@ -85,9 +85,13 @@ from ...streaming import (
     MediaStream,
     ChunksTooSlowException,
     ChunkCacheNotifier,
+    ProviderConnectionLimiter,
+    ProviderThroughput,
 )
 
 if TYPE_CHECKING:
+    from sqlalchemy.orm import Session
+
     from program.media.item import MediaItem
     from program.media.filesystem_entry import FilesystemEntry
 
@@ -96,11 +100,15 @@ class FileHandle(TypedDict):
     inode: pyfuse3.InodeT
     last_read_end: int
     subtitle_content: bytes | None
+    cdn_url_validated: bool
 
 
-class CachedDirectoryEntry(TypedDict):
-    name: str
-    is_directory: bool
+class RegisteredFile(TypedDict):
+    original_filename: str
+    file_size: int
+    created_at: str
+    updated_at: str
+    entry_type: Literal["media", "subtitle"]
 
 
 class RivenVFS(pyfuse3.Operations):
@@ -169,6 +177,10 @@ class RivenVFS(pyfuse3.Operations):
                 ttl_seconds=self.fs.cache_ttl_seconds,
                 eviction=self.fs.cache_eviction,
                 metrics_enabled=self.fs.cache_metrics,
+                io_workers=self.fs.cache_io_workers,
+                storage=self.fs.cache_storage,
+                max_pinned_bytes=self.fs.cache_pinned_max_size_mb * 1024 * 1024,
+                memory_tier_bytes=self.fs.cache_memory_tier_mb * 1024 * 1024,
             )
         )
 
@@ -176,12 +188,25 @@ class RivenVFS(pyfuse3.Operations):
 
         di[ChunkCacheNotifier] = ChunkCacheNotifier()
 
+        di[ProviderThroughput] = ProviderThroughput()
+
+        di[ProviderConnectionLimiter] = ProviderConnectionLimiter(
+            max_connections=settings_manager.settings.stream.max_parallel_connections_per_provider
+        )
+
         # VFS Tree: In-memory tree structure for O(1) path lookups
         # This replaces _path_to_inode, _path_aliases, and _dir_tree
         self._root = VFSRoot()
         self._inode_to_node: dict[int, VFSNode] = {pyfuse3.ROOT_INODE: self._root}
         self._next_inode = pyfuse3.InodeT(pyfuse3.ROOT_INODE + 1)
 
+        # Inodes previously assigned to each path, persisted so that files keep their inode
+        # across restarts and syncs, and media servers don't treat them as new files.
+        # Newly assigned inodes are buffered and persisted in batches.
+        self._persisted_inodes = dict[str, pyfuse3.InodeT]()
+        self._unpersisted_inodes = dict[str, pyfuse3.InodeT]()
+        self._inode_persistence_enabled = False
+
         # Tree lock to prevent race conditions between FUSE operations and tree rebuilds
         # pyfuse3 runs FUSE operations in threads, so we use threading.RLock()
         self._tree_lock = threading.RLock()
@@ -192,7 +217,8 @@ class RivenVFS(pyfuse3.Operations):
         # Profile hash for detecting changes (optimization: skip re-matching if unchanged)
         self._last_profile_hash: int | None = None
 
-        # Set of paths currently being streamed
+        # Streams currently in use, keyed by original_filename.
+        # A stream is shared by every file handle reading the same file.
         self._active_streams = dict[str, MediaStream]()
 
         # Lock for managing active streams dict
@@ -205,6 +231,12 @@ class RivenVFS(pyfuse3.Operations):
         # Opener statistics
         self.opener_stats = dict[str, dict[str, Any]]()
 
+        # Recently validated CDN URLs, so repeated opens don't each probe the CDN
+        self._cdn_url_validator = CDNUrlValidator(
+            ttl_seconds=self.fs.cdn_url_validation_ttl_seconds,
+            negative_ttl_seconds=self.fs.cdn_url_validation_negative_ttl_seconds,
+        )
+
         # Mount management
         self.mounted = False
         self._mountpoint = os.path.abspath(mountpoint)
@@ -212,6 +244,14 @@ class RivenVFS(pyfuse3.Operations):
         self._unmount_requested = trio_util.AsyncBool(False)
         self.stream_nursery: trio.Nursery
 
+        # Token for the FUSE event loop, used to schedule work onto it from other threads
+        self._trio_token: trio.lowlevel.TrioToken | None = None
+
+        # Bounds concurrent header/footer pre-warms, so large imports don't hit provider rate limits
+        self._prewarm_limiter = trio.CapacityLimiter(
+            max(1, self.fs.cache_prewarm_concurrency)
+        )
+
         def _fuse_runner():
             async def _async_main() -> NoReturn:
                 async with self.mountpoint_lifecycle():
@@ -236,6 +276,9 @@ class RivenVFS(pyfuse3.Operations):
 
         logger.log("VFS", f"RivenVFS mounted at {self._mountpoint}")
 
+        # Reuse the inodes assigned in previous runs
+        self._load_persisted_inodes()
+
         # Synchronize library profiles with VFS structure
         self.sync()
 
@@ -264,6 +307,7 @@ class RivenVFS(pyfuse3.Operations):
                 async with trio_util.run_and_cancelling(self._monitor_stream_timeouts):
                     async with trio.open_nursery() as nursery:
                         self.stream_nursery = nursery
+                        self._trio_token = trio.lowlevel.current_trio_token()
 
                         # Keep the stream nursery alive and ready to spawn tasks
                         yield
@@ -271,6 +315,7 @@ class RivenVFS(pyfuse3.Operations):
                         # Cancel streams on exit
                         nursery.cancel_scope.cancel()
         finally:
+            self._trio_token = None
             self._cleanup_mountpoint(self._mountpoint)
             self.mounted = False
 
@@ -305,7 +350,7 @@ class RivenVFS(pyfuse3.Operations):
 
                                 await stream.close()
 
-                                self._active_streams.pop(stream_key)
+                                self._active_streams.pop(stream_key, None)
                         except Exception:
                             logger.exception("Error during stream timeout check")
                 else:
@@ -315,10 +360,6 @@ class RivenVFS(pyfuse3.Operations):
 
             await trio.sleep(60)
 
-    def _stream_key(self, path: str, fh: int) -> str:
-        """Generate unique key for stream tracking."""
-        return f"{path}:{fh}"
-
     # ========== VFS Tree Helper Methods ==========
 
     def _get_node_by_path(self, path: str) -> VFSNode | None:
@@ -385,6 +426,7 @@ class RivenVFS(pyfuse3.Operations):
                 if child is None:
                     # Create the node
                     is_last = i == len(parts) - 1
+                    child_path = "/" + "/".join(parts[: i + 1])
 
                     if is_last and not is_directory:
                         if not original_filename:
@@ -400,7 +442,7 @@ class RivenVFS(pyfuse3.Operations):
                         child = VFSFile(
                             name=part,
                             original_filename=original_filename,
-                            inode=self._assign_inode(),
+                            inode=self._assign_inode(child_path),
                             parent=current,
                             file_size=file_size,
                             created_at=created_at,
@@ -410,7 +452,7 @@ class RivenVFS(pyfuse3.Operations):
                     else:
                         child = VFSDirectory(
                             name=part,
-                            inode=self._assign_inode(),
+                            inode=self._assign_inode(child_path),
                             parent=current,
                         )
 
@@ -463,12 +505,166 @@ class RivenVFS(pyfuse3.Operations):
             if isinstance(child, VFSDirectory):
                 self._remove_node_recursive(child)
 
-    def _assign_inode(self) -> pyfuse3.InodeT:
-        """Assign a new inode number."""
+    def _assign_inode(self, path: str) -> pyfuse3.InodeT:
+        """
+        Get the inode for a path, reusing the one previously assigned to it if any.
+
+        Callers must hold the tree lock.
+
+        Args:
+            path: NORMALIZED VFS path of the node being created
+        """
+
+        inode = self._persisted_inodes.get(path)
+
+        if inode is not None and inode not in self._inode_to_node:
+            return inode
+
         inode = self._next_inode
         self._next_inode = pyfuse3.InodeT(inode + 1)
+
+        self._persisted_inodes[path] = inode
+        self._unpersisted_inodes[path] = inode
+
         return inode
 
+    def _load_persisted_inodes(self) -> None:
+        """Load the inodes assigned to VFS paths in previous runs."""
+
+        from program.media.vfs_inode import VFSInode, VFSInodeCounter
+
+        try:
+            with db_session() as session:
+                rows = session.query(VFSInode.path, VFSInode.inode).all()
+                next_inode = session.query(VFSInodeCounter.next_inode).scalar()
+        except Exception as e:
+            logger.warning(
+                f"Failed to load persisted VFS inodes; inodes will not be stable across restarts: {e}"
+            )
+            return
+
+        with self._tree_lock:
+            self._persisted_inodes = {
+                path: pyfuse3.InodeT(inode) for path, inode in rows
+            }
+
+            if self._persisted_inodes:
+                self._next_inode = pyfuse3.InodeT(
+                    max(self._next_inode, max(self._persisted_inodes.values()) + 1)
+                )
+
+            # Inodes of pruned paths lie above every remaining one; never reuse them
+            if next_inode is not None:
+                self._next_inode = pyfuse3.InodeT(max(self._next_inode, next_inode))
+
+            self._inode_persistence_enabled = True
+
+        logger.debug(f"Loaded {len(rows)} persisted VFS inodes")
+
+    def _persist_inodes(self) -> None:
+        """Persist the inodes assigned since the last call."""
+
+        from sqlalchemy import insert
+
+        from program.media.vfs_inode import VFSInode
+
+        with self._tree_lock:
+            if not self._inode_persistence_enabled or not self._unpersisted_inodes:
+                return
+
+            pending = self._unpersisted_inodes
+            self._unpersisted_inodes = dict[str, pyfuse3.InodeT]()
+            next_inode = self._next_inode
+
+        paths = list(pending)
+        batch_size = 1000
+
+        try:
+            with db_session() as session:
+                self._record_next_inode(session, next_inode)
+
+                for i in range(0, len(paths), batch_size):
+                    batch = paths[i : i + batch_size]
+
+                    # Paths whose previous inode was taken are re-assigned; replace their rows
+                    session.query(VFSInode).filter(VFSInode.path.in_(batch)).delete(
+                        synchronize_session=False
+                    )
+                    session.execute(
+                        insert(VFSInode),
+                        [{"path": path, "inode": pending[path]} for path in batch],
+                    )
+
+                session.commit()
+        except Exception as e:
+            logger.warning(f"Failed to persist {len(pending)} VFS inodes: {e}")
+
+            # Retry with the next batch
+            with self._tree_lock:
+                for path, inode in pending.items():
+                    self._unpersisted_inodes.setdefault(path, inode)
+
+    def _prune_persisted_inodes(self) -> None:
+        """
+        Forget the inodes of paths that are no longer in the tree.
+
+        Only called after a full sync, when the tree holds every path that should exist;
+        paths removed by individual syncs keep their inode until then, so re-adding them reuses it.
+        """
+
+        from program.media.vfs_inode import VFSInode
+
+        with self._tree_lock:
+            if not self._inode_persistence_enabled:
+                return
+
+            live_paths = {node.path for node in self._inode_to_node.values()}
+            stale_paths = [
+                path for path in self._persisted_inodes if path not in live_paths
+            ]
+
+            for path in stale_paths:
+                del self._persisted_inodes[path]
+                self._unpersisted_inodes.pop(path, None)
+
+            next_inode = self._next_inode
+
+        if not stale_paths:
+            return
+
+        batch_size = 1000
+
+        try:
+            with db_session() as session:
+                # The pruned inodes must stay below the next one assigned after a restart
+                self._record_next_inode(session, next_inode)
+
+                for i in range(0, len(stale_paths), batch_size):
+                    session.query(VFSInode).filter(
+                        VFSInode.path.in_(stale_paths[i : i + batch_size])
+                    ).delete(synchronize_session=False)
+
+                session.commit()
+        except Exception as e:
+            # The rows are reloaded and pruned again by the next full sync
+            logger.warning(f"Failed to prune {len(stale_paths)} VFS inodes: {e}")
+            return
+
+        logger.debug(f"Pruned {len(stale_paths)} stale VFS inodes")
+
+    @staticmethod
+    def _record_next_inode(session: Session, next_inode: pyfuse3.InodeT) -> None:
+        """Raise the persisted high-water mark of assigned inodes to `next_inode`."""
+
+        from program.media.vfs_inode import VFSInodeCounter
+
+        counter = session.get(VFSInodeCounter, 1, with_for_update=True)
+
+        if counter is None:
+            session.add(VFSInodeCounter(id=1, next_inode=next_inode))
+        elif counter.next_inode < next_inode:
+            counter.next_inode = next_inode
+
     def _get_parent_inodes(self, node: VFSNode) -> list[pyfuse3.InodeT]:
         """
         Get all parent inodes from node up to root.
@@ -550,8 +746,67 @@ class RivenVFS(pyfuse3.Operations):
             self._register_filesystem_entry(subtitle, video_paths=video_paths)
             subtitle.available_in_vfs = True
 
+        self._persist_inodes()
+
         return True
 
+    def prewarm(self, item: MediaItem) -> None:
+        """
+        Schedule the header and footer of a MediaItem's media file to be fetched into the cache, pinned.
+
+        This lets the first open and probe by a player or media server scan be served locally.
+        Returns immediately; the fetch happens in the background on the FUSE event loop.
+
+        Args:
+            item: MediaItem whose media file to pre-warm
+        """
+
+        if not self.fs.cache_prewarm or self._trio_token is None:
+            return
+
+        if not (entry := item.media_entry) or not entry.original_filename:
+            return
+
+        try:
+            trio.from_thread.run_sync(
+                self.stream_nursery.start_soon,
+                self._prewarm_stream,
+                entry.original_filename,
+                entry.file_size,
+                trio_token=self._trio_token,
+            )
+        except trio.RunFinishedError:
+            # The FUSE loop is restarting or shutting down; there's nothing to warm
+            pass
+
+    async def _prewarm_stream(self, original_filename: str, file_size: int) -> None:
+        """Fetch a file's header and footer into the cache, pinned."""
+
+        # Prewarm holds the file's shared stream like an open file would,
+        # so a player opening the file meanwhile reuses its header and footer fetches.
+        fh = self._next_fh
+        self._next_fh = pyfuse3.FileHandleT(self._next_fh + 1)
+
+        async with self._prewarm_limiter:
+            try:
+                stream = await self._get_stream(
+                    path=original_filename,
+                    fh=fh,
+                    file_size=file_size,
+                    original_filename=original_filename,
+                )
+
+                await stream.prewarm()
+
+                logger.debug(f"Pre-warmed header and footer for {original_filename}")
+            except pyfuse3.FUSEError:
+                # The entry has no URL or provider yet; there's nothing to warm
+                pass
+            except Exception as e:
+                logger.warning(f"Failed to pre-warm {original_filename}: {e}")
+            finally:
+                await self._detach_from_stream(fh)
+
     def remove(self, item: MediaItem) -> bool:
         """
         Remove a MediaItem from the VFS.
@@ -708,16 +963,20 @@ class RivenVFS(pyfuse3.Operations):
 
     def _sync_full(self) -> None:
         """
-        Full VFS sync: Re-match all entries and rebuild entire VFS tree.
+        Full VFS sync: Re-match all entries and reconcile the VFS tree with the database.
 
         Steps:
         1. Check if profiles changed (skip if not)
-        2. Re-match all entries against current library profiles
-        3. Clear VFS tree
-        4. Re-register all entries using add()
-        5. Batch invalidate all collected inodes
+        2. Re-match all entries against current library profiles, and compute
+           the files that should be registered, from a single query
+        3. Diff against the current tree: remove stale paths, add new ones and update
+           changed files in place, so unchanged nodes keep their inodes
+        4. Batch invalidate only the inodes touched by the diff
         """
 
+        from sqlalchemy.orm import joinedload
+
+        from program.media.item import MediaItem
         from program.media.media_entry import MediaEntry
         from program.services.library_profile_matcher import LibraryProfileMatcher
 
@@ -746,17 +1005,21 @@ class RivenVFS(pyfuse3.Operations):
 
         matcher = LibraryProfileMatcher()
 
-        # Step 1: Re-match all entries against current library profiles and collect item IDs
-        item_ids = list[int]()
+        # Step 1: Re-match all entries and collect the files every item should expose
+        desired_files = dict[str, RegisteredFile]()
         rematched_count = 0
 
         with db_session() as session:
             entries = (
-                session.query(MediaEntry).filter(MediaEntry.is_directory == False).all()
+                session.query(MediaEntry)
+                .options(joinedload(MediaEntry.media_item))
+                .filter(MediaEntry.is_directory == False)
+                .all()
             )
 
+            items = dict[int, MediaItem]()
+
             for entry in entries:
-                # Get the MediaItem for this entry to re-match profiles
                 item = entry.media_item
 
                 if not item:
@@ -774,60 +1037,70 @@ class RivenVFS(pyfuse3.Operations):
                     entry.library_profiles = new_profiles
                     rematched_count += 1
 
-                # Store item ID for later registration (avoid duplicates)
-                if item.id not in item_ids:
-                    item_ids.append(item.id)
-
-            session.commit()
+                items.setdefault(item.id, item)
 
             logger.debug(f"Re-matched {rematched_count} entries with updated profiles")
 
-        # Step 2: Clear VFS tree and rebuild from scratch
-        logger.debug("Clearing VFS tree for rebuild")
+            for item in items.values():
+                try:
+                    self._collect_registered_files(item, desired_files)
+                except Exception as e:
+                    logger.exception(f"Failed to resolve paths for item {item.id}: {e}")
 
-        with self._tree_lock:
-            # Create new root node
-            self._root = VFSRoot()
-            self._inode_to_node = {pyfuse3.ROOT_INODE: self._root}
+            session.commit()
 
-        # Clear pending invalidations for this sync
-        self._pending_invalidations.clear()
+        # Step 2: Diff against the current tree
+        with self._tree_lock:
+            current_files = {
+                node.path: node
+                for node in self._inode_to_node.values()
+                if isinstance(node, VFSFile)
+            }
 
-        # Step 3: Re-register all items
-        logger.debug(f"Re-registering {len(item_ids)} items")
+        removed_paths = [path for path in current_files if path not in desired_files]
+        added_paths = [path for path in desired_files if path not in current_files]
+        changed_count = 0
 
-        registered_count = 0
+        # Step 3: Apply the diff
+        for path in removed_paths:
+            self._unregister_clean_path(path)
 
-        with db_session() as session:
-            from program.media.item import MediaItem
+        with self._tree_lock:
+            for path, node in current_files.items():
+                registered_file = desired_files.get(path)
 
-            items = session.query(MediaItem).filter(MediaItem.id.in_(item_ids)).all()
-            item_map = {item.id: item for item in items}
+                if not registered_file or not self._update_file_node(
+                    node, registered_file
+                ):
+                    continue
 
-            for item_id in item_ids:
-                try:
-                    item = item_map.get(item_id)
+                # Same path and inode, different content; drop the kernel's cached pages too
+                self._pending_invalidations.add(node.inode)
+                changed_count += 1
 
-                    if not item:
-                        continue
+        for path in added_paths:
+            self._register_clean_path(clean_path=path, **desired_files[path])
 
-                    # Use add() to register the item (handles both media and subtitles)
-                    if self.add(item):
-                        registered_count += 1
-                except Exception as e:
-                    logger.exception(f"Failed to register item {item_id}: {e}")
-            if registered_count > 0:
-                session.commit()
+        # Directories of disabled or removed library profiles are no longer persistent
+        with self._tree_lock:
+            self._prune_empty_directories(self._root)
 
-        logger.log("VFS", f"Full sync complete: re-registered {registered_count} items")
+        logger.log(
+            "VFS",
+            f"Full sync complete: {len(added_paths)} added, {len(removed_paths)} removed, "
+            f"{changed_count} changed, {len(desired_files) - len(added_paths) - changed_count} unchanged",
+        )
 
         # Step 4: Ensure persistent library profile directories exist
         # This creates /movies, /shows, and /{profile}/movies, /{profile}/shows
         # These directories are never pruned, even when empty
         self._ensure_library_profile_directories()
 
-        # Step 5: Batch invalidate all collected inodes
-        # This is critical: reduces syscalls from O(n) to O(1)
+        self._prune_persisted_inodes()
+        self._persist_inodes()
+
+        # Step 5: Batch invalidate the inodes touched by the diff
+        # This is critical: reduces syscalls from O(n) to O(changes)
         if self._pending_invalidations:
             invalidated_count = 0
             try:
@@ -848,13 +1121,110 @@ class RivenVFS(pyfuse3.Operations):
                 self._pending_invalidations.clear()
 
         # Invalidate root directory
-        if registered_count > 0:
+        if added_paths or removed_paths:
             try:
                 pyfuse3.invalidate_inode(pyfuse3.ROOT_INODE, attr_only=False)
                 logger.debug(f"Invalidated root directory cache after sync")
             except Exception as e:
                 logger.trace(f"Could not invalidate root directory: {e}")
 
+    def _collect_registered_files(
+        self,
+        item: MediaItem,
+        registered_files: dict[str, RegisteredFile],
+    ) -> None:
+        """
+        Collect the files an item should expose in the VFS, keyed by normalized path.
+
+        Mirrors add(): the item's MediaEntry at all of its VFS paths, plus its subtitles alongside each of them.
+        """
+
+        if not (entry := item.media_entry):
+            return
+
+        video_paths = entry.get_all_vfs_paths()
+
+        if not video_paths:
+            return
+
+        entry.available_in_vfs = True
+
+        for path in video_paths:
+            registered_files.setdefault(
+                self._normalize_path(path),
+                RegisteredFile(
+                    original_filename=entry.original_filename,
+                    file_size=entry.file_size,
+                    created_at=entry.created_at.isoformat(),
+                    updated_at=entry.updated_at.isoformat(),
+                    entry_type="media",
+                ),
+            )
+
+        for subtitle in item.subtitles:
+            for video_path in video_paths:
+                registered_files.setdefault(
+                    self._normalize_path(
+                        self._subtitle_path(video_path, subtitle.language)
+                    ),
+                    RegisteredFile(
+                        original_filename=f"subtitle:{subtitle.parent_original_filename}:{subtitle.language}",
+                        file_size=subtitle.file_size,
+                        created_at=subtitle.created_at.isoformat(),
+                        updated_at=subtitle.updated_at.isoformat(),
+                        entry_type="subtitle",
+                    ),
+                )
+
+            subtitle.available_in_vfs = True
+
+    def _prune_empty_directories(self, directory: VFSDirectory) -> bool:
+        """
+        Remove empty, non-persistent directories below a directory. Callers must hold the tree lock.
+
+        Returns:
+            True if the directory itself is now empty
+        """
+
+        for child in list(directory.children.values()):
+            if not isinstance(child, VFSDirectory):
+                continue
+
+            if self._prune_empty_directories(child) and not (
+                self._is_persistent_directory(child.path)
+            ):
+                directory.remove_child(child.name)
+                self._inode_to_node.pop(child.inode, None)
+                self._pending_invalidations.add(directory.inode)
+
+        return not directory.children
+
+    @staticmethod
+    def _update_file_node(node: VFSFile, registered_file: RegisteredFile) -> bool:
+        """
+        Update a file node's metadata in place. Callers must hold the tree lock.
+
+        Returns:
+            True if anything changed
+        """
+
+        changed = node.update(**registered_file)
+
+        if changed and node.parent:
+            # Its attributes are cached in the parent's listing
+            node.parent.invalidate_listing()
+
+        return changed
+
+    @staticmethod
+    def _subtitle_path(video_path: str, language: str) -> str:
+        """Get the path of a subtitle registered alongside a video."""
+
+        directory = os.path.dirname(video_path)
+        name_without_ext = os.path.splitext(os.path.basename(video_path))[0]
+
+        return os.path.join(directory, f"{name_without_ext}.{language}.srt")
+
     def _sync_individual(self, item: "MediaItem") -> None:
         """
         Individual sync: Re-register a specific item (unregister + register).
@@ -975,7 +1345,6 @@ class RivenVFS(pyfuse3.Operations):
 
         from program.media.media_entry import MediaEntry
         from program.media.subtitle_entry import SubtitleEntry
-        import os
 
         if isinstance(entry, MediaEntry):
             # Register MediaEntry (video file)
@@ -1009,12 +1378,7 @@ class RivenVFS(pyfuse3.Operations):
 
             for video_path in video_paths:
                 # Generate subtitle path alongside video
-                directory = os.path.dirname(video_path)
-                filename = os.path.basename(video_path)
-                name_without_ext = os.path.splitext(filename)[0]
-                subtitle_path = os.path.join(
-                    directory, f"{name_without_ext}.{language}.srt"
-                )
+                subtitle_path = self._subtitle_path(video_path, language)
 
                 if self._register_clean_path(
                     clean_path=subtitle_path,
@@ -1051,7 +1415,6 @@ class RivenVFS(pyfuse3.Operations):
         """
         from program.media.media_entry import MediaEntry
         from program.media.subtitle_entry import SubtitleEntry
-        import os
 
         if isinstance(entry, MediaEntry):
             # Unregister MediaEntry (video file) by original_filename
@@ -1073,12 +1436,7 @@ class RivenVFS(pyfuse3.Operations):
 
             for video_path in video_paths:
                 # Generate subtitle path alongside video
-                directory = os.path.dirname(video_path)
-                filename = os.path.basename(video_path)
-                name_without_ext = os.path.splitext(filename)[0]
-                subtitle_path = os.path.join(
-                    directory, f"{name_without_ext}.{language}.srt"
-                )
+                subtitle_path = self._subtitle_path(video_path, language)
 
                 if self._unregister_clean_path(subtitle_path):
                     unregistered_paths.append(subtitle_path)
@@ -1306,36 +1664,36 @@ class RivenVFS(pyfuse3.Operations):
             return "/"
         return "/".join(path.rstrip("/").split("/")[:-1]) or "/"
 
-    def _list_directory_cached(self, path: str) -> list["CachedDirectoryEntry"] | None:
+    def _get_directory_listing(
+        self, node: VFSDirectory
+    ) -> list[tuple[pyfuse3.FileNameT, pyfuse3.EntryAttributes]]:
         """
-        List directory contents using VFS tree for O(1) lookups.
+        Get a directory's readdir entries, including "." and "..".
 
-        The VFS tree is built during sync() and provides
-        instant directory listings without any database queries.
+        Names are encoded and attributes computed once, then cached on the node until
+        its children change, so each readdir page only costs the entries it returns.
 
-        Args:
-            path: NORMALIZED VFS path (caller must normalize)
+        Callers must hold the tree lock.
         """
 
-        with self._tree_lock:
-            # Get node from tree
-            node = self._get_node_by_path(path)
+        if node.listing is not None:
+            return node.listing
 
-            if node is None or not isinstance(node, VFSDirectory):
-                return None
+        parent = node.parent or node
 
-            # Build result list from node's children - no database queries!
-            children = list[CachedDirectoryEntry]()
+        listing = [
+            (pyfuse3.FileNameT(b"."), self._get_attributes(node)),
+            (pyfuse3.FileNameT(b".."), self._get_attributes(parent)),
+        ]
 
-            for name, child in node.children.items():
-                children.append(
-                    CachedDirectoryEntry(
-                        name=name,
-                        is_directory=isinstance(child, VFSDirectory),
-                    )
-                )
+        for name, child in node.children.items():
+            listing.append(
+                (pyfuse3.FileNameT(name.encode("utf-8")), self._get_attributes(child))
+            )
+
+        node.listing = listing
 
-            return children
+        return listing
 
     def _get_path_from_inode(self, inode: int) -> str:
         """Get path from inode number using the VFS tree."""
@@ -1440,90 +1798,59 @@ class RivenVFS(pyfuse3.Operations):
     ) -> pyfuse3.EntryAttributes:
         """Get file/directory attributes."""
         try:
-            path = self._get_path_from_inode(inode)
-
-            attrs = pyfuse3.EntryAttributes()
-            attrs.st_ino = inode
-            attrs.generation = 0
-            attrs.entry_timeout = 300
-            attrs.attr_timeout = 300
-            attrs.st_uid = os.getuid() if hasattr(os, "getuid") else 0
-            attrs.st_gid = os.getgid() if hasattr(os, "getgid") else 0
-            # Hint larger block size to kernel
-            attrs.st_blksize = 128 * 1024
-            attrs.st_blocks = 1
-
-            import stat
-
-            # Special case for root directory
-            if path == "/":
-                attrs.st_mode = pyfuse3.ModeT(stat.S_IFDIR | 0o755)
-                attrs.st_nlink = 2
-                attrs.st_size = 0
-                # Use current time for root directory
-                now_ns = self._current_time_ns()
-                attrs.st_atime_ns = now_ns
-                attrs.st_mtime_ns = now_ns
-                attrs.st_ctime_ns = now_ns
-                return attrs
-
-            # For other paths, get node from tree
-            node = self._get_node_by_path(path)
-            if node is None:
-                raise pyfuse3.FUSEError(errno.ENOENT)
+            with self._tree_lock:
+                node = self._inode_to_node.get(inode)
 
-            # Check if it's a directory
-            if isinstance(node, VFSDirectory):
-                # This is a virtual directory (e.g., /kids, /anime, /movies)
-                attrs.st_mode = pyfuse3.ModeT(stat.S_IFDIR | 0o755)
-                attrs.st_nlink = 2
-                attrs.st_size = 0
-                now_ns = self._current_time_ns()
-                attrs.st_atime_ns = now_ns
-                attrs.st_mtime_ns = now_ns
-                attrs.st_ctime_ns = now_ns
-                return attrs
-
-            # It's a file - use cached metadata from node (NO DATABASE QUERY!)
-            # Metadata was populated during sync()
-
-            if not isinstance(node, VFSFile):
-                logger.error(
-                    f"Node type mismatch for inode={inode} path={path}. Expected VFSFile, got {type(node).__name__}"
-                )
-                raise pyfuse3.FUSEError(errno.ENOENT)
+                if node is None:
+                    raise pyfuse3.FUSEError(errno.ENOENT)
 
-            # Parse timestamps from cached metadata
-            if node.created_at:
-                from datetime import datetime
+                return self._get_attributes(node)
+        except pyfuse3.FUSEError:
+            raise
+        except Exception:
+            logger.exception(f"getattr error for inode={inode}")
+            raise pyfuse3.FUSEError(errno.EIO)
 
-                try:
-                    created_dt = datetime.fromisoformat(node.created_at)
-                    created_ns = int(created_dt.timestamp() * 1_000_000_000)
-                except Exception:
-                    created_ns = self._current_time_ns()
-            else:
-                created_ns = self._current_time_ns()
+    def _get_attributes(self, node: VFSNode) -> pyfuse3.EntryAttributes:
+        """
+        Get the attributes of a node, built once from its cached metadata without any database query.
 
-            if node.updated_at:
-                from datetime import datetime
+        Callers must hold the tree lock.
+        """
 
-                try:
-                    updated_dt = datetime.fromisoformat(node.updated_at)
-                    updated_ns = int(updated_dt.timestamp() * 1_000_000_000)
-                except Exception:
-                    updated_ns = created_ns
-            else:
-                updated_ns = created_ns
+        if node.attributes is not None:
+            return node.attributes
+
+        attrs = pyfuse3.EntryAttributes()
+        attrs.st_ino = node.inode
+        attrs.generation = 0
+        attrs.entry_timeout = 300
+        attrs.attr_timeout = 300
+        attrs.st_uid = os.getuid() if hasattr(os, "getuid") else 0
+        attrs.st_gid = os.getgid() if hasattr(os, "getgid") else 0
+        # Hint larger block size to kernel
+        attrs.st_blksize = 128 * 1024
+        attrs.st_blocks = 1
+
+        import stat
 
+        # Check if it's a directory
+        if isinstance(node, VFSDirectory):
+            # This is the root or a virtual directory (e.g., /kids, /anime, /movies)
+            attrs.st_mode = pyfuse3.ModeT(stat.S_IFDIR | 0o755)
+            attrs.st_nlink = 2
+            attrs.st_size = 0
+            now_ns = self._current_time_ns()
+            attrs.st_atime_ns = now_ns
+            attrs.st_mtime_ns = now_ns
+            attrs.st_ctime_ns = now_ns
+        elif isinstance(node, VFSFile):
             # Set timestamps: ctime = creation, mtime = modification, atime = access (use mtime)
-            attrs.st_ctime_ns = created_ns
-            attrs.st_mtime_ns = updated_ns
-            attrs.st_atime_ns = (
-                updated_ns  # Use mtime for atime to avoid constant updates
-            )
+            attrs.st_ctime_ns = node.created_at_ns
+            attrs.st_mtime_ns = node.updated_at_ns
+            # Use mtime for atime to avoid constant updates
+            attrs.st_atime_ns = node.updated_at_ns
 
-            # We already know it's a file from the VFSDirectory check above
             attrs.st_mode = pyfuse3.ModeT(stat.S_IFREG | 0o644)
             attrs.st_nlink = 1
             size = node.file_size
@@ -1532,13 +1859,15 @@ class RivenVFS(pyfuse3.Operations):
                 size = 1337 * 1024 * 1024  # Default size when unknown
 
             attrs.st_size = size
+        else:
+            logger.error(
+                f"Node type mismatch for inode={node.inode} path={node.path}. Expected VFSFile, got {type(node).__name__}"
+            )
+            raise pyfuse3.FUSEError(errno.ENOENT)
 
-            return attrs
-        except pyfuse3.FUSEError:
-            raise
-        except Exception:
-            logger.exception(f"getattr error for inode={inode}")
-            raise pyfuse3.FUSEError(errno.EIO)
+        node.attributes = attrs
+
+        return attrs
 
     async def lookup(
         self,
@@ -1617,43 +1946,19 @@ class RivenVFS(pyfuse3.Operations):
     ) -> None:
         """Read directory entries."""
         try:
-            path = self._get_path_from_inode(fh)
-            entries = self._list_directory_cached(path)
-
-            if not entries:
-                raise pyfuse3.FUSEError(errno.ENOENT)
-
-            # Build directory listing
             with self._tree_lock:
                 node = self._inode_to_node.get(fh)
-                parent_inode = (
-                    node.parent.inode if node and node.parent else pyfuse3.ROOT_INODE
-                )
-
-                items = [(b".", pyfuse3.InodeT(fh)), (b"..", parent_inode)]
-
-                for entry in entries:
-                    name_bytes = entry["name"].encode("utf-8")
 
-                    # Get child node from tree
-                    if isinstance(node, VFSDirectory):
-                        child_node = node.get_child(entry["name"])
+                if not isinstance(node, VFSDirectory):
+                    raise pyfuse3.FUSEError(errno.ENOENT)
 
-                        if child_node and child_node.inode:
-                            items.append((name_bytes, child_node.inode))
+                listing = self._get_directory_listing(node)
 
             # Send directory entries starting from offset
-            for idx in range(start_id, len(items)):
-                name_bytes, child_ino = items[idx]
-
-                if child_ino:
-                    attrs = await self.getattr(child_ino)
-                else:
-                    attrs = pyfuse3.EntryAttributes()
+            for idx in range(start_id, len(listing)):
+                name, attrs = listing[idx]
 
-                if not pyfuse3.readdir_reply(
-                    token, pyfuse3.FileNameT(name_bytes), attrs, idx + 1
-                ):
+                if not pyfuse3.readdir_reply(token, name, attrs, idx + 1):
                     break
         except pyfuse3.FUSEError:
             raise
@@ -1683,12 +1988,15 @@ class RivenVFS(pyfuse3.Operations):
                 path = node.path
                 entry_type = node.entry_type
 
-            # Only validate the CDN URL for media entries; subtitles are read directly from the database
-            if entry_type == "media":
+            # Only validate the CDN URL for media entries; subtitles are read directly from the database.
+            # Validation may instead be deferred to the first read, so opens return immediately.
+            validate_on_open = self.fs.cdn_url_validation == "open"
+
+            if entry_type == "media" and validate_on_open:
                 try:
                     logger.trace(f"Validating CDN URL for {node.path}...")
 
-                    DebridCDNUrl.from_filename(node.original_filename).validate()
+                    await self._cdn_url_validator.validate(node.original_filename)
                 except DebridServiceLinkUnavailable:
                     logger.warning(
                         f"Dead link for {node.path}; attempting to download a working one..."
@@ -1752,6 +2060,7 @@ class RivenVFS(pyfuse3.Operations):
                 "inode": inode,  # Store inode to resolve node/metadata later
                 "last_read_end": 0,
                 "subtitle_content": None,
+                "cdn_url_validated": entry_type != "media" or validate_on_open,
             }
 
             logger.trace(f"open: path={path} fh={fh}")
@@ -1760,10 +2069,18 @@ class RivenVFS(pyfuse3.Operations):
         except pyfuse3.FUSEError:
             raise
 
-    async def read(self, fh: pyfuse3.FileHandleT, off: int, size: int) -> bytes:
+    async def read(
+        self,
+        fh: pyfuse3.FileHandleT,
+        off: int,
+        size: int,
+    ) -> bytes | memoryview:
         """
         Read data from file at offset.
 
+        Cached media data may be returned as a zero-copy view into a memory-mapped cache chunk,
+        which pyfuse3 passes straight into the FUSE reply.
+
         Implements efficient streaming with:
         - Fixed-size chunk fetching (32MB default)
         - Concurrent chunk fetching for cache misses
@@ -1871,6 +2188,16 @@ class RivenVFS(pyfuse3.Operations):
             if request_end < request_start:
                 return b""
 
+            if not handle_info["cdn_url_validated"]:
+                try:
+                    await self._cdn_url_validator.validate(original_filename)
+                except DebridServiceLinkUnavailable as e:
+                    logger.warning(f"Dead link for {path}: {e}")
+
+                    raise pyfuse3.FUSEError(errno.ENOENT) from e
+
+                handle_info["cdn_url_validated"] = True
+
             stream = await self._get_stream(
                 path=path,
                 fh=fh,
@@ -1880,6 +2207,7 @@ class RivenVFS(pyfuse3.Operations):
 
             try:
                 return await stream.read(
+                    fh=fh,
                     request_start=request_start,
                     request_end=request_end,
                     request_size=request_size,
@@ -1900,6 +2228,9 @@ class RivenVFS(pyfuse3.Operations):
                         stream.build_log_message(f"{exc.__class__.__name__}: {exc}")
                     )
 
+                # Make the next open revalidate, rather than trust a URL that just failed
+                self._cdn_url_validator.invalidate(original_filename)
+
                 raise pyfuse3.FUSEError(errno.ENOENT) from e
             except* DebridServiceForbiddenException as e:
                 for exc in e.exceptions:
@@ -1984,12 +2315,7 @@ class RivenVFS(pyfuse3.Operations):
                         if node:
                             path = node.path
 
-                if path:
-                    stream_key = self._stream_key(path, fh)
-                    active_stream = self._active_streams.pop(stream_key, None)
-
-                    if active_stream:
-                        await active_stream.close()
+                await self._detach_from_stream(fh)
 
             logger.trace(f"release: fh={fh} path={path}")
         except pyfuse3.FUSEError:
@@ -2079,6 +2405,46 @@ class RivenVFS(pyfuse3.Operations):
             )
             raise pyfuse3.FUSEError(errno.EIO)
 
+    async def _detach_from_stream(self, fh: pyfuse3.FileHandleT) -> None:
+        """
+        Detach a file handle from its shared stream,
+        closing the stream once no handles are left reading from it.
+
+        Detaching waits for the handle's connection to stop, so it happens
+        outside the lock, which every open needs.
+        """
+
+        async with self._active_streams_lock:
+            attached = next(
+                (
+                    (stream_key, active_stream)
+                    for stream_key, active_stream in self._active_streams.items()
+                    if fh in active_stream.handles
+                ),
+                None,
+            )
+
+        if not attached:
+            return
+
+        stream_key, active_stream = attached
+
+        if await active_stream.detach(fh) > 0:
+            return
+
+        async with self._active_streams_lock:
+            # Another handle may have attached whilst detaching
+            is_unused = (
+                not active_stream.handles
+                and self._active_streams.get(stream_key) is active_stream
+            )
+
+            if is_unused:
+                self._active_streams.pop(stream_key)
+
+        if is_unused:
+            await active_stream.close()
+
     async def _get_stream(
         self,
         path: str,
@@ -2087,7 +2453,10 @@ class RivenVFS(pyfuse3.Operations):
         original_filename: str,
     ) -> MediaStream:
         """
-        Get the file handle's stream. If no stream exists, initialise it.
+        Get the shared stream for the file handle's original file. If no stream exists, initialise it.
+
+        Every file handle reading the same original file shares a single stream,
+        so concurrent readers (e.g. a transcoder and a scanner) reuse the same chunk fetches.
 
         Args:
             path: The path to stream.
@@ -2095,13 +2464,21 @@ class RivenVFS(pyfuse3.Operations):
             file_size: The size of the file to stream.
             original_filename: The original filename in the backend.
         Returns:
-            The MediaStream for the specified path and file handle.
+            The MediaStream for the specified original file, with the file handle attached.
         """
 
-        stream_key = self._stream_key(path, fh)
+        stream_key = original_filename
+        stream = self._active_streams.get(stream_key)
+
+        if stream and not stream.is_killed.value:
+            stream.attach(fh)
 
-        if stream_key not in self._active_streams:
-            async with self._active_streams_lock:
+            return stream
+
+        async with self._active_streams_lock:
+            stream = self._active_streams.get(stream_key)
+
+            if not stream or stream.is_killed.value:
                 # Get provider info and URL from database
                 entry_info = await trio.to_thread.run_sync(
                     lambda: self.vfs_db.get_entry_by_original_filename(
@@ -2113,13 +2490,16 @@ class RivenVFS(pyfuse3.Operations):
                     raise pyfuse3.FUSEError(errno.ENOENT)
 
                 self._active_streams[stream_key] = MediaStream(
-                    fh=fh,
                     file_size=file_size,
                     path=path,
                     original_filename=original_filename,
                     provider=entry_info.provider,
                     initial_url=entry_info.url,
+                    bitrate=entry_info.bitrate,
                     nursery=self.stream_nursery,
                 )
 
-        return self._active_streams[stream_key]
+            stream = self._active_streams[stream_key]
+            stream.attach(fh)
+
+        return stream
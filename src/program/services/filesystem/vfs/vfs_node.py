@@ -1,11 +1,23 @@
-from functools import cached_property
+import time
+from datetime import datetime
+
 import pyfuse3
 
-from dataclasses import dataclass
 from typing import Literal
 
 
-@dataclass
+def parse_timestamp_ns(timestamp: str | None) -> int | None:
+    """Parse an ISO timestamp into nanoseconds since the epoch, or None if missing or invalid."""
+
+    if not timestamp:
+        return None
+
+    try:
+        return int(datetime.fromisoformat(timestamp).timestamp() * 1_000_000_000)
+    except ValueError:
+        return None
+
+
 class VFSNode:
     """
     Represents a node (file or directory) in the VFS tree.
@@ -13,19 +25,37 @@ class VFSNode:
     This is the core data structure for the in-memory VFS tree, providing
     O(1) lookups and eliminating the need for path resolution.
 
+    Nodes use __slots__ to keep large trees compact, and cache their FUSE
+    attributes so getattr and lookup don't rebuild them on every call.
+
     Attributes:
         name: Name of this node (e.g., "Frozen.mkv" or "movies")
         inode: FUSE inode number assigned to this node
         parent: Reference to parent VFSDirectory (None for root)
+        attributes: Cached FUSE attributes, None until built or after the node changed
     """
 
-    name: str
-    inode: pyfuse3.InodeT
-    parent: "VFSDirectory | None"
+    __slots__ = ("name", "inode", "parent", "attributes", "_path")
+
+    def __init__(
+        self,
+        name: str,
+        inode: pyfuse3.InodeT,
+        parent: "VFSDirectory | None",
+    ) -> None:
+        self.name = name
+        self.inode = inode
+        self.parent = parent
+        self.attributes: pyfuse3.EntryAttributes | None = None
+        self._path: str | None = None
 
-    @cached_property
+    @property
     def path(self) -> str:
-        """Get the full VFS path for this node by walking up to root."""
+        """Get the full VFS path for this node by walking up to root. Computed once."""
+
+        if self._path is not None:
+            return self._path
+
         if self.parent is None:
             return "/"
 
@@ -36,13 +66,11 @@ class VFSNode:
             parts.append(current.name)
             current = current.parent
 
-        if not parts:
-            return "/"
+        self._path = "/" + "/".join(reversed(parts))
 
-        return "/" + "/".join(reversed(parts))
+        return self._path
 
 
-@dataclass
 class VFSDirectory(VFSNode):
     """
     Represents a directory node in the VFS tree.
@@ -51,22 +79,45 @@ class VFSDirectory(VFSNode):
 
     Attributes:
         parent: Reference to parent VFSDirectory
+        children: Child nodes by name
+        listing: Cached readdir entries, dropped whenever the directory's children change
     """
 
-    @property
-    def children(self) -> dict[str, VFSNode]:
-        """Get children dict."""
+    __slots__ = ("children", "listing")
+
+    def __init__(
+        self,
+        name: str,
+        inode: pyfuse3.InodeT,
+        parent: "VFSDirectory | None",
+    ) -> None:
+        super().__init__(name=name, inode=inode, parent=parent)
+
+        self.children = dict[str, VFSNode]()
+        self.listing: list[tuple[pyfuse3.FileNameT, pyfuse3.EntryAttributes]] | None = (
+            None
+        )
+
+    def invalidate_listing(self) -> None:
+        """
+        Drop the cached readdir entries after a child was added, removed or changed.
+
+        The directory's own attributes are dropped too, so its times are those of the change,
+        along with the parent's listing, which holds them.
+        """
 
-        if not hasattr(self, "_children"):
-            self._children = dict[str, VFSNode]()
+        self.listing = None
+        self.attributes = None
 
-        return self._children
+        if self.parent is not None:
+            self.parent.listing = None
 
     def add_child(self, child: VFSNode) -> None:
         """Add a child node to this directory."""
 
         child.parent = self
         self.children[child.name] = child
+        self.invalidate_listing()
 
     def remove_child(self, name: str) -> VFSNode | None:
         """Remove and return a child node by name."""
@@ -74,6 +125,7 @@ class VFSDirectory(VFSNode):
 
         if child:
             child.parent = None
+            self.invalidate_listing()
 
         return child
 
@@ -91,7 +143,6 @@ class VFSDirectory(VFSNode):
         )
 
 
-@dataclass
 class VFSRoot(VFSDirectory):
     """
     Represents the root node of the VFS tree.
@@ -102,6 +153,8 @@ class VFSRoot(VFSDirectory):
         parent: None (root has no parent)
     """
 
+    __slots__ = ()
+
     def __init__(self) -> None:
         super().__init__(
             name="",
@@ -109,7 +162,7 @@ class VFSRoot(VFSDirectory):
             parent=None,
         )
 
-    @cached_property
+    @property
     def path(self) -> Literal["/"]:
         """
         Skips expensive path calculation for root node.
@@ -120,7 +173,6 @@ class VFSRoot(VFSDirectory):
         return "/"
 
 
-@dataclass
 class VFSFile(VFSNode):
     """
     Represents a file node in the VFS tree.
@@ -135,18 +187,18 @@ class VFSFile(VFSNode):
 
         # Cached file metadata
         file_size: File size in bytes
-        created_at: Creation timestamp as ISO string
-        updated_at: Modification timestamp as ISO string
+        created_at_ns: Creation time in nanoseconds since the epoch
+        updated_at_ns: Modification time in nanoseconds since the epoch
         entry_type: Entry type ("media" or "subtitle")
     """
 
-    original_filename: str
-
-    # Cached metadata for files (eliminates database queries)
-    file_size: int
-    created_at: str
-    updated_at: str
-    entry_type: Literal["media", "subtitle"]
+    __slots__ = (
+        "original_filename",
+        "file_size",
+        "created_at_ns",
+        "updated_at_ns",
+        "entry_type",
+    )
 
     def __init__(
         self,
@@ -168,9 +220,62 @@ class VFSFile(VFSNode):
 
         self.original_filename = original_filename
         self.file_size = file_size
-        self.created_at = created_at
-        self.updated_at = updated_at
         self.entry_type = entry_type
+        self._set_timestamps(created_at, updated_at)
+
+    def update(
+        self,
+        *,
+        original_filename: str,
+        file_size: int,
+        created_at: str,
+        updated_at: str,
+        entry_type: Literal["media", "subtitle"],
+    ) -> bool:
+        """
+        Update the file's metadata in place, dropping its cached attributes if anything changed.
+
+        Returns:
+            True if anything changed
+        """
+
+        previous = (
+            self.original_filename,
+            self.file_size,
+            self.created_at_ns,
+            self.updated_at_ns,
+            self.entry_type,
+        )
+
+        self.original_filename = original_filename
+        self.file_size = file_size
+        self.entry_type = entry_type
+        self._set_timestamps(created_at, updated_at)
+
+        changed = previous != (
+            self.original_filename,
+            self.file_size,
+            self.created_at_ns,
+            self.updated_at_ns,
+            self.entry_type,
+        )
+
+        if changed:
+            self.attributes = None
+
+        return changed
+
+    def _set_timestamps(self, created_at: str, updated_at: str) -> None:
+        created_at_ns = parse_timestamp_ns(created_at)
+
+        if created_at_ns is None:
+            # Keep the time assigned before, so an unparseable timestamp doesn't count as a change
+            created_at_ns = getattr(self, "created_at_ns", None) or time.time_ns()
+
+        updated_at_ns = parse_timestamp_ns(updated_at)
+
+        self.created_at_ns = created_at_ns
+        self.updated_at_ns = created_at_ns if updated_at_ns is None else updated_at_ns
 
     def __repr__(self) -> str:
         return (
@@ -179,8 +284,8 @@ class VFSFile(VFSNode):
             f"inode={self.inode}, "
             f"original_filename={self.original_filename!r}, "
             f"file_size={self.file_size}, "
-            f"created_at={self.created_at!r}, "
-            f"updated_at={self.updated_at!r}, "
+            f"created_at_ns={self.created_at_ns}, "
+            f"updated_at_ns={self.updated_at_ns}, "
             f"entry_type={self.entry_type!r}"
             ")"
         )
@@ -1,11 +1,13 @@
+import asyncio
 import threading
-from collections.abc import Generator
+from collections.abc import Callable, Generator
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from queue import Queue, Empty
 
 
 from loguru import logger
+from RTN import Torrent
 
 from program.core.runner import MediaItemGenerator, Runner, RunnerResult
 from program.media.item import MediaItem
@@ -19,11 +21,18 @@ from program.services.scrapers.mediafusion import Mediafusion
 from program.services.scrapers.orionoid import Orionoid
 from program.services.scrapers.prowlarr import Prowlarr
 from program.services.scrapers.rarbg import Rarbg
-from program.services.scrapers.shared import parse_results
+from program.services.scrapers.scrape_loop import scrape_loop
+from program.services.scrapers.season_results import season_results
+from program.services.scrapers.shared import (
+    keep_best_torrents,
+    parse_results,
+    rank_results,
+)
 from program.services.scrapers.torrentio import Torrentio
 from program.services.scrapers.zilean import Zilean
 from program.settings import settings_manager
 from program.settings.models import Observable, ScraperModel
+from program.utils.concurrency import provider_limiter
 
 
 class Scraping(Runner[ScraperModel, ScraperService[Observable]]):
@@ -128,7 +137,16 @@ class Scraping(Runner[ScraperModel, ScraperService[Observable]]):
         def run_service(svc: "ScraperService[Observable]", item: MediaItem) -> None:
             """Run a single service and update the results."""
 
-            service_results = svc.run(item)
+            def scrape_service() -> dict[str, str]:
+                with provider_limiter.limit(svc.key):
+                    return svc.run(item)
+
+            if manual:
+                service_results = scrape_service()
+            else:
+                service_results = season_results.get_or_scrape(
+                    svc.key, item, scrape_service
+                )
 
             with results_lock:
                 try:
@@ -138,22 +156,31 @@ class Scraping(Runner[ScraperModel, ScraperService[Observable]]):
                         f"Error updating results for {svc.__class__.__name__}: {e}"
                     )
 
-        with ThreadPoolExecutor(
-            thread_name_prefix="ScraperService_",
-            max_workers=max(1, len(self.initialized_services)),
-        ) as executor:
-            futures = {
-                executor.submit(run_service, service, item): service.key
-                for service in self.initialized_services
-            }
+        def add_results(_service_key: str, service_results: dict[str, str]) -> None:
+            with results_lock:
+                results.update(service_results)
 
-            for future in as_completed(futures):
-                try:
-                    future.result()
-                except Exception as e:
-                    logger.error(
-                        f"Exception occurred while running service {futures[future]}: {e}"
-                    )
+        if settings_manager.settings.scraping.async_scraping:
+            scrape_loop.run(
+                self._scrape_async(item, add_results, share_season_results=not manual)
+            )
+        else:
+            with ThreadPoolExecutor(
+                thread_name_prefix="ScraperService_",
+                max_workers=max(1, len(self.initialized_services)),
+            ) as executor:
+                futures = {
+                    executor.submit(run_service, service, item): service.key
+                    for service in self.initialized_services
+                }
+
+                for future in as_completed(futures):
+                    try:
+                        future.result()
+                    except Exception as e:
+                        logger.error(
+                            f"Exception occurred while running service {futures[future]}: {e}"
+                        )
 
         if not results:
             logger.log("NOT_FOUND", f"No streams to process for {item.log_string}")
@@ -182,23 +209,29 @@ class Scraping(Runner[ScraperModel, ScraperService[Observable]]):
     ) -> Generator[tuple[str, dict[str, Stream]], None, None]:
         """Scrape an item and yield results incrementally as each scraper finishes.
 
+        Only the results a service returned that no earlier service did are ranked,
+        then merged with those ranked so far and sorted, respecting the bucket limit.
+
         Args:
             item: The media item to scrape.
             manual: If True, bypass content filters for manual scraping.
 
         Yields:
-            Tuples of (service_name, parsed_streams_dict) as each service completes.
+            Tuples of (service_name, new_streams_dict) as each service completes,
+            where new_streams_dict holds the streams kept that weren't yielded before, best first.
         """
         results_queue: Queue[tuple[str, dict[str, str]]] = Queue()
-        all_raw_results = dict[str, str]()
-        results_lock = threading.RLock()
+        seen_infohashes = set[str]()
+        ranked_torrents = dict[str, Torrent]()
+        yielded_infohashes = set[str]()
 
         def run_service_streaming(
             svc: "ScraperService[Observable]", item: MediaItem
         ) -> None:
             """Run a single service and put results in the queue."""
             try:
-                service_results = svc.run(item)
+                with provider_limiter.limit(svc.key):
+                    service_results = svc.run(item)
                 if service_results:
                     results_queue.put((svc.key, service_results))
                 else:
@@ -207,34 +240,41 @@ class Scraping(Runner[ScraperModel, ScraperService[Observable]]):
                 logger.error(f"Error running {svc.key}: {e}")
                 results_queue.put((svc.key, {}))
 
-        with ThreadPoolExecutor(
-            thread_name_prefix="ScraperServiceStreaming_",
-            max_workers=max(1, len(self.initialized_services)),
-        ) as executor:
-            futures = {
-                executor.submit(run_service_streaming, service, item): service.key
-                for service in self.initialized_services
-            }
+        def collect_results() -> Generator[tuple[str, dict[str, Stream]], None, None]:
+            """Rank and yield each service's results as they arrive."""
 
             services_completed = 0
-            total_services = len(futures)
+            total_services = len(self.initialized_services)
 
             while services_completed < total_services:
                 try:
                     service_name, raw_results = results_queue.get(timeout=60.0)
                     services_completed += 1
 
-                    if raw_results:
-                        with results_lock:
-                            all_raw_results.update(raw_results)
+                    new_results = {
+                        infohash: raw_title
+                        for infohash, raw_title in raw_results.items()
+                        if infohash not in seen_infohashes
+                    }
 
-                        parsed_streams = parse_results(
-                            item,
-                            all_raw_results,
-                            manual=manual,
+                    if new_results:
+                        seen_infohashes.update(new_results)
+                        ranked_torrents.update(
+                            rank_results(item, new_results, manual=manual)
                         )
 
-                        yield (service_name, parsed_streams)
+                        new_streams = {
+                            infohash: Stream(torrent)
+                            for torrent in keep_best_torrents(
+                                ranked_torrents, manual=manual
+                            )
+                            if (infohash := torrent.infohash.lower())
+                            not in yielded_infohashes
+                        }
+
+                        yielded_infohashes.update(new_streams)
+
+                        yield (service_name, new_streams)
                     else:
                         yield (service_name, {})
 
@@ -242,6 +282,85 @@ class Scraping(Runner[ScraperModel, ScraperService[Observable]]):
                     logger.warning("Timeout waiting for scraper results")
                     break
 
+        if settings_manager.settings.scraping.async_scraping:
+            future = scrape_loop.submit(
+                self._scrape_async(
+                    item,
+                    lambda service_key, service_results: results_queue.put(
+                        (service_key, service_results)
+                    ),
+                    share_season_results=False,
+                )
+            )
+
+            try:
+                yield from collect_results()
+            finally:
+                # Stop scrapers still running if the consumer stopped early
+                future.cancel()
+        else:
+            with ThreadPoolExecutor(
+                thread_name_prefix="ScraperServiceStreaming_",
+                max_workers=max(1, len(self.initialized_services)),
+            ) as executor:
+                for service in self.initialized_services:
+                    executor.submit(run_service_streaming, service, item)
+
+                yield from collect_results()
+
+    async def _scrape_async(
+        self,
+        item: MediaItem,
+        on_results: Callable[[str, dict[str, str]], None],
+        share_season_results: bool,
+    ) -> None:
+        """Run all services concurrently on the scrape loop, passing each one's results to `on_results`."""
+
+        async def run_service(svc: "ScraperService[Observable]") -> None:
+            try:
+                service_results = await self._run_service_async(
+                    svc, item, share_season_results
+                )
+            except TimeoutError:
+                logger.warning(
+                    f"{svc.key} didn't finish scraping {item.log_string} within {svc.deadline}s"
+                )
+                service_results = {}
+            except Exception as e:
+                logger.error(f"Exception occurred while running service {svc.key}: {e}")
+                service_results = {}
+
+            on_results(svc.key, service_results)
+
+        await asyncio.gather(
+            *(run_service(service) for service in self.initialized_services)
+        )
+
+    @staticmethod
+    async def _run_service_async(
+        svc: "ScraperService[Observable]",
+        item: MediaItem,
+        share_season_results: bool,
+    ) -> dict[str, str]:
+        """
+        Run a single service within its deadline.
+
+        Services without an async implementation run in one of the loop's worker threads,
+        which can't be interrupted: past the deadline, their results are discarded.
+        """
+
+        async def scrape_service() -> dict[str, str]:
+            async with provider_limiter.limit_async(svc.key):
+                async with asyncio.timeout(svc.deadline):
+                    return await svc.run_async(item)
+
+        if share_season_results:
+            return await season_results.get_or_scrape_async(
+                svc.key, item, scrape_service
+            )
+
+        return await scrape_service()
+
     def should_submit(self, item: MediaItem) -> bool:
         """Check if an item should be submitted for scraping."""
 
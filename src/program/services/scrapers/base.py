@@ -1,12 +1,11 @@
-import hashlib
+import asyncio
 from abc import abstractmethod
-from typing import Literal, TypeVar, cast
+from collections.abc import Iterable
+from typing import Literal, TypeVar
 
-import bencodepy
 from loguru import logger
 from program.media.item import Episode, MediaItem, Movie, Season, Show
-from program.utils.request import SmartSession
-from program.utils.torrent import extract_infohash
+from program.services.scrapers.infohash_resolver import infohash_resolver
 from program.core.runner import Runner
 from program.settings.models import Observable
 
@@ -23,6 +22,9 @@ class ScraperService(Runner[T, "ScraperService", dict[str, str]]):
 
     Optional attributes:
     - requires_imdb_id: whether the scraper needs an IMDb id to function
+
+    Implementations may also override `run_async` to scrape on the shared event loop
+    in async scraping mode; by default, `run` is called from a worker thread.
     """
 
     requires_imdb_id = False
@@ -41,6 +43,32 @@ class ScraperService(Runner[T, "ScraperService", dict[str, str]]):
     @abstractmethod
     def scrape(self, item: MediaItem) -> dict[str, str]: ...
 
+    async def run_async(self, item: MediaItem) -> dict[str, str]:
+        """
+        Scrape the item on the scrape loop.
+
+        Defaults to running `run` in one of the loop's worker threads; async implementations
+        make their requests with `scrape_loop.client` instead.
+        """
+
+        return await asyncio.to_thread(self.run, item)
+
+    @property
+    def deadline(self) -> float | None:
+        """
+        Seconds a scrape may take in async scraping mode before it's cancelled, or None for no limit.
+
+        Defaults to enough time for the configured request timeout on every attempt.
+        """
+
+        settings = getattr(self, "settings", None)
+        timeout = getattr(settings, "timeout", None)
+
+        if not timeout:
+            return None
+
+        return timeout * (getattr(settings, "retries", 0) + 1)
+
     @staticmethod
     def get_stremio_identifier(
         item: MediaItem,
@@ -82,42 +110,17 @@ class ScraperService(Runner[T, "ScraperService", dict[str, str]]):
         3. A URL containing the infohash
 
         Returns the infohash or None if it cannot be extracted.
+        Resolved URLs are remembered, so each is only fetched once.
         """
-        if not url:
-            return None
 
-        session = SmartSession()
-        try:
-            # Try to download with redirects disabled to check for magnet redirects
-            r = session.get(url, allow_redirects=False)
-
-            # If it's a redirect (3xx status code)
-            if 300 <= r.status_code < 400:
-                location = r.headers.get("Location", "")
-                if location:
-                    # Check if the redirect is a magnet link and extract infohash
-                    infohash = extract_infohash(location)
-                    if infohash:
-                        return infohash
-
-            # If it's a successful response, try to parse as torrent file
-            if r.status_code == 200:
-                try:
-                    torrent_dict = cast(dict[bytes, bytes], bencodepy.decode(r.content))
-                    info = torrent_dict[b"info"]
-                    infohash = hashlib.sha1(bencodepy.encode(info)).hexdigest()
-
-                    return infohash.lower()
-                except Exception:
-                    # Not a valid torrent file, try to extract from URL
-                    pass
-
-            # Try to extract infohash from the URL itself (handles magnets and bare hashes)
-            infohash = extract_infohash(url)
-            if infohash:
-                return infohash
-
-        except Exception as e:
-            logger.debug(f"Failed to get infohash from URL {url}: {e}")
-
-        return None
+        return infohash_resolver.resolve(url)
+
+    @staticmethod
+    def get_infohashes_from_urls(urls: Iterable[str], timeout: float) -> dict[str, str]:
+        """
+        Get the infohashes of many URLs in parallel, as `get_infohash_from_url` does.
+
+        Returns the infohashes by URL of those resolved within `timeout` seconds.
+        """
+
+        return infohash_resolver.resolve_many(urls, timeout)
@@ -0,0 +1,258 @@
+"""Resolution of indexer download URLs to infohashes."""
+
+import hashlib
+import threading
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor, wait
+from datetime import datetime, timedelta
+from typing import cast
+
+import bencodepy
+from loguru import logger
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from program.db.db import db_session
+from program.media.resolved_infohash import ResolvedInfohash
+from program.settings import settings_manager
+from program.utils.lru_cache import ResizableLRUCache
+from program.utils.request import SmartSession
+from program.utils.torrent import extract_infohash
+
+
+class InfohashResolver:
+    """
+    Resolves indexer download URLs to infohashes, remembering what each URL resolved to.
+
+    Jackett and Prowlarr return the same download links on every scrape, and resolving one
+    means downloading and decoding a torrent file. Resolved URLs are kept in an in-memory LRU
+    of `scraping.infohash_cache_size` entries, and with `scraping.persist_resolved_infohashes`
+    in the database too. URLs that were fetched but didn't lead to a torrent are remembered
+    for `negative_ttl`; failed requests aren't remembered at all.
+
+    Fetches share one pooled session, rather than opening a new client per URL, and URLs
+    resolved in bulk share one set of `max_workers` threads across all scrapes.
+    """
+
+    negative_ttl = timedelta(days=1)
+
+    # Prune the table back to the cache size after this many stores
+    prune_interval = 500
+
+    max_workers = 16
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._resolved = ResizableLRUCache[str, tuple[str | None, datetime]](
+            lambda: settings_manager.settings.scraping.infohash_cache_size
+        )
+        self._session: SmartSession | None = None
+        self._executor: ThreadPoolExecutor | None = None
+        self._stores_since_prune = 0
+
+    @property
+    def persist(self) -> bool:
+        return settings_manager.settings.scraping.persist_resolved_infohashes
+
+    @property
+    def session(self) -> SmartSession:
+        with self._lock:
+            if self._session is None:
+                self._session = SmartSession()
+
+            return self._session
+
+    def resolve(self, url: str) -> str | None:
+        """Get the infohash a download URL resolves to, fetching it if it isn't remembered."""
+
+        if not url:
+            return None
+
+        url_hash = hashlib.sha1(url.encode()).hexdigest()
+
+        if entry := self._recall(url_hash):
+            infohash, resolved_at = entry
+
+            if infohash or datetime.now() - resolved_at <= self.negative_ttl:
+                return infohash
+
+        infohash, is_conclusive = self._fetch(url)
+
+        if is_conclusive:
+            self._remember(url_hash, infohash)
+
+        return infohash
+
+    def resolve_many(self, urls: Iterable[str], timeout: float) -> dict[str, str]:
+        """
+        Resolve download URLs in parallel, giving up on those not resolved within `timeout` seconds.
+
+        Returns:
+            The infohashes of the URLs that resolved, by URL.
+        """
+
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    thread_name_prefix="InfohashResolver", max_workers=self.max_workers
+                )
+
+            executor = self._executor
+
+        futures = {executor.submit(self.resolve, url): url for url in set(urls) if url}
+        done, pending = wait(futures, timeout=timeout)
+        resolved = dict[str, str]()
+
+        for future in done:
+            try:
+                if infohash := future.result():
+                    resolved[futures[future]] = infohash
+            except Exception as e:
+                logger.debug(f"Failed to get infohash from URL {futures[future]}: {e}")
+
+        for future in pending:
+            future.cancel()
+            logger.debug(f"Timeout getting infohash from URL {futures[future]}")
+
+        return resolved
+
+    def _recall(self, url_hash: str) -> tuple[str | None, datetime] | None:
+        """Get the infohash a URL was resolved to, and when, or None if it isn't remembered."""
+
+        entry = self._resolved.get(url_hash)
+
+        if entry is None and self.persist:
+            entry = self._load(url_hash)
+
+            if entry is not None:
+                self._resolved.set(url_hash, entry)
+
+        return entry
+
+    def _remember(self, url_hash: str, infohash: str | None) -> None:
+        resolved_at = datetime.now()
+
+        self._resolved.set(url_hash, (infohash, resolved_at))
+
+        if self.persist and settings_manager.settings.scraping.infohash_cache_size > 0:
+            self._store(url_hash, infohash, resolved_at)
+
+    def _fetch(self, url: str) -> tuple[str | None, bool]:
+        """
+        Fetch a download URL and extract its infohash.
+
+        A URL can be:
+        1. A direct torrent file download
+        2. A redirect to a magnet link
+        3. A URL containing the infohash
+
+        Returns:
+            The infohash or None, and whether the result is conclusive,
+            i.e. the indexer answered rather than the request failing.
+        """
+
+        is_conclusive = False
+
+        try:
+            # Try to download with redirects disabled to check for magnet redirects
+            r = self.session.get(url, allow_redirects=False)
+
+            # A rate limit or server error may resolve on the next scrape
+            is_conclusive = r.status_code < 500 and r.status_code != 429
+
+            # If it's a redirect (3xx status code)
+            if 300 <= r.status_code < 400:
+                location = r.headers.get("Location", "")
+                if location:
+                    # Check if the redirect is a magnet link and extract infohash
+                    infohash = extract_infohash(location)
+                    if infohash:
+                        return infohash, True
+
+            # If it's a successful response, try to parse as torrent file
+            if r.status_code == 200:
+                try:
+                    torrent_dict = cast(dict[bytes, bytes], bencodepy.decode(r.content))
+                    info = torrent_dict[b"info"]
+                    infohash = hashlib.sha1(bencodepy.encode(info)).hexdigest()
+
+                    return infohash.lower(), True
+                except Exception:
+                    # Not a valid torrent file, try to extract from URL
+                    pass
+        except Exception as e:
+            logger.debug(f"Failed to get infohash from URL {url}: {e}")
+
+        # Try to extract infohash from the URL itself (handles magnets and bare hashes)
+        infohash = extract_infohash(url)
+
+        if infohash:
+            return infohash, True
+
+        return None, is_conclusive
+
+    def _load(self, url_hash: str) -> tuple[str | None, datetime] | None:
+        try:
+            with db_session() as session:
+                row = session.execute(
+                    select(
+                        ResolvedInfohash.infohash, ResolvedInfohash.resolved_at
+                    ).where(ResolvedInfohash.url_hash == url_hash)
+                ).first()
+        except Exception as e:
+            logger.warning(f"Failed to load resolved infohash: {e}")
+            return None
+
+        return (row[0], row[1]) if row else None
+
+    def _store(
+        self, url_hash: str, infohash: str | None, resolved_at: datetime
+    ) -> None:
+        statement = insert(ResolvedInfohash).values(
+            url_hash=url_hash,
+            infohash=infohash,
+            resolved_at=resolved_at,
+        )
+
+        with self._lock:
+            self._stores_since_prune += 1
+            should_prune = self._stores_since_prune >= self.prune_interval
+
+            if should_prune:
+                self._stores_since_prune = 0
+
+        try:
+            with db_session() as session:
+                session.execute(
+                    statement.on_conflict_do_update(
+                        index_elements=[ResolvedInfohash.url_hash],
+                        set_={
+                            "infohash": statement.excluded.infohash,
+                            "resolved_at": statement.excluded.resolved_at,
+                        },
+                    )
+                )
+
+                if should_prune:
+                    self._prune(session)
+
+                session.commit()
+        except Exception as e:
+            logger.warning(f"Failed to store resolved infohash: {e}")
+
+    def _prune(self, session: Session) -> None:
+        """Delete all but the most recently resolved `infohash_cache_size` URLs."""
+
+        newest = (
+            select(ResolvedInfohash.url_hash)
+            .order_by(ResolvedInfohash.resolved_at.desc())
+            .limit(settings_manager.settings.scraping.infohash_cache_size)
+        )
+
+        session.execute(
+            delete(ResolvedInfohash).where(ResolvedInfohash.url_hash.not_in(newest))
+        )
+
+
+infohash_resolver = InfohashResolver()
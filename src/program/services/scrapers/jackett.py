@@ -1,7 +1,5 @@
 """Jackett scraper module"""
 
-import concurrent.futures
-
 from loguru import logger
 from pydantic import BaseModel, Field
 from requests import ReadTimeout
@@ -40,6 +38,15 @@ class Jackett(ScraperService[JackettConfig]):
         self.request_handler = None
         self._initialize()
 
+    @property
+    def deadline(self) -> float | None:
+        """Allow for resolving download URLs after the search itself."""
+
+        if (deadline := super().deadline) is None:
+            return None
+
+        return deadline + self.settings.infohash_fetch_timeout
+
     def validate(self) -> bool:
         """Validate Jackett settings."""
 
@@ -147,44 +154,14 @@ class Jackett(ScraperService[JackettConfig]):
 
             # Fetch URLs in parallel
             if urls_to_fetch:
-                with concurrent.futures.ThreadPoolExecutor(
-                    thread_name_prefix="JackettHashExtract", max_workers=10
-                ) as executor:
-                    future_to_result = {
-                        executor.submit(self.get_infohash_from_url, result.link): (
-                            result,
-                            title,
-                        )
-                        for result, title in urls_to_fetch
-                        if result.link
-                    }
-
-                    done, pending = concurrent.futures.wait(
-                        future_to_result.keys(),
-                        timeout=self.settings.infohash_fetch_timeout,
-                    )
-
-                    # Process completed futures
-                    for future in done:
-                        result, title = future_to_result[future]
-
-                        try:
-                            infohash = future.result()
-
-                            if infohash:
-                                torrents[infohash] = title
-                        except Exception as e:
-                            logger.debug(
-                                f"Failed to get infohash from Link for {title}: {e}"
-                            )
-
-                    # Cancel and log timeouts for pending futures
-                    for future in pending:
-                        result, title = future_to_result[future]
-
-                        future.cancel()
-
-                        logger.debug(f"Timeout getting infohash from Link for {title}")
+                infohashes = self.get_infohashes_from_urls(
+                    (result.link for result, _ in urls_to_fetch if result.link),
+                    timeout=self.settings.infohash_fetch_timeout,
+                )
+
+                for result, title in urls_to_fetch:
+                    if infohash := infohashes.get(result.link or ""):
+                        torrents[infohash] = title
 
         if torrents:
             logger.log(
@@ -0,0 +1,128 @@
+"""Cache of parsed torrent titles."""
+
+import hashlib
+from collections.abc import Iterable
+from importlib.metadata import PackageNotFoundError, version
+
+from loguru import logger
+from RTN import ParsedData
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+
+from program.db.db import db_session
+from program.media.parsed_title import ParsedTitle
+from program.settings import settings_manager
+from program.utils.lru_cache import ResizableLRUCache
+
+
+def _get_parser_version() -> str:
+    try:
+        return version("rank-torrent-name")
+    except PackageNotFoundError:
+        return "unknown"
+
+
+class ParsedTitleCache:
+    """
+    Parsed torrent titles by raw title.
+
+    Parsing a title is the expensive part of ranking, and depends only on the title itself,
+    whilst the same titles come back for every episode of a season and on every re-scrape.
+    Recently parsed titles are kept in an in-memory LRU; with `scraping.persist_parsed_titles`
+    enabled, they're also stored in the database, so they survive restarts.
+
+    Stored parses are tagged with the parser version, so upgrading RTN parses titles afresh.
+    """
+
+    def __init__(self) -> None:
+        self._titles = ResizableLRUCache[str, ParsedData](
+            lambda: settings_manager.settings.scraping.parsed_title_cache_size
+        )
+        self.parser_version = _get_parser_version()
+
+    @property
+    def persist(self) -> bool:
+        return settings_manager.settings.scraping.persist_parsed_titles
+
+    def get_many(self, raw_titles: Iterable[str]) -> dict[str, ParsedData]:
+        """Get the cached parses of the given titles; titles that aren't cached are left out."""
+
+        wanted = set(raw_titles)
+        found = self._titles.get_many(wanted)
+
+        if self.persist and (missing := wanted - found.keys()):
+            stored = self._load(missing)
+
+            self._titles.update(stored)
+            found.update(stored)
+
+        return found
+
+    def put_many(self, parsed_titles: dict[str, ParsedData]) -> None:
+        """Cache newly parsed titles."""
+
+        if not parsed_titles:
+            return
+
+        self._titles.update(parsed_titles)
+
+        if self.persist:
+            self._store(parsed_titles)
+
+    def _load(self, raw_titles: set[str]) -> dict[str, ParsedData]:
+        hashes = {_hash_title(raw_title): raw_title for raw_title in raw_titles}
+
+        try:
+            with db_session() as session:
+                rows = session.execute(
+                    select(ParsedTitle.title_hash, ParsedTitle.data).where(
+                        ParsedTitle.title_hash.in_(hashes),
+                        ParsedTitle.parser_version == self.parser_version,
+                    )
+                ).all()
+        except Exception as e:
+            logger.warning(f"Failed to load parsed titles: {e}")
+            return {}
+
+        loaded = dict[str, ParsedData]()
+
+        for title_hash, data in rows:
+            try:
+                loaded[hashes[title_hash]] = ParsedData.model_validate(data)
+            except Exception:
+                continue
+
+        return loaded
+
+    def _store(self, parsed_titles: dict[str, ParsedData]) -> None:
+        rows = [
+            {
+                "title_hash": _hash_title(raw_title),
+                "parser_version": self.parser_version,
+                "data": parsed.model_dump(mode="json"),
+            }
+            for raw_title, parsed in parsed_titles.items()
+        ]
+
+        statement = insert(ParsedTitle).values(rows)
+
+        try:
+            with db_session() as session:
+                session.execute(
+                    statement.on_conflict_do_update(
+                        index_elements=[ParsedTitle.title_hash],
+                        set_={
+                            "parser_version": statement.excluded.parser_version,
+                            "data": statement.excluded.data,
+                        },
+                        where=ParsedTitle.parser_version
+                        != statement.excluded.parser_version,
+                    )
+                )
+                session.commit()
+        except Exception as e:
+            logger.warning(f"Failed to store parsed titles: {e}")
+
+
+def _hash_title(raw_title: str) -> str:
+    return hashlib.sha1(raw_title.encode()).hexdigest()
@@ -109,6 +109,15 @@ class Prowlarr(ScraperService[ProwlarrConfig]):
             backoff_factor=0.3,
         )
 
+    @property
+    def deadline(self) -> float | None:
+        """Allow for resolving download URLs after the search itself."""
+
+        if (deadline := super().deadline) is None:
+            return None
+
+        return deadline + self.settings.infohash_fetch_timeout
+
     def validate(self) -> bool:
         """Validate Prowlarr settings."""
 
@@ -529,43 +538,18 @@ class Prowlarr(ScraperService[ProwlarrConfig]):
 
         # Fetch URLs in parallel
         if urls_to_fetch:
-            with concurrent.futures.ThreadPoolExecutor(
-                thread_name_prefix="ProwlarrHashExtract", max_workers=10
-            ) as executor:
-                future_to_torrent = {
-                    executor.submit(self.get_infohash_from_url, torrent.download_url): (
-                        torrent,
-                        title,
-                    )
-                    for torrent, title in urls_to_fetch
+            infohashes = self.get_infohashes_from_urls(
+                (
+                    torrent.download_url
+                    for torrent, _ in urls_to_fetch
                     if torrent.download_url
-                }
-
-                done, pending = concurrent.futures.wait(
-                    future_to_torrent.keys(),
-                    timeout=self.settings.infohash_fetch_timeout,
-                )
+                ),
+                timeout=self.settings.infohash_fetch_timeout,
+            )
 
-                # Process completed futures
-                for future in done:
-                    torrent, title = future_to_torrent[future]
-
-                    try:
-                        infohash = future.result()
-                        if infohash:
-                            streams[infohash] = title
-                    except Exception as e:
-                        logger.debug(
-                            f"Failed to get infohash from downloadUrl for {title}: {e}"
-                        )
-
-                # Cancel and log timeouts for pending futures
-                for future in pending:
-                    torrent, title = future_to_torrent[future]
-                    future.cancel()
-                    logger.debug(
-                        f"Timeout getting infohash from downloadUrl for {title}"
-                    )
+            for torrent, title in urls_to_fetch:
+                if infohash := infohashes.get(torrent.download_url or ""):
+                    streams[infohash] = title
 
         logger.debug(
             f"Indexer {indexer.name} found {len(streams)} streams for {item.log_string} in {time.time() - start_time:.2f} seconds"
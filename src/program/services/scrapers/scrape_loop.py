@@ -0,0 +1,151 @@
+"""Event loop that scrapers run on in async scraping mode."""
+
+import asyncio
+import contextlib
+import threading
+from collections.abc import Coroutine
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any
+
+import httpx
+from loguru import logger
+
+
+class ScrapeLoop:
+    """
+    A single asyncio event loop, on its own thread, shared by every scrape.
+
+    With `scraping.async_scraping` enabled, each item's scrape runs as one coroutine on this loop
+    instead of in a thread pool of its own, so scraping many items concurrently doesn't start a
+    thread per scraper per item. Scrapers with an async implementation share `client`; the rest
+    run on the loop's `max_workers` worker threads.
+
+    The loop and its thread are started on first use, and stopped by `close`.
+    """
+
+    max_workers = 32
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._executor: ThreadPoolExecutor | None = None
+        self._client: httpx.AsyncClient | None = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """The HTTP client shared by async scrapers. Only use it from coroutines running on the loop."""
+
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                http2=True,
+                follow_redirects=True,
+                limits=httpx.Limits(
+                    max_connections=200,
+                    max_keepalive_connections=100,
+                    keepalive_expiry=60.0,
+                ),
+                timeout=httpx.Timeout(connect=5.0, read=30.0, write=10.0, pool=5.0),
+            )
+
+        return self._client
+
+    def submit[T](self, coroutine: Coroutine[Any, Any, T]) -> Future[T]:
+        """Schedule a coroutine on the loop; cancelling the returned future cancels it."""
+
+        return asyncio.run_coroutine_threadsafe(coroutine, self._get_loop())
+
+    def run[T](self, coroutine: Coroutine[Any, Any, T]) -> T:
+        """Run a coroutine on the loop, blocking until it's done."""
+
+        return self.submit(coroutine).result()
+
+    def close(self, timeout: float = 10.0) -> None:
+        """
+        Cancel running scrapes, close the shared client and stop the loop and its worker threads.
+
+        Scrapers running in worker threads can't be interrupted; they're given `timeout` seconds to finish.
+        """
+
+        with self._lock:
+            loop, self._loop = self._loop, None
+            thread, self._thread = self._thread, None
+            executor, self._executor = self._executor, None
+
+        if loop is None or thread is None or executor is None:
+            return
+
+        try:
+            asyncio.run_coroutine_threadsafe(
+                self._shutdown(executor, timeout), loop
+            ).result()
+        except Exception as e:
+            logger.warning(f"Failed to shut down the scrape loop cleanly: {e}")
+
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout=timeout)
+
+        if not thread.is_alive():
+            loop.close()
+
+    async def _shutdown(self, executor: ThreadPoolExecutor, timeout: float) -> None:
+        tasks = [
+            task for task in asyncio.all_tasks() if task is not asyncio.current_task()
+        ]
+
+        for task in tasks:
+            task.cancel()
+
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+        loop = asyncio.get_running_loop()
+        stopped = loop.create_future()
+
+        def shutdown_executor() -> None:
+            executor.shutdown(wait=True)
+
+            with contextlib.suppress(RuntimeError):
+                loop.call_soon_threadsafe(stopped.set_result, None)
+
+        # Waited for from a thread of its own, as the executor's threads can't wait on themselves
+        threading.Thread(
+            target=shutdown_executor,
+            name="ScrapeLoopShutdown",
+            daemon=True,
+        ).start()
+
+        try:
+            async with asyncio.timeout(timeout):
+                await stopped
+        except TimeoutError:
+            logger.warning(
+                f"Scrapers still running in worker threads after {timeout}s; not waiting for them"
+            )
+
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                self._executor = ThreadPoolExecutor(
+                    thread_name_prefix="ScraperService_",
+                    max_workers=self.max_workers,
+                )
+                loop.set_default_executor(self._executor)
+
+                self._thread = threading.Thread(
+                    target=loop.run_forever,
+                    name="ScrapeLoop",
+                    daemon=True,
+                )
+                self._thread.start()
+
+                self._loop = loop
+
+            return self._loop
+
+
+scrape_loop = ScrapeLoop()
@@ -0,0 +1,206 @@
+"""Scrape results shared between the episodes of a season."""
+
+import asyncio
+import threading
+import time
+from collections import Counter
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import dataclass, field
+
+from loguru import logger
+
+from program.media.item import Episode, MediaItem, Season
+from program.services.scrapers.shared import parse_titles
+from program.settings import settings_manager
+
+type SeasonKey = tuple[str, str, int]
+
+
+@dataclass
+class SeasonResults:
+    """The results a scraper returned for the episodes and the season of a show's season."""
+
+    expires_at: float
+    results: dict[str, str] = field(default_factory=dict[str, str])
+
+
+class SeasonResultStore:
+    """
+    Short-lived store of scraper results by (scraper, show ID, season number).
+
+    Episodes of a new show are scraped one by one, yet scrapers return largely the same
+    season packs for each of them. Results scraped for an episode or a season are kept for
+    `scraping.shared_results_ttl_seconds`; an episode of the same season reuses them instead
+    of querying the scraper again, as long as they include a release covering that episode.
+
+    Scrapes of the same season by the same scraper are serialised, so episodes scraped
+    concurrently wait for the first one's results rather than all querying the scraper.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._entries = dict[SeasonKey, SeasonResults]()
+        self._key_locks = dict[SeasonKey, threading.Lock]()
+        self._async_key_locks = dict[SeasonKey, asyncio.Lock]()
+        # Scrapes holding or waiting for each key's lock; a key lock is only dropped without any
+        self._holders = Counter[SeasonKey]()
+
+    def get_or_scrape(
+        self,
+        service_key: str,
+        item: MediaItem,
+        scrape: Callable[[], dict[str, str]],
+    ) -> dict[str, str]:
+        """Get the item's results from its season's stored results, or scrape them and store them."""
+
+        ttl = settings_manager.settings.scraping.shared_results_ttl_seconds
+        key = self._get_key(service_key, item)
+
+        if key is None or ttl <= 0:
+            return scrape()
+
+        with self._hold(key):
+            if (shared := self._get_shared(key, item)) is not None:
+                return shared
+
+            results = scrape()
+            self._add(key, results, ttl)
+
+            return results
+
+    async def get_or_scrape_async(
+        self,
+        service_key: str,
+        item: MediaItem,
+        scrape: Callable[[], Awaitable[dict[str, str]]],
+    ) -> dict[str, str]:
+        """Like `get_or_scrape`, for scrapes running on the scrape loop."""
+
+        ttl = settings_manager.settings.scraping.shared_results_ttl_seconds
+        key = self._get_key(service_key, item)
+
+        if key is None or ttl <= 0:
+            return await scrape()
+
+        async with self._hold_async(key):
+            # Checking coverage parses titles, which mustn't block the loop
+            if (
+                shared := await asyncio.to_thread(self._get_shared, key, item)
+            ) is not None:
+                return shared
+
+            results = await scrape()
+            self._add(key, results, ttl)
+
+            return results
+
+    def _get_shared(self, key: SeasonKey, item: MediaItem) -> dict[str, str] | None:
+        """Get the stored results of the item's season if they cover the item."""
+
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry and entry.expires_at <= time.monotonic():
+                entry = None
+
+        if entry and isinstance(item, Episode) and self._covers(entry.results, item):
+            logger.debug(
+                f"Reusing {len(entry.results)} {key[0]} results from {item.parent.log_string} for {item.log_string}"
+            )
+
+            return dict(entry.results)
+
+        return None
+
+    def _add(self, key: SeasonKey, results: dict[str, str], ttl: int) -> None:
+        now = time.monotonic()
+
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None or entry.expires_at <= now:
+                entry = self._entries[key] = SeasonResults(expires_at=now + ttl)
+
+            entry.results.update(results)
+
+            self._purge(now)
+
+    @staticmethod
+    def _get_key(service_key: str, item: MediaItem) -> SeasonKey | None:
+        if isinstance(item, Episode):
+            show, season_number = item.parent.parent, item.parent.number
+        elif isinstance(item, Season):
+            show, season_number = item.parent, item.number
+        else:
+            return None
+
+        show_id = show.imdb_id or show.tvdb_id
+
+        if not show_id:
+            return None
+
+        return (service_key, str(show_id), season_number)
+
+    @staticmethod
+    def _covers(results: dict[str, str], episode: Episode) -> bool:
+        """Whether any result is a pack of the episode's season, or a release including the episode."""
+
+        season_number = episode.parent.number
+
+        return any(
+            season_number in parsed.seasons
+            and (not parsed.episodes or episode.number in parsed.episodes)
+            for parsed in parse_titles(set(results.values())).values()
+        )
+
+    @contextmanager
+    def _hold(self, key: SeasonKey) -> Iterator[None]:
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+            self._holders[key] += 1
+
+        try:
+            with key_lock:
+                yield
+        finally:
+            self._release(key)
+
+    @asynccontextmanager
+    async def _hold_async(self, key: SeasonKey) -> AsyncIterator[None]:
+        with self._lock:
+            key_lock = self._async_key_locks.setdefault(key, asyncio.Lock())
+            self._holders[key] += 1
+
+        try:
+            async with key_lock:
+                yield
+        finally:
+            self._release(key)
+
+    def _release(self, key: SeasonKey) -> None:
+        with self._lock:
+            self._holders[key] -= 1
+
+            if self._holders[key] <= 0:
+                del self._holders[key]
+
+    def _purge(self, now: float) -> None:
+        """
+        Drop expired entries, and the locks of keys without an entry or holders. Callers must hold the lock.
+
+        A key lock may be unlocked yet already taken by a scrape about to wait on it,
+        so it is only dropped once no scrape holds or waits for it.
+        """
+
+        for key in [k for k, entry in self._entries.items() if entry.expires_at <= now]:
+            del self._entries[key]
+
+        for key_locks in (self._key_locks, self._async_key_locks):
+            for key in [
+                k for k in key_locks if k not in self._entries and not self._holders[k]
+            ]:
+                del key_locks[key]
+
+
+season_results = SeasonResultStore()
@@ -1,15 +1,21 @@
 """Shared functions for scrapers."""
 
+import math
+import time
 from datetime import datetime
 from loguru import logger
 from RTN import (
     RTN,
     ParsedData,
     Torrent,
+    check_fetch,
+    get_lev_ratio,
+    get_rank,
     sort_torrents,
     BaseRankingModel,
     DefaultRanking,
 )
+from RTN.exceptions import GarbageTorrent, SettingsDisabled
 from RTN.models import SettingsModel
 from typing import cast
 
@@ -17,12 +23,27 @@ from program.media.item import Episode, MediaItem, Movie, Season, Show
 from program.media.stream import Stream
 from program.settings import settings_manager
 from program.settings.models import RTNSettingsModel, ScraperModel
+from program.services.scrapers.parsed_titles import ParsedTitleCache
+from program.utils.process_pool import ProcessPool
+from program.utils.torrent import parse_raw_titles
 
 scraping_settings: ScraperModel = settings_manager.settings.scraping
 ranking_settings: RTNSettingsModel = settings_manager.settings.ranking
 ranking_model: BaseRankingModel = DefaultRanking()
 rtn = RTN(ranking_settings, ranking_model)
 
+# Processes that parse large sets of new titles when `workers.ranking_processes` is set
+ranking_pool = ProcessPool(preload=["RTN", "program.utils.torrent"])
+
+# Fewer titles are parsed in-process, where they cost less than a round-trip to the pool
+MIN_POOLED_RESULTS = 50
+
+# Titles the ranking processes haven't parsed by then are parsed in-process instead
+POOLED_PARSE_TIMEOUT_SECONDS = 60
+
+# Titles are parsed once, then only the item-dependent checks and ranking run on each scrape
+parsed_titles = ParsedTitleCache()
+
 
 def get_ranking_overrides(
     ranking_overrides: dict[str, list[str]] | None,
@@ -85,7 +106,29 @@ def parse_results(
         manual: If True, bypass content filters (for manual scraping).
     """
 
-    torrents = set[Torrent]()
+    return sort_streams(item, rank_results(item, results, manual=manual), manual=manual)
+
+
+def rank_results(
+    item: MediaItem,
+    results: dict[str, str],
+    manual: bool = False,
+) -> dict[str, Torrent]:
+    """Rank the results from the scrapers, dropping those that don't match the item.
+
+    Each result is ranked on its own, so results can be ranked in batches as they arrive
+    and passed to `sort_streams` together.
+
+    Args:
+        item: The media item to rank results for.
+        results: Dict mapping infohash to raw title.
+        manual: If True, bypass content filters (for manual scraping).
+
+    Returns:
+        Dict mapping infohash to the ranked torrent.
+    """
+
+    torrents = dict[str, Torrent]()
     processed_infohashes = set[str]()
     correct_title = item.top_title
 
@@ -107,20 +150,27 @@ def parse_results(
         else {}
     )
 
+    remove_trash = active_settings.options["remove_all_trash"] if not manual else False
+
     logger.debug(f"Processing {len(results)} results for {item.log_string}")
 
+    parsed = parse_titles(set(results.values()))
+
     for infohash, raw_title in results.items():
         if infohash in processed_infohashes:
             continue
 
         try:
-            torrent = rtn_instance.rank(
+            if (parsed_data := parsed.get(raw_title)) is None:
+                raise GarbageTorrent(f"Failed to parse '{raw_title}'")
+
+            torrent = _rank_parsed(
+                rtn_instance,
+                parsed_data,
                 raw_title=raw_title,
                 infohash=infohash,
                 correct_title=correct_title,
-                remove_trash=active_settings.options[
-                    "remove_all_trash"
-                ] if not manual else False,
+                remove_trash=remove_trash,
                 aliases=aliases,
             )
 
@@ -255,24 +305,35 @@ def parse_results(
                     )
                     continue
 
-            torrents.add(torrent)
+            torrents[infohash] = torrent
             processed_infohashes.add(infohash)
         except Exception as e:
             logger.trace(f"GarbageTorrent: {e}")
             processed_infohashes.add(infohash)
             continue
 
+    return torrents
+
+
+def sort_streams(
+    item: MediaItem,
+    torrents: dict[str, Torrent],
+    manual: bool = False,
+) -> dict[str, Stream]:
+    """Sort ranked torrents into streams, best first, keeping `bucket_limit` per quality bucket.
+
+    Args:
+        item: The media item the torrents were ranked for.
+        torrents: Dict mapping infohash to the ranked torrent.
+        manual: If True, keep every torrent (for manual scraping).
+    """
+
     if torrents:
         logger.debug(f"Found {len(torrents)} streams for {item.log_string}")
 
-        sorted_torrents = sort_torrents(
-            torrents,
-            bucket_limit=scraping_settings.bucket_limit if not manual else 0,
-        )
-
         torrent_stream_map = {
             torrent.infohash.lower(): Stream(torrent)
-            for torrent in sorted_torrents.values()
+            for torrent in keep_best_torrents(torrents, manual=manual)
         }
 
         logger.debug(
@@ -284,9 +345,140 @@ def parse_results(
     return {}
 
 
+def keep_best_torrents(
+    torrents: dict[str, Torrent],
+    manual: bool = False,
+) -> list[Torrent]:
+    """Sort ranked torrents best first, keeping `bucket_limit` per quality bucket, or all of them if manual."""
+
+    sorted_torrents = sort_torrents(
+        set(torrents.values()),
+        bucket_limit=scraping_settings.bucket_limit if not manual else 0,
+    )
+
+    return list(sorted_torrents.values())
+
+
 # helper functions
 
 
+def parse_titles(raw_titles: set[str]) -> dict[str, ParsedData]:
+    """
+    Parse raw titles, reusing earlier parses from the parsed title cache.
+
+    New titles are parsed in the ranking processes if enabled and there are enough of them,
+    and added to the cache. Titles that fail to parse are left out.
+    """
+
+    parsed = parsed_titles.get_many(raw_titles)
+    new_titles = [raw_title for raw_title in raw_titles if raw_title not in parsed]
+
+    if not new_titles:
+        return parsed
+
+    processes = settings_manager.settings.workers.ranking_processes
+    new_parses = dict[str, ParsedData]()
+
+    if processes and len(new_titles) >= MIN_POOLED_RESULTS:
+        chunk_size = math.ceil(len(new_titles) / processes)
+
+        try:
+            executor = ranking_pool.get_executor(processes)
+
+            futures = [
+                executor.submit(parse_raw_titles, new_titles[i : i + chunk_size])
+                for i in range(0, len(new_titles), chunk_size)
+            ]
+            deadline = time.monotonic() + POOLED_PARSE_TIMEOUT_SECONDS
+
+            try:
+                for future in futures:
+                    new_parses.update(
+                        future.result(timeout=max(0, deadline - time.monotonic()))
+                    )
+            finally:
+                for future in futures:
+                    future.cancel()
+        except Exception as e:
+            logger.warning(
+                f"Failed to parse titles in worker processes, parsing in-process: {e!r}"
+            )
+            new_parses.clear()
+
+    if not new_parses:
+        new_parses = parse_raw_titles(new_titles)
+
+    parsed_titles.put_many(new_parses)
+    parsed.update(new_parses)
+
+    return parsed
+
+
+def _rank_parsed(
+    rtn_instance: RTN,
+    parsed_data: ParsedData,
+    *,
+    raw_title: str,
+    infohash: str,
+    correct_title: str,
+    remove_trash: bool,
+    aliases: dict[str, list[str]],
+) -> Torrent:
+    """
+    Rank an already parsed title, like `RTN.rank` does after parsing it.
+
+    Raises:
+        GarbageTorrent: If the torrent is invalid or, with `remove_trash`, should be ignored.
+    """
+
+    if not rtn_instance.settings.enabled:
+        raise SettingsDisabled("Settings are disabled and cannot be used.")
+
+    if not raw_title or not infohash:
+        raise ValueError("Both the title and infohash must be provided.")
+
+    if len(infohash) != 40:
+        raise GarbageTorrent(
+            "The infohash must be a valid SHA-1 hash and 40 characters in length."
+        )
+
+    lev_ratio = 0.0
+
+    if correct_title:
+        lev_ratio = get_lev_ratio(
+            correct_title,
+            parsed_data.parsed_title,
+            rtn_instance.lev_threshold,
+            aliases,
+        )
+
+        if remove_trash and lev_ratio < rtn_instance.lev_threshold:
+            raise GarbageTorrent(
+                f"'{raw_title}' does not match the correct title. correct title: '{correct_title}', parsed title: '{parsed_data.parsed_title}'"
+            )
+
+    is_fetchable, failed_keys = check_fetch(parsed_data, rtn_instance.settings)
+    rank = get_rank(parsed_data, rtn_instance.settings, rtn_instance.ranking_model)
+
+    if remove_trash:
+        if not is_fetchable:
+            raise GarbageTorrent(f"'{raw_title}' denied by: {', '.join(failed_keys)}")
+
+        if rank < rtn_instance.settings.options["remove_ranks_under"]:
+            raise GarbageTorrent(
+                f"'{raw_title}' does not meet the minimum rank requirement, got rank of {rank}"
+            )
+
+    return Torrent(
+        infohash=infohash,
+        raw_title=raw_title,
+        data=parsed_data,
+        fetch=is_fetchable,
+        rank=rank,
+        lev_ratio=lev_ratio,
+    )
+
+
 def _check_item_year(aired_at: datetime, data: ParsedData) -> bool:
     """Check if the year of the torrent is within the range of the item."""
 
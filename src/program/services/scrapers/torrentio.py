@@ -1,11 +1,13 @@
 """Torrentio scraper module"""
 
+import httpx
 from loguru import logger
 from pydantic import BaseModel, Field
 from requests import HTTPError
 
 from program.media.item import MediaItem
 from program.services.scrapers.base import ScraperService
+from program.services.scrapers.scrape_loop import scrape_loop
 from program.settings import settings_manager
 from program.settings.models import TorrentioConfig
 from program.utils.request import SmartSession
@@ -97,23 +99,39 @@ class Torrentio(ScraperService[TorrentioConfig]):
 
         return {}
 
+    async def run_async(self, item: MediaItem) -> dict[str, str]:
+        """Scrape Torrentio with the given media item for streams, on the scrape loop"""
+
+        if self.proxies:
+            # Proxies are set per client, so proxied requests stay on the session's own clients
+            return await super().run_async(item)
+
+        try:
+            return await self.scrape_async(item)
+        except httpx.HTTPStatusError as http_err:
+            if http_err.response.status_code == 429:
+                logger.debug(
+                    f"Torrentio rate limit exceeded for item: {item.log_string}"
+                )
+            else:
+                logger.error(
+                    f"Torrentio HTTP error for {item.log_string}: {str(http_err)}"
+                )
+        except Exception as e:
+            logger.exception(f"Torrentio exception thrown: {str(e)}")
+
+        return {}
+
     def scrape(self, item: MediaItem) -> dict[str, str]:
         """Wrapper for `Torrentio` scrape method"""
 
-        identifier, scrape_type, imdb_id = self.get_stremio_identifier(item)
+        url = self._get_stream_url(item)
 
-        if not imdb_id:
+        if not url:
             return {}
 
-        url = (
-            f"{self.settings.url}/{self.settings.filter}/stream/{scrape_type}/{imdb_id}"
-        )
-
-        if identifier:
-            url += identifier
-
         response = self.session.get(
-            f"{url}.json",
+            url,
             timeout=self.timeout,
             headers=self.headers,
             proxies=self.proxies,
@@ -125,7 +143,49 @@ class Torrentio(ScraperService[TorrentioConfig]):
             )
             response.raise_for_status()
 
-        data = TorrentioScrapeResponse.model_validate(response.json())
+        return self._get_torrents(item, response.json())
+
+    async def scrape_async(self, item: MediaItem) -> dict[str, str]:
+        """Async counterpart of `scrape`"""
+
+        url = self._get_stream_url(item)
+
+        if not url:
+            return {}
+
+        response = await self.session.request_async(
+            scrape_loop.client,
+            "GET",
+            url,
+            timeout=self.timeout,
+            headers=self.headers,
+        )
+
+        if not response.is_success:
+            logger.error(
+                f"Torrentio request failed for {item.log_string} - Status Code: {response.status_code}"
+            )
+            response.raise_for_status()
+
+        return self._get_torrents(item, response.json())
+
+    def _get_stream_url(self, item: MediaItem) -> str | None:
+        identifier, scrape_type, imdb_id = self.get_stremio_identifier(item)
+
+        if not imdb_id:
+            return None
+
+        url = (
+            f"{self.settings.url}/{self.settings.filter}/stream/{scrape_type}/{imdb_id}"
+        )
+
+        if identifier:
+            url += identifier
+
+        return f"{url}.json"
+
+    def _get_torrents(self, item: MediaItem, response_data: object) -> dict[str, str]:
+        data = TorrentioScrapeResponse.model_validate(response_data)
 
         if not data.streams:
             logger.log("NOT_FOUND", f"No streams found for {item.log_string}")
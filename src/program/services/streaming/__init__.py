@@ -12,12 +12,16 @@ from .exceptions.media_stream_data_exception import (
 )
 from .exceptions.media_stream_exception import MediaStreamException
 from .chunker import ChunkCacheNotifier
+from .connection_limiter import ProviderConnectionLimiter
+from .session_statistics import ProviderThroughput
 
 __all__ = [
     "MediaStream",
     "Cache",
     "CacheConfig",
     "ChunkCacheNotifier",
+    "ProviderConnectionLimiter",
+    "ProviderThroughput",
     "MediaStreamException",
     "MediaStreamDataException",
     "ByteLengthMismatchException",
@@ -1,5 +1,5 @@
 from __future__ import annotations
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Callable
 from contextlib import asynccontextmanager
 
 import trio
@@ -7,16 +7,41 @@ import hashlib
 import os
 import threading
 import time
-import json
 from collections import OrderedDict
 from dataclasses import dataclass
 from pathlib import Path
 from bisect import bisect_right, insort
-from typing import Literal, NotRequired, Required, TypedDict
+from typing import Literal, NotRequired, Required, TypedDict, TypeVar
 
 
 from loguru import logger
 
+from .eviction import SegmentedLRU
+from .stores import CacheEntry, ChunkStore, FileChunkStore, SegmentChunkStore
+
+T = TypeVar("T")
+
+type CacheIOOperation = Literal["read", "write", "delete", "scan", "map"]
+
+# Data served from the cache; single-chunk hits are zero-copy views into a mapped chunk file.
+type CacheData = bytes | memoryview
+
+# Where a cache hit was served from: the RAM tier, or one of the disk tiers
+type CacheTier = Literal["memory", "pinned", "protected", "probationary"]
+
+
+class CacheIOLatencySnapshot(TypedDict):
+    count: Required[int]
+    avg_ms: Required[float]
+    max_ms: Required[float]
+
+
+class CacheTierSnapshot(TypedDict):
+    hits: Required[int]
+    hit_ratio: Required[float]
+    entries: Required[int]
+    bytes: Required[int]
+
 
 class CacheSnapshot(TypedDict):
     hits: Required[int]
@@ -26,6 +51,13 @@ class CacheSnapshot(TypedDict):
     evictions: Required[int]
     total_bytes: NotRequired[int]
     entries: NotRequired[int]
+    io_queue_depth: NotRequired[int]
+    io_in_flight: NotRequired[int]
+    io_latency: NotRequired[dict[str, CacheIOLatencySnapshot]]
+    mapped_chunks: NotRequired[int]
+    pinned_entries: NotRequired[int]
+    pinned_bytes: NotRequired[int]
+    tiers: NotRequired[dict[str, CacheTierSnapshot]]
 
 
 @dataclass
@@ -33,24 +65,22 @@ class CacheConfig:
     cache_dir: Path
     max_size_bytes: int = 10 * 1024 * 1024 * 1024  # 10 GiB
     ttl_seconds: int = 2 * 60 * 60  # 2 hours
-    eviction: Literal["LRU", "TTL"] = "LRU"
+    eviction: Literal["LRU", "SLRU", "TTL"] = "LRU"
     metrics_enabled: bool = True
-
-
-@dataclass(frozen=True)
-class CacheEntry:
-    key: str
-    cache_key: str
-    start: int
-    size: int
-    mtime: float
+    io_workers: int = 4
+    max_mapped_chunks: int = 256
+    storage: Literal["files", "segments"] = "files"
+    segment_size_bytes: int = 256 * 1024 * 1024  # 256 MiB
+    max_pinned_bytes: int = 1024 * 1024 * 1024  # 1 GiB
+    # Share of the cache the protected (header/footer and re-used) chunks may take before being demoted
+    protected_fraction: float = 0.8
+    memory_tier_bytes: int = 64 * 1024 * 1024  # 64 MiB
 
 
 @dataclass(frozen=True)
 class ChunkInfo:
     chunk_key: str
     chunk_ts: float
-    chunk_file: Path
     copy_start: int
     bytes_to_read: int
     chunk_end: int
@@ -63,8 +93,24 @@ class Metrics:
         self.bytes_from_cache = 0
         self.bytes_written = 0
         self.evictions = 0
+        self.tier_hits = dict[CacheTier, int]()
+        # Per-operation I/O latency: op -> [count, total_seconds, max_seconds]
+        self.io_latency = dict[str, list[float]]()
         self.lock = threading.Lock()
 
+    def record_hit(self, tier: CacheTier, size: int) -> None:
+        with self.lock:
+            self.hits += 1
+            self.bytes_from_cache += size
+            self.tier_hits[tier] = self.tier_hits.get(tier, 0) + 1
+
+    def record_io(self, op: CacheIOOperation, duration: float) -> None:
+        with self.lock:
+            stats = self.io_latency.setdefault(op, [0, 0.0, 0.0])
+            stats[0] += 1
+            stats[1] += duration
+            stats[2] = max(stats[2], duration)
+
     def snapshot(self) -> CacheSnapshot:
         with self.lock:
             return CacheSnapshot(
@@ -73,26 +119,62 @@ class Metrics:
                 bytes_from_cache=self.bytes_from_cache,
                 bytes_written=self.bytes_written,
                 evictions=self.evictions,
+                io_latency={
+                    op: CacheIOLatencySnapshot(
+                        count=int(count),
+                        avg_ms=round(total / count * 1000, 2) if count else 0.0,
+                        max_ms=round(max_seconds * 1000, 2),
+                    )
+                    for op, (count, total, max_seconds) in self.io_latency.items()
+                },
             )
 
 
 class Cache:
     """
-    Simple file-based block cache on disk with cross-chunk boundary support.
-    We maintain a small in-memory LRU index for eviction decisions.
+    Simple block cache on disk with cross-chunk boundary support.
+    We maintain a small in-memory index for eviction decisions.
+
+    Unpinned chunks are ordered for eviction by a segmented LRU (see `SegmentedLRU`):
+    header and footer chunks are admitted to a protected segment that is evicted last,
+    and with the "SLRU" policy, re-used chunks are promoted there too.
+    Pinned chunks (e.g. pre-warmed headers and footers) are kept in a separate index,
+    exempt from LRU/TTL eviction and bounded by `CacheConfig.max_pinned_bytes`.
+
+    The most recently written and hottest protected chunks are also kept in a small RAM tier
+    (`CacheConfig.memory_tier_bytes`), so they are served without touching the disk.
+
+    Chunks are persisted by a ChunkStore, either as one file per chunk
+    or packed into large segment files with a compact index (see `CacheConfig.storage`).
+
+    All disk I/O is dispatched to a bounded pool of worker threads,
+    so a slow disk never stalls the FUSE event loop.
     """
 
     def __init__(self, cfg: CacheConfig) -> None:
         self.cfg = cfg
-        self._index = OrderedDict[str, CacheEntry]()
+        self._policy = SegmentedLRU(
+            max_protected_bytes=int(cfg.max_size_bytes * cfg.protected_fraction),
+            promote_on_hit=cfg.eviction == "SLRU",
+        )
+        self._pinned = OrderedDict[str, CacheEntry]()
         self._by_path = dict[str, list[int]]()
+        # Size of the largest chunk indexed; streams of the same file may cache differently sized chunks
+        self._max_chunk_bytes = 0
         self._total_bytes = 0
+        self._pinned_bytes = 0
+        self._memory = OrderedDict[str, bytes]()
+        self._memory_bytes = 0
         self._lock = trio.Lock()
-        # Thread lock for synchronizing _index/_by_path access
+        # Thread lock for synchronizing _policy/_pinned/_by_path access
         self._thread_lock = threading.Lock()
         self._metrics = Metrics()
         self._last_log = 0.0  # Initialize last log timestamp
 
+        # Bounds the number of worker threads performing disk I/O at once.
+        # Operations beyond this limit queue up without blocking the event loop.
+        self._io_limiter = trio.CapacityLimiter(max(1, self.cfg.io_workers))
+
         try:
             os.makedirs(self.cfg.cache_dir, exist_ok=True)
         except Exception as e:
@@ -101,8 +183,21 @@ class Cache:
                 f"Disk cache directory init warning for {self.cfg.cache_dir}: {e}"
             )
 
+        self._store = self._create_store()
+
         trio.run(self._initialize)
 
+    def _create_store(self) -> ChunkStore:
+        if self.cfg.storage == "segments":
+            return SegmentChunkStore(
+                self.cfg.cache_dir,
+                self.cfg.max_mapped_chunks,
+                max_size_bytes=self.cfg.max_size_bytes,
+                segment_size_bytes=self.cfg.segment_size_bytes,
+            )
+
+        return FileChunkStore(self.cfg.cache_dir, self.cfg.max_mapped_chunks)
+
     @asynccontextmanager
     async def locks(self) -> AsyncGenerator[None, None]:
         """Async context manager to acquire the cache locks."""
@@ -111,6 +206,21 @@ class Cache:
             with self._thread_lock:
                 yield
 
+    async def _run_io(self, op: CacheIOOperation, fn: Callable[[], T]) -> T:
+        """
+        Run a blocking disk operation on an I/O worker thread.
+
+        The recorded latency includes time spent queued for a free worker,
+        which is the delay actually observed by the caller.
+        """
+
+        start = time.perf_counter()
+
+        try:
+            return await trio.to_thread.run_sync(fn, limiter=self._io_limiter)
+        finally:
+            self._metrics.record_io(op, time.perf_counter() - start)
+
     async def _initialize(self) -> None:
         # Lazy-rebuild index for any pre-existing files so size limits apply after restart
         try:
@@ -119,237 +229,246 @@ class Cache:
             logger.debug(f"Disk cache initial scan skipped: {e}")
 
     async def _initial_scan(self) -> None:
-        # Build index from on-disk files, ordered by mtime ascending for LRU correctness
-        entries: list[CacheEntry] = []
+        # Build index from the store, ordered by mtime ascending for LRU correctness
+        entries = await self._run_io("scan", self._store.load_entries)
+
+        async with self.locks():
+            self._policy.clear()
+            self._pinned.clear()
+            self._by_path.clear()
+            self._memory.clear()
+            self._max_chunk_bytes = 0
+            self._total_bytes = 0
+            self._pinned_bytes = 0
+            self._memory_bytes = 0
+
+            for cache_entry in entries:
+                if cache_entry.pinned:
+                    self._pinned[cache_entry.key] = cache_entry
+                    self._pinned_bytes += cache_entry.size
+                else:
+                    self._policy.admit(cache_entry)
+
+                self._total_bytes += cache_entry.size
 
+                # Rebuild _by_path index
+                lst = self._by_path.setdefault(cache_entry.cache_key, [])
+                insort(lst, cache_entry.start)
+                self._max_chunk_bytes = max(self._max_chunk_bytes, cache_entry.size)
+
+        # If we are over budget, evict oldest until within max_disk_bytes
         try:
-            for sub in self.cfg.cache_dir.iterdir():
-                try:
-                    if sub.is_dir():
-                        for fp in sub.iterdir():
-                            try:
-                                if not fp.is_file() or fp.suffix == ".meta":
-                                    continue
-
-                                key = fp.name
-                                st = fp.stat()
-
-                                # Try to read metadata for this cache entry
-                                metadata = self._read_metadata(key)
-
-                                if metadata:
-                                    cache_key, start = metadata
-                                    entries.append(
-                                        CacheEntry(
-                                            key=key,
-                                            cache_key=cache_key,
-                                            start=start,
-                                            size=int(st.st_size),
-                                            mtime=float(st.st_mtime),
-                                        )
-                                    )
-                                else:
-                                    # No metadata found - this is an orphaned file
-                                    logger.warning(
-                                        f"Removing orphaned cache file without metadata: {fp}"
-                                    )
-
-                                    try:
-                                        fp.unlink()
-                                        # Also remove any stale metadata file
-                                        self._remove_metadata(key)
-                                    except Exception as e:
-                                        logger.warning(
-                                            f"Failed to remove orphaned cache file {fp}: {e}"
-                                        )
-
-                            except Exception:
-                                continue
-                    elif sub.is_file() and sub.suffix != ".meta":
-                        key = sub.name
-                        st = sub.stat()
-
-                        # Try to read metadata for this cache entry
-                        metadata = self._read_metadata(key)
-                        if metadata:
-                            cache_key, start = metadata
-                            entries.append(
-                                CacheEntry(
-                                    key=key,
-                                    cache_key=cache_key,
-                                    start=start,
-                                    size=int(st.st_size),
-                                    mtime=float(st.st_mtime),
-                                )
-                            )
-                        else:
-                            # No metadata found - this is an orphaned file
-                            logger.warning(
-                                f"Removing orphaned cache file without metadata: {sub}"
-                            )
-                            try:
-                                sub.unlink()
-                                # Also remove any stale metadata file
-                                self._remove_metadata(key)
-                            except Exception as e:
-                                logger.warning(
-                                    f"Failed to remove orphaned cache file {sub}: {e}"
-                                )
-                except Exception:
-                    continue
-        finally:
-            entries.sort(key=lambda t: t.mtime)  # by mtime asc
+            await self.trim()
+        except Exception:
+            pass
 
-            async with self.locks():
-                self._index.clear()
-                self._by_path.clear()
-                self._total_bytes = 0
+    def _find_covering(self, cache_key: str, start: int, end: int) -> CacheEntry | None:
+        """
+        Find the chunk containing `start` that extends furthest towards `end`.
+
+        The chunk starting closest before `start` may be a smaller chunk nested inside a larger one
+        cached by another stream, so earlier chunks are checked as far back as the largest chunk could reach.
+        Callers must hold the thread lock.
+        """
+
+        s_list = self._by_path.get(cache_key)
+
+        if not s_list:
+            return None
+
+        best: CacheEntry | None = None
+        idx = bisect_right(s_list, start) - 1
 
-                for cache_entry in entries:
-                    self._index[cache_entry.key] = cache_entry
-                    self._total_bytes += cache_entry.size
+        while idx >= 0 and start - s_list[idx] < self._max_chunk_bytes:
+            cache_entry = self._lookup(self._key(cache_key, s_list[idx]))
 
-                    # Rebuild _by_path index
-                    lst = self._by_path.setdefault(cache_entry.cache_key, [])
-                    insort(lst, cache_entry.start)
+            if cache_entry:
+                chunk_end = cache_entry.start + cache_entry.size - 1
 
-            # If we are over budget, evict oldest until within max_disk_bytes
-            try:
-                await self.trim()
-            except Exception:
-                pass
+                if chunk_end >= start and (
+                    best is None or chunk_end > best.start + best.size - 1
+                ):
+                    best = cache_entry
+
+                    if chunk_end >= end:
+                        break
+
+            idx -= 1
+
+        return best
 
     def _key(self, path: str, start: int) -> str:
         h = hashlib.sha1(f"{path}|{start}".encode()).hexdigest()
         return h
 
-    def _file_for(self, key: str) -> Path:
-        # Two-level fanout to avoid too many files in one dir
-        sub = key[:2]
-        p = self.cfg.cache_dir / sub
-        p.mkdir(parents=True, exist_ok=True)
-        return p / key
+    async def _read_slice(self, key: str, offset: int, size: int) -> CacheData | None:
+        """
+        Read a slice of a chunk, or None if the chunk isn't stored.
 
-    def _metadata_file_for(self, key: str) -> Path:
-        """Get the metadata sidecar file path for a cache entry."""
+        Served as a view into a memory mapping where possible,
+        mapping the chunk's backing file on first access.
+        """
 
-        return self._file_for(key).with_suffix(".meta")
+        view = self._store.view(key, offset, size)
 
-    def _write_metadata(self, key: str, cache_key: str, start: int) -> None:
-        """Write metadata for a cache entry to a sidecar file."""
+        if view is None and await self._run_io("map", lambda: self._store.map(key)):
+            view = self._store.view(key, offset, size)
 
-        metadata = {"cache_key": cache_key, "start": start}
+        if view is not None:
+            return view
 
-        try:
-            with self._metadata_file_for(key).open("w") as f:
-                json.dump(metadata, f)
-        except Exception as e:
-            logger.warning(f"Failed to write cache metadata for {key}: {e}")
+        return await self._run_io("read", lambda: self._store.read(key, offset, size))
 
-    def _read_metadata(self, key: str) -> tuple[str, int] | None:
-        """Read metadata for a cache entry from its sidecar file."""
+    @property
+    def max_pinned_bytes(self) -> int:
+        """Budget for pinned entries; at most half the cache, so policy eviction always has room to work."""
 
-        metadata_file = self._metadata_file_for(key)
+        return min(self.cfg.max_pinned_bytes, self.cfg.max_size_bytes // 2)
 
-        if not metadata_file.exists():
-            return None
+    def _lookup(self, k: str) -> CacheEntry | None:
+        """Get an entry from either index. Callers must hold the cache locks."""
 
-        try:
-            with metadata_file.open("r") as f:
-                metadata = json.load(f)
-                return metadata["cache_key"], metadata["start"]
-        except Exception as e:
-            logger.warning(f"Failed to read cache metadata for {key}: {e}")
-            return None
+        return self._policy.get(k) or self._pinned.get(k)
 
-    def _remove_metadata(self, key: str) -> None:
-        """Remove metadata file for a cache entry."""
+    def _tier_of(self, k: str) -> CacheTier:
+        """Get the disk tier an entry is in. Callers must hold the cache locks."""
 
-        try:
-            metadata_file = self._metadata_file_for(key)
+        if k in self._pinned:
+            return "pinned"
 
-            if metadata_file.exists():
-                metadata_file.unlink()
-        except Exception as e:
-            logger.warning(f"Failed to remove cache metadata for {key}: {e}")
+        return self._policy.tier_of(k) or "probationary"
 
-    async def _evict_lru(self, need_bytes: int = 0) -> None:
-        async with self.locks():
-            target = max(0, self._total_bytes + need_bytes - self.cfg.max_size_bytes)
+    def _touch(self, k: str) -> None:
+        """Record a hit on an entry for eviction ordering. Callers must hold the cache locks."""
+
+        if k in self._pinned:
+            self._pinned.move_to_end(k, last=True)
+        else:
+            self._policy.touch(k)
+
+    def _remember(self, k: str, data: bytes) -> None:
+        """Keep a chunk in the RAM tier. Callers must hold the cache locks."""
+
+        if len(data) > self.cfg.memory_tier_bytes:
+            return
+
+        self._drop_from_memory(k)
+
+        self._memory[k] = data
+        self._memory_bytes += len(data)
+
+        while self._memory_bytes > self.cfg.memory_tier_bytes:
+            _, oldest = self._memory.popitem(last=False)
+            self._memory_bytes -= len(oldest)
+
+    def _drop_from_memory(self, k: str) -> None:
+        """Remove a chunk from the RAM tier. Callers must hold the cache locks."""
+
+        data = self._memory.pop(k, None)
+
+        if data is not None:
+            self._memory_bytes -= len(data)
+
+    def _promote_to_memory(self, k: str) -> None:
+        """Copy a chunk into the RAM tier if its backing file is mapped. Callers must hold the cache locks."""
+
+        if k in self._memory or not (cache_entry := self._lookup(k)):
+            return
 
-            while target > 0 and self._index:
-                k, cache_entry = self._index.popitem(last=False)  # LRU
+        view = self._store.view(k, 0, cache_entry.size)
 
-                # Remove from per-path index
-                lst = self._by_path.get(cache_entry.cache_key)
+        if view is not None:
+            self._remember(k, bytes(view))
 
-                if lst:
-                    idx = bisect_right(lst, cache_entry.start) - 1
+    def _forget(self, keys: list[str]) -> None:
+        """Remove entries from the index. Callers must hold the cache locks."""
 
-                    if idx >= 0 and lst[idx] == cache_entry.start:
-                        del lst[idx]
+        for k in keys:
+            cache_entry = self._policy.remove(k) or self._pinned.pop(k, None)
 
-                    if not lst:
-                        self._by_path.pop(cache_entry.cache_key, None)
+            if not cache_entry:
+                continue
+
+            if cache_entry.pinned:
+                self._pinned_bytes -= cache_entry.size
+
+            self._unindex(cache_entry)
+
+    def _unindex(self, cache_entry: CacheEntry) -> None:
+        """Remove an entry from the path index, RAM tier and size accounting. Callers must hold the cache locks."""
+
+        self._drop_from_memory(cache_entry.key)
+
+        lst = self._by_path.get(cache_entry.cache_key)
 
-                fp = self._file_for(k)
+        if lst:
+            idx = bisect_right(lst, cache_entry.start) - 1
 
-                try:
-                    if fp.exists():
-                        fp.unlink()
+            if idx >= 0 and lst[idx] == cache_entry.start:
+                del lst[idx]
 
-                    # Also remove metadata file
-                    self._remove_metadata(k)
-                except Exception:
-                    pass
+            if not lst:
+                self._by_path.pop(cache_entry.cache_key, None)
+
+        self._total_bytes -= cache_entry.size
+
+    async def _evict_lru(self, need_bytes: int = 0) -> None:
+        evicted_keys = list[str]()
+
+        async with self.locks():
+            target = max(0, self._total_bytes + need_bytes - self.cfg.max_size_bytes)
+
+            while target > 0 and (cache_entry := self._policy.pop_victim()):
+                self._unindex(cache_entry)
+
+                evicted_keys.append(cache_entry.key)
 
-                self._total_bytes -= cache_entry.size
                 target -= cache_entry.size
                 self._metrics.evictions += 1
 
-    async def _evict_ttl(self) -> None:
-        ttl = self.cfg.ttl_seconds
-        now = time.time()
-        removed = 0
+        # Remove evicted files outside the lock; the index no longer references them.
+        if evicted_keys:
+            await self._run_io("delete", lambda: self._store.delete(evicted_keys))
 
-        async with self.locks():
-            for k in list(self._index.keys()):
-                cache_entry = self._index.get(k)
+    async def _evict_pinned(self, need_bytes: int) -> None:
+        """Unpin and remove the oldest pinned entries until `need_bytes` more can be pinned."""
 
-                if not cache_entry:
-                    continue
+        evicted_keys = list[str]()
 
-                if now - cache_entry.mtime > ttl:
-                    fp = self._file_for(k)
+        async with self.locks():
+            pinned_bytes = self._pinned_bytes
 
-                    try:
-                        if fp.exists():
-                            fp.unlink()
+            for k, cache_entry in self._pinned.items():
+                if pinned_bytes + need_bytes <= self.max_pinned_bytes:
+                    break
+
+                evicted_keys.append(k)
+                pinned_bytes -= cache_entry.size
 
-                        # Also remove metadata file
-                        self._remove_metadata(k)
-                    except Exception:
-                        pass
+            self._forget(evicted_keys)
+            self._metrics.evictions += len(evicted_keys)
 
-                    self._index.pop(k, None)
-                    lst = self._by_path.get(cache_entry.cache_key)
+        if evicted_keys:
+            await self._run_io("delete", lambda: self._store.delete(evicted_keys))
 
-                    if lst:
-                        idx = bisect_right(lst, cache_entry.start) - 1
+    async def _evict_ttl(self) -> None:
+        ttl = self.cfg.ttl_seconds
+        now = time.time()
+        evicted_keys = list[str]()
 
-                        if idx >= 0 and lst[idx] == cache_entry.start:
-                            del lst[idx]
+        async with self.locks():
+            for cache_entry in self._policy:
+                if now - cache_entry.mtime > ttl:
+                    evicted_keys.append(cache_entry.key)
 
-                        if not lst:
-                            self._by_path.pop(cache_entry.cache_key, None)
+            self._forget(evicted_keys)
 
-                    self._total_bytes -= cache_entry.size
-                    removed += 1
+        if evicted_keys:
+            self._metrics.evictions += len(evicted_keys)
 
-        if removed:
-            self._metrics.evictions += removed
+            await self._run_io("delete", lambda: self._store.delete(evicted_keys))
 
-    async def get(self, cache_key: str, start: int, end: int) -> bytes:
+    async def get(self, cache_key: str, start: int, end: int) -> CacheData:
         needed_len = max(0, end - start + 1)
 
         if needed_len == 0:
@@ -360,77 +479,65 @@ class Cache:
         # Fast path: Try to find a single chunk that contains the entire request
         # This avoids holding the lock during file I/O for the common case
         chunk_key = None
-        chunk_file = None
         chunk_start_offset = 0
 
         async with self.locks():
-            s_list = self._by_path.get(cache_key)
+            cache_entry = self._find_covering(cache_key, start, end)
+
+            # Check if this single chunk covers the entire request
+            if cache_entry and end <= cache_entry.start + cache_entry.size - 1:
+                # Fast path: single chunk covers entire request
+                chunk_key = cache_entry.key
+                chunk_start_offset = cache_entry.start
 
-            if s_list:
-                # Find chunk that might contain start position
-                idx = bisect_right(s_list, start) - 1
+                # Fastest path: the chunk is in the RAM tier
+                data = self._memory.get(chunk_key)
 
-                if idx >= 0:
-                    chunk_start = s_list[idx]
-                    cache_entry = self._index.get(self._key(cache_key, chunk_start))
+                if data is not None:
+                    self._memory.move_to_end(chunk_key, last=True)
+                    self._touch(chunk_key)
+                    self._metrics.record_hit("memory", needed_len)
 
-                    if cache_entry:
-                        chunk_end = chunk_start + cache_entry.size - 1
+                    offset = start - chunk_start_offset
 
-                        # Check if this single chunk covers the entire request
-                        if start >= chunk_start and end <= chunk_end:
-                            # Fast path: single chunk covers entire request
-                            chunk_key = self._key(cache_key, chunk_start)
-                            chunk_file = self._file_for(chunk_key)
-                            chunk_start_offset = chunk_start
-                            # Don't update timestamps yet - do it after successful read
+                    return memoryview(data)[offset : offset + needed_len]
+
+                # Don't update timestamps yet - do it after successful read
 
         # Fast path: read single chunk outside the lock
-        if chunk_key and chunk_file:
-            try:
-                read_start = time.time()
+        if chunk_key:
+            read_start = time.time()
 
-                # Calculate slice within chunk
-                copy_start = start - chunk_start_offset
-                copy_end = end - chunk_start_offset
-                bytes_to_read = copy_end - copy_start + 1
+            # Calculate slice within chunk
+            copy_start = start - chunk_start_offset
+            copy_end = end - chunk_start_offset
+            bytes_to_read = copy_end - copy_start + 1
 
-                # Optimization: Only read the slice we need, not the entire chunk!
-                # This is much faster for large chunks (128MB) when we only need 128KB
-                with chunk_file.open("rb") as f:
-                    f.seek(copy_start)
-                    result = f.read(bytes_to_read)
+            # Optimization: Only read the slice we need, not the entire chunk!
+            # This is much faster for large chunks (128MB) when we only need 128KB
+            result = await self._read_slice(chunk_key, copy_start, bytes_to_read)
 
+            # A missing chunk falls through to the slow path
+            if result is not None:
                 read_time = time.time() - read_start
 
                 if read_time > 0.05:  # Log slow reads (>50ms)
                     logger.warning(
-                        f"Slow cache read: {len(result)/(1024*1024):.2f}MB in {read_time*1000:.0f}ms from {chunk_file}"
+                        f"Slow cache read: {len(result)/(1024*1024):.2f}MB in {read_time*1000:.0f}ms from chunk {chunk_key}"
                     )
 
                 if len(result) == needed_len:
-                    # Update LRU (move to end) but only update timestamp periodically
+                    # Update eviction order; timestamps are only refreshed periodically
                     # to reduce lock contention and index modifications
                     async with self.locks():
-                        if chunk_key in self._index:
-                            cache_entry = self._index[chunk_key]
-                            self._index.move_to_end(chunk_key, last=True)
-
-                            # Only update timestamp if it's been more than 10 seconds
-                            # This reduces write pressure on the index
-                            now = time.time()
-
-                            if now - cache_entry.mtime > 10.0:
-                                self._index[chunk_key] = CacheEntry(
-                                    key=cache_entry.key,
-                                    cache_key=cache_entry.cache_key,
-                                    mtime=now,
-                                    start=cache_entry.start,
-                                    size=cache_entry.size,
-                                )
-
-                    self._metrics.hits += 1
-                    self._metrics.bytes_from_cache += needed_len
+                        tier = self._tier_of(chunk_key)
+                        self._touch(chunk_key)
+
+                        if tier in ("pinned", "protected"):
+                            # Probed over and over by players and scanners; keep it in RAM
+                            self._promote_to_memory(chunk_key)
+
+                    self._metrics.record_hit(tier, needed_len)
 
                     total_time = time.time() - get_start_time
 
@@ -440,58 +547,41 @@ class Cache:
                         )
 
                     return result
-            except FileNotFoundError:
-                # Chunk file missing, fall through to slow path
-                pass
 
         # Slow path: multi-chunk stitching for cross-chunk boundary requests
         # Plan the read operations while holding the lock, then release it for I/O
         chunks_to_read = list[ChunkInfo]()
 
         async with self.locks():
-            s_list = self._by_path.get(cache_key)
-
-            if s_list:
-                current_pos = start
-
-                while current_pos <= end:
-                    # Find chunk that contains current_pos
-                    idx = bisect_right(s_list, current_pos) - 1
-                    if idx < 0:
-                        break  # No chunk starts at or before current_pos
-
-                    chunk_start = s_list[idx]
-                    chunk_key = self._key(cache_key, chunk_start)
-                    cache_entry = self._index.get(chunk_key)
-
-                    if not cache_entry:
-                        break  # Chunk not in index
-
-                    chunk_end = chunk_start + cache_entry.size - 1
-
-                    # Check if this chunk covers current_pos
-                    if current_pos < chunk_start or current_pos > chunk_end:
-                        break  # Gap in coverage
-
-                    # Calculate what portion of this chunk we need
-                    copy_start = max(current_pos, chunk_start) - chunk_start
-                    copy_end = min(end, chunk_end) - chunk_start
-                    bytes_to_read = copy_end - copy_start + 1
-
-                    # Plan this read operation
-                    chunk_file = self._file_for(chunk_key)
-                    chunks_to_read.append(
-                        ChunkInfo(
-                            chunk_key=chunk_key,
-                            chunk_ts=cache_entry.mtime,
-                            chunk_file=chunk_file,
-                            copy_start=copy_start,
-                            bytes_to_read=bytes_to_read,
-                            chunk_end=chunk_end,
-                        )
+            current_pos = start
+
+            while current_pos <= end:
+                # Find chunk that contains current_pos
+                cache_entry = self._find_covering(cache_key, current_pos, end)
+
+                if not cache_entry:
+                    break  # Gap in coverage
+
+                chunk_start = cache_entry.start
+                chunk_end = chunk_start + cache_entry.size - 1
+
+                # Calculate what portion of this chunk we need
+                copy_start = current_pos - chunk_start
+                copy_end = min(end, chunk_end) - chunk_start
+                bytes_to_read = copy_end - copy_start + 1
+
+                # Plan this read operation
+                chunks_to_read.append(
+                    ChunkInfo(
+                        chunk_key=cache_entry.key,
+                        chunk_ts=cache_entry.mtime,
+                        copy_start=copy_start,
+                        bytes_to_read=bytes_to_read,
+                        chunk_end=chunk_end,
                     )
+                )
 
-                    current_pos = chunk_end + 1
+                current_pos = chunk_end + 1
 
         # Execute reads outside the lock to reduce contention
         if chunks_to_read:
@@ -499,12 +589,14 @@ class Cache:
             chunks_used = list[tuple[str, float]]()
 
             for chunk_info in chunks_to_read:
-                try:
-                    with chunk_info.chunk_file.open("rb") as f:
-                        f.seek(chunk_info.copy_start)
-                        chunk_slice = f.read(chunk_info.bytes_to_read)
-                except FileNotFoundError:
-                    # Chunk file missing, abort slow path
+                chunk_slice = await self._read_slice(
+                    chunk_info.chunk_key,
+                    chunk_info.copy_start,
+                    chunk_info.bytes_to_read,
+                )
+
+                if chunk_slice is None:
+                    # Chunk missing, abort slow path
                     break
 
                 if len(chunk_slice) == chunk_info.bytes_to_read:
@@ -516,44 +608,25 @@ class Cache:
             else:
                 # All chunks read successfully (no break occurred)
                 if len(result_data) == needed_len:
-                    # Update LRU and timestamps while holding the lock
+                    # Update eviction order and timestamps while holding the lock
                     async with self.locks():
-                        now = time.time()
-
-                        for chunk_key, chunk_ts in chunks_used:
-                            if chunk_key in self._index:  # Verify chunk still exists
-                                self._index.move_to_end(chunk_key, last=True)
-
-                                # Only update timestamp if it's been more than 10 seconds
-                                if now - chunk_ts > 10.0:
-                                    cache_entry = self._index[chunk_key]
-                                    self._index[chunk_key] = CacheEntry(
-                                        key=cache_entry.key,
-                                        mtime=now,
-                                        cache_key=cache_entry.cache_key,
-                                        start=cache_entry.start,
-                                        size=cache_entry.size,
-                                    )
-
-                    self._metrics.hits += 1
-                    self._metrics.bytes_from_cache += needed_len
+                        # Attributed to the tier of the chunk the read starts in
+                        tier = self._tier_of(chunks_used[0][0])
+
+                        for chunk_key, _ in chunks_used:
+                            self._touch(chunk_key)
+
+                    self._metrics.record_hit(tier, needed_len)
 
                     return bytes(result_data)
 
-        # Fallback: Direct probe for exact key on filesystem and rebuild index
+        # Fallback: Direct probe for exact key in the store and rebuild index
         k = self._key(cache_key, start)
-        fp = self._file_for(k)
-        data: bytes | None = None
-
-        try:
-            with fp.open("rb") as f:
-                data = f.read()
-        except FileNotFoundError:
-            data = None
+        data = await self._run_io("read", lambda: self._store.read(k))
 
         if data is None:
             async with self.locks():
-                self._index.pop(k, None)
+                self._forget([k])
 
             self._metrics.misses += 1
             # No log for cache misses - reduces noise (misses are expected and normal)
@@ -561,17 +634,20 @@ class Cache:
 
         # If we got here but entry was missing in index, rebuild it
         async with self.locks():
-            if k not in self._index:
+            if self._lookup(k) is None:
                 sz = len(data)
-                self._index[k] = CacheEntry(
-                    key=k,
-                    cache_key=cache_key,
-                    start=start,
-                    size=sz,
-                    mtime=time.time(),
+                self._policy.admit(
+                    CacheEntry(
+                        key=k,
+                        cache_key=cache_key,
+                        start=start,
+                        size=sz,
+                        mtime=time.time(),
+                    )
                 )
                 lst = self._by_path.setdefault(cache_key, [])
                 insort(lst, start)
+                self._max_chunk_bytes = max(self._max_chunk_bytes, sz)
                 self._total_bytes += sz
 
         if end < start:
@@ -580,79 +656,129 @@ class Cache:
         length = end - start + 1
 
         if len(data) >= length:
-            self._metrics.hits += 1
-            self._metrics.bytes_from_cache += length
+            self._metrics.record_hit("probationary", length)
             return data[:length]
 
         self._metrics.misses += 1
 
         return b""
 
-    async def put(self, cache_key: str, start: int, data: bytes) -> None:
+    async def put(
+        self,
+        cache_key: str,
+        start: int,
+        data: bytes,
+        *,
+        pinned: bool = False,
+        protected: bool = False,
+    ) -> None:
+        """
+        Store a chunk in the cache.
+
+        Protected chunks (e.g. headers and footers) are only evicted once no other unpinned chunks are left.
+        Pinned chunks are exempt from LRU/TTL eviction; once `max_pinned_bytes` is reached,
+        the oldest pinned chunks are removed to make room.
+        """
+
         if not data:
             return
 
         k = self._key(cache_key, start)
         need = len(data)
 
+        if pinned:
+            if need > self.max_pinned_bytes:
+                pinned = False
+            else:
+                await self._evict_pinned(need)
+
         if self.cfg.eviction == "TTL":
             await self._evict_ttl()
         else:
             await self._evict_lru(need)
 
-        fp = self._file_for(k)
-
         try:
-            with fp.open("wb") as f:
-                f.write(data)
-
-            # Write metadata after successful data write
-            self._write_metadata(k, cache_key, start)
+            displaced_keys = await self._run_io(
+                "write",
+                lambda: self._store.write(k, cache_key, start, data, pinned),
+            )
         except Exception as e:
             logger.warning(f"Disk cache write failed: {e}")
             return
 
         async with self.locks():
-            prev = self._index.pop(k, None)
-
-            if prev:
-                self._total_bytes -= prev.size
-                lst_prev = self._by_path.get(cache_key)
-
-                if lst_prev:
-                    idx_prev = bisect_right(lst_prev, start) - 1
+            # Chunks the store dropped to make room for this one
+            if displaced_keys:
+                self._forget(displaced_keys)
+                self._metrics.evictions += len(displaced_keys)
 
-                    if idx_prev >= 0 and lst_prev[idx_prev] == start:
-                        del lst_prev[idx_prev]
+            # Replace any previous entry for this chunk
+            self._forget([k])
 
-                    if not lst_prev:
-                        self._by_path.pop(cache_key, None)
-
-            self._index[k] = CacheEntry(
+            cache_entry = CacheEntry(
                 key=k,
                 cache_key=cache_key,
                 start=start,
                 size=need,
                 mtime=time.time(),
+                pinned=pinned,
             )
+
+            if pinned:
+                self._pinned[k] = cache_entry
+                self._pinned_bytes += need
+            else:
+                self._policy.admit(cache_entry, protected=protected)
+
             lst = self._by_path.setdefault(cache_key, [])
             insort(lst, start)
+            self._max_chunk_bytes = max(self._max_chunk_bytes, need)
             self._total_bytes += need
             self._metrics.bytes_written += need
 
+            # Freshly written chunks are about to be read by the stream that fetched them
+            self._remember(k, bytes(data))
+
+    async def pin(self, cache_key: str, start: int, end: int) -> bool:
+        """
+        Pin an already cached range [start, end], as if it had been `put` with `pinned=True`.
+
+        Returns whether the range is cached; it's left unpinned if it doesn't fit the pinned budget.
+        """
+
+        async with self.locks():
+            cache_entry = self._find_covering(cache_key, start, end)
+
+            if (
+                cache_entry
+                and cache_entry.pinned
+                and cache_entry.start == start
+                and cache_entry.size == end - start + 1
+            ):
+                return True
+
+        data = await self.get(cache_key, start, end)
+
+        if len(data) != end - start + 1:
+            return False
+
+        # Re-written rather than flagged in place, so the pin is persisted by the store
+        await self.put(cache_key, start, bytes(data), pinned=True, protected=True)
+
+        return True
+
     def has(self, cache_key: str, start: int, end: int) -> bool:
         """
-        Check if the cache contains the full range [start, end] for the given cache_key.
+        Check if a single cached chunk contains the full range [start, end] for the given cache_key.
 
+        The chunk may start before `start`, e.g. a larger chunk cached by another stream of the same file.
         This uses a thread-safe approach to prevent data races with concurrent writers.
         """
 
-        k = self._key(cache_key, start)
-
-        # Use a separate thread lock to protect _index reads from async writers
+        # Use a separate thread lock to protect index reads from async writers
         # This avoids the need to make this method async
         with self._thread_lock:
-            cache_entry = self._index.get(k)
+            cache_entry = self._find_covering(cache_key, start, end)
 
             if not cache_entry:
                 return False
@@ -662,12 +788,13 @@ class Cache:
             if end > chunk_end:
                 return False
 
-        # Check file existence outside the lock
-        fp = self._file_for(k)
-
-        return fp.exists()
+        # Check the store outside the lock
+        return self._store.exists(cache_entry.key)
 
     async def trim(self) -> None:
+        # Pinned entries can't be evicted by policy, so keep them within their own budget first
+        await self._evict_pinned(0)
+
         # Primary policy-based trimming
         if self.cfg.eviction == "TTL":
             await self._evict_ttl()
@@ -689,7 +816,33 @@ class Cache:
 
         async with self.locks():
             s["total_bytes"] = self._total_bytes
-            s["entries"] = len(self._index)
+            s["entries"] = len(self._policy) + len(self._pinned)
+            s["pinned_entries"] = len(self._pinned)
+            s["pinned_bytes"] = self._pinned_bytes
+
+            tier_sizes: dict[CacheTier, tuple[int, int]] = {
+                "memory": (len(self._memory), self._memory_bytes),
+                "pinned": (len(self._pinned), self._pinned_bytes),
+                "protected": self._policy.size_of("protected"),
+                "probationary": self._policy.size_of("probationary"),
+            }
+
+        lookups = s["hits"] + s["misses"]
+
+        s["tiers"] = {
+            tier: CacheTierSnapshot(
+                hits=(hits := self._metrics.tier_hits.get(tier, 0)),
+                hit_ratio=round(hits / lookups, 3) if lookups else 0.0,
+                entries=entries,
+                bytes=size,
+            )
+            for tier, (entries, size) in tier_sizes.items()
+        }
+
+        io_statistics = self._io_limiter.statistics()
+        s["io_queue_depth"] = io_statistics.tasks_waiting
+        s["io_in_flight"] = io_statistics.borrowed_tokens
+        s["mapped_chunks"] = self._store.mapped_count
 
         return s
 
@@ -286,6 +286,52 @@ class Chunker:
             (self.file_size - self.footer_size - self.header_size) // self.chunk_size,
         )
 
+    @staticmethod
+    def choose_chunk_size(
+        *,
+        base_chunk_size: int,
+        max_chunk_size: int,
+        file_size: int,
+        bitrate: int | None = None,
+        throughput: float | None = None,
+    ) -> int:
+        """Choose the chunk size for a stream.
+
+        A whole chunk must download before any of it can be read, so each chunk should
+        arrive within about a second, whilst high-bitrate files benefit from fewer,
+        larger requests. Chunks hold about a second of playback at the probed bitrate,
+        capped by what the provider has been measured to deliver in a second and by
+        1/64th of the file.
+
+        The result is always a power-of-two multiple of the base chunk size,
+        so that chunk boundaries line up across streams of the same file
+        and a larger cached chunk can serve reads for a stream using smaller chunks.
+
+        Parameters:
+            base_chunk_size (int): The configured chunk size; the smallest size chosen.
+            max_chunk_size (int): The largest chunk size to choose.
+            file_size (int): The size of the file in bytes.
+            bitrate (int | None): The file's overall bitrate in bits per second, if probed.
+            throughput (float | None): The provider's download throughput in bytes per second, if measured.
+
+        Returns:
+            int: The chunk size in bytes.
+        """
+
+        target = base_chunk_size if bitrate is None else bitrate // 8
+
+        if throughput is not None:
+            target = min(target, int(throughput))
+
+        target = min(target, max_chunk_size, file_size // 64)
+
+        chunk_size = base_chunk_size
+
+        while chunk_size * 2 <= target:
+            chunk_size *= 2
+
+        return chunk_size
+
     @cached_property
     def header_chunk(self) -> Chunk:
         """Get the header chunk.
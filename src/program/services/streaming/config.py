@@ -26,6 +26,15 @@ class Config:
     # Tolerance for detecting scan reads. Any read that jumps more than this value is considered a scan.
     scan_tolerance_blocks: int = 25
 
+    # Seconds of playback to keep cached ahead of the play head during sequential playback.
+    read_ahead_seconds: int = 30
+
+    # Upper bound on the bytes kept cached ahead of the play head. 0 disables read-ahead.
+    read_ahead_max_bytes: int = 256 * 1024 * 1024
+
+    # Chunks fetched concurrently over separate connections when playback starts or seeks. 0 disables.
+    parallel_seek_chunks: int = 0
+
     @property
     def block_size(self) -> int:
         """Kernel block size; the byte length the OS reads/writes at a time."""
@@ -44,6 +53,12 @@ class Config:
 
         return self.block_size * self.sequential_read_tolerance_blocks
 
+    @property
+    def read_ahead_max_chunks(self) -> int:
+        """Upper bound on the chunks kept cached ahead of the play head."""
+
+        return self.read_ahead_max_bytes // self.chunk_size
+
     @property
     def scan_tolerance(self) -> int:
         """Tolerance for detecting scan reads. Any read that jumps more than this value is considered a scan."""
@@ -0,0 +1,23 @@
+import trio
+
+
+class ProviderConnectionLimiter:
+    """
+    Bounds the extra connections opened to each provider for parallel chunk fetches.
+
+    Streams fetch the chunks around a seek target over several concurrent connections.
+    Providers throttle or ban accounts that open too many at once, so every stream
+    streaming from the same provider draws from a shared budget.
+    """
+
+    def __init__(self, max_connections: int) -> None:
+        self.max_connections = max_connections
+        self._limiters = dict[str, trio.CapacityLimiter]()
+
+    def get(self, provider: str) -> trio.CapacityLimiter:
+        """Get the limiter for a provider, creating it on first use."""
+
+        if provider not in self._limiters:
+            self._limiters[provider] = trio.CapacityLimiter(self.max_connections)
+
+        return self._limiters[provider]
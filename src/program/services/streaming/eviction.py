@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from collections.abc import Iterator
+from dataclasses import replace
+from typing import Literal
+
+from .stores import CacheEntry
+
+type EvictionTier = Literal["probationary", "protected"]
+
+
+class SegmentedLRU:
+    """
+    Eviction order for unpinned cache entries, split into two LRU segments.
+
+    New entries are admitted to the probationary segment and are always evicted from there first.
+    Entries admitted as protected (e.g. header and footer chunks, which every player and scanner probes)
+    live in the protected segment, which is bounded by `max_protected_bytes`;
+    overflow is demoted back to the most recently used end of the probationary segment.
+
+    With `promote_on_hit`, a probationary entry that is read again after sitting idle
+    for `reuse_after_seconds` is promoted to the protected segment, and entries re-admitted shortly after being evicted go straight to the protected segment
+    (an ARC-style "ghost" list), so one long sequential stream can't flush the whole working set.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_protected_bytes: int,
+        promote_on_hit: bool,
+        reuse_after_seconds: float = 60.0,
+        max_ghosts: int = 10_000,
+    ) -> None:
+        self.max_protected_bytes = max_protected_bytes
+        self.promote_on_hit = promote_on_hit
+        self.reuse_after_seconds = reuse_after_seconds
+        self.max_ghosts = max_ghosts
+
+        self._probationary = OrderedDict[str, CacheEntry]()
+        self._protected = OrderedDict[str, CacheEntry]()
+        self._ghosts = OrderedDict[str, None]()
+        self._protected_bytes = 0
+        self._probationary_bytes = 0
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._probationary or key in self._protected
+
+    def __len__(self) -> int:
+        return len(self._probationary) + len(self._protected)
+
+    def __iter__(self) -> Iterator[CacheEntry]:
+        """Iterate over all entries, in eviction order."""
+
+        yield from list(self._probationary.values())
+        yield from list(self._protected.values())
+
+    def get(self, key: str) -> CacheEntry | None:
+        return self._probationary.get(key) or self._protected.get(key)
+
+    def tier_of(self, key: str) -> EvictionTier | None:
+        if key in self._probationary:
+            return "probationary"
+
+        if key in self._protected:
+            return "protected"
+
+        return None
+
+    def size_of(self, tier: EvictionTier) -> tuple[int, int]:
+        """Get the number of entries and bytes in a segment."""
+
+        if tier == "protected":
+            return len(self._protected), self._protected_bytes
+
+        return len(self._probationary), self._probationary_bytes
+
+    def admit(self, entry: CacheEntry, *, protected: bool = False) -> None:
+        """Add an entry as the most recently used of its segment."""
+
+        self.remove(entry.key)
+
+        if self.promote_on_hit and entry.key in self._ghosts:
+            # Evicted recently and needed again; it belongs to the working set
+            del self._ghosts[entry.key]
+            protected = True
+
+        if protected:
+            self._add_protected(entry)
+        else:
+            self._probationary[entry.key] = entry
+            self._probationary_bytes += entry.size
+
+    def touch(self, key: str, *, refresh_after_seconds: float = 10.0) -> None:
+        """
+        Record a hit on an entry, moving it to the most recently used end of its segment.
+
+        The entry's mtime is only refreshed once it is `refresh_after_seconds` old,
+        to keep index churn down on hot chunks.
+        """
+
+        entry = self.get(key)
+
+        if not entry:
+            return
+
+        now = time.time()
+        idle_seconds = now - entry.mtime
+
+        if idle_seconds > refresh_after_seconds:
+            entry = replace(entry, mtime=now)
+
+        if key in self._protected:
+            self._protected[key] = entry
+            self._protected.move_to_end(key, last=True)
+        elif self.promote_on_hit and idle_seconds > self.reuse_after_seconds:
+            # Playback reads each chunk right after it is downloaded;
+            # a read after the chunk sat idle is a genuine re-use, so protect it.
+            self._probationary_bytes -= self._probationary.pop(key).size
+            self._add_protected(entry)
+        else:
+            self._probationary[key] = entry
+            self._probationary.move_to_end(key, last=True)
+
+    def remove(self, key: str) -> CacheEntry | None:
+        if entry := self._probationary.pop(key, None):
+            self._probationary_bytes -= entry.size
+        elif entry := self._protected.pop(key, None):
+            self._protected_bytes -= entry.size
+
+        return entry
+
+    def pop_victim(self) -> CacheEntry | None:
+        """Remove and return the next entry to evict, or None if there are no entries."""
+
+        if self._probationary:
+            _, entry = self._probationary.popitem(last=False)
+            self._probationary_bytes -= entry.size
+        elif self._protected:
+            _, entry = self._protected.popitem(last=False)
+            self._protected_bytes -= entry.size
+        else:
+            return None
+
+        if self.promote_on_hit:
+            self._ghosts[entry.key] = None
+
+            while len(self._ghosts) > self.max_ghosts:
+                self._ghosts.popitem(last=False)
+
+        return entry
+
+    def clear(self) -> None:
+        self._probationary.clear()
+        self._protected.clear()
+        self._ghosts.clear()
+        self._protected_bytes = 0
+        self._probationary_bytes = 0
+
+    def _add_protected(self, entry: CacheEntry) -> None:
+        self._protected[entry.key] = entry
+        self._protected_bytes += entry.size
+
+        # Demote the least recently used protected entries to make room
+        while (
+            self._protected_bytes > self.max_protected_bytes
+            and len(self._protected) > 1
+        ):
+            _, demoted = self._protected.popitem(last=False)
+            self._protected_bytes -= demoted.size
+            self._probationary[demoted.key] = demoted
+            self._probationary_bytes += demoted.size
@@ -3,13 +3,13 @@ import trio_util
 import pyfuse3
 import httpx
 
-from functools import cached_property
+from functools import cached_property, partial
 from contextlib import asynccontextmanager
 from loguru import logger
 from typing import Any, Literal
 from http import HTTPStatus
 from kink import di
-from collections.abc import AsyncGenerator, AsyncIterator
+from collections.abc import AsyncGenerator, AsyncIterator, Awaitable, Callable
 from ordered_set import OrderedSet
 
 from program.settings import settings_manager
@@ -17,8 +17,10 @@ from program.utils import benchmark
 from program.utils.async_client import AsyncClient
 from program.utils.proxy_client import ProxyClient
 
+from .cache import CacheData
 from .chunker import Chunk, ChunkCacheNotifier, ChunkRange, Chunker
 from .config import Config
+from .connection_limiter import ProviderConnectionLimiter
 from .exceptions import (
     CacheDataNotFoundException,
     ChunksTooSlowException,
@@ -37,9 +39,11 @@ from .exceptions import (
     DebridServiceLinkUnavailable,
 )
 from .file_metadata import FileMetadata
-from .recent_reads import Read, RecentReads
-from .session_statistics import SessionStatistics
+from .read_ahead import ReadAhead
+from .recent_reads import Read
+from .session_statistics import ProviderThroughput, SessionStatistics
 from .stream_connection import StreamConnection
+from .stream_handle import StreamHandle
 
 
 # Providers that require proxy connections for streaming
@@ -63,45 +67,63 @@ class MediaStream:
 
     This class manages the streaming of media content, including handling
     connections, fetching data, and managing playback.
+
+    A single stream is shared by every file handle reading the same original file.
+    Each attached handle drives its own connection when it needs data nobody else is fetching,
+    whilst chunks already being fetched by another handle are awaited rather than re-downloaded.
     """
 
     def __init__(
         self,
         *,
-        fh: pyfuse3.FileHandleT,
         file_size: int,
         path: str,
         original_filename: str,
         nursery: trio.Nursery,
         provider: str,
         initial_url: str,
+        bitrate: int | None = None,
     ) -> None:
         stream_settings = settings_manager.settings.stream
         fs = settings_manager.settings.filesystem
 
-        self.fh = fh
         self.nursery = nursery
         self.provider = provider
-        self.recent_reads: RecentReads = RecentReads()
-        self.is_streaming: trio_util.AsyncBool = trio_util.AsyncBool(False)
+        self.handles = dict[pyfuse3.FileHandleT, StreamHandle]()
         self.is_killed: trio_util.AsyncBool = trio_util.AsyncBool(False)
-        self._stream_error: trio_util.AsyncValue[Exception | None] = (
-            trio_util.AsyncValue(None)
-        )
         self.enable_tracing = settings_manager.settings.enable_stream_tracing
 
         # Store initial URL to avoid redundant unrestrict calls
         self.target_url: trio_util.AsyncValue[str] = trio_util.AsyncValue(initial_url)
 
         self.config = Config(
-            chunk_size=stream_settings.chunk_size_mb * 1024 * 1024,
+            chunk_size=Chunker.choose_chunk_size(
+                base_chunk_size=stream_settings.chunk_size_mb * 1024 * 1024,
+                max_chunk_size=stream_settings.max_chunk_size_mb * 1024 * 1024,
+                file_size=file_size,
+                bitrate=bitrate,
+                throughput=di[ProviderThroughput].get(provider),
+            ),
             activity_timeout_seconds=stream_settings.activity_timeout_seconds,
             chunk_wait_timeout_seconds=stream_settings.chunk_wait_timeout_seconds,
             connect_timeout_seconds=stream_settings.connect_timeout_seconds,
+            read_ahead_seconds=stream_settings.read_ahead_seconds,
+            # Never let read-ahead claim more than a quarter of the cache
+            read_ahead_max_bytes=min(
+                stream_settings.read_ahead_max_mb,
+                fs.cache_max_size_mb // 4,
+            )
+            * 1024
+            * 1024,
+            parallel_seek_chunks=stream_settings.parallel_seek_chunks,
         )
 
         self.session_statistics = SessionStatistics()
 
+        # Chunks currently being downloaded by any of this stream's connections.
+        # Used to avoid fetching the same chunk more than once for concurrent handles.
+        self._in_flight_chunks = set[Chunk]()
+
         self.file_metadata = FileMetadata(
             file_size=file_size,
             path=path,
@@ -148,12 +170,12 @@ class MediaStream:
     def __repr__(self) -> str:
         return (
             f"<MediaStream[{self.provider}] "
-            f"fh={self.fh} "
+            f"handles={list(self.handles)} "
             f"path={self.file_metadata.path} "
             f"session_statistics={self.session_statistics} "
-            f"last_read_timestamp={self.recent_reads.current_read.value.timestamp if self.recent_reads.current_read.value else None} "
+            f"last_read_timestamp={self.last_read_timestamp} "
             f"is_timed_out={self.is_timed_out} "
-            f"is_streaming={self.is_streaming.value} "
+            f"is_streaming={self.is_streaming} "
             f"file_size={self.file_metadata.file_size} "
             ">"
         )
@@ -178,37 +200,125 @@ class MediaStream:
 
         return aligned_footer_size
 
+    @property
+    def last_read_timestamp(self) -> float | None:
+        """The timestamp of the most recent read across all attached handles."""
+
+        timestamps = [
+            handle.recent_reads.current_read.value.timestamp
+            for handle in self.handles.values()
+            if handle.recent_reads.current_read.value
+        ]
+
+        return max(timestamps, default=None)
+
     @property
     def is_timed_out(self) -> bool:
-        if not self.recent_reads.current_read.value:
+        last_read_timestamp = self.last_read_timestamp
+
+        if last_read_timestamp is None:
             return False
 
         return (
-            trio.current_time() - self.recent_reads.current_read.value.timestamp
+            trio.current_time() - last_read_timestamp
             > self.config.activity_timeout_seconds
         )
 
+    @property
+    def is_streaming(self) -> bool:
+        """Whether any attached handle currently has an open stream connection."""
+
+        return any(handle.is_streaming.value for handle in self.handles.values())
+
+    def attach(self, fh: pyfuse3.FileHandleT) -> StreamHandle:
+        """
+        Attach a file handle to this stream.
+
+        Attaching an already-attached handle returns the existing handle state.
+        """
+
+        if fh not in self.handles:
+            self.handles[fh] = StreamHandle(
+                fh=fh,
+                read_ahead=ReadAhead(
+                    chunk_size=self.config.chunk_size,
+                    max_chunks=self.config.read_ahead_max_chunks,
+                    buffer_seconds=self.config.read_ahead_seconds,
+                    seek_tolerance=self.config.scan_tolerance,
+                ),
+            )
+
+            if self.enable_tracing:
+                logger.log(
+                    "STREAM",
+                    self.build_log_message(f"Attached fh={fh}"),
+                )
+
+        return self.handles[fh]
+
+    async def detach(self, fh: pyfuse3.FileHandleT) -> int:
+        """
+        Detach a file handle from this stream, stopping its connection if one is open.
+
+        Returns:
+            The number of handles still attached to the stream.
+        """
+
+        handle = self.handles.pop(fh, None)
+
+        if handle:
+            await self._stop_handle(handle)
+
+            if self.enable_tracing:
+                logger.log(
+                    "STREAM",
+                    self.build_log_message(f"Detached fh={fh}"),
+                )
+
+        return len(self.handles)
+
+    async def _stop_handle(self, handle: StreamHandle) -> None:
+        """Signal a handle's connection to stop, and wait for it to close."""
+
+        if not handle.is_streaming.value:
+            return
+
+        try:
+            with trio.fail_after(5):
+                handle.is_killed.value = True
+                await handle.is_streaming.wait_value(False)
+        except trio.TooSlowError:
+            logger.warning(
+                self.build_log_message(
+                    f"Stream for fh={handle.fh} didn't stop within 5 seconds"
+                )
+            )
+
     @asynccontextmanager
-    async def stream_lifecycle(self) -> AsyncGenerator[None]:
+    async def stream_lifecycle(self, handle: StreamHandle) -> AsyncGenerator[None]:
         """Context manager for managing stream lifecycle."""
 
         try:
-            self.is_streaming.value = True
+            handle.is_streaming.value = True
 
             if self.enable_tracing:
                 logger.log(
                     "STREAM",
-                    self.build_log_message("Starting stream lifecycle"),
+                    self.build_log_message(
+                        f"Starting stream lifecycle for fh={handle.fh}"
+                    ),
                 )
 
             yield
         finally:
-            self.is_streaming.value = False
+            handle.is_streaming.value = False
 
             if self.enable_tracing:
                 logger.log(
                     "STREAM",
-                    self.build_log_message("Stream lifecycle ended"),
+                    self.build_log_message(
+                        f"Stream lifecycle ended for fh={handle.fh}"
+                    ),
                 )
 
     @asynccontextmanager
@@ -252,12 +362,18 @@ class MediaStream:
         self,
         position: int,
         *,
+        handle: StreamHandle,
         task_status: trio.TaskStatus = trio.TASK_STATUS_IGNORED,
     ) -> None:
         has_started = False
 
-        async with self.stream_lifecycle():
-            async with trio_util.move_on_when(lambda: self.is_killed.wait_value(True)):
+        async with self.stream_lifecycle(handle):
+            async with trio_util.move_on_when(
+                lambda: trio_util.wait_any(
+                    lambda: self.is_killed.wait_value(True),
+                    lambda: handle.is_killed.wait_value(True),
+                )
+            ):
                 attempt_count = 0
                 max_attempts = 4
 
@@ -335,56 +451,89 @@ class MediaStream:
                                             else None
                                         )
                                     ):
-                                        for chunk in chunks:
-                                            chunk_label = f"[{chunk.start}-{chunk.end}]"
-
-                                            with benchmark(
-                                                log=lambda duration, c=chunk: (
-                                                    logger.log(
-                                                        "STREAM",
-                                                        self.build_log_message(
-                                                            f"Fetching {c} took {duration}s"
-                                                        ),
-                                                    )
-                                                    if self.enable_tracing
-                                                    else None
-                                                )
-                                            ):
-                                                data = await anext(connection.reader)
-
-                                            if data == b"":
-                                                raise EmptyDataException(
-                                                    range=(chunk.start, chunk.end)
-                                                )
-
-                                            with benchmark(
-                                                log=lambda duration, label=chunk_label, range_label=chunk_range_label: (
-                                                    logger.log(
-                                                        "STREAM",
-                                                        self.build_log_message(
-                                                            f"Processing chunk(s) #{range_label} {label} took {duration}s"
-                                                        ),
+                                        # Claim the whole batch up front, so other handles
+                                        # wait for these chunks rather than fetching them too.
+                                        claimed = {
+                                            chunk
+                                            for chunk in chunks
+                                            if chunk not in self._in_flight_chunks
+                                        }
+                                        self._in_flight_chunks.update(claimed)
+
+                                        try:
+                                            for chunk in chunks:
+                                                chunk_label = f"[{chunk.start}-{chunk.end}]"
+
+                                                with benchmark(
+                                                    log=lambda duration, c=chunk: (
+                                                        logger.log(
+                                                            "STREAM",
+                                                            self.build_log_message(
+                                                                f"Fetching {c} took {duration}s"
+                                                            ),
+                                                        )
+                                                        if self.enable_tracing
+                                                        else None
                                                     )
-                                                    if self.enable_tracing
-                                                    else None
-                                                )
-                                            ):
-                                                connection.increment_sequential_chunks()
+                                                ):
+                                                    fetch_started = trio.current_time()
 
-                                                await self._cache_chunk(
-                                                    start=chunk.start,
-                                                    data=data,
-                                                )
+                                                    data = await anext(connection.reader)
 
-                                                chunk.emit_cache_signal()
+                                                    fetch_duration = (
+                                                        trio.current_time() - fetch_started
+                                                    )
 
-                                                connection.current_read_position += len(
-                                                    data
-                                                )
+                                                    handle.read_ahead.record_download(
+                                                        size=len(data),
+                                                        duration=fetch_duration,
+                                                    )
+                                                    self.session_statistics.record_download(
+                                                        size=len(data),
+                                                        duration=fetch_duration,
+                                                    )
 
-                                                self.session_statistics.bytes_transferred += len(
-                                                    data
-                                                )
+                                                if data == b"":
+                                                    raise EmptyDataException(
+                                                        range=(chunk.start, chunk.end)
+                                                    )
+
+                                                with benchmark(
+                                                    log=lambda duration, label=chunk_label, range_label=chunk_range_label: (
+                                                        logger.log(
+                                                            "STREAM",
+                                                            self.build_log_message(
+                                                                f"Processing chunk(s) #{range_label} {label} took {duration}s"
+                                                            ),
+                                                        )
+                                                        if self.enable_tracing
+                                                        else None
+                                                    )
+                                                ):
+                                                    connection.increment_sequential_chunks()
+
+                                                    try:
+                                                        await self._cache_chunk(
+                                                            start=chunk.start,
+                                                            data=data,
+                                                        )
+                                                    finally:
+                                                        if chunk in claimed:
+                                                            claimed.discard(chunk)
+                                                            self._in_flight_chunks.discard(
+                                                                chunk
+                                                            )
+
+                                                    chunk.emit_cache_signal()
+
+                                                    connection.current_read_position += len(
+                                                        data
+                                                    )
+                                        finally:
+                                            # Release the chunks this connection didn't get to
+                                            self._in_flight_chunks.difference_update(
+                                                claimed
+                                            )
 
                                 if seek_range:
                                     await _process_chunks(seek_range.uncached_chunks)
@@ -392,9 +541,10 @@ class MediaStream:
 
                                 async for (
                                     read
-                                ) in self.recent_reads.current_read.eventual_values(
+                                ) in handle.recent_reads.current_read.eventual_values(
                                     lambda v: (
-                                        v is not None and v.read_type == "body_read"
+                                        v is not None
+                                        and v.read_type in ("body_read", "cache_hit")
                                     )
                                 ):
                                     if not read:
@@ -405,6 +555,21 @@ class MediaStream:
                                     uncached_chunks = read.chunk_range.uncached_chunks
 
                                     if len(uncached_chunks) == 0:
+                                        # Everything this read needs is cached,
+                                        # so use the connection to keep ahead of the play head.
+                                        await self._read_ahead(
+                                            read=read,
+                                            handle=handle,
+                                            connection=connection,
+                                            process_chunks=_process_chunks,
+                                        )
+
+                                        continue
+
+                                    if self._is_fetching_elsewhere(uncached_chunks):
+                                        # Another handle's connection is already downloading
+                                        # everything this read needs; the reader will be
+                                        # notified once those chunks are cached.
                                         continue
 
                                     if self.enable_tracing:
@@ -438,7 +603,11 @@ class MediaStream:
                                                 ),
                                             )
 
-                                        connection.seek(chunk_range=read.chunk_range)
+                                        connection.seek(
+                                            chunk_range=self._fetch_in_parallel(
+                                                read.chunk_range
+                                            )
+                                        )
 
                                         break
 
@@ -463,12 +632,23 @@ class MediaStream:
                                                 ),
                                             )
 
-                                        connection.seek(chunk_range=read.chunk_range)
+                                        connection.seek(
+                                            chunk_range=self._fetch_in_parallel(
+                                                read.chunk_range
+                                            )
+                                        )
 
                                         break
 
                                     await _process_chunks(uncached_chunks)
 
+                                    await self._read_ahead(
+                                        read=read,
+                                        handle=handle,
+                                        connection=connection,
+                                        process_chunks=_process_chunks,
+                                    )
+
                             position = connection.current_read_position
                             seek_range = connection.seek_range
                     except RecoverableMediaStreamException as e:
@@ -489,7 +669,7 @@ class MediaStream:
 
                             continue
                         else:
-                            self._stream_error.value = e.original_exception
+                            handle.stream_error.value = e.original_exception
 
                             break
                     except FatalMediaStreamException as e:
@@ -499,7 +679,7 @@ class MediaStream:
                             )
                         )
 
-                        self._stream_error.value = e.original_exception
+                        handle.stream_error.value = e.original_exception
 
                         break
                     except Exception as e:
@@ -508,7 +688,7 @@ class MediaStream:
                             self.build_log_message(f"Unexpected error from stream: {e}")
                         )
 
-                        self._stream_error.value = e
+                        handle.stream_error.value = e
 
                         break
 
@@ -546,29 +726,30 @@ class MediaStream:
     async def close(self) -> None:
         """Immediately terminate the active stream."""
 
+        self.is_killed.value = True
+
         # First wait for the stream to stop, then close the client
-        if self.is_streaming.value:
+        if self.is_streaming:
             # If the file was streaming,
             # clear all chunk cache emitters to free up memory.
             di[ChunkCacheNotifier].clear_emitters(
                 cache_key=self.file_metadata.original_filename
             )
 
-            # Wait for the stream loop to close
-            try:
-                with trio.fail_after(5):
-                    self.is_killed.value = True
-                    await self.is_streaming.wait_value(False)
-            except trio.TooSlowError:
-                logger.warning(
-                    self.build_log_message("Stream didn't stop within 5 seconds")
-                )
+            # Wait for every handle's stream loop to close
+            for handle in list(self.handles.values()):
+                await self._stop_handle(handle)
+
+        di[ProviderThroughput].record(
+            provider=self.provider,
+            statistics=self.session_statistics,
+        )
 
         if self.enable_tracing:
             logger.log(
                 "STREAM",
                 self.build_log_message(
-                    f"Ended stream for {self.file_metadata.path} fh={self.fh} "
+                    f"Ended stream for {self.file_metadata.path} "
                     f"after transferring {self.session_statistics.bytes_transferred / (1024 * 1024):.2f}MB "
                     f"in {self.session_statistics.total_session_connections} connections."
                 ),
@@ -585,19 +766,14 @@ class MediaStream:
 
         return data[:size]
 
-    async def scan_header(self, read_position: int, size: int) -> bytes:
+    async def scan_header(self, read_position: int, size: int) -> CacheData:
         """Scans the start of the media file for header data."""
 
-        data = await self._fetch_discrete_byte_range(
-            start=self.chunker.header_chunk.start,
-            size=self.chunker.header_chunk.size,
-        )
-
-        self.chunker.header_chunk.emit_cache_signal()
+        data = await self._fetch_shared_chunk(chunk=self.chunker.header_chunk)
 
         return data[read_position : read_position + size]
 
-    async def scan_footer(self, read_position: int, size: int) -> bytes:
+    async def scan_footer(self, read_position: int, size: int) -> CacheData:
         """
         Scans the end of the media file for footer data.
 
@@ -608,19 +784,32 @@ class MediaStream:
 
         footer_chunk = self.chunker.footer_chunk
 
-        data = await self._fetch_discrete_byte_range(
-            start=footer_chunk.start,
-            size=footer_chunk.size,
-        )
-
-        self.chunker.footer_chunk.emit_cache_signal()
+        data = await self._fetch_shared_chunk(chunk=footer_chunk)
 
         slice_offset = read_position - footer_chunk.start
 
         return data[slice_offset : slice_offset + size]
 
+    async def prewarm(self) -> None:
+        """
+        Fetch the header and footer chunks into the cache, pinned.
+
+        Players and media server scanners probe the container index (e.g. the moov atom or MKV cues)
+        on first open, so having these cached up front means that probe never waits on the CDN.
+        """
+
+        for chunk in (self.chunker.header_chunk, self.chunker.footer_chunk):
+            # Chunks cached by an earlier read may still be evicted until they're pinned
+            if chunk.is_cached.value and await self._pin_cache(
+                start=chunk.start,
+                end=chunk.end,
+            ):
+                continue
+
+            await self._fetch_shared_chunk(chunk=chunk, pinned=True)
+
     @asynccontextmanager
-    async def capture_stream_errors(self) -> AsyncIterator[None]:
+    async def capture_stream_errors(self, handle: StreamHandle) -> AsyncIterator[None]:
         """Context manager to capture and log stream errors."""
 
         # Handle the read request whilst monitoring for stream kill signals, and errors.
@@ -629,58 +818,110 @@ class MediaStream:
         async with trio_util.move_on_when(
             lambda: trio_util.wait_any(
                 lambda: self.is_killed.wait_value(True),
-                lambda: self._stream_error.wait_value(lambda v: v is not None),
+                lambda: handle.is_killed.wait_value(True),
+                lambda: handle.stream_error.wait_value(lambda v: v is not None),
             )
         ):
             yield
 
-        if self.is_killed.value:
+        if self.is_killed.value or handle.is_killed.value:
             raise MediaStreamKilledException
 
-        if self._stream_error.value:
-            raise self._stream_error.value from None
+        if handle.stream_error.value:
+            raise handle.stream_error.value from None
 
     @asynccontextmanager
-    async def read_lifecycle(self, chunk_range: ChunkRange) -> AsyncIterator[ReadType]:
+    async def read_lifecycle(
+        self,
+        handle: StreamHandle,
+        chunk_range: ChunkRange,
+    ) -> AsyncIterator[ReadType]:
         """Context manager for managing read lifecycle."""
 
         try:
             read_type = await self._detect_read_type(
+                handle=handle,
                 chunk_range=chunk_range,
             )
 
+            if read_type in ("body_read", "cache_hit"):
+                start, end = chunk_range.request_range
+
+                handle.read_ahead.record_read(
+                    position=start,
+                    end=end,
+                    timestamp=trio.current_time(),
+                )
+
             # Start the stream and wait for a connection before progressing with a body read.
             # This MUST be done before assigning a value to current_read,
             # or else the stream will not receive the value.
-            if read_type == "body_read" and not self.is_streaming.value:
+            #
+            # If every chunk this read needs is already being fetched by another handle,
+            # there is no need to open a new connection; the read will wait for those chunks instead.
+            if (
+                read_type == "body_read"
+                and not handle.is_streaming.value
+                and not self._is_fetching_elsewhere(chunk_range.uncached_chunks)
+            ):
+                stream_range = self._fetch_in_parallel(chunk_range)
+
                 with trio.fail_after(self.config.connect_timeout_seconds):
-                    await self.nursery.start(self.run, chunk_range.position)
+                    await self.nursery.start(
+                        partial(self.run, handle=handle),
+                        stream_range.position,
+                    )
+            elif (
+                read_type == "cache_hit"
+                and not handle.is_streaming.value
+                and (
+                    read_ahead_chunk := self._next_read_ahead_chunk(
+                        handle=handle,
+                        chunk_range=chunk_range,
+                    )
+                )
+            ):
+                # Playback is being served from the cache, but is about to run out of cached chunks.
+                # Start the stream early, so the next chunks are fetched before the player needs them.
+                with trio.fail_after(self.config.connect_timeout_seconds):
+                    await self.nursery.start(
+                        partial(self.run, handle=handle),
+                        read_ahead_chunk.start,
+                    )
 
-            self.recent_reads.current_read.value = Read(
+            handle.recent_reads.current_read.value = Read(
                 chunk_range=chunk_range,
                 read_type=read_type,
             )
 
             yield read_type
         finally:
-            self.recent_reads.previous_read.value = self.recent_reads.current_read.value
+            handle.recent_reads.previous_read.value = (
+                handle.recent_reads.current_read.value
+            )
 
     async def read(
         self,
         *,
+        fh: pyfuse3.FileHandleT,
         request_start: int,
         request_end: int,
         request_size: int,
-    ) -> bytes:
+    ) -> CacheData:
         """Handles incoming read requests from the VFS."""
 
+        handle = self.attach(fh)
+
         read_range = self.chunker.get_chunk_range(
             position=request_start,
             size=request_size,
         )
 
-        async with self.capture_stream_errors():
-            async with self.read_lifecycle(chunk_range=read_range) as read_type:
+        async with self.capture_stream_errors(handle):
+            async with self.read_lifecycle(
+                handle=handle,
+                chunk_range=read_range,
+            ) as read_type:
                 if self.enable_tracing:
                     logger.log(
                         "STREAM",
@@ -725,7 +966,7 @@ class MediaStream:
     async def read_bytes(
         self,
         chunk_range: ChunkRange,
-    ) -> bytes:
+    ) -> CacheData:
         """Read a specific number of bytes from the stream."""
 
         start, end = chunk_range.request_range
@@ -987,6 +1228,7 @@ class MediaStream:
     async def _detect_read_type(
         self,
         *,
+        handle: StreamHandle,
         chunk_range: ChunkRange,
     ) -> ReadType:
         start, end = chunk_range.request_range
@@ -1011,7 +1253,7 @@ class MediaStream:
         file_size = self.file_metadata.file_size
 
         if (
-            (self.recent_reads.last_read_end or 0)
+            (handle.recent_reads.last_read_end or 0)
             < start - self.config.sequential_read_tolerance
         ) and file_size - self.footer_size <= start <= file_size:
             return "footer_scan"
@@ -1023,9 +1265,9 @@ class MediaStream:
             # for cues or metadata after initial playback start.
             #
             # Scans typically read less than a single block.
-            self.recent_reads.last_read_end is not None
+            handle.recent_reads.last_read_end is not None
             and (
-                abs(self.recent_reads.last_read_end - start)
+                abs(handle.recent_reads.last_read_end - start)
                 > self.config.scan_tolerance
             )
             and start != self.config.header_size
@@ -1036,7 +1278,7 @@ class MediaStream:
             # for this file, but the scan happens on a new file handle
             # and is the first request to be made.
             start > self.config.header_size
-            and self.recent_reads.last_read_end is None
+            and handle.recent_reads.last_read_end is None
         ):
             return "general_scan"
 
@@ -1050,6 +1292,8 @@ class MediaStream:
         start: int,
         size: int,
         should_cache: bool = True,
+        pinned: bool = False,
+        protected: bool = False,
     ) -> bytes:
         """
         Fetch a discrete range of data outside of the main stream.
@@ -1067,9 +1311,13 @@ class MediaStream:
             start=start,
             end=start + size - 1,
         ) as response:
+            fetch_started = trio.current_time()
             data = await response.aread()
 
-            self.session_statistics.bytes_transferred += len(data)
+            self.session_statistics.record_download(
+                size=len(data),
+                duration=trio.current_time() - fetch_started,
+            )
 
             verified_data = self._verify_scan_integrity((start, start + size), data)
 
@@ -1077,10 +1325,224 @@ class MediaStream:
                 await self._cache_chunk(
                     start=start,
                     data=verified_data[:size],
+                    pinned=pinned,
+                    protected=protected,
                 )
 
             return verified_data
 
+    async def _fetch_shared_chunk(
+        self,
+        *,
+        chunk: Chunk,
+        pinned: bool = False,
+    ) -> CacheData:
+        """
+        Fetch a discrete chunk (e.g. the header or footer), sharing the download between handles.
+
+        If another handle is already fetching the chunk, wait for it to be cached and serve it from the cache instead.
+        """
+
+        if chunk in self._in_flight_chunks:
+            with trio.move_on_after(self.config.chunk_wait_timeout_seconds):
+                await chunk.is_cached.wait_value(True)
+
+            cached_data = await self._read_cache(start=chunk.start, end=chunk.end)
+
+            if cached_data:
+                return cached_data
+
+        self._in_flight_chunks.add(chunk)
+
+        try:
+            data = await self._fetch_discrete_byte_range(
+                start=chunk.start,
+                size=chunk.size,
+                pinned=pinned,
+                # Shared chunks are the header and footer, which every player and scanner probes
+                protected=True,
+            )
+        finally:
+            self._in_flight_chunks.discard(chunk)
+
+        chunk.emit_cache_signal()
+
+        return data
+
+    def _next_read_ahead_chunk(
+        self,
+        *,
+        handle: StreamHandle,
+        chunk_range: ChunkRange,
+    ) -> Chunk | None:
+        """
+        Get the next chunk to read ahead of the given read, if any.
+
+        Only whole body chunks within the handle's read-ahead target are considered;
+        chunks that are already cached, or being fetched by another connection, are skipped over.
+        """
+
+        if handle.read_ahead.is_paused(trio.current_time()):
+            return None
+
+        position = chunk_range.last_chunk.end + 1
+
+        for _ in range(handle.read_ahead.target_chunks):
+            if position >= self.file_metadata.file_size:
+                return None
+
+            chunk = self.chunker.get_chunk_range(position=position).first_chunk
+
+            if (
+                chunk == self.chunker.footer_chunk
+                or chunk.size != self.config.chunk_size
+            ):
+                return None
+
+            if not chunk.is_cached.value and chunk not in self._in_flight_chunks:
+                return chunk
+
+            position = chunk.end + 1
+
+        return None
+
+    async def _read_ahead(
+        self,
+        *,
+        read: Read,
+        handle: StreamHandle,
+        connection: StreamConnection,
+        process_chunks: Callable[[OrderedSet[Chunk]], Awaitable[None]],
+    ) -> None:
+        """
+        Top up the chunks cached ahead of the play head during sequential playback.
+
+        Chunks are fetched one at a time, and only whilst the connection is positioned at the next one needed,
+        so read-ahead never forces a reconnect. It yields as soon as a newer read arrives,
+        and stops when the viewer pauses.
+        """
+
+        while handle.recent_reads.current_read.value is read:
+            chunk = self._next_read_ahead_chunk(
+                handle=handle,
+                chunk_range=read.chunk_range,
+            )
+
+            if chunk is None or chunk.start != connection.current_read_position:
+                return
+
+            if self.enable_tracing:
+                logger.log(
+                    "STREAM",
+                    self.build_log_message(
+                        f"Reading ahead {chunk} "
+                        f"(target={handle.read_ahead.target_chunks} chunks, "
+                        f"consumption={handle.read_ahead.consumption_rate / (1024 * 1024):.2f}MB/s, "
+                        f"download={handle.read_ahead.download_rate / (1024 * 1024):.2f}MB/s)"
+                    ),
+                )
+
+            await process_chunks(OrderedSet([chunk]))
+
+    def _fetch_in_parallel(self, chunk_range: ChunkRange) -> ChunkRange:
+        """
+        Fetch the chunks at the start of playback or a seek concurrently, each over its own connection.
+
+        A single connection downloads chunks one after another, so after a seek the player waits on each in turn.
+        Instead, up to `parallel_seek_chunks` body chunks from the first uncached one are fetched in parallel,
+        within the provider's shared connection budget, whilst the stream's own connection opens after them.
+
+        Returns:
+            The range the stream's connection should continue from: the rest of the read after the parallel
+            window, or the given range if nothing was fetched in parallel.
+        """
+
+        if self.config.parallel_seek_chunks <= 0 or not chunk_range.uncached_chunks:
+            return chunk_range
+
+        limiter = di[ProviderConnectionLimiter].get(self.provider)
+        position = chunk_range.uncached_chunks[0].start
+        dispatched = 0
+
+        for _ in range(self.config.parallel_seek_chunks):
+            chunk = self.chunker.get_chunk_range(position=position).first_chunk
+
+            if chunk in (self.chunker.header_chunk, self.chunker.footer_chunk):
+                break
+
+            if not chunk.is_cached.value and chunk not in self._in_flight_chunks:
+                # A unique borrower per fetch, as the token is released by the fetching task
+                borrower = object()
+
+                try:
+                    limiter.acquire_on_behalf_of_nowait(borrower)
+                except trio.WouldBlock:
+                    break
+
+                self._in_flight_chunks.add(chunk)
+                self.nursery.start_soon(
+                    self._fetch_parallel_chunk,
+                    chunk,
+                    limiter,
+                    borrower,
+                )
+                dispatched += 1
+
+            position = chunk.end + 1
+
+        if dispatched == 0 or position >= self.chunker.footer_chunk.start:
+            return chunk_range
+
+        if self.enable_tracing:
+            logger.log(
+                "STREAM",
+                self.build_log_message(
+                    f"Fetching {dispatched} chunks in parallel from {chunk_range.uncached_chunks[0].start}; "
+                    f"continuing stream from {position}"
+                ),
+            )
+
+        _, end = chunk_range.request_range
+
+        return self.chunker.get_chunk_range(
+            position=position,
+            size=max(1, end - position + 1),
+        )
+
+    async def _fetch_parallel_chunk(
+        self,
+        chunk: Chunk,
+        limiter: trio.CapacityLimiter,
+        borrower: object,
+    ) -> None:
+        """Fetch a single chunk over its own connection, releasing its connection token when done."""
+
+        try:
+            async with trio_util.move_on_when(
+                lambda: self.is_killed.wait_value(True)
+            ):
+                await self._fetch_discrete_byte_range(
+                    start=chunk.start,
+                    size=chunk.size,
+                )
+
+                chunk.emit_cache_signal()
+        except Exception as e:
+            # Readers waiting on this chunk time out, and the stream's connection fetches it on the next read
+            logger.warning(
+                self.build_log_message(f"Parallel fetch of {chunk} failed: {e}")
+            )
+        finally:
+            self._in_flight_chunks.discard(chunk)
+            limiter.release_on_behalf_of(borrower)
+
+    def _is_fetching_elsewhere(self, chunks: OrderedSet[Chunk]) -> bool:
+        """Whether all the given chunks are already being fetched by another connection."""
+
+        return len(chunks) > 0 and all(
+            chunk in self._in_flight_chunks for chunk in chunks
+        )
+
     async def _wait_until_chunks_ready(
         self,
         *,
@@ -1119,7 +1581,7 @@ class MediaStream:
         *,
         start: int,
         end: int,
-    ) -> bytes:
+    ) -> CacheData:
         """Fetch the given byte range from the cache, if it exists."""
 
         from .cache import Cache
@@ -1135,6 +1597,8 @@ class MediaStream:
         *,
         start: int,
         data: bytes,
+        pinned: bool = False,
+        protected: bool = False,
     ) -> None:
         """Cache the given chunk of data."""
 
@@ -1144,6 +1608,19 @@ class MediaStream:
             cache_key=self.file_metadata.original_filename,
             start=start,
             data=data,
+            pinned=pinned,
+            protected=protected,
+        )
+
+    async def _pin_cache(self, *, start: int, end: int) -> bool:
+        """Pin the given cached byte range, returning whether it was cached."""
+
+        from .cache import Cache
+
+        return await di[Cache].pin(
+            cache_key=self.file_metadata.original_filename,
+            start=start,
+            end=end,
         )
 
     async def _refresh_download_url(self) -> bool:
@@ -1231,6 +1708,6 @@ class MediaStream:
         return data
 
     def build_log_message(self, message: str) -> str:
-        return (
-            f"{message} [fh: {self.fh} | file={self.file_metadata.path.split('/')[-1]}]"
-        )
+        fhs = ",".join(str(fh) for fh in self.handles)
+
+        return f"{message} [fh: {fhs} | file={self.file_metadata.path.split('/')[-1]}]"
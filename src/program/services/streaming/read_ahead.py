@@ -0,0 +1,108 @@
+import math
+from dataclasses import dataclass
+
+
+@dataclass
+class ReadAhead:
+    """
+    Adaptive read-ahead for sequential playback.
+
+    Measures how fast the player consumes data and how fast chunks download,
+    and from that decides how many chunks to keep cached ahead of the play head:
+    enough to cover `buffer_seconds` of playback, or as many as allowed
+    when downloads are barely keeping up with playback.
+    """
+
+    chunk_size: int
+
+    # Upper bound on the number of chunks kept ahead of the play head. 0 disables read-ahead.
+    max_chunks: int
+
+    # Seconds of playback to keep buffered ahead of the play head.
+    buffer_seconds: float
+
+    # Any read that jumps further than this from the previous one is considered a seek.
+    seek_tolerance: int
+
+    # Reads stop while the viewer is paused; no read-ahead happens after this long without one.
+    pause_timeout_seconds: float = 10.0
+
+    # Minimum time over which consumption is measured, to smooth out bursty reads.
+    sample_interval_seconds: float = 1.0
+
+    # Exponential smoothing factor for rate measurements.
+    smoothing: float = 0.3
+
+    consumption_rate: float = 0.0
+    download_rate: float = 0.0
+
+    _window_position: int | None = None
+    _window_timestamp: float = 0.0
+    _last_position: int | None = None
+    _last_read_timestamp: float | None = None
+
+    def record_read(self, *, position: int, end: int, timestamp: float) -> None:
+        """Record a sequential read by the player, updating the consumption rate."""
+
+        is_seek = self._last_position is None or (
+            abs(position - self._last_position) > self.seek_tolerance
+        )
+
+        self._last_position = end + 1
+        self._last_read_timestamp = timestamp
+
+        if is_seek or self._window_position is None:
+            # Measure from the end of this read; it was consumed at the start of the window
+            self._window_position = end + 1
+            self._window_timestamp = timestamp
+
+            return
+
+        elapsed = timestamp - self._window_timestamp
+
+        if elapsed < self.sample_interval_seconds:
+            return
+
+        rate = max(0, end + 1 - self._window_position) / elapsed
+
+        self.consumption_rate = self._smooth(self.consumption_rate, rate)
+        self._window_position = end + 1
+        self._window_timestamp = timestamp
+
+    def record_download(self, *, size: int, duration: float) -> None:
+        """Record a chunk download, updating the download rate."""
+
+        if duration <= 0:
+            return
+
+        self.download_rate = self._smooth(self.download_rate, size / duration)
+
+    def is_paused(self, now: float) -> bool:
+        """Whether the player has stopped reading, e.g. because the viewer paused."""
+
+        return (
+            self._last_read_timestamp is None
+            or now - self._last_read_timestamp > self.pause_timeout_seconds
+        )
+
+    @property
+    def target_chunks(self) -> int:
+        """The number of chunks to keep cached ahead of the play head."""
+
+        if self.max_chunks <= 0 or self.consumption_rate <= 0:
+            return 0
+
+        if self.download_rate and self.download_rate < self.consumption_rate * 1.5:
+            # Downloads are barely keeping up with playback,
+            # so any latency spike will stall; buffer as much as allowed.
+            return self.max_chunks
+
+        lead_bytes = self.consumption_rate * self.buffer_seconds
+
+        return max(1, min(self.max_chunks, math.ceil(lead_bytes / self.chunk_size)))
+
+    def _smooth(self, current: float, sample: float) -> float:
+        if current <= 0:
+            return sample
+
+        return self.smoothing * sample + (1 - self.smoothing) * current
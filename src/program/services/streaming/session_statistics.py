@@ -7,3 +7,60 @@ class SessionStatistics:
 
     bytes_transferred: int = 0
     total_session_connections: int = 0
+
+    # Time spent waiting on downloads, excluding idle time between reads.
+    download_seconds: float = 0.0
+
+    def record_download(self, *, size: int, duration: float) -> None:
+        """Record bytes received from the provider and how long they took to arrive."""
+
+        self.bytes_transferred += size
+        self.download_seconds += max(0.0, duration)
+
+    @property
+    def throughput(self) -> float | None:
+        """Average download throughput in bytes per second, or None if nothing was timed."""
+
+        if self.download_seconds <= 0:
+            return None
+
+        return self.bytes_transferred / self.download_seconds
+
+
+class ProviderThroughput:
+    """
+    Smoothed download throughput per provider, measured over past streaming sessions.
+
+    Used to size the chunks of new streams before they have downloaded anything themselves.
+    """
+
+    # Sessions that downloaded less than this are dominated by connection latency; ignore them.
+    min_sample_bytes = 4 * 1024 * 1024
+
+    # Exponential smoothing factor for session measurements.
+    smoothing = 0.3
+
+    def __init__(self) -> None:
+        self._rates = dict[str, float]()
+
+    def record(self, *, provider: str, statistics: SessionStatistics) -> None:
+        """Fold a finished session's throughput into the provider's estimate."""
+
+        throughput = statistics.throughput
+
+        if throughput is None or statistics.bytes_transferred < self.min_sample_bytes:
+            return
+
+        current = self._rates.get(provider)
+
+        if current is None:
+            self._rates[provider] = throughput
+        else:
+            self._rates[provider] = (
+                self.smoothing * throughput + (1 - self.smoothing) * current
+            )
+
+    def get(self, provider: str) -> float | None:
+        """The estimated throughput for a provider in bytes per second, if measured."""
+
+        return self._rates.get(provider)
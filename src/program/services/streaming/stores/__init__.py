@@ -0,0 +1,11 @@
+from .base import CacheEntry, ChunkMappings, ChunkStore
+from .file_store import FileChunkStore
+from .segment_store import SegmentChunkStore
+
+__all__ = [
+    "CacheEntry",
+    "ChunkMappings",
+    "ChunkStore",
+    "FileChunkStore",
+    "SegmentChunkStore",
+]
@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+import mmap
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+
+
+@dataclass(frozen=True)
+class CacheEntry:
+    key: str
+    cache_key: str
+    start: int
+    size: int
+    mtime: float
+    # Pinned entries are exempt from LRU/TTL eviction
+    pinned: bool = False
+
+
+class ChunkMappings:
+    """
+    LRU of read-only memory mappings of cache files.
+
+    Keeping hot cache files mapped lets cache hits be served as slices of the mapping,
+    avoiding an open/seek/read and a copy for every kernel read.
+    """
+
+    def __init__(self, max_mappings: int) -> None:
+        self.max_mappings = max(1, max_mappings)
+        self._mappings = OrderedDict[str, mmap.mmap]()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._mappings)
+
+    def get(self, key: str) -> mmap.mmap | None:
+        """Get an existing mapping for the file, marking it as recently used."""
+
+        with self._lock:
+            mapping = self._mappings.get(key)
+
+            if mapping is not None:
+                self._mappings.move_to_end(key, last=True)
+
+            return mapping
+
+    def open(self, key: str, path: Path) -> mmap.mmap | None:
+        """Map a file, or None if it doesn't exist. Blocking; runs on an I/O worker."""
+
+        try:
+            with path.open("rb") as f:
+                mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (FileNotFoundError, ValueError):
+            # ValueError is raised for empty files, which can't be mapped
+            return None
+
+        with self._lock:
+            previous = self._mappings.pop(key, None)
+            self._mappings[key] = mapping
+
+            evicted = [previous] if previous is not None else []
+
+            while len(self._mappings) > self.max_mappings:
+                _, oldest = self._mappings.popitem(last=False)
+                evicted.append(oldest)
+
+        for old_mapping in evicted:
+            self._close(old_mapping)
+
+        return mapping
+
+    def discard(self, key: str) -> None:
+        """Drop the mapping for a file, e.g. before it is replaced or deleted."""
+
+        with self._lock:
+            mapping = self._mappings.pop(key, None)
+
+        if mapping is not None:
+            self._close(mapping)
+
+    def clear(self) -> None:
+        with self._lock:
+            mappings = list(self._mappings.values())
+            self._mappings.clear()
+
+        for mapping in mappings:
+            self._close(mapping)
+
+    @staticmethod
+    def view(mapping: mmap.mmap | None, offset: int, size: int) -> memoryview | None:
+        """Slice a mapping, or None if it doesn't cover the range or was closed concurrently."""
+
+        if mapping is None or offset + size > len(mapping):
+            return None
+
+        try:
+            return memoryview(mapping)[offset : offset + size]
+        except ValueError:
+            # Unmapped by another worker between lookup and slicing
+            return None
+
+    @staticmethod
+    def _close(mapping: mmap.mmap) -> None:
+        try:
+            mapping.close()
+        except BufferError:
+            # Views into the mapping are still being served;
+            # it will be unmapped once the last of them is released.
+            pass
+
+
+class ChunkStore(ABC):
+    """
+    On-disk storage for cached chunks, addressed by chunk key.
+
+    The Cache owns the in-memory index and eviction policy; stores only persist chunk data
+    and enough metadata to rebuild that index on startup.
+    All methods except `view` block and are run on the Cache's I/O workers.
+    """
+
+    def __init__(self, cache_dir: Path, max_mappings: int) -> None:
+        self.cache_dir = cache_dir
+        self._mappings = ChunkMappings(max_mappings)
+
+    @property
+    def mapped_count(self) -> int:
+        return len(self._mappings)
+
+    @abstractmethod
+    def load_entries(self) -> list[CacheEntry]:
+        """Load all stored entries, ordered by mtime ascending for LRU correctness."""
+
+    @abstractmethod
+    def view(self, key: str, offset: int, size: int) -> memoryview | None:
+        """Get a zero-copy view of a chunk slice if its backing file is already mapped. Non-blocking."""
+
+    @abstractmethod
+    def map(self, key: str) -> bool:
+        """Map the file backing a chunk so that subsequent `view` calls can serve it."""
+
+    @abstractmethod
+    def read(self, key: str, offset: int = 0, size: int | None = None) -> bytes | None:
+        """Read a slice of a chunk, or None if the chunk isn't stored."""
+
+    @abstractmethod
+    def write(
+        self,
+        key: str,
+        cache_key: str,
+        start: int,
+        data: bytes,
+        pinned: bool = False,
+    ) -> list[str]:
+        """
+        Store a chunk, replacing any previous data for the key.
+
+        Whether the chunk is pinned is persisted, so pins survive restarts.
+
+        Returns the keys of any other chunks the store had to drop to make room,
+        which the caller must remove from its index.
+        """
+
+    @abstractmethod
+    def delete(self, keys: list[str]) -> None:
+        """Remove chunks from the store. Unknown keys are ignored."""
+
+    @abstractmethod
+    def exists(self, key: str) -> bool:
+        """Check whether a chunk is stored."""
+
+    def close(self) -> None:
+        self._mappings.clear()
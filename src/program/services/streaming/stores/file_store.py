@@ -0,0 +1,209 @@
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+from loguru import logger
+
+from .base import CacheEntry, ChunkMappings, ChunkStore
+from .segment_store import SEGMENTS_DIR_NAME
+
+
+class FileChunkStore(ChunkStore):
+    """
+    Stores each chunk as its own file, with a JSON metadata sidecar.
+
+    Files are fanned out over `cache_dir/<key[:2]>/<key>` to avoid too many files in one directory.
+    """
+
+    def load_entries(self) -> list[CacheEntry]:
+        entries: list[CacheEntry] = []
+
+        try:
+            for sub in self.cache_dir.iterdir():
+                try:
+                    if sub.is_dir():
+                        if sub.name == SEGMENTS_DIR_NAME:
+                            # Owned by the segment store
+                            continue
+
+                        for fp in sub.iterdir():
+                            try:
+                                if not fp.is_file() or fp.suffix == ".meta":
+                                    continue
+
+                                if fp.suffix == ".tmp":
+                                    # Leftover from an interrupted write
+                                    fp.unlink(missing_ok=True)
+                                    continue
+
+                                entry = self._load_entry(fp)
+
+                                if entry:
+                                    entries.append(entry)
+                            except Exception as e:
+                                logger.debug(
+                                    f"Skipping unreadable cache file {fp}: {e}"
+                                )
+                                continue
+                    elif sub.is_file() and sub.suffix != ".meta":
+                        entry = self._load_entry(sub)
+
+                        if entry:
+                            entries.append(entry)
+                except Exception as e:
+                    logger.debug(f"Skipping unreadable cache entry {sub}: {e}")
+                    continue
+        finally:
+            entries.sort(key=lambda t: t.mtime)  # by mtime asc
+
+        return entries
+
+    def _load_entry(self, fp: Path) -> CacheEntry | None:
+        key = fp.name
+        st = fp.stat()
+
+        # Try to read metadata for this cache entry
+        metadata = self._read_metadata(key)
+
+        if metadata:
+            cache_key, start, pinned = metadata
+
+            return CacheEntry(
+                key=key,
+                cache_key=cache_key,
+                start=start,
+                size=int(st.st_size),
+                mtime=float(st.st_mtime),
+                pinned=pinned,
+            )
+
+        # No metadata found - this is an orphaned file
+        logger.warning(f"Removing orphaned cache file without metadata: {fp}")
+
+        try:
+            fp.unlink()
+            # Also remove any stale metadata file
+            self._remove_metadata(key)
+        except Exception as e:
+            logger.warning(f"Failed to remove orphaned cache file {fp}: {e}")
+
+        return None
+
+    def _file_for(self, key: str) -> Path:
+        # Two-level fanout to avoid too many files in one dir
+        return self.cache_dir / key[:2] / key
+
+    def _metadata_file_for(self, key: str) -> Path:
+        """Get the metadata sidecar file path for a cache entry."""
+
+        return self._file_for(key).with_suffix(".meta")
+
+    def _write_metadata(
+        self,
+        key: str,
+        cache_key: str,
+        start: int,
+        pinned: bool,
+    ) -> None:
+        """Write metadata for a cache entry to a sidecar file."""
+
+        metadata = {"cache_key": cache_key, "start": start}
+
+        if pinned:
+            metadata["pinned"] = True
+
+        try:
+            with self._metadata_file_for(key).open("w") as f:
+                json.dump(metadata, f)
+        except Exception as e:
+            logger.warning(f"Failed to write cache metadata for {key}: {e}")
+
+    def _read_metadata(self, key: str) -> tuple[str, int, bool] | None:
+        """Read metadata for a cache entry from its sidecar file."""
+
+        metadata_file = self._metadata_file_for(key)
+
+        if not metadata_file.exists():
+            return None
+
+        try:
+            with metadata_file.open("r") as f:
+                metadata = json.load(f)
+                return (
+                    metadata["cache_key"],
+                    metadata["start"],
+                    bool(metadata.get("pinned", False)),
+                )
+        except Exception as e:
+            logger.warning(f"Failed to read cache metadata for {key}: {e}")
+            return None
+
+    def _remove_metadata(self, key: str) -> None:
+        """Remove metadata file for a cache entry."""
+
+        try:
+            metadata_file = self._metadata_file_for(key)
+
+            if metadata_file.exists():
+                metadata_file.unlink()
+        except Exception as e:
+            logger.warning(f"Failed to remove cache metadata for {key}: {e}")
+
+    def view(self, key: str, offset: int, size: int) -> memoryview | None:
+        return ChunkMappings.view(self._mappings.get(key), offset, size)
+
+    def map(self, key: str) -> bool:
+        return self._mappings.open(key, self._file_for(key)) is not None
+
+    def read(self, key: str, offset: int = 0, size: int | None = None) -> bytes | None:
+        try:
+            with self._file_for(key).open("rb") as f:
+                if offset:
+                    f.seek(offset)
+
+                return f.read() if size is None else f.read(size)
+        except FileNotFoundError:
+            return None
+
+    def write(
+        self,
+        key: str,
+        cache_key: str,
+        start: int,
+        data: bytes,
+        pinned: bool = False,
+    ) -> list[str]:
+        fp = self._file_for(key)
+        fp.parent.mkdir(parents=True, exist_ok=True)
+
+        # Existing mappings of this chunk must never see a truncated file,
+        # so write to a temporary file and atomically replace the chunk.
+        self._mappings.discard(key)
+
+        tmp = fp.with_suffix(".tmp")
+
+        with tmp.open("wb") as f:
+            f.write(data)
+
+        os.replace(tmp, fp)
+
+        # Write metadata after successful data write
+        self._write_metadata(key, cache_key, start, pinned)
+
+        return []
+
+    def delete(self, keys: list[str]) -> None:
+        for key in keys:
+            try:
+                self._mappings.discard(key)
+                self._file_for(key).unlink(missing_ok=True)
+
+                # Also remove metadata file
+                self._remove_metadata(key)
+            except Exception as e:
+                logger.debug(f"Failed to delete cache file for {key}: {e}")
+
+    def exists(self, key: str) -> bool:
+        return self._file_for(key).exists()
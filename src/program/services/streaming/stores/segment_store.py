@@ -0,0 +1,391 @@
+from __future__ import annotations
+
+import math
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import NamedTuple
+
+from loguru import logger
+
+from .base import CacheEntry, ChunkMappings, ChunkStore
+
+SEGMENTS_DIR_NAME = "segments"
+
+# Lower bound for segment files, so small caches don't end up with a file per chunk.
+MIN_SEGMENT_SIZE = 16 * 1024 * 1024  # 16 MiB
+
+
+class ChunkLocation(NamedTuple):
+    segment: int
+    offset: int
+    size: int
+    pinned: bool = False
+
+
+class SegmentChunkStore(ChunkStore):
+    """
+    Stores chunks appended to a small number of large, preallocated segment files,
+    with their locations kept in a SQLite index.
+
+    Startup loads the index rather than walking and stat-ing every chunk,
+    and deleting a chunk is an index update. Space is reclaimed a whole segment at a time:
+    segments are unlinked once they hold no live chunks, and when every segment slot is in use
+    the segment with the fewest live bytes is dropped, along with its remaining chunks.
+    Segments holding pinned chunks are only dropped when no other segment can be.
+
+    Segment ids are never reused and written regions are never overwritten,
+    so views into a mapped segment stay valid for as long as they are held.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        max_mappings: int,
+        *,
+        max_size_bytes: int,
+        segment_size_bytes: int,
+    ) -> None:
+        super().__init__(cache_dir, max_mappings)
+
+        self.root = cache_dir / SEGMENTS_DIR_NAME
+        self.segment_size = max(
+            1, min(segment_size_bytes, max(MIN_SEGMENT_SIZE, max_size_bytes // 8))
+        )
+        # One spare segment gives eviction room to free space before a segment must be dropped
+        self.max_segments = max(2, math.ceil(max_size_bytes / self.segment_size) + 1)
+
+        self._locations = dict[str, ChunkLocation]()
+        self._segment_keys = dict[int, set[str]]()
+        self._segment_sizes = dict[int, int]()
+        self._write_offsets = dict[int, int]()
+        self._active_segment: int | None = None
+        self._next_segment = 0
+        self._db: sqlite3.Connection | None = None
+
+        # Guards the in-memory index and the database connection
+        self._lock = threading.Lock()
+        # Serialises appends, so space is never handed out twice
+        self._write_lock = threading.Lock()
+
+    def _path_for(self, segment: int) -> Path:
+        return self.root / f"{segment:08d}.seg"
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._db is None:
+            self.root.mkdir(parents=True, exist_ok=True)
+
+            db = sqlite3.connect(self.root / "index.sqlite", check_same_thread=False)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA synchronous=NORMAL")
+            db.execute(
+                """
+                CREATE TABLE IF NOT EXISTS chunks (
+                    key TEXT PRIMARY KEY,
+                    cache_key TEXT NOT NULL,
+                    start INTEGER NOT NULL,
+                    segment INTEGER NOT NULL,
+                    offset INTEGER NOT NULL,
+                    size INTEGER NOT NULL,
+                    mtime REAL NOT NULL,
+                    pinned INTEGER NOT NULL DEFAULT 0
+                ) WITHOUT ROWID
+                """
+            )
+            db.commit()
+
+            self._db = db
+
+        return self._db
+
+    def load_entries(self) -> list[CacheEntry]:
+        with self._lock:
+            db = self._connect()
+
+            self._mappings.clear()
+            self._locations.clear()
+            self._segment_keys.clear()
+            self._segment_sizes.clear()
+            self._write_offsets.clear()
+
+            for fp in self.root.glob("*.seg"):
+                try:
+                    self._segment_sizes[int(fp.stem)] = fp.stat().st_size
+                except (ValueError, OSError):
+                    continue
+
+            entries: list[CacheEntry] = []
+            stale_keys: list[str] = []
+
+            rows = db.execute(
+                "SELECT key, cache_key, start, segment, offset, size, mtime, pinned FROM chunks ORDER BY mtime"
+            )
+
+            for key, cache_key, start, segment, offset, size, mtime, pinned in rows:
+                segment_size = self._segment_sizes.get(segment)
+
+                if segment_size is None or offset + size > segment_size:
+                    # Segment file was removed or truncated outside of the cache
+                    stale_keys.append(key)
+                    continue
+
+                self._register(key, ChunkLocation(segment, offset, size, bool(pinned)))
+                self._write_offsets[segment] = max(
+                    self._write_offsets.get(segment, 0), offset + size
+                )
+                entries.append(
+                    CacheEntry(
+                        key=key,
+                        cache_key=cache_key,
+                        start=start,
+                        size=size,
+                        mtime=mtime,
+                        pinned=bool(pinned),
+                    )
+                )
+
+            if stale_keys:
+                logger.warning(
+                    f"Dropping {len(stale_keys)} cache index entries with missing segment data"
+                )
+                self._delete_rows(stale_keys)
+
+            for segment in list(self._segment_sizes):
+                if not self._segment_keys.get(segment):
+                    self._drop_segment(segment)
+
+            self._next_segment = max(self._segment_sizes, default=-1) + 1
+            # Keep appending to the newest segment after a restart
+            self._active_segment = max(self._segment_sizes, default=None)
+
+            return entries
+
+    def view(self, key: str, offset: int, size: int) -> memoryview | None:
+        with self._lock:
+            location = self._locations.get(key)
+
+        if location is None or offset + size > location.size:
+            return None
+
+        return ChunkMappings.view(
+            self._mappings.get(str(location.segment)),
+            location.offset + offset,
+            size,
+        )
+
+    def map(self, key: str) -> bool:
+        with self._lock:
+            location = self._locations.get(key)
+
+        if location is None:
+            return False
+
+        segment_key = str(location.segment)
+
+        if self._mappings.get(segment_key) is not None:
+            return True
+
+        return (
+            self._mappings.open(segment_key, self._path_for(location.segment))
+            is not None
+        )
+
+    def read(self, key: str, offset: int = 0, size: int | None = None) -> bytes | None:
+        with self._lock:
+            location = self._locations.get(key)
+
+        if location is None:
+            return None
+
+        remaining = max(0, location.size - offset)
+        size = remaining if size is None else min(size, remaining)
+
+        try:
+            fd = os.open(self._path_for(location.segment), os.O_RDONLY)
+        except FileNotFoundError:
+            return None
+
+        try:
+            return os.pread(fd, size, location.offset + offset)
+        finally:
+            os.close(fd)
+
+    def write(
+        self,
+        key: str,
+        cache_key: str,
+        start: int,
+        data: bytes,
+        pinned: bool = False,
+    ) -> list[str]:
+        with self._write_lock:
+            with self._lock:
+                self._connect()
+                segment, offset, displaced = self._allocate(len(data))
+
+            fd = os.open(self._path_for(segment), os.O_WRONLY)
+
+            try:
+                os.pwrite(fd, data, offset)
+            finally:
+                os.close(fd)
+
+            with self._lock:
+                previous = self._locations.get(key)
+
+                if previous is not None:
+                    # The old data is left in place as dead space; it may still be mapped
+                    self._unregister(key, previous)
+
+                self._register(key, ChunkLocation(segment, offset, len(data), pinned))
+
+                db = self._connect()
+                db.execute(
+                    "INSERT OR REPLACE INTO chunks (key, cache_key, start, segment, offset, size, mtime, pinned) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        key,
+                        cache_key,
+                        start,
+                        segment,
+                        offset,
+                        len(data),
+                        time.time(),
+                        int(pinned),
+                    ),
+                )
+                db.commit()
+
+        # The chunk itself may have lived in a dropped segment, but it has just been rewritten
+        return [displaced_key for displaced_key in displaced if displaced_key != key]
+
+    def delete(self, keys: list[str]) -> None:
+        with self._lock:
+            emptied = set[int]()
+
+            for key in keys:
+                location = self._locations.get(key)
+
+                if location is None:
+                    continue
+
+                self._unregister(key, location)
+
+                if not self._segment_keys.get(location.segment):
+                    emptied.add(location.segment)
+
+            if self._db is not None:
+                self._delete_rows(keys)
+
+            for segment in emptied:
+                if segment != self._active_segment:
+                    self._drop_segment(segment)
+
+    def exists(self, key: str) -> bool:
+        with self._lock:
+            return key in self._locations
+
+    def close(self) -> None:
+        super().close()
+
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    def _register(self, key: str, location: ChunkLocation) -> None:
+        self._locations[key] = location
+        self._segment_keys.setdefault(location.segment, set()).add(key)
+
+    def _unregister(self, key: str, location: ChunkLocation) -> None:
+        self._locations.pop(key, None)
+        segment_keys = self._segment_keys.get(location.segment)
+
+        if segment_keys is not None:
+            segment_keys.discard(key)
+
+    def _reclaim_cost(self, segment: int) -> tuple[bool, int]:
+        """Cost of dropping a segment: whether it holds pinned chunks, then its live bytes."""
+
+        locations = [
+            self._locations[key] for key in self._segment_keys.get(segment, ())
+        ]
+
+        return (
+            any(location.pinned for location in locations),
+            sum(location.size for location in locations),
+        )
+
+    def _allocate(self, size: int) -> tuple[int, int, list[str]]:
+        """
+        Reserve space for a chunk, starting a new segment if the active one is full.
+
+        Returns the segment, the offset within it,
+        and the keys of any chunks dropped to free a segment slot.
+        """
+
+        active = self._active_segment
+
+        if (
+            active is not None
+            and self._write_offsets.get(active, 0) + size <= self._segment_sizes[active]
+        ):
+            offset = self._write_offsets.get(active, 0)
+            self._write_offsets[active] = offset + size
+
+            return active, offset, []
+
+        displaced = list[str]()
+
+        while self._segment_sizes and len(self._segment_sizes) >= self.max_segments:
+            victim = min(self._segment_sizes, key=self._reclaim_cost)
+            displaced.extend(self._drop_segment(victim))
+
+        if displaced:
+            self._delete_rows(displaced)
+
+        segment = self._next_segment
+        self._next_segment += 1
+
+        # Oversized chunks get a segment of their own
+        segment_size = max(self.segment_size, size)
+
+        with self._path_for(segment).open("wb") as f:
+            f.truncate(segment_size)
+
+        self._segment_sizes[segment] = segment_size
+        self._write_offsets[segment] = size
+        self._active_segment = segment
+
+        return segment, 0, displaced
+
+    def _drop_segment(self, segment: int) -> list[str]:
+        """Forget a segment and all chunks in it, and delete its file."""
+
+        keys = self._segment_keys.pop(segment, set())
+
+        for key in keys:
+            self._locations.pop(key, None)
+
+        self._segment_sizes.pop(segment, None)
+        self._write_offsets.pop(segment, None)
+
+        if self._active_segment == segment:
+            self._active_segment = None
+
+        # Outstanding views keep the unlinked file's pages alive until released
+        self._mappings.discard(str(segment))
+
+        try:
+            self._path_for(segment).unlink(missing_ok=True)
+        except OSError as e:
+            logger.warning(f"Failed to remove cache segment {segment}: {e}")
+
+        return list(keys)
+
+    def _delete_rows(self, keys: list[str]) -> None:
+        db = self._connect()
+        db.executemany("DELETE FROM chunks WHERE key = ?", [(key,) for key in keys])
+        db.commit()
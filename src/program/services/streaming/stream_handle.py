@@ -0,0 +1,31 @@
+from dataclasses import dataclass, field
+
+import pyfuse3
+import trio_util
+
+from .read_ahead import ReadAhead
+from .recent_reads import RecentReads
+
+
+@dataclass
+class StreamHandle:
+    """
+    Per-file-handle state for a shared media stream.
+
+    Several file handles can read the same file at once (e.g. a transcoder and a scanner),
+    so read detection, connection lifecycle and errors are tracked per handle,
+    whilst the stream itself, and its chunk fetches, are shared between them.
+    """
+
+    fh: pyfuse3.FileHandleT
+    read_ahead: ReadAhead
+    recent_reads: RecentReads = field(default_factory=RecentReads)
+    is_streaming: trio_util.AsyncBool = field(
+        default_factory=lambda: trio_util.AsyncBool(False)
+    )
+    is_killed: trio_util.AsyncBool = field(
+        default_factory=lambda: trio_util.AsyncBool(False)
+    )
+    stream_error: trio_util.AsyncValue[Exception | None] = field(
+        default_factory=lambda: trio_util.AsyncValue(None)
+    )
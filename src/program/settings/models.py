@@ -276,12 +276,55 @@ class FilesystemModel(Observable):
         default=2 * 60 * 60,
         description="Cache time-to-live in seconds (2 hours default)",
     )
-    cache_eviction: Literal["LRU", "TTL"] = Field(
-        default="LRU", description="Cache eviction policy (LRU or TTL)"
+    cache_eviction: Literal["LRU", "SLRU", "TTL"] = Field(
+        default="LRU",
+        description="Cache eviction policy (LRU, SLRU or TTL). SLRU also protects chunks that are re-used after sitting idle from being flushed by long sequential streams",
+    )
+    cache_memory_tier_mb: int = Field(
+        default=64,
+        ge=0,
+        description="Size in MB of the in-memory tier above the disk cache, holding the most recently written and most probed chunks (64 MB default, 0 to disable)",
     )
     cache_metrics: bool = Field(
         default=True, description="Enable cache metrics logging"
     )
+    cache_io_workers: int = Field(
+        default=4,
+        ge=1,
+        description="Number of worker threads used for cache disk I/O (4 default)",
+    )
+    cache_prewarm: bool = Field(
+        default=True,
+        description="Fetch the header and footer of newly added media files into the cache, pinned, so the first probe by a player or media server is served locally",
+    )
+    cache_prewarm_concurrency: int = Field(
+        default=2,
+        ge=1,
+        description="Maximum number of files pre-warmed at once (2 default)",
+    )
+    cache_pinned_max_size_mb: int = Field(
+        default=1024,
+        ge=0,
+        description="Maximum cache space in MB for pinned pre-warmed data, capped at half the cache size; the oldest pinned data is dropped beyond this (1024 MB default)",
+    )
+    cdn_url_validation: Literal["open", "first_read"] = Field(
+        default="open",
+        description="When to validate debrid CDN URLs of media files: on open, or deferred to the first read so opens return immediately",
+    )
+    cdn_url_validation_ttl_seconds: int = Field(
+        default=300,
+        ge=0,
+        description="How long a successful CDN URL validation is reused before the URL is probed again (0 disables caching)",
+    )
+    cdn_url_validation_negative_ttl_seconds: int = Field(
+        default=30,
+        ge=0,
+        description="How long a failed CDN URL validation is remembered before retrying (0 disables caching)",
+    )
+    cache_storage: Literal["files", "segments"] = Field(
+        default="files",
+        description="Cache storage layout: one file per chunk, or chunks packed into large segment files with a compact index for fast startup on large caches",
+    )
 
     # VFS Naming Templates
     movie_dir_template: str = Field(
@@ -788,6 +831,33 @@ class ScraperModel(Observable):
     dubbed_anime_only: bool = Field(
         default=False, description="Only scrape dubbed anime content"
     )
+    parsed_title_cache_size: int = Field(
+        default=50_000,
+        ge=0,
+        description="Number of parsed torrent titles kept in memory, so titles returned by repeated scrapes aren't parsed again (0 to disable)",
+    )
+    persist_parsed_titles: bool = Field(
+        default=False,
+        description="Also store parsed torrent titles in the database, so they survive restarts",
+    )
+    infohash_cache_size: int = Field(
+        default=20_000,
+        ge=0,
+        description="Number of indexer download URLs remembered with the infohash they resolved to, so Jackett and Prowlarr don't download the same torrent files on every scrape (0 to disable)",
+    )
+    persist_resolved_infohashes: bool = Field(
+        default=True,
+        description="Also store resolved infohashes in the database, so they survive restarts",
+    )
+    shared_results_ttl_seconds: int = Field(
+        default=900,
+        ge=0,
+        description="Seconds to share a scraper's results for an episode or season with the other episodes of the season, which reuse them instead of scraping again if they include a matching release (15 minutes default, 0 to disable)",
+    )
+    async_scraping: bool = Field(
+        default=False,
+        description="Run all scrapes on one shared event loop, cancelling scrapers that exceed their timeout, rather than starting a thread per scraper for every item",
+    )
     torrentio: TorrentioConfig = Field(
         default_factory=lambda: TorrentioConfig(), description="Torrentio configuration"
     )
@@ -835,6 +905,48 @@ class IndexerModel(Observable):
     )
 
 
+class WorkersModel(Observable):
+    indexer: int = Field(
+        default=4,
+        ge=1,
+        le=32,
+        description="Number of items indexed concurrently",
+    )
+    scraping: int = Field(
+        default=4,
+        ge=1,
+        le=32,
+        description="Number of items scraped concurrently",
+    )
+    downloader: int = Field(
+        default=2,
+        ge=1,
+        le=32,
+        description="Number of items downloaded concurrently",
+    )
+    default: int = Field(
+        default=1,
+        ge=1,
+        le=32,
+        description="Number of concurrent jobs for all other services",
+    )
+    provider_limit: int = Field(
+        default=2,
+        ge=0,
+        description="Maximum concurrent requests to each scraper or debrid provider (0 for unlimited)",
+    )
+    provider_limits: dict[str, int] = Field(
+        default_factory=dict,
+        description="Per-provider overrides of provider_limit, keyed by provider (e.g. realdebrid, prowlarr)",
+    )
+    ranking_processes: int = Field(
+        default=0,
+        ge=0,
+        le=32,
+        description="Number of worker processes that rank scraped results, keeping it off the main interpreter (0 to rank in-process)",
+    )
+
+
 class DatabaseModel(Observable):
     host: PostgresDsn = Field(
         default_factory=lambda: PostgresDsn(
@@ -842,6 +954,10 @@ class DatabaseModel(Observable):
         ),
         description="Database connection string",
     )
+    persistent_event_queue: bool = Field(
+        default=False,
+        description="Persist queued and running events in the database so they resume after a restart",
+    )
 
 
 class NotificationsModel(Observable):
@@ -914,6 +1030,11 @@ class StreamModel(Observable):
         ge=1,
         description="Chunk size in MB for streaming downloads (1 MB default). Note: Smaller chunks are generally more efficient, as the entire chunk must be downloaded before it can be read.",
     )
+    max_chunk_size_mb: int = Field(
+        default=8,
+        ge=1,
+        description="Maximum chunk size in MB for streaming downloads. Each stream picks a multiple of chunk_size_mb up to this, based on the file's bitrate and the provider's measured download speed (8 MB default, set to chunk_size_mb to always use fixed chunks)",
+    )
     connect_timeout_seconds: int = Field(
         default=10,
         ge=1,
@@ -929,6 +1050,26 @@ class StreamModel(Observable):
         ge=1,
         description="Timeout in seconds before a stream is considered inactive during resource cleanup (60 seconds default)",
     )
+    read_ahead_seconds: int = Field(
+        default=30,
+        ge=0,
+        description="Seconds of playback to keep cached ahead of the play head during sequential playback, based on the measured playback rate (30 seconds default)",
+    )
+    read_ahead_max_mb: int = Field(
+        default=256,
+        ge=0,
+        description="Maximum data in MB to keep cached ahead of the play head; capped at a quarter of the cache size (256 MB default, 0 to disable read-ahead)",
+    )
+    parallel_seek_chunks: int = Field(
+        default=4,
+        ge=0,
+        description="Number of chunks fetched concurrently, each over its own connection, when playback starts or seeks (4 default, 0 to fetch sequentially)",
+    )
+    max_parallel_connections_per_provider: int = Field(
+        default=8,
+        ge=1,
+        description="Maximum concurrent connections per provider used for parallel chunk fetches, shared by all streams (8 default)",
+    )
 
 
 class AppModel(Observable):
@@ -953,6 +1094,10 @@ class AppModel(Observable):
     tracemalloc: bool = Field(
         default=False, description="Enable Python memory tracking (debug)"
     )
+    workers: WorkersModel = Field(
+        default_factory=lambda: WorkersModel(),
+        description="Service concurrency configuration",
+    )
     filesystem: FilesystemModel = Field(
         default_factory=lambda: FilesystemModel(),
         description="Filesystem configuration",
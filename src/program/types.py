@@ -49,6 +49,7 @@ class Event:
     run_at: datetime = datetime.now()
     item_state: States | None = None  # Cached state for priority sorting
     overrides: dict[str, Any] | None = None
+    queue_id: int | None = None  # Row ID in the durable event queue, if persisted
 
     @property
     def log_message(self) -> str:
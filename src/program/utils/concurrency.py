@@ -0,0 +1,201 @@
+import asyncio
+import threading
+from collections import Counter, deque
+from collections.abc import AsyncIterator, Iterator
+from contextlib import asynccontextmanager, contextmanager
+
+from program.settings import settings_manager
+
+
+class ProviderLimiter:
+    """
+    Caps the number of concurrent requests made to each upstream provider (scrapers, debrid services).
+
+    Services process several items at once, so without a cap every worker could hit the same provider simultaneously.
+    Limits come from `settings.workers` and are re-read on every acquire, so changes apply to new requests.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._semaphores = dict[str, tuple[int, threading.BoundedSemaphore | None]]()
+        self._in_flight = Counter[str]()
+        self._waiting = Counter[str]()
+        # Coroutines waiting in `limit_async` for a slot of each semaphore, woken as slots are released
+        self._async_waiters = dict[
+            threading.BoundedSemaphore,
+            deque[tuple[asyncio.AbstractEventLoop, asyncio.Future[None]]],
+        ]()
+
+    @staticmethod
+    def limit_for(provider: str) -> int:
+        """Get the concurrency limit of a provider, 0 meaning unlimited."""
+
+        workers = settings_manager.settings.workers
+
+        return workers.provider_limits.get(provider, workers.provider_limit)
+
+    @contextmanager
+    def limit(self, provider: str) -> Iterator[None]:
+        """Hold one of the provider's request slots for the duration of the block."""
+
+        semaphore = self._get_semaphore(provider)
+
+        with self._lock:
+            self._waiting[provider] += 1
+
+        try:
+            if semaphore:
+                semaphore.acquire()
+        finally:
+            with self._lock:
+                self._waiting[provider] -= 1
+
+        with self._hold(provider, semaphore):
+            yield
+
+    @asynccontextmanager
+    async def limit_async(self, provider: str) -> AsyncIterator[None]:
+        """Like `limit`, but waits for a slot without blocking the event loop."""
+
+        semaphore = self._get_semaphore(provider)
+
+        with self._lock:
+            self._waiting[provider] += 1
+
+        try:
+            if semaphore:
+                await self._acquire_async(semaphore)
+        finally:
+            with self._lock:
+                self._waiting[provider] -= 1
+
+        with self._hold(provider, semaphore):
+            yield
+
+    def stats(self) -> dict[str, dict[str, int]]:
+        """Get the limit, in-flight and waiting request counts of each provider used so far."""
+
+        with self._lock:
+            return {
+                provider: {
+                    "limit": limit,
+                    "in_flight": self._in_flight[provider],
+                    "waiting": self._waiting[provider],
+                }
+                for provider, (limit, _) in self._semaphores.items()
+            }
+
+    @contextmanager
+    def _hold(
+        self, provider: str, semaphore: threading.BoundedSemaphore | None
+    ) -> Iterator[None]:
+        """Count an acquired slot as in flight, releasing it at the end of the block."""
+
+        try:
+            with self._lock:
+                self._in_flight[provider] += 1
+
+            yield
+        finally:
+            with self._lock:
+                self._in_flight[provider] -= 1
+
+            if semaphore:
+                semaphore.release()
+                self._wake(semaphore)
+
+    async def _acquire_async(self, semaphore: threading.BoundedSemaphore) -> None:
+        """Take a slot of the semaphore, waiting to be woken by a release rather than blocking the loop."""
+
+        loop = asyncio.get_running_loop()
+
+        while True:
+            waiter = loop.create_future()
+
+            # Registered before trying, so a slot released in between still wakes it
+            with self._lock:
+                self._async_waiters.setdefault(semaphore, deque()).append(
+                    (loop, waiter)
+                )
+
+            if semaphore.acquire(blocking=False):
+                if not self._discard_waiter(semaphore, waiter):
+                    # Already woken for a slot it didn't need; pass the wake-up on
+                    self._wake(semaphore)
+
+                return
+
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                # Woken for a slot it won't take; pass the wake-up on
+                if (
+                    not self._discard_waiter(semaphore, waiter)
+                    and not waiter.cancelled()
+                ):
+                    self._wake(semaphore)
+
+                raise
+
+    def _wake(self, semaphore: threading.BoundedSemaphore) -> None:
+        """Wake the longest waiting coroutine for a slot of the semaphore, if any."""
+
+        with self._lock:
+            if not (waiters := self._async_waiters.get(semaphore)):
+                return
+
+            loop, waiter = waiters.popleft()
+
+            if not waiters:
+                del self._async_waiters[semaphore]
+
+        def wake() -> None:
+            if waiter.done():
+                # Cancelled meanwhile
+                self._wake(semaphore)
+            else:
+                waiter.set_result(None)
+
+        try:
+            loop.call_soon_threadsafe(wake)
+        except RuntimeError:
+            # Its loop was closed
+            self._wake(semaphore)
+
+    def _discard_waiter(
+        self, semaphore: threading.BoundedSemaphore, waiter: asyncio.Future[None]
+    ) -> bool:
+        """Stop waiting for a slot, returning False if the waiter was already woken."""
+
+        with self._lock:
+            waiters = self._async_waiters.get(semaphore, deque())
+
+            for entry in waiters:
+                if entry[1] is waiter:
+                    waiters.remove(entry)
+                    break
+            else:
+                return False
+
+            if not waiters:
+                del self._async_waiters[semaphore]
+
+            return True
+
+    def _get_semaphore(self, provider: str) -> threading.BoundedSemaphore | None:
+        limit = self.limit_for(provider)
+
+        with self._lock:
+            current = self._semaphores.get(provider)
+
+            if current and current[0] == limit:
+                return current[1]
+
+            # Holders of a replaced semaphore still release it, without affecting new requests
+            semaphore = threading.BoundedSemaphore(limit) if limit else None
+            self._semaphores[provider] = (limit, semaphore)
+
+            return semaphore
+
+
+provider_limiter = ProviderLimiter()
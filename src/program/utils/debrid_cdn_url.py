@@ -1,5 +1,8 @@
-from typing import Self
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Literal, Self
 import httpx
+import trio
 from loguru import logger
 
 from http import HTTPStatus
@@ -12,6 +15,8 @@ from program.services.streaming.exceptions import (
 )
 from program.media.media_entry import MediaEntry
 from program.db.db import db_session
+from program.utils.async_client import AsyncClient
+from program.utils.proxy_client import ProxyClient
 
 
 class RefreshedURLIdenticalException(Exception):
@@ -47,73 +52,123 @@ class DebridCDNUrl:
 
             return cls(entry)
 
-    def validate(
-        self,
-        attempt_refresh: bool = True,
-        attempt: int = 1,
-    ) -> str | None:
+    def validate(self, attempt_refresh: bool = True) -> str | None:
         """Get a validated CDN URL, refreshing if requested."""
 
-        try:
-            # Assert URL availability by opening a stream, using a proxy if needed
-            proxy = (
-                self.provider in PROXY_REQUIRED_PROVIDERS
-                and settings_manager.settings.downloaders.proxy_url
-                or None
-            )
-
-            try:
-                # If no URL is set, attempt to refresh it first if requested,
-                # otherwise return as an invalid URL
-                if not self.url:
-                    if attempt_refresh:
-                        if url := self._refresh():
-                            self.url = url
-                        else:
-                            return None
-                    else:
+        with self._link_unavailable_if_refresh_identical():
+            for attempt in range(1, self.max_validation_attempts + 2):
+                try:
+                    # If no URL is set, attempt to refresh it first if requested,
+                    # otherwise return as an invalid URL
+                    if not self.url and not (attempt_refresh and self._refresh()):
                         return None
 
-                with httpx.Client(proxy=proxy) as client:
-                    with client.stream(method="GET", url=self.url) as response:
-                        response.raise_for_status()
-
-                        return self.url
-            except httpx.TimeoutException as e:
-                logger.error(f"Timeout while validating CDN URL {self.url}: {e}")
-            except httpx.ConnectError as e:
-                logger.error(
-                    f"Connection error while validating CDN URL {self.url}: {e}"
-                )
-            except httpx.HTTPStatusError as e:
-                status_code = e.response.status_code
-
-                if (
-                    status_code in (HTTPStatus.NOT_FOUND, HTTPStatus.GONE)
-                    and attempt == 1
-                ):
-                    # Only attempt to refresh the URL on the first failure
-                    if attempt_refresh:
-                        if url := self._refresh():
-                            self.url = url
-                    else:
+                    return self._probe()
+                except RefreshedURLIdenticalException:
+                    raise
+                except Exception as e:
+                    action = self._on_failure(e, attempt, attempt_refresh)
+
+                if action == "refresh":
+                    self._refresh()
+                elif action == "give_up":
+                    return None
+
+            return None
+
+    async def validate_async(self, attempt_refresh: bool = True) -> str | None:
+        """
+        Get a validated CDN URL, refreshing if requested, without blocking the event loop.
+
+        The URL is probed with the shared async HTTP client, reusing pooled connections,
+        and only the first byte is requested. Refreshes run on a worker thread.
+        """
+
+        with self._link_unavailable_if_refresh_identical():
+            for attempt in range(1, self.max_validation_attempts + 2):
+                try:
+                    if not self.url and not (
+                        attempt_refresh and await trio.to_thread.run_sync(self._refresh)
+                    ):
                         return None
-            except RefreshedURLIdenticalException:
-                raise
-            except Exception as e:
-                logger.error(
-                    f"Unexpected error while validating CDN URL {self.url}: {e}"
-                )
 
-                return None
+                    return await self._probe_async()
+                except RefreshedURLIdenticalException:
+                    raise
+                except Exception as e:
+                    action = self._on_failure(e, attempt, attempt_refresh)
 
-            if attempt <= self.max_validation_attempts:
-                return self.validate(
-                    attempt_refresh=attempt_refresh,
-                    attempt=attempt + 1,
-                )
+                if action == "refresh":
+                    await trio.to_thread.run_sync(self._refresh)
+                elif action == "give_up":
+                    return None
 
             return None
+
+    def _probe(self) -> str:
+        """Assert URL availability by opening a stream, using a proxy if needed."""
+
+        assert self.url
+
+        proxy = (
+            self.provider in PROXY_REQUIRED_PROVIDERS
+            and settings_manager.settings.downloaders.proxy_url
+            or None
+        )
+
+        with httpx.Client(proxy=proxy) as client:
+            with client.stream(method="GET", url=self.url) as response:
+                response.raise_for_status()
+
+                return self.url
+
+    async def _probe_async(self) -> str:
+        """Assert URL availability by requesting its first byte with the shared client."""
+
+        assert self.url
+
+        async with self._async_client.stream(
+            method="GET",
+            url=self.url,
+            headers={"Range": "bytes=0-0"},
+        ) as response:
+            response.raise_for_status()
+
+            return self.url
+
+    def _on_failure(
+        self,
+        error: Exception,
+        attempt: int,
+        attempt_refresh: bool,
+    ) -> Literal["retry", "refresh", "give_up"]:
+        """Decide what to do after a failed validation attempt."""
+
+        if isinstance(error, httpx.TimeoutException):
+            logger.error(f"Timeout while validating CDN URL {self.url}: {error}")
+        elif isinstance(error, httpx.ConnectError):
+            logger.error(
+                f"Connection error while validating CDN URL {self.url}: {error}"
+            )
+        elif isinstance(error, httpx.HTTPStatusError):
+            status_code = error.response.status_code
+
+            if status_code in (HTTPStatus.NOT_FOUND, HTTPStatus.GONE) and attempt == 1:
+                # Only attempt to refresh the URL on the first failure
+                return "refresh" if attempt_refresh else "give_up"
+        else:
+            logger.error(
+                f"Unexpected error while validating CDN URL {self.url}: {error}"
+            )
+
+            return "give_up"
+
+        return "retry"
+
+    @contextmanager
+    def _link_unavailable_if_refresh_identical(self) -> Iterator[None]:
+        try:
+            yield
         except RefreshedURLIdenticalException as e:
             # If the URL hasn't changed after refreshing, it is likely dead.
             # Raise an exception to indicate the link is unavailable to trigger a re-scrape.
@@ -122,6 +177,18 @@ class DebridCDNUrl:
                 link=self.url or "Unknown URL",
             ) from e
 
+    @property
+    def _async_client(self) -> AsyncClient | ProxyClient:
+        """The shared HTTP client for this provider, using the proxy client if required."""
+
+        if (
+            self.provider in PROXY_REQUIRED_PROVIDERS
+            and settings_manager.settings.downloaders.proxy_url
+        ):
+            return di[ProxyClient]
+
+        return di[AsyncClient]
+
     def _refresh(self) -> str | None:
         """Refresh the CDN URL."""
 
@@ -0,0 +1,68 @@
+"""Thread-safe LRU cache sized from settings."""
+
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Mapping
+
+
+class ResizableLRUCache[K, V]:
+    """
+    Thread-safe LRU cache whose size is re-read on every access, so a changed setting applies immediately.
+
+    Reads count as uses, so shrinking the cache drops the least recently read or written entries.
+    A size of zero or less disables the cache, dropping its entries.
+    """
+
+    def __init__(self, get_maxsize: Callable[[], int]) -> None:
+        self._get_maxsize = get_maxsize
+        self._lock = threading.Lock()
+        self._entries = OrderedDict[K, V]()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: K) -> V | None:
+        return self.get_many([key]).get(key)
+
+    def get_many(self, keys: Iterable[K]) -> dict[K, V]:
+        """Get the cached values of the given keys, marking them as recently used; keys that aren't cached are left out."""
+
+        found = dict[K, V]()
+
+        with self._lock:
+            if not self._resize():
+                return found
+
+            for key in keys:
+                if key in self._entries:
+                    self._entries.move_to_end(key)
+                    found[key] = self._entries[key]
+
+        return found
+
+    def set(self, key: K, value: V) -> None:
+        self.update({key: value})
+
+    def update(self, entries: Mapping[K, V]) -> None:
+        """Cache values as the most recently used, evicting the least recently used beyond the size."""
+
+        with self._lock:
+            if not (maxsize := self._resize()):
+                return
+
+            for key, value in entries.items():
+                self._entries[key] = value
+                self._entries.move_to_end(key)
+
+            while len(self._entries) > maxsize:
+                self._entries.popitem(last=False)
+
+    def _resize(self) -> int:
+        """Apply the configured size, returning it, or 0 if the cache is disabled. Callers must hold the lock."""
+
+        maxsize = max(0, self._get_maxsize())
+
+        while len(self._entries) > maxsize:
+            self._entries.popitem(last=False)
+
+        return maxsize
@@ -0,0 +1,67 @@
+"""
+Worker process pool for CPU-bound work.
+
+Worker processes import this module to run their initializer, so it must not import modules
+with side effects, such as `program.settings`, which rewrites the settings file when imported.
+"""
+
+import multiprocessing
+import signal
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+
+def _init_worker_process() -> None:
+    """Leave shutdown to the parent: ignore Ctrl+C and drop its inherited SIGTERM handler."""
+
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+
+
+class ProcessPool:
+    """
+    Pool of worker processes for CPU-bound work, so it doesn't hold the GIL needed by the FUSE and API threads.
+
+    Workers are forked from a forkserver rather than from this process: forking a process that
+    runs threads can leave the child holding a lock that no thread will ever release. Nor are they
+    spawned, since spawning re-runs the entry point, which starts the server. The forkserver imports
+    the `preload` modules once, so workers start with them already imported.
+    Submitted functions must be module-level, take picklable arguments and live in modules
+    that are safe to import in a fresh process.
+    """
+
+    def __init__(self, preload: list[str] | None = None) -> None:
+        self.preload = preload or []
+        self._lock = threading.Lock()
+        self._executor: ProcessPoolExecutor | None = None
+        self._max_workers = 0
+
+    def get_executor(self, max_workers: int) -> ProcessPoolExecutor:
+        """Get the pool's executor, recreating it if the number of workers changed."""
+
+        with self._lock:
+            if self._executor and self._max_workers == max_workers:
+                return self._executor
+
+            if self._executor:
+                self._executor.shutdown(wait=False)
+
+            mp_context = multiprocessing.get_context("forkserver")
+            mp_context.set_forkserver_preload(self.preload)
+
+            self._executor = ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=mp_context,
+                initializer=_init_worker_process,
+            )
+            self._max_workers = max_workers
+
+            return self._executor
+
+    def shutdown(self) -> None:
+        with self._lock:
+            if self._executor:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+
+            self._executor = None
+            self._max_workers = 0
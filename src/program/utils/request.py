@@ -1,5 +1,6 @@
 from collections.abc import Generator, Mapping
 from datetime import datetime
+import asyncio
 import json
 import random
 import ssl
@@ -74,35 +75,44 @@ class TokenBucket:
         deficit/rate, releasing the lock during sleep so other threads can progress.
         """
 
-        need = float(tokens)
-
-        while True:
-            with self._lock:
-                now = time.monotonic()
-                self._refill(now)
-
-                if self.tokens >= need:
-                    self.tokens -= need
-                    return
-
-                # Compute exact time to wait for next available tokens
-                deficit = max(0.0, need - self.tokens)
-                sleep_for = deficit / self.rate if self.rate > 0 else 0.05
-
-                if self.name:
-                    logger.trace(
-                        "Rate limit sleep: host={} sleep={:.3f}s deficit={:.3f} rate={:.3f} tokens={:.3f}/{:.0f}",
-                        self.name,
-                        sleep_for,
-                        deficit,
-                        self.rate,
-                        self.tokens,
-                        self.capacity,
-                    )
-
+        while sleep_for := self._take_or_delay(float(tokens)):
             # Release lock while sleeping to allow other threads to make progress
             time.sleep(sleep_for)
 
+    async def wait_async(self, tokens: int = 1) -> None:
+        """Like `wait`, but sleeps without blocking the event loop."""
+
+        while sleep_for := self._take_or_delay(float(tokens)):
+            await asyncio.sleep(sleep_for)
+
+    def _take_or_delay(self, need: float) -> float:
+        """Take the tokens if they're available and return 0, else return how long to sleep for."""
+
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+
+            if self.tokens >= need:
+                self.tokens -= need
+                return 0.0
+
+            # Compute exact time to wait for next available tokens
+            deficit = max(0.0, need - self.tokens)
+            sleep_for = deficit / self.rate if self.rate > 0 else 0.05
+
+            if self.name:
+                logger.trace(
+                    "Rate limit sleep: host={} sleep={:.3f}s deficit={:.3f} rate={:.3f} tokens={:.3f}/{:.0f}",
+                    self.name,
+                    sleep_for,
+                    deficit,
+                    self.rate,
+                    self.tokens,
+                    self.capacity,
+                )
+
+            return sleep_for
+
 
 class CircuitBreakerOpen(RuntimeError):
     """Raised when a circuit breaker is OPEN and requests should fail fast."""
@@ -633,6 +643,80 @@ class SmartSession:
     def options(self, url: str, **kwargs: Any) -> SmartResponse:
         return self.request("OPTIONS", url, **kwargs)
 
+    async def request_async(
+        self,
+        client: httpx.AsyncClient,
+        method: str,
+        url: str,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        """
+        Make a request on an async client, with this session's base URL, headers, auth, cookies,
+        rate limiting, circuit breaker and retries.
+
+        Proxies aren't supported, as they're configured on the client.
+
+        Args:
+            client (httpx.AsyncClient): Client to send the request with.
+            method (str): HTTP method.
+            url (str): Request URL (relative or absolute).
+            **kwargs: Additional httpx request parameters.
+
+        Returns:
+            httpx.Response: The response to the last attempt.
+        """
+
+        if self.base_url and not url.lower().startswith(("http://", "https://")):
+            url = f"{self.base_url}/{url.lstrip('/')}"
+
+        parsed = urlparse(url)
+        domain = parsed.hostname.lower() if parsed.hostname else ""
+
+        breaker = self.breakers.get(domain)
+
+        if breaker:
+            breaker.before_request()
+
+        limiter = self.limiters.get(domain)
+
+        if limiter:
+            await limiter.wait_async()
+
+        kwargs["headers"] = {**self.headers, **(kwargs.get("headers") or {})}
+        kwargs.pop("verify", None)
+        kwargs.pop("cert", None)
+        kwargs["auth"] = kwargs.pop("auth", self.auth)
+        kwargs["cookies"] = kwargs.pop("cookies", self.cookies)
+        attempt = 0
+
+        while True:
+            attempt += 1
+
+            try:
+                response = await client.request(method.upper(), url, **kwargs)
+            except httpx.RequestError:
+                if attempt <= self.retries:
+                    await asyncio.sleep(self._backoff(attempt))
+                    continue
+
+                if breaker:
+                    breaker.after_request(False)
+
+                raise
+
+            is_retryable = (
+                response.status_code == 429 or 500 <= response.status_code < 600
+            )
+
+            if is_retryable and attempt <= self.retries:
+                await asyncio.sleep(self._compute_retry_delay(response, attempt))
+                continue
+
+            if breaker:
+                breaker.after_request(not is_retryable)
+
+            return response
+
     def close(self):
         try:
             self._client.close()
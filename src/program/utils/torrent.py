@@ -4,6 +4,7 @@ import base64
 import re
 
 from loguru import logger
+from RTN import ParsedData, parse
 
 # Pattern to match infohashes in magnet links (supports both 40-char hex and 32-char base32)
 INFOHASH_PATTERN = re.compile(r"btih:([a-fA-F0-9]{40}|[a-zA-Z0-9]{32})", re.IGNORECASE)
@@ -58,3 +59,21 @@ def extract_infohash(text: str) -> str | None:
         return normalize_infohash(infohash)
 
     return None
+
+
+def parse_raw_titles(raw_titles: list[str]) -> dict[str, ParsedData]:
+    """
+    Parse raw torrent titles, leaving out those that fail to parse.
+
+    Also runs in the ranking processes, so this module must stay safe to import in a fresh process.
+    """
+
+    parsed = dict[str, ParsedData]()
+
+    for raw_title in raw_titles:
+        try:
+            parsed[raw_title] = parse(raw_title)
+        except Exception as e:
+            logger.trace(f"Failed to parse '{raw_title}': {e}")
+
+    return parsed
@@ -13,6 +13,7 @@ from sqlalchemy import Date, cast, func, select
 from program.apis import TraktAPI
 from program.db import db_functions
 from program.db.db import db_session
+from program.managers.event_manager import WorkerStats
 from program.media.item import Episode, MediaItem, Movie, Season, Show
 from program.media.state import States
 from program.program import Program
@@ -410,6 +411,17 @@ async def get_events() -> EventResponse:
     return EventResponse(events=events)
 
 
+@router.get(
+    "/events/workers",
+    operation_id="event_workers",
+    response_model=WorkerStats,
+)
+async def get_event_workers() -> WorkerStats:
+    """Get queue depth and in-flight jobs of each service, and in-flight requests of each provider."""
+
+    return di[Program].em.get_worker_stats()
+
+
 class MountResponse(BaseModel):
     files: dict[str, str]
 
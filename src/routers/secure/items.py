@@ -694,13 +694,15 @@ async def retry_items(
 async def retry_library_items() -> RetryResponse:
     item_ids = db_functions.retry_library()
 
-    for item_id in item_ids:
-        di[Program].em.add_event(
+    di[Program].em.add_events(
+        [
             Event(
                 emitted_by="RetryLibrary",
                 item_id=item_id,
             )
-        )
+            for item_id in item_ids
+        ]
+    )
 
     return RetryResponse(
         message=f"Retried {len(item_ids)} items",
@@ -67,6 +67,19 @@ async def stream_events(
         ),
     ],
 ) -> StreamingResponse:
+    """
+    Stream server-sent events of the given type.
+
+    `event_update` sends a snapshot of the running jobs first, then only the changes to it:
+
+    - `{"type": "snapshot", "seq": n, "events": {service: [item_id, ...]}}`
+    - `{"type": "delta", "seq": n, "added": {service: [item_id]}, "removed": {service: [item_id]}}`
+
+    Deltas follow the snapshot in `seq` order. An item is added when its first job for a service
+    starts, and removed once its last one finishes. Before, every message was the full
+    `{service: [item_id, ...]}` mapping, as still returned by `GET /events`.
+    """
+
     return StreamingResponse(
         sse_manager.subscribe(event_type),
         media_type="text/event-stream",
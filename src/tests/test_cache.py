@@ -0,0 +1,155 @@
+"""Tests for the streaming chunk cache."""
+
+import threading
+import time
+
+import pytest
+import trio
+
+from program.services.streaming.cache import Cache, CacheConfig
+
+KB = 1024
+
+
+def make_cache(cache_dir, **kwargs) -> Cache:
+    kwargs.setdefault("max_size_bytes", 1024 * KB)
+    kwargs.setdefault("memory_tier_bytes", 0)
+
+    return Cache(cfg=CacheConfig(cache_dir=cache_dir, **kwargs))
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return make_cache(tmp_path)
+
+
+def test_disk_io_runs_on_worker_threads(cache, monkeypatch):
+    threads = set[threading.Thread]()
+    store_write = cache._store.write
+
+    def write(*args, **kwargs) -> list[str]:
+        threads.add(threading.current_thread())
+
+        return store_write(*args, **kwargs)
+
+    monkeypatch.setattr(cache._store, "write", write)
+
+    async def run() -> bytes:
+        await cache.put("file.mkv", 0, b"x" * KB)
+
+        return bytes(await cache.get("file.mkv", 0, KB - 1))
+
+    assert trio.run(run) == b"x" * KB
+    assert threads
+    assert threading.main_thread() not in threads
+
+
+def test_disk_io_is_bounded_by_io_workers(tmp_path, monkeypatch):
+    cache = make_cache(tmp_path, io_workers=2)
+    lock = threading.Lock()
+    running = 0
+    most_running = 0
+    store_write = cache._store.write
+
+    def write(*args, **kwargs) -> list[str]:
+        nonlocal running, most_running
+
+        with lock:
+            running += 1
+            most_running = max(most_running, running)
+
+        try:
+            # Long enough for every put to be queued
+            time.sleep(0.05)
+
+            return store_write(*args, **kwargs)
+        finally:
+            with lock:
+                running -= 1
+
+    monkeypatch.setattr(cache._store, "write", write)
+
+    async def run() -> None:
+        async with trio.open_nursery() as nursery:
+            for index in range(6):
+                nursery.start_soon(cache.put, "file.mkv", index * KB, b"x" * KB)
+
+    trio.run(run)
+
+    assert most_running == 2
+
+
+def test_disk_io_latency_is_recorded(cache):
+    async def run():
+        await cache.put("file.mkv", 0, b"x" * KB)
+        await cache.get("file.mkv", 0, KB - 1)
+
+        return await cache.stats()
+
+    stats = trio.run(run)
+
+    assert stats["io_latency"]["write"]["count"] == 1
+    assert stats["io_queue_depth"] == 0
+    assert stats["io_in_flight"] == 0
+
+
+def test_single_chunk_hits_are_served_from_a_mapping(cache):
+    async def run():
+        await cache.put("file.mkv", 0, b"0123456789")
+
+        return await cache.get("file.mkv", 2, 5), await cache.stats()
+
+    data, stats = trio.run(run)
+
+    assert isinstance(data, memoryview)
+    assert bytes(data) == b"2345"
+    assert stats["mapped_chunks"] == 1
+
+
+def test_mapped_chunks_are_bounded(tmp_path):
+    cache = make_cache(tmp_path, max_mapped_chunks=2)
+
+    async def run():
+        for index in range(4):
+            await cache.put(f"file{index}.mkv", 0, bytes([index]) * KB)
+
+        reads = [
+            bytes(await cache.get(f"file{index}.mkv", 0, KB - 1)) for index in range(4)
+        ]
+
+        return reads, await cache.stats()
+
+    reads, stats = trio.run(run)
+
+    assert reads == [bytes([index]) * KB for index in range(4)]
+    assert stats["mapped_chunks"] == 2
+
+
+def test_overwritten_chunks_are_remapped(cache):
+    async def run():
+        await cache.put("file.mkv", 0, b"old!")
+        old = await cache.get("file.mkv", 0, 3)
+
+        await cache.put("file.mkv", 0, b"new!")
+
+        return bytes(old), bytes(await cache.get("file.mkv", 0, 3))
+
+    assert trio.run(run) == (b"old!", b"new!")
+
+
+def test_cached_chunks_can_be_pinned(cache):
+    async def run():
+        await cache.put("file.mkv", 0, b"header")
+        pinned = await cache.pin("file.mkv", 0, 5)
+        missing = await cache.pin("file.mkv", 100, 105)
+
+        return pinned, missing, await cache.stats()
+
+    pinned, missing, stats = trio.run(run)
+
+    assert pinned
+    assert not missing
+    assert stats["pinned_entries"] == 1
+    assert stats["tiers"]["probationary"]["entries"] == 0
+    # The pin survives a restart
+    assert [entry.pinned for entry in cache._store.load_entries()] == [True]
@@ -0,0 +1,80 @@
+"""Tests for cached, deduplicated CDN URL validation."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+import trio
+
+from program.services.filesystem.vfs import cdn_url_validator
+from program.services.filesystem.vfs.cdn_url_validator import CDNUrlValidator
+
+URL = "https://cdn.example/file.mkv"
+
+
+@pytest.fixture
+def from_filename():
+    cdn_url = MagicMock()
+    cdn_url.validate_async = AsyncMock(return_value=URL)
+
+    with patch.object(
+        cdn_url_validator.DebridCDNUrl, "from_filename", return_value=cdn_url
+    ) as from_filename:
+        yield from_filename
+
+
+def test_validations_are_reused(from_filename):
+    validator = CDNUrlValidator(ttl_seconds=60, negative_ttl_seconds=60)
+
+    async def run():
+        return [await validator.validate("file.mkv") for _ in range(3)]
+
+    assert trio.run(run) == [URL, URL, URL]
+    from_filename.assert_called_once_with("file.mkv")
+
+
+def test_failed_validations_use_the_negative_ttl(from_filename):
+    from_filename.return_value.validate_async.return_value = None
+    validator = CDNUrlValidator(ttl_seconds=60, negative_ttl_seconds=0)
+
+    async def run():
+        return [await validator.validate("file.mkv") for _ in range(2)]
+
+    assert trio.run(run) == [None, None]
+    assert from_filename.call_count == 2
+
+
+def test_invalidated_files_are_validated_again(from_filename):
+    validator = CDNUrlValidator(ttl_seconds=60, negative_ttl_seconds=60)
+
+    async def run():
+        await validator.validate("file.mkv")
+        validator.invalidate("file.mkv")
+        await validator.validate("file.mkv")
+
+    trio.run(run)
+
+    assert from_filename.call_count == 2
+
+
+def test_concurrent_validations_share_one_request(from_filename):
+    async def slow_validate():
+        await trio.sleep(0.05)
+
+        return URL
+
+    from_filename.return_value.validate_async.side_effect = slow_validate
+    validator = CDNUrlValidator(ttl_seconds=60, negative_ttl_seconds=60)
+    results = list[str | None]()
+
+    async def validate():
+        results.append(await validator.validate("file.mkv"))
+
+    async def run():
+        async with trio.open_nursery() as nursery:
+            for _ in range(5):
+                nursery.start_soon(validate)
+
+    trio.run(run)
+
+    assert results == [URL] * 5
+    from_filename.assert_called_once()
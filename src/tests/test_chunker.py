@@ -0,0 +1,54 @@
+"""Tests for per-stream chunk sizing."""
+
+from program.services.streaming.chunker import Chunker
+from program.services.streaming.session_statistics import (
+    ProviderThroughput,
+    SessionStatistics,
+)
+
+MB = 1024 * 1024
+GB = 1024 * MB
+
+
+def choose(**kwargs) -> int:
+    return Chunker.choose_chunk_size(
+        base_chunk_size=MB,
+        max_chunk_size=8 * MB,
+        **{"file_size": 20 * GB, **kwargs},
+    )
+
+
+def test_defaults_to_base_chunk_size_without_bitrate():
+    assert choose() == MB
+
+
+def test_holds_about_a_second_of_playback():
+    # 40 Mbit/s is 5 MB/s, rounded down to the nearest power-of-two multiple
+    assert choose(bitrate=40_000_000) == 4 * MB
+
+
+def test_capped_by_throughput_file_size_and_maximum():
+    assert choose(bitrate=40_000_000, throughput=2.5 * MB) == 2 * MB
+    assert choose(bitrate=40_000_000, file_size=200 * MB) == 2 * MB
+    assert choose(bitrate=400_000_000) == 8 * MB
+
+
+def test_never_below_base_chunk_size():
+    assert choose(bitrate=1_000_000, throughput=0.1 * MB) == MB
+    assert choose(file_size=MB) == MB
+
+
+def test_provider_throughput_ignores_small_sessions():
+    throughput = ProviderThroughput()
+
+    small = SessionStatistics()
+    small.record_download(size=MB, duration=0.1)
+    throughput.record(provider="realdebrid", statistics=small)
+
+    assert throughput.get("realdebrid") is None
+
+    large = SessionStatistics()
+    large.record_download(size=40 * MB, duration=4)
+    throughput.record(provider="realdebrid", statistics=large)
+
+    assert throughput.get("realdebrid") == 10 * MB
@@ -0,0 +1,173 @@
+"""Tests for the per-provider concurrency limiter and the worker process pool."""
+
+import asyncio
+import os
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from program.settings import settings_manager
+from program.utils.concurrency import ProviderLimiter
+from program.utils.process_pool import ProcessPool
+
+
+def test_limit_caps_concurrent_requests(monkeypatch):
+    monkeypatch.setattr(
+        settings_manager.settings.workers, "provider_limits", {"realdebrid": 2}
+    )
+
+    limiter = ProviderLimiter()
+    lock = threading.Lock()
+    active = 0
+    peak = 0
+
+    def request():
+        nonlocal active, peak
+
+        with limiter.limit("realdebrid"):
+            with lock:
+                active += 1
+                peak = max(peak, active)
+
+            time.sleep(0.05)
+
+            with lock:
+                active -= 1
+
+    threads = [threading.Thread(target=request) for _ in range(6)]
+
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    assert peak == 2
+    assert limiter.stats()["realdebrid"] == {"limit": 2, "in_flight": 0, "waiting": 0}
+
+
+def test_zero_limit_is_unlimited(monkeypatch):
+    monkeypatch.setattr(settings_manager.settings.workers, "provider_limit", 0)
+
+    limiter = ProviderLimiter()
+
+    with limiter.limit("torrentio"), limiter.limit("torrentio"):
+        assert limiter.stats()["torrentio"]["in_flight"] == 2
+
+
+def test_changed_limit_applies_to_new_requests(monkeypatch):
+    monkeypatch.setattr(settings_manager.settings.workers, "provider_limit", 1)
+
+    limiter = ProviderLimiter()
+
+    with limiter.limit("prowlarr"):
+        monkeypatch.setattr(settings_manager.settings.workers, "provider_limit", 2)
+
+        # Would block forever if the old single-slot semaphore were still used
+        with limiter.limit("prowlarr"):
+            assert limiter.stats()["prowlarr"] == {
+                "limit": 2,
+                "in_flight": 2,
+                "waiting": 0,
+            }
+
+
+def test_limit_async_shares_slots_with_limit(monkeypatch):
+    monkeypatch.setattr(
+        settings_manager.settings.workers, "provider_limits", {"torrentio": 1}
+    )
+
+    limiter = ProviderLimiter()
+
+    async def request() -> dict[str, int]:
+        async with limiter.limit_async("torrentio"):
+            return limiter.stats()["torrentio"]
+
+    with limiter.limit("torrentio"), pytest.raises(TimeoutError):
+        asyncio.run(asyncio.wait_for(request(), timeout=0.2))
+
+    assert asyncio.run(request()) == {"limit": 1, "in_flight": 1, "waiting": 0}
+    assert limiter.stats()["torrentio"] == {"limit": 1, "in_flight": 0, "waiting": 0}
+
+
+def test_limit_async_is_woken_when_a_slot_is_released(monkeypatch):
+    monkeypatch.setattr(
+        settings_manager.settings.workers, "provider_limits", {"torrentio": 1}
+    )
+
+    limiter = ProviderLimiter()
+    held = threading.Event()
+
+    def hold() -> None:
+        with limiter.limit("torrentio"):
+            held.set()
+            time.sleep(0.05)
+
+    async def request() -> None:
+        # Waiters are woken by the release, rather than polling for a slot
+        with patch("asyncio.sleep", side_effect=AssertionError("polled")):
+            async with limiter.limit_async("torrentio"):
+                pass
+
+    thread = threading.Thread(target=hold)
+    thread.start()
+    held.wait()
+
+    asyncio.run(asyncio.wait_for(request(), timeout=1))
+    thread.join()
+
+    assert limiter.stats()["torrentio"] == {"limit": 1, "in_flight": 0, "waiting": 0}
+
+
+def test_cancelled_async_waiters_pass_their_slot_on(monkeypatch):
+    monkeypatch.setattr(
+        settings_manager.settings.workers, "provider_limits", {"torrentio": 1}
+    )
+
+    limiter = ProviderLimiter()
+
+    async def request() -> dict[str, int]:
+        async with limiter.limit_async("torrentio"):
+            return limiter.stats()["torrentio"]
+
+    async def run() -> dict[str, int]:
+        holder = limiter.limit_async("torrentio")
+        await holder.__aenter__()
+
+        first = asyncio.create_task(request())
+        second = asyncio.create_task(request())
+        await asyncio.sleep(0.01)
+
+        # The slot goes to the first waiter, which is cancelled before it can take it
+        await holder.__aexit__(None, None, None)
+        first.cancel()
+
+        return await asyncio.wait_for(second, timeout=1)
+
+    assert asyncio.run(run()) == {"limit": 1, "in_flight": 1, "waiting": 0}
+    assert limiter.stats()["torrentio"] == {"limit": 1, "in_flight": 0, "waiting": 0}
+
+
+def test_process_pool_runs_in_other_processes():
+    pool = ProcessPool()
+
+    try:
+        executor = pool.get_executor(2)
+
+        assert executor.submit(os.getpid).result(timeout=30) != os.getpid()
+    finally:
+        pool.shutdown()
+
+
+def test_process_pool_is_recreated_when_resized():
+    pool = ProcessPool()
+
+    try:
+        executor = pool.get_executor(1)
+
+        assert pool.get_executor(1) is executor
+        assert pool.get_executor(2) is not executor
+    finally:
+        pool.shutdown()
@@ -0,0 +1,145 @@
+"""Tests for the indexed priority event queue."""
+
+import threading
+import time
+from datetime import datetime, timedelta
+from queue import Empty
+
+import pytest
+
+from program.managers.event_queue import EventIndex, EventQueue
+from program.media.item import Movie
+from program.media.state import States
+from program.types import Event
+
+
+def make_event(
+    item_id: int | None = None,
+    state: States | None = None,
+    run_at: datetime | None = None,
+) -> Event:
+    return Event(
+        emitted_by="Manual",
+        item_id=item_id,
+        run_at=run_at or datetime.now() - timedelta(seconds=1),
+        item_state=state,
+    )
+
+
+def test_get_orders_by_state_priority_then_run_at():
+    queue = EventQueue()
+    now = datetime.now()
+
+    indexed = make_event(1, States.Indexed, now - timedelta(seconds=30))
+    completed_late = make_event(2, States.Completed, now - timedelta(seconds=5))
+    completed_early = make_event(3, States.Completed, now - timedelta(seconds=10))
+    downloaded = make_event(4, States.Downloaded, now - timedelta(seconds=20))
+
+    for event in (indexed, completed_late, completed_early, downloaded):
+        queue.put(event)
+
+    assert [queue.get(0) for _ in range(4)] == [
+        completed_early,
+        completed_late,
+        downloaded,
+        indexed,
+    ]
+
+    with pytest.raises(Empty):
+        queue.get(0)
+
+
+def test_future_events_are_not_returned_before_run_at():
+    queue = EventQueue()
+
+    queue.put(make_event(1, States.Completed, datetime.now() + timedelta(hours=1)))
+    due = make_event(2, States.Indexed)
+    queue.put(due)
+
+    assert queue.get(0) is due
+
+    with pytest.raises(Empty):
+        queue.get(0)
+
+    assert len(queue) == 1
+
+
+def test_get_sleeps_until_next_event_is_due():
+    queue = EventQueue()
+    event = make_event(1, run_at=datetime.now() + timedelta(seconds=0.2))
+    queue.put(event)
+
+    start = time.monotonic()
+
+    assert queue.get(timeout=5) is event
+    assert 0.1 < time.monotonic() - start < 2
+
+
+def test_get_wakes_when_an_event_is_queued():
+    queue = EventQueue()
+    event = make_event(1)
+
+    timer = threading.Timer(0.1, queue.put, args=(event,))
+    timer.start()
+
+    try:
+        assert queue.get(timeout=5) is event
+    finally:
+        timer.cancel()
+
+
+def test_removed_events_are_skipped():
+    queue = EventQueue()
+    first = make_event(1, States.Completed)
+    second = make_event(2, States.Indexed)
+
+    queue.put(first)
+    queue.put(second)
+
+    assert queue.remove(first)
+    assert not queue.remove(first)
+    assert not queue.contains_item_id(1)
+    assert queue.get(0) is second
+
+
+def test_remove_item_id_removes_every_event_for_the_item():
+    queue = EventQueue()
+    events = [make_event(1), make_event(1), make_event(2)]
+
+    for event in events:
+        queue.put(event)
+
+    assert queue.remove_item_id(1) == events[:2]
+    assert len(queue) == 1
+    assert queue.get(0) is events[2]
+
+
+def test_many_removals_compact_the_heaps():
+    queue = EventQueue()
+    events = [make_event(i) for i in range(1, 1001)]
+
+    for event in events:
+        queue.put(event)
+
+    for event in events[:-1]:
+        queue.remove(event)
+
+    assert len(queue._scheduled) + len(queue._ready) < 100
+    assert queue.get(0) is events[-1]
+
+
+def test_index_matches_content_items_by_external_ids():
+    index = EventIndex()
+    event = Event(
+        emitted_by="Manual",
+        content_item=Movie({"tmdb_id": "603", "imdb_id": "tt0133093"}),
+    )
+
+    index.add(event)
+
+    assert index.contains_item(Movie({"imdb_id": "tt0133093"}))
+    assert not index.contains_item(Movie({"tmdb_id": "604"}))
+
+    assert index.discard(event)
+    assert not index.contains_item(Movie({"imdb_id": "tt0133093"}))
+    assert len(index) == 0
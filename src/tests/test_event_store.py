@@ -0,0 +1,253 @@
+"""Tests for the durable event queue store."""
+
+import os
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+
+import pytest
+from sqlalchemy import create_engine, select, text
+from testcontainers.postgres import PostgresContainer
+
+from program.db.db import db, run_migrations
+from program.managers.event_store import EventStore
+from program.media.item import Movie
+from program.media.queued_event import QueuedEvent
+from program.media.state import States
+from program.settings import settings_manager
+from program.types import Event
+
+
+@pytest.fixture
+def persistent_queue(monkeypatch):
+    monkeypatch.setattr(
+        settings_manager.settings.database, "persistent_event_queue", True
+    )
+
+
+@pytest.fixture
+def session():
+    session = MagicMock()
+
+    with patch("program.managers.event_store.db_session") as db_session:
+        db_session.return_value.__enter__.return_value = session
+        yield session
+
+
+def test_add_is_a_noop_when_disabled(monkeypatch, session):
+    monkeypatch.setattr(
+        settings_manager.settings.database, "persistent_event_queue", False
+    )
+    event = Event(emitted_by="Manual", item_id=1)
+
+    EventStore().add(event)
+
+    assert event.queue_id is None
+    session.execute.assert_not_called()
+
+
+@pytest.mark.usefixtures("persistent_queue")
+def test_add_stores_row_id(session):
+    session.execute.return_value.scalar_one.return_value = 42
+    event = Event(emitted_by="Manual", item_id=1, item_state=States.Scraped)
+
+    EventStore().add(event)
+
+    assert event.queue_id == 42
+    session.commit.assert_called_once()
+
+
+@pytest.mark.usefixtures("persistent_queue")
+def test_content_only_events_are_not_persisted(session):
+    event = Event(emitted_by="Manual")
+
+    EventStore().add(event)
+
+    assert event.queue_id is None
+    session.execute.assert_not_called()
+
+
+def test_claim_fails_when_row_is_locked_or_claimed(session):
+    session.execute.return_value.scalar_one_or_none.return_value = None
+
+    assert (
+        EventStore().claim(Event(emitted_by="Manual", item_id=1, queue_id=7)) is False
+    )
+
+
+def test_claim_marks_row_as_claimed_by_worker(session):
+    row = MagicMock(attempts=0, claimed_by=None)
+    session.execute.return_value.scalar_one_or_none.return_value = row
+    store = EventStore()
+
+    assert store.claim(Event(emitted_by="Manual", item_id=1, queue_id=7)) is True
+    assert row.claimed_by == store.worker_id
+    assert row.attempts == 1
+
+
+def test_claim_fails_when_database_is_unreachable(session):
+    session.execute.side_effect = ConnectionError
+
+    assert EventStore().claim(Event(emitted_by="Manual", item_id=1, queue_id=7)) is None
+
+
+def test_unpersisted_events_are_always_claimed(session):
+    assert EventStore().claim(Event(emitted_by="Manual", item_id=1)) is True
+    session.execute.assert_not_called()
+
+
+def test_remove_clears_queue_ids(session):
+    events = [
+        Event(emitted_by="Manual", item_id=1, queue_id=1),
+        Event(emitted_by="Manual", item_id=2),
+    ]
+
+    EventStore().remove(events)
+
+    assert all(event.queue_id is None for event in events)
+    session.execute.assert_called_once()
+
+
+@pytest.mark.usefixtures("persistent_queue")
+def test_restore_builds_events_from_rows(session):
+    run_at = datetime(2026, 1, 1)
+    row = MagicMock(
+        id=3,
+        item_id=10,
+        emitted_by="Scraping",
+        item_state="Indexed",
+        run_at=run_at,
+        overrides=None,
+    )
+    session.execute.return_value.scalars.return_value.all.return_value = [row]
+
+    (event,) = EventStore().restore()
+
+    assert event.queue_id == 3
+    assert event.item_id == 10
+    assert event.emitted_by == "Scraping"
+    assert event.item_state == States.Indexed
+    assert event.run_at == run_at
+
+
+@pytest.mark.usefixtures("persistent_queue")
+def test_restore_only_releases_claims_of_stopped_processes(session):
+    store = EventStore()
+    # Same PID, but a different start time: the process was restarted
+    stopped = f"{store.host}:{os.getpid()}:0"
+    claimants = MagicMock()
+    claimants.scalars.return_value = [store.worker_id, stopped]
+    session.execute.side_effect = [claimants, MagicMock(), MagicMock()]
+
+    store.restore()
+
+    release = session.execute.call_args_list[1].args[0]
+
+    assert release.whereclause.right.value == [stopped]
+
+
+# ------------------------- Against Postgres -------------------------------- #
+
+
+@pytest.fixture(scope="module")
+def db_engine():
+    with PostgresContainer(
+        "postgres:16.4-alpine3.20",
+        username="postgres",
+        password="postgres",  # noqa: S106
+        dbname="riven",
+    ) as pg:
+        url = pg.get_connection_url()
+        if url.startswith("postgresql://"):
+            url = url.replace("postgresql://", "postgresql+psycopg2://", 1)
+
+        os.environ["DATABASE_URL"] = url
+        run_migrations(database_url=url)
+
+        engine = create_engine(url, future=True, pool_pre_ping=True)
+
+        # Rebind global db.* so the store uses this engine
+        db.engine = engine
+        db.Session.configure(bind=engine)
+
+        yield engine
+
+        engine.dispose()
+
+
+@pytest.fixture
+def item_id(db_engine):
+    with db.Session() as session:
+        movie = Movie({"title": "Movie", "tmdb_id": "603", "type": "movie"})
+        session.add(movie)
+        session.commit()
+
+        item_id = movie.id
+
+    yield item_id
+
+    with db_engine.connect() as conn:
+        conn.execute(
+            text('TRUNCATE "QueuedEvent", "MediaItem" RESTART IDENTITY CASCADE')
+        )
+        conn.commit()
+
+
+def claimed_by(queue_id: int) -> str | None:
+    with db.Session() as session:
+        return session.execute(
+            select(QueuedEvent.claimed_by).where(QueuedEvent.id == queue_id)
+        ).scalar_one()
+
+
+@pytest.mark.usefixtures("persistent_queue")
+def test_claim_skips_rows_locked_by_another_worker(item_id):
+    store = EventStore()
+    event = Event(emitted_by="Manual", item_id=item_id)
+    store.add(event)
+
+    assert event.queue_id is not None
+
+    # Another worker is mid-claim; don't wait for it
+    with db.Session() as other:
+        other.execute(
+            select(QueuedEvent)
+            .where(QueuedEvent.id == event.queue_id)
+            .with_for_update()
+        ).scalar_one()
+
+        assert store.claim(event) is False
+
+    assert store.claim(event) is True
+    assert claimed_by(event.queue_id) == store.worker_id
+
+    # Once claimed, no other worker gets it
+    assert EventStore().claim(event) is False
+
+
+@pytest.mark.usefixtures("persistent_queue")
+def test_restore_releases_only_the_claims_of_stopped_processes(item_id):
+    store = EventStore()
+    # Same PID, but a different start time: the process was restarted
+    stopped = f"{store.host}:{os.getpid()}:0"
+    other_host = "elsewhere:1:0"
+
+    events = {
+        claimant: Event(emitted_by="Manual", item_id=item_id)
+        for claimant in (store.worker_id, stopped, other_host)
+    }
+
+    for event in events.values():
+        store.add(event, claimed=True)
+
+    with db.Session() as session:
+        for claimant, event in events.items():
+            session.get(QueuedEvent, event.queue_id).claimed_by = claimant
+
+        session.commit()
+
+    restored = store.restore()
+
+    assert [event.queue_id for event in restored] == [events[stopped].queue_id]
+    assert claimed_by(events[stopped].queue_id) is None
+    assert claimed_by(events[store.worker_id].queue_id) == store.worker_id
+    assert claimed_by(events[other_host].queue_id) == other_host
@@ -0,0 +1,132 @@
+"""Tests for the segmented LRU eviction order."""
+
+import time
+
+from program.services.streaming.eviction import SegmentedLRU
+from program.services.streaming.stores import CacheEntry
+
+
+def make_entry(key: str, size: int = 10, idle_seconds: float = 0) -> CacheEntry:
+    return CacheEntry(
+        key=key,
+        cache_key=key,
+        start=0,
+        size=size,
+        mtime=time.time() - idle_seconds,
+    )
+
+
+def make_policy(**kwargs) -> SegmentedLRU:
+    kwargs.setdefault("max_protected_bytes", 100)
+    kwargs.setdefault("promote_on_hit", True)
+    kwargs.setdefault("reuse_after_seconds", 60)
+
+    return SegmentedLRU(**kwargs)
+
+
+def evict_all(policy: SegmentedLRU) -> list[str]:
+    return [entry.key for entry in iter(policy.pop_victim, None)]
+
+
+def test_least_recently_used_entries_are_evicted_first():
+    policy = make_policy(promote_on_hit=False)
+
+    for key in ("a", "b", "c"):
+        policy.admit(make_entry(key))
+
+    policy.touch("a")
+
+    assert evict_all(policy) == ["b", "c", "a"]
+    assert len(policy) == 0
+
+
+def test_probationary_entries_are_evicted_before_protected_ones():
+    policy = make_policy()
+
+    policy.admit(make_entry("header"), protected=True)
+    policy.admit(make_entry("a"))
+    policy.admit(make_entry("b"))
+
+    assert policy.tier_of("header") == "protected"
+    assert evict_all(policy) == ["a", "b", "header"]
+
+
+def test_entries_reused_after_sitting_idle_are_promoted():
+    policy = make_policy()
+
+    policy.admit(make_entry("idle", idle_seconds=120))
+    policy.admit(make_entry("fresh"))
+
+    policy.touch("idle")
+    policy.touch("fresh")
+
+    assert policy.tier_of("idle") == "protected"
+    assert policy.tier_of("fresh") == "probationary"
+    assert policy.size_of("protected") == (1, 10)
+    assert policy.size_of("probationary") == (1, 10)
+
+
+def test_entries_are_not_promoted_without_promote_on_hit():
+    policy = make_policy(promote_on_hit=False)
+
+    policy.admit(make_entry("idle", idle_seconds=120))
+    policy.touch("idle")
+
+    assert policy.tier_of("idle") == "probationary"
+
+
+def test_protected_overflow_is_demoted_to_probationary():
+    policy = make_policy(max_protected_bytes=20)
+
+    policy.admit(make_entry("a"))
+
+    for key in ("p1", "p2", "p3"):
+        policy.admit(make_entry(key), protected=True)
+
+    assert policy.tier_of("p1") == "probationary"
+    assert policy.size_of("protected") == (2, 20)
+    # Demoted entries become the most recently used probationary entries
+    assert evict_all(policy) == ["a", "p1", "p2", "p3"]
+
+
+def test_recently_evicted_entries_are_readmitted_as_protected():
+    policy = make_policy()
+
+    policy.admit(make_entry("a"))
+    policy.admit(make_entry("b"))
+
+    assert policy.pop_victim().key == "a"
+
+    policy.admit(make_entry("a"))
+    policy.admit(make_entry("c"))
+
+    assert policy.tier_of("a") == "protected"
+    assert policy.tier_of("c") == "probationary"
+
+
+def test_ghosts_are_bounded():
+    policy = make_policy(max_ghosts=1)
+
+    policy.admit(make_entry("a"))
+    policy.admit(make_entry("b"))
+    evict_all(policy)
+
+    policy.admit(make_entry("a"))
+    policy.admit(make_entry("b"))
+
+    # Only the most recent eviction is remembered
+    assert policy.tier_of("a") == "probationary"
+    assert policy.tier_of("b") == "protected"
+
+
+def test_removed_entries_leave_the_byte_counts():
+    policy = make_policy()
+
+    policy.admit(make_entry("a", size=5))
+    policy.admit(make_entry("b", size=7), protected=True)
+
+    assert policy.remove("a").key == "a"
+    assert policy.remove("b").key == "b"
+    assert policy.remove("missing") is None
+    assert policy.size_of("probationary") == (0, 0)
+    assert policy.size_of("protected") == (0, 0)
@@ -0,0 +1,69 @@
+"""Tests for resolving indexer download URLs to infohashes."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from program.services.scrapers.infohash_resolver import InfohashResolver
+from program.settings import settings_manager
+
+URL = "http://indexer/download?id=1"
+INFOHASH = "c08a9ee8ce3a5c2c08865e2b05406273cabc97e7"
+
+
+@pytest.fixture(autouse=True)
+def scraping_settings(monkeypatch):
+    scraping = settings_manager.settings.scraping
+
+    monkeypatch.setattr(scraping, "infohash_cache_size", 10)
+    monkeypatch.setattr(scraping, "persist_resolved_infohashes", False)
+
+    return scraping
+
+
+def make_resolver(status_code: int, location: str = "") -> InfohashResolver:
+    resolver = InfohashResolver()
+    resolver._session = MagicMock()
+    resolver._session.get.return_value = MagicMock(
+        status_code=status_code, headers={"Location": location}
+    )
+
+    return resolver
+
+
+def test_resolved_urls_are_fetched_once():
+    resolver = make_resolver(302, f"magnet:?xt=urn:btih:{INFOHASH}")
+
+    assert resolver.resolve(URL) == INFOHASH
+    assert resolver.resolve(URL) == INFOHASH
+    resolver._session.get.assert_called_once()
+
+
+def test_negative_results_are_remembered():
+    resolver = make_resolver(404)
+
+    assert resolver.resolve(URL) is None
+    assert resolver.resolve(URL) is None
+    resolver._session.get.assert_called_once()
+
+
+@pytest.mark.parametrize("status_code", [429, 503])
+def test_failed_requests_are_retried(status_code):
+    resolver = make_resolver(status_code)
+
+    resolver.resolve(URL)
+    resolver.resolve(URL)
+
+    assert resolver._session.get.call_count == 2
+
+
+def test_expired_negative_results_are_retried():
+    resolver = make_resolver(404)
+    resolver.resolve(URL)
+
+    with patch.object(
+        InfohashResolver, "negative_ttl", new=-InfohashResolver.negative_ttl
+    ):
+        resolver.resolve(URL)
+
+    assert resolver._session.get.call_count == 2
@@ -0,0 +1,112 @@
+"""Tests for the in-memory show/season/episode index."""
+
+import gc
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from program.managers import item_hierarchy
+from program.managers.item_hierarchy import ItemHierarchy
+from program.media.item import Episode, Season
+
+# Show 1 has seasons 2 and 3; season 2 has episodes 4 and 5, season 3 has episode 6
+ROWS = [(2, 1), (3, 1), (4, 2), (5, 2), (6, 3)]
+
+
+@pytest.fixture
+def session():
+    session = MagicMock()
+    session.execute.return_value.all.return_value = ROWS
+
+    with patch("program.managers.item_hierarchy.db_session") as db_session:
+        db_session.return_value.__enter__.return_value = session
+        yield session
+
+
+def make_session(new=(), deleted=()) -> MagicMock:
+    return MagicMock(info={}, new=list(new), deleted=list(deleted))
+
+
+@pytest.mark.usefixtures("session")
+def test_related_ids_match_get_item_ids_order():
+    hierarchy = ItemHierarchy()
+
+    assert hierarchy.related_ids(1) == [4, 5, 6, 2, 3]
+    assert hierarchy.related_ids(2) == [4, 5]
+    assert hierarchy.related_ids(4) == []
+    assert hierarchy.related_ids(99) == []
+
+
+@pytest.mark.usefixtures("session")
+def test_ancestor_ids():
+    hierarchy = ItemHierarchy()
+
+    assert hierarchy.ancestor_ids(4) == [2, 1]
+    assert hierarchy.ancestor_ids(3) == [1]
+    assert hierarchy.ancestor_ids(1) == []
+
+
+def test_loads_once(session):
+    hierarchy = ItemHierarchy()
+
+    hierarchy.related_ids(1)
+    hierarchy.ancestor_ids(6)
+
+    session.execute.assert_called_once()
+
+
+def test_committed_inserts_and_deletes_are_applied(session):
+    hierarchy = ItemHierarchy()
+    hierarchy.related_ids(1)
+
+    episode = MagicMock(spec=Episode, id=7, parent_id=3)
+    deleted_season = MagicMock(spec=Season, id=2)
+
+    flushed = make_session(new=[episode], deleted=[deleted_season])
+    item_hierarchy._on_flush(flushed, None)
+
+    # Nothing changes until the session commits
+    assert hierarchy.related_ids(3) == [6]
+
+    item_hierarchy._on_commit(flushed)
+
+    assert hierarchy.related_ids(3) == [6, 7]
+    assert hierarchy.related_ids(1) == [6, 7, 3]
+    assert hierarchy.ancestor_ids(4) == []
+    session.execute.assert_called_once()
+
+
+@pytest.mark.usefixtures("session")
+def test_rolled_back_changes_are_discarded():
+    hierarchy = ItemHierarchy()
+    hierarchy.related_ids(1)
+
+    rolled_back = make_session(new=[MagicMock(spec=Episode, id=7, parent_id=3)])
+    item_hierarchy._on_flush(rolled_back, None)
+    item_hierarchy._on_rollback(rolled_back)
+    item_hierarchy._on_commit(rolled_back)
+
+    assert hierarchy.related_ids(3) == [6]
+
+
+@pytest.mark.usefixtures("session")
+def test_every_index_is_kept_current_by_one_set_of_listeners():
+    first = ItemHierarchy()
+    second = ItemHierarchy()
+    first.related_ids(1)
+    second.related_ids(1)
+
+    flushed = make_session(new=[MagicMock(spec=Episode, id=7, parent_id=3)])
+    item_hierarchy._on_flush(flushed, None)
+    item_hierarchy._on_commit(flushed)
+
+    assert first.related_ids(3) == [6, 7]
+    assert second.related_ids(3) == [6, 7]
+
+    # Indexes hold no listeners of their own, so dropping one leaves nothing behind
+    live = len(item_hierarchy._hierarchies)
+    del second
+    gc.collect()
+
+    assert len(item_hierarchy._hierarchies) == live - 1
+    assert first in item_hierarchy._hierarchies
@@ -0,0 +1,43 @@
+"""Tests for the resizable LRU cache."""
+
+from program.utils.lru_cache import ResizableLRUCache
+
+
+def make_cache(maxsize: int) -> tuple[ResizableLRUCache[str, int], dict[str, int]]:
+    size = {"maxsize": maxsize}
+
+    return ResizableLRUCache[str, int](lambda: size["maxsize"]), size
+
+
+def test_least_recently_used_entries_are_evicted():
+    cache, _ = make_cache(2)
+
+    cache.update({"a": 1, "b": 2})
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get_many(["a", "b", "c"]) == {"a": 1, "c": 3}
+
+
+def test_shrinking_keeps_the_most_recently_used_entries():
+    cache, size = make_cache(3)
+
+    cache.update({"a": 1, "b": 2, "c": 3})
+    cache.get("a")
+    size["maxsize"] = 2
+
+    assert cache.get_many(["a", "b", "c"]) == {"a": 1, "c": 3}
+    assert len(cache) == 2
+
+
+def test_zero_size_disables_the_cache():
+    cache, size = make_cache(2)
+
+    cache.set("a", 1)
+    size["maxsize"] = 0
+
+    assert cache.get("a") is None
+
+    cache.set("b", 2)
+
+    assert len(cache) == 0
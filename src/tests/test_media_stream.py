@@ -0,0 +1,332 @@
+"""Tests for sharing one media stream between the file handles reading a file, and for its chunk fetching."""
+
+from contextlib import asynccontextmanager
+from dataclasses import replace
+from functools import partial
+from unittest.mock import MagicMock
+
+import pytest
+import trio
+import trio.testing
+from kink import di
+
+from program.services.filesystem.vfs.rivenvfs import RivenVFS
+from program.services.streaming.cache import Cache, CacheConfig
+from program.services.streaming.chunker import ChunkCacheNotifier
+from program.services.streaming.connection_limiter import ProviderConnectionLimiter
+from program.services.streaming.media_stream import MediaStream
+from program.services.streaming.recent_reads import Read
+from program.services.streaming.session_statistics import ProviderThroughput
+from program.settings import settings_manager
+from program.utils.async_client import AsyncClient
+
+MB = 1024 * 1024
+
+
+@pytest.fixture(autouse=True)
+def services(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings_manager.settings.stream, "chunk_size_mb", 1)
+    monkeypatch.setattr(settings_manager.settings.stream, "max_chunk_size_mb", 1)
+
+    cache = Cache(cfg=CacheConfig(cache_dir=tmp_path, max_size_bytes=256 * MB))
+
+    # Emitters are shared by every notifier, so don't carry cached state between tests
+    ChunkCacheNotifier.emitters.clear()
+
+    di[Cache] = cache
+    di[ChunkCacheNotifier] = ChunkCacheNotifier()
+    di[ProviderThroughput] = ProviderThroughput()
+    di[ProviderConnectionLimiter] = ProviderConnectionLimiter(max_connections=8)
+    di[AsyncClient] = MagicMock()
+
+
+@pytest.fixture
+def stream() -> MediaStream:
+    return MediaStream(
+        file_size=64 * MB,
+        path="/movies/Movie (2020)/Movie (2020).mkv",
+        original_filename="Movie.2020.1080p.WEB.mkv",
+        nursery=MagicMock(),
+        provider="realdebrid",
+        initial_url="https://cdn.example/Movie.2020.1080p.WEB.mkv",
+    )
+
+
+@pytest.fixture
+def fetches(stream, monkeypatch) -> list[int]:
+    """Fake the CDN for discrete fetches, recording the start of each one."""
+
+    fetches = list[int]()
+
+    async def fetch(start: int, size: int, pinned: bool = False, **_kwargs) -> bytes:
+        fetches.append(start)
+        await trio.sleep(0.05)
+
+        data = b"h" * size
+        await stream._cache_chunk(start=start, data=data, pinned=pinned)
+
+        return data
+
+    monkeypatch.setattr(stream, "_fetch_discrete_byte_range", fetch)
+
+    return fetches
+
+
+def fake_cdn(stream: MediaStream, release: trio.Event):
+    """Replace the stream's connections with ones that send each chunk once `release` is set."""
+
+    class Response:
+        http_version = "HTTP/1.1"
+        request = MagicMock(url=stream.target_url.value)
+
+        async def aiter_raw(self, chunk_size: int):
+            while True:
+                await release.wait()
+
+                yield b"x" * chunk_size
+
+    @asynccontextmanager
+    async def establish_connection(**_kwargs):
+        yield Response()
+
+    stream.establish_connection = establish_connection
+
+
+def test_handles_of_the_same_file_share_one_stream(monkeypatch):
+    vfs = RivenVFS.__new__(RivenVFS)
+    vfs._active_streams = dict[str, MediaStream]()
+    vfs._active_streams_lock = trio.Lock()
+    vfs.stream_nursery = MagicMock()
+    vfs.vfs_db = MagicMock()
+    vfs.vfs_db.get_entry_by_original_filename.return_value = MagicMock(
+        url="https://cdn.example/Movie.2020.1080p.WEB.mkv",
+        provider="realdebrid",
+        bitrate=None,
+    )
+
+    closed = list[MediaStream]()
+
+    async def close(self: MediaStream) -> None:
+        closed.append(self)
+
+    monkeypatch.setattr(MediaStream, "close", close)
+
+    async def get_stream(fh: int) -> MediaStream:
+        return await vfs._get_stream(
+            path="/movies/Movie (2020)/Movie (2020).mkv",
+            fh=fh,
+            file_size=64 * MB,
+            original_filename="Movie.2020.1080p.WEB.mkv",
+        )
+
+    async def run() -> MediaStream:
+        stream = await get_stream(1)
+
+        assert await get_stream(2) is stream
+        assert set(stream.handles) == {1, 2}
+
+        # The stream outlives its first handle...
+        await vfs._detach_from_stream(1)
+        assert vfs._active_streams == {"Movie.2020.1080p.WEB.mkv": stream}
+        assert closed == []
+
+        # ...and is closed with its last
+        await vfs._detach_from_stream(2)
+        assert vfs._active_streams == {}
+
+        return stream
+
+    stream = trio.run(run)
+
+    assert closed == [stream]
+    vfs.vfs_db.get_entry_by_original_filename.assert_called_once()
+
+
+def test_attaching_a_handle_twice_reuses_its_state(stream):
+    handle = stream.attach(1)
+
+    assert stream.attach(1) is handle
+    assert stream.attach(2) is not handle
+    assert set(stream.handles) == {1, 2}
+
+
+def test_detaching_stops_only_that_handles_connection(stream):
+    streaming = stream.attach(1)
+    idle = stream.attach(2)
+    streaming.is_streaming.value = True
+
+    async def connection() -> None:
+        await streaming.is_killed.wait_value(True)
+        streaming.is_streaming.value = False
+
+    async def run() -> list[int]:
+        async with trio.open_nursery() as nursery:
+            nursery.start_soon(connection)
+
+            return [
+                await stream.detach(1),
+                await stream.detach(3),
+                await stream.detach(2),
+            ]
+
+    assert trio.run(run) == [1, 1, 0]
+    assert streaming.is_killed.value
+    assert not idle.is_killed.value
+
+
+def test_concurrent_fetches_of_a_chunk_share_one_download(stream, fetches):
+    header = stream.chunker.header_chunk
+    results = list[bytes]()
+
+    async def read() -> None:
+        results.append(bytes(await stream._fetch_shared_chunk(chunk=header)))
+
+    async def run() -> None:
+        async with trio.open_nursery() as nursery:
+            for _ in range(3):
+                nursery.start_soon(read)
+
+    trio.run(run)
+
+    assert fetches == [header.start]
+    assert results == [b"h" * header.size] * 3
+
+
+def test_a_connection_claims_its_whole_batch_before_reading_it(stream):
+    handle = stream.attach(1)
+    release = trio.Event()
+    fake_cdn(stream, release)
+
+    chunk_range = stream.chunker.get_chunk_range(
+        position=stream.config.header_size,
+        size=3 * stream.config.chunk_size,
+    )
+    first, second, third = chunk_range.chunks
+
+    async def run() -> None:
+        async with trio.open_nursery() as nursery:
+            await nursery.start(
+                partial(stream.run, stream.config.header_size, handle=handle)
+            )
+
+            # Another handle is already fetching the last chunk
+            stream._in_flight_chunks.add(third)
+
+            handle.recent_reads.current_read.value = Read(
+                chunk_range=chunk_range,
+                read_type="body_read",
+            )
+            await trio.testing.wait_all_tasks_blocked()
+
+            # Still waiting for the first chunk, yet the rest of the batch is claimed too
+            assert stream._in_flight_chunks == {first, second, third}
+            assert stream._is_fetching_elsewhere(chunk_range.uncached_chunks[1:])
+
+            handle.is_killed.value = True
+
+    trio.run(run)
+
+    # Chunks this connection never fetched are released, but not another handle's claim
+    assert stream._in_flight_chunks == {third}
+    assert not handle.is_streaming.value
+
+
+def test_prewarm_caches_the_header_and_footer_pinned(stream, fetches):
+    header = stream.chunker.header_chunk
+    footer = stream.chunker.footer_chunk
+
+    trio.run(stream.prewarm)
+
+    assert fetches == [header.start, footer.start]
+    assert header.is_cached.value
+    assert footer.is_cached.value
+    assert len(di[Cache]._pinned) == 2
+
+
+def test_prewarm_pins_chunks_that_are_already_cached(stream, fetches):
+    header = stream.chunker.header_chunk
+
+    async def run() -> None:
+        await stream._cache_chunk(start=header.start, data=b"h" * header.size)
+        header.emit_cache_signal()
+
+        await stream.prewarm()
+
+    trio.run(run)
+
+    # Only the footer had to be fetched, yet both are pinned
+    assert fetches == [stream.chunker.footer_chunk.start]
+    assert len(di[Cache]._pinned) == 2
+
+
+def fetch_in_parallel(stream: MediaStream, chunks: int):
+    """Fetch in parallel around a seek to the start of the body, returning the range the stream continues from."""
+
+    chunk_range = stream.chunker.get_chunk_range(
+        position=stream.config.header_size,
+        size=chunks * stream.config.chunk_size,
+    )
+
+    async def run():
+        async with trio.open_nursery() as nursery:
+            stream.nursery = nursery
+
+            return stream._fetch_in_parallel(chunk_range)
+
+    return chunk_range, trio.run(run)
+
+
+def test_seeks_fetch_the_following_chunks_in_parallel(stream, fetches):
+    stream.config = replace(stream.config, parallel_seek_chunks=3)
+
+    chunk_range, remaining = fetch_in_parallel(stream, chunks=5)
+    chunks = list(chunk_range.chunks)
+
+    assert sorted(fetches) == [chunk.start for chunk in chunks[:3]]
+    assert all(chunk.is_cached.value for chunk in chunks[:3])
+    # The stream's own connection picks up after the parallel window
+    assert list(remaining.chunks) == chunks[3:]
+    assert remaining.request_range[1] == chunk_range.request_range[1]
+    assert stream._in_flight_chunks == set()
+    assert di[ProviderConnectionLimiter].get("realdebrid").borrowed_tokens == 0
+
+
+def test_parallel_fetches_skip_chunks_fetched_elsewhere(stream, fetches):
+    stream.config = replace(stream.config, parallel_seek_chunks=3)
+
+    first = stream.chunker.get_chunk_range(position=stream.config.header_size)
+    stream._in_flight_chunks.add(first.first_chunk)
+
+    chunk_range, remaining = fetch_in_parallel(stream, chunks=5)
+    chunks = list(chunk_range.chunks)
+
+    assert sorted(fetches) == [chunk.start for chunk in chunks[1:3]]
+    assert list(remaining.chunks) == chunks[3:]
+
+
+def test_parallel_fetches_stay_within_the_provider_budget(stream, fetches):
+    di[ProviderConnectionLimiter] = ProviderConnectionLimiter(max_connections=2)
+    stream.config = replace(stream.config, parallel_seek_chunks=4)
+
+    chunk_range, remaining = fetch_in_parallel(stream, chunks=6)
+    chunks = list(chunk_range.chunks)
+
+    assert sorted(fetches) == [chunk.start for chunk in chunks[:2]]
+    assert list(remaining.chunks) == chunks[2:]
+
+
+def test_nothing_is_fetched_in_parallel_when_disabled(stream, fetches):
+    stream.config = replace(stream.config, parallel_seek_chunks=0)
+
+    chunk_range, remaining = fetch_in_parallel(stream, chunks=3)
+
+    assert fetches == []
+    assert remaining is chunk_range
+
+
+def test_connection_budgets_are_shared_per_provider():
+    limiter = ProviderConnectionLimiter(max_connections=3)
+
+    assert limiter.get("realdebrid") is limiter.get("realdebrid")
+    assert limiter.get("realdebrid") is not limiter.get("alldebrid")
+    assert limiter.get("alldebrid").total_tokens == 3
@@ -0,0 +1,92 @@
+"""Tests for the parsed torrent title cache."""
+
+from concurrent.futures import Future
+from unittest.mock import MagicMock, patch
+
+import pytest
+from RTN import RTN, DefaultRanking, SettingsModel, parse
+
+from program.services.scrapers import shared
+from program.services.scrapers.parsed_titles import ParsedTitleCache
+from program.settings import settings_manager
+from program.utils import torrent
+
+TITLE = "Swamp People Serpent Invasion S03E05 720p WEB h264-KOGi[eztv re] mkv"
+INFOHASH = "c08a9ee8ce3a5c2c08865e2b05406273cabc97e7"
+
+
+@pytest.fixture
+def scraping_settings(monkeypatch):
+    scraping = settings_manager.settings.scraping
+
+    monkeypatch.setattr(scraping, "parsed_title_cache_size", 2)
+    monkeypatch.setattr(scraping, "persist_parsed_titles", False)
+
+    return scraping
+
+
+def test_cache_keeps_most_recent_titles(scraping_settings):
+    cache = ParsedTitleCache()
+    parsed = {
+        title: parse(title) for title in ("A.2019.1080p", "B.2020.720p", "C.2021.2160p")
+    }
+
+    cache.put_many(parsed)
+
+    assert set(cache.get_many(parsed)) == {"B.2020.720p", "C.2021.2160p"}
+
+
+def test_zero_size_disables_cache(scraping_settings, monkeypatch):
+    monkeypatch.setattr(scraping_settings, "parsed_title_cache_size", 0)
+    cache = ParsedTitleCache()
+
+    cache.put_many({TITLE: parse(TITLE)})
+
+    assert cache.get_many([TITLE]) == {}
+
+
+def test_titles_are_parsed_once(scraping_settings):
+    with patch.object(shared, "parsed_titles", ParsedTitleCache()):
+        with patch.object(torrent, "parse", wraps=parse) as parse_spy:
+            shared.parse_titles({TITLE})
+            parsed = shared.parse_titles({TITLE})
+
+    assert parse_spy.call_count == 1
+    assert parsed[TITLE].parsed_title == parse(TITLE).parsed_title
+
+
+def test_stuck_ranking_processes_fall_back_to_parsing_in_process(
+    scraping_settings, monkeypatch
+):
+    executor = MagicMock()
+    executor.submit.return_value = Future()
+    titles = {f"Movie.{year}.1080p.WEB" for year in range(1950, 2000)}
+
+    monkeypatch.setattr(settings_manager.settings.workers, "ranking_processes", 2)
+    monkeypatch.setattr(shared, "POOLED_PARSE_TIMEOUT_SECONDS", 0)
+    monkeypatch.setattr(shared, "parsed_titles", ParsedTitleCache())
+
+    with patch.object(shared.ranking_pool, "get_executor", return_value=executor):
+        parsed = shared.parse_titles(titles)
+
+    assert executor.submit.call_count == 2
+    assert set(parsed) == titles
+
+
+def test_rank_parsed_matches_rtn_rank():
+    rtn = RTN(SettingsModel(), DefaultRanking())
+
+    expected = rtn.rank(TITLE, INFOHASH, correct_title="Swamp People")
+    torrent = shared._rank_parsed(
+        rtn,
+        parse(TITLE),
+        raw_title=TITLE,
+        infohash=INFOHASH,
+        correct_title="Swamp People",
+        remove_trash=False,
+        aliases={},
+    )
+
+    assert torrent.rank == expected.rank
+    assert torrent.fetch == expected.fetch
+    assert torrent.lev_ratio == expected.lev_ratio
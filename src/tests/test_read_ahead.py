@@ -0,0 +1,96 @@
+"""Tests for adaptive read-ahead sizing."""
+
+from program.services.streaming.read_ahead import ReadAhead
+
+MB = 1024 * 1024
+
+
+def make_read_ahead(**kwargs) -> ReadAhead:
+    kwargs.setdefault("chunk_size", MB)
+    kwargs.setdefault("max_chunks", 16)
+    kwargs.setdefault("buffer_seconds", 10)
+    kwargs.setdefault("seek_tolerance", 4 * MB)
+
+    return ReadAhead(**kwargs)
+
+
+def play(read_ahead: ReadAhead, *, rate: int, seconds: int, start: int = 0) -> int:
+    """Read sequentially at `rate` bytes per second, one read per second; returns the end position."""
+
+    position = start
+
+    for second in range(seconds + 1):
+        read_ahead.record_read(
+            position=position,
+            end=position + rate - 1,
+            timestamp=float(second),
+        )
+        position += rate
+
+    return position
+
+
+def test_nothing_is_read_ahead_before_playback_is_measured():
+    read_ahead = make_read_ahead()
+
+    read_ahead.record_read(position=0, end=MB - 1, timestamp=0)
+
+    assert read_ahead.target_chunks == 0
+
+
+def test_buffers_the_configured_seconds_of_playback():
+    read_ahead = make_read_ahead()
+
+    play(read_ahead, rate=MB // 2, seconds=5)
+
+    # 10 seconds at half a chunk per second
+    assert read_ahead.consumption_rate == MB // 2
+    assert read_ahead.target_chunks == 5
+
+
+def test_target_is_capped_at_max_chunks():
+    read_ahead = make_read_ahead(max_chunks=4)
+
+    play(read_ahead, rate=2 * MB, seconds=5)
+
+    assert read_ahead.target_chunks == 4
+
+
+def test_buffers_as_much_as_allowed_when_downloads_barely_keep_up():
+    read_ahead = make_read_ahead()
+
+    play(read_ahead, rate=MB // 2, seconds=5)
+    read_ahead.record_download(size=MB, duration=1.5)
+
+    assert read_ahead.target_chunks == 16
+
+
+def test_disabled_without_max_chunks():
+    read_ahead = make_read_ahead(max_chunks=0)
+
+    play(read_ahead, rate=MB, seconds=5)
+
+    assert read_ahead.target_chunks == 0
+
+
+def test_seeks_restart_the_measurement():
+    read_ahead = make_read_ahead()
+
+    end = play(read_ahead, rate=MB // 2, seconds=5)
+    rate = read_ahead.consumption_rate
+
+    # A jump far past the tolerance isn't counted as bytes consumed
+    read_ahead.record_read(position=end + 100 * MB, end=end + 100 * MB, timestamp=6)
+
+    assert read_ahead.consumption_rate == rate
+
+
+def test_paused_once_reads_stop():
+    read_ahead = make_read_ahead(pause_timeout_seconds=10)
+
+    assert read_ahead.is_paused(now=0)
+
+    read_ahead.record_read(position=0, end=MB - 1, timestamp=0)
+
+    assert not read_ahead.is_paused(now=5)
+    assert read_ahead.is_paused(now=11)
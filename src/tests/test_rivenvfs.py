@@ -0,0 +1,326 @@
+"""Tests for the RivenVFS tree: full sync diffing, inode persistence and cached listings."""
+
+import threading
+from contextlib import contextmanager
+from unittest.mock import MagicMock
+
+import pyfuse3
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+from program.db.base_model import Base
+from program.media.vfs_inode import VFSInode, VFSInodeCounter
+from program.services import library_profile_matcher
+from program.services.filesystem.vfs import rivenvfs
+from program.services.filesystem.vfs.rivenvfs import RegisteredFile, RivenVFS
+from program.services.filesystem.vfs.vfs_node import VFSDirectory, VFSFile, VFSRoot
+
+MOVIE = "/movies/Movie (2020)/Movie (2020).mkv"
+SUBTITLE = "/movies/Movie (2020)/Movie (2020).en.srt"
+EPISODE = "/shows/Show (2019)/Season 01/Show (2019) - s01e01.mkv"
+
+
+def registered_file(
+    original_filename: str, updated_at: str = "2026-01-01T00:00:00"
+) -> RegisteredFile:
+    return RegisteredFile(
+        original_filename=original_filename,
+        file_size=1024,
+        created_at="2026-01-01T00:00:00",
+        updated_at=updated_at,
+        entry_type="media",
+    )
+
+
+@pytest.fixture(autouse=True)
+def invalidated(monkeypatch) -> list[int]:
+    """Record the inodes invalidated in the kernel cache, which isn't mounted here."""
+
+    invalidated = list[int]()
+
+    def invalidate_inode(inode: int, **_kwargs) -> None:
+        invalidated.append(inode)
+
+    monkeypatch.setattr(rivenvfs.pyfuse3, "invalidate_inode", invalidate_inode)
+
+    return invalidated
+
+
+def make_vfs() -> RivenVFS:
+    """Build an unmounted VFS, with only the tree state."""
+
+    vfs = RivenVFS.__new__(RivenVFS)
+    vfs._root = VFSRoot()
+    vfs._inode_to_node = {pyfuse3.ROOT_INODE: vfs._root}
+    vfs._next_inode = pyfuse3.InodeT(pyfuse3.ROOT_INODE + 1)
+    vfs._persisted_inodes = dict[str, pyfuse3.InodeT]()
+    vfs._unpersisted_inodes = dict[str, pyfuse3.InodeT]()
+    vfs._inode_persistence_enabled = False
+    vfs._tree_lock = threading.RLock()
+    vfs._pending_invalidations = set[pyfuse3.InodeT]()
+    vfs._last_profile_hash = None
+
+    return vfs
+
+
+@pytest.fixture
+def vfs() -> RivenVFS:
+    return make_vfs()
+
+
+@pytest.fixture
+def database(monkeypatch) -> None:
+    """Persist inodes to an in-memory database."""
+
+    engine = create_engine("sqlite://", poolclass=StaticPool)
+    Base.metadata.create_all(
+        engine, tables=[VFSInode.__table__, VFSInodeCounter.__table__]
+    )
+
+    @contextmanager
+    def db_session():
+        with Session(engine) as session:
+            yield session
+
+    monkeypatch.setattr(rivenvfs, "db_session", db_session)
+
+
+@pytest.fixture
+def library(vfs, monkeypatch) -> dict[str, RegisteredFile]:
+    """The files the database exposes, editable between full syncs."""
+
+    library = dict[str, RegisteredFile]()
+
+    session = MagicMock()
+    session.query.return_value.options.return_value.filter.return_value.all.return_value = [
+        MagicMock(library_profiles=[], media_item=MagicMock(id=1))
+    ]
+
+    @contextmanager
+    def db_session():
+        yield session
+
+    def collect_registered_files(_item, registered_files) -> None:
+        registered_files.update(library)
+
+    monkeypatch.setattr(rivenvfs, "db_session", db_session)
+    monkeypatch.setattr(
+        library_profile_matcher,
+        "LibraryProfileMatcher",
+        lambda: MagicMock(get_matching_profiles=MagicMock(return_value=[])),
+    )
+    monkeypatch.setattr(vfs, "_collect_registered_files", collect_registered_files)
+
+    return library
+
+
+def sync_full(vfs: RivenVFS) -> None:
+    # Profiles don't change between these syncs; don't skip them
+    vfs._last_profile_hash = None
+    vfs._sync_full()
+
+
+def get_file(vfs: RivenVFS, path: str) -> VFSFile:
+    node = vfs._get_node_by_path(path)
+
+    assert isinstance(node, VFSFile)
+
+    return node
+
+
+def test_full_sync_registers_the_library(vfs, library):
+    library[MOVIE] = registered_file("Movie.2020.mkv")
+    library[EPISODE] = registered_file("Show.S01E01.mkv")
+
+    sync_full(vfs)
+
+    assert get_file(vfs, MOVIE).original_filename == "Movie.2020.mkv"
+    assert get_file(vfs, EPISODE).original_filename == "Show.S01E01.mkv"
+
+
+def test_full_sync_keeps_unchanged_nodes(vfs, library, invalidated):
+    library[MOVIE] = registered_file("Movie.2020.mkv")
+    library[EPISODE] = registered_file("Show.S01E01.mkv")
+    sync_full(vfs)
+
+    movie = get_file(vfs, MOVIE)
+    episode = get_file(vfs, EPISODE)
+    invalidated.clear()
+
+    sync_full(vfs)
+
+    assert get_file(vfs, MOVIE) is movie
+    assert get_file(vfs, EPISODE) is episode
+    assert invalidated == []
+
+
+def test_full_sync_removes_and_adds_only_the_difference(vfs, library):
+    library[MOVIE] = registered_file("Movie.2020.mkv")
+    library[EPISODE] = registered_file("Show.S01E01.mkv")
+    sync_full(vfs)
+
+    movie = get_file(vfs, MOVIE)
+
+    del library[EPISODE]
+    library[SUBTITLE] = registered_file("subtitle:Movie.2020.mkv:en")
+    sync_full(vfs)
+
+    assert get_file(vfs, MOVIE) is movie
+    assert get_file(vfs, SUBTITLE).original_filename == "subtitle:Movie.2020.mkv:en"
+    # The show's directories went with its last episode
+    assert vfs._get_node_by_path(EPISODE) is None
+    assert vfs._get_node_by_path("/shows/Show (2019)") is None
+    assert vfs._get_node_by_path("/shows") is not None
+
+
+def test_full_sync_updates_changed_files_in_place(vfs, library, invalidated):
+    library[MOVIE] = registered_file("Movie.2020.mkv")
+    sync_full(vfs)
+
+    movie = get_file(vfs, MOVIE)
+    inode = movie.inode
+    invalidated.clear()
+
+    library[MOVIE] = registered_file("Movie.2020.REPACK.mkv", "2026-02-01T00:00:00")
+    sync_full(vfs)
+
+    assert get_file(vfs, MOVIE) is movie
+    assert movie.inode == inode
+    assert movie.original_filename == "Movie.2020.REPACK.mkv"
+    assert inode in invalidated
+
+
+def register(vfs: RivenVFS, *paths: str) -> list[int]:
+    for path in paths:
+        vfs._register_clean_path(path, **registered_file(path))
+
+    return [get_file(vfs, path).inode for path in paths]
+
+
+@pytest.mark.usefixtures("database")
+def test_inodes_survive_a_restart(vfs):
+    vfs._load_persisted_inodes()
+    inodes = register(vfs, MOVIE, EPISODE)
+    vfs._persist_inodes()
+
+    restarted = make_vfs()
+    restarted._load_persisted_inodes()
+
+    # Registered in a different order, yet each path keeps its inode
+    assert register(restarted, EPISODE, MOVIE) == inodes[::-1]
+
+
+@pytest.mark.usefixtures("database")
+def test_pruned_inodes_are_not_reused(vfs):
+    vfs._load_persisted_inodes()
+    _, episode_inode = register(vfs, MOVIE, EPISODE)
+    vfs._persist_inodes()
+
+    vfs._unregister_clean_path(EPISODE)
+    vfs._prune_persisted_inodes()
+
+    restarted = make_vfs()
+    restarted._load_persisted_inodes()
+
+    assert EPISODE not in restarted._persisted_inodes
+    assert min(register(restarted, SUBTITLE, EPISODE)) > episode_inode
+
+
+@pytest.mark.usefixtures("database")
+def test_removed_paths_keep_their_inode_until_pruned(vfs):
+    vfs._load_persisted_inodes()
+    (inode,) = register(vfs, MOVIE)
+    vfs._persist_inodes()
+
+    vfs._unregister_clean_path(MOVIE)
+
+    assert register(vfs, MOVIE) == [inode]
+
+
+def listed_names(vfs: RivenVFS, path: str) -> list[bytes]:
+    with vfs._tree_lock:
+        directory = vfs._get_node_by_path(path)
+
+        assert isinstance(directory, VFSDirectory)
+
+        return [name for name, _ in vfs._get_directory_listing(directory)]
+
+
+def test_directory_listings_are_cached(vfs):
+    register(vfs, MOVIE)
+    directory = get_file(vfs, MOVIE).parent
+
+    assert vfs._get_directory_listing(directory) is vfs._get_directory_listing(
+        directory
+    )
+
+
+def test_directory_listings_follow_added_and_removed_files(vfs):
+    register(vfs, MOVIE)
+
+    assert listed_names(vfs, "/movies/Movie (2020)") == [
+        b".",
+        b"..",
+        b"Movie (2020).mkv",
+    ]
+
+    register(vfs, SUBTITLE)
+
+    assert listed_names(vfs, "/movies/Movie (2020)") == [
+        b".",
+        b"..",
+        b"Movie (2020).mkv",
+        b"Movie (2020).en.srt",
+    ]
+
+    vfs._unregister_clean_path(MOVIE)
+
+    assert listed_names(vfs, "/movies/Movie (2020)") == [
+        b".",
+        b"..",
+        b"Movie (2020).en.srt",
+    ]
+
+
+def test_directory_listings_follow_changed_files(vfs, library):
+    library[MOVIE] = registered_file("Movie.2020.mkv")
+    sync_full(vfs)
+
+    movie = get_file(vfs, MOVIE)
+    stale = vfs._get_directory_listing(movie.parent)
+
+    library[MOVIE] = registered_file("Movie.2020.mkv", "2026-02-01T00:00:00")
+    sync_full(vfs)
+
+    listing = vfs._get_directory_listing(movie.parent)
+    _, attributes = listing[-1]
+
+    assert listing is not stale
+    assert attributes.st_mtime_ns == movie.updated_at_ns
+
+
+def test_directory_attributes_follow_their_children(vfs, monkeypatch):
+    now = 1
+
+    monkeypatch.setattr(vfs, "_current_time_ns", lambda: now)
+
+    register(vfs, MOVIE)
+    directory = get_file(vfs, MOVIE).parent
+
+    with vfs._tree_lock:
+        assert vfs._get_attributes(directory).st_mtime_ns == 1
+        listing = vfs._get_directory_listing(directory.parent)
+
+    now = 2
+    register(vfs, SUBTITLE)
+
+    with vfs._tree_lock:
+        assert vfs._get_attributes(directory).st_mtime_ns == 2
+
+        # The parent lists the directory with its new attributes
+        assert vfs._get_directory_listing(directory.parent) is not listing
+        assert dict(vfs._get_directory_listing(directory.parent))[
+            b"Movie (2020)"
+        ] is vfs._get_attributes(directory)
@@ -0,0 +1,154 @@
+"""Tests for running scrapers on the shared scrape loop."""
+
+import asyncio
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from program.services.scrapers import Scraping
+from program.services.scrapers.base import ScraperService
+from program.services.scrapers.scrape_loop import ScrapeLoop
+
+RESULTS = {"a" * 40: "Movie.2020.1080p.WEB"}
+
+
+class AsyncScraper:
+    key = "async"
+
+    def __init__(self, delay: float, deadline: float | None) -> None:
+        self.delay = delay
+        self.deadline = deadline
+
+    async def run_async(self, _item) -> dict[str, str]:
+        await asyncio.sleep(self.delay)
+
+        return RESULTS
+
+
+class SyncScraper:
+    key = "sync"
+    deadline = None
+    run_async = ScraperService.run_async
+
+    def __init__(self) -> None:
+        self.thread: threading.Thread | None = None
+
+    def run(self, _item) -> dict[str, str]:
+        self.thread = threading.current_thread()
+
+        return RESULTS
+
+
+@pytest.fixture
+def loop():
+    loop = ScrapeLoop()
+
+    yield loop
+
+    loop.close()
+
+
+def test_async_scraper_runs_on_the_loop(loop):
+    scraper = AsyncScraper(delay=0, deadline=5)
+
+    results = loop.run(Scraping._run_service_async(scraper, MagicMock(), False))
+
+    assert results == RESULTS
+
+
+def test_async_scraper_is_cancelled_past_its_deadline(loop):
+    scraper = AsyncScraper(delay=5, deadline=0.05)
+
+    with pytest.raises(TimeoutError):
+        loop.run(Scraping._run_service_async(scraper, MagicMock(), False))
+
+
+def test_sync_scraper_runs_in_a_worker_thread(loop):
+    scraper = SyncScraper()
+
+    results = loop.run(Scraping._run_service_async(scraper, MagicMock(), False))
+
+    assert results == RESULTS
+    assert scraper.thread is not threading.current_thread()
+    assert scraper.thread.name.startswith("ScraperService_")
+
+
+def test_cancelling_a_submitted_scrape_cancels_it(loop):
+    started = threading.Event()
+    cancelled = threading.Event()
+
+    async def scrape() -> None:
+        started.set()
+
+        try:
+            await asyncio.sleep(5)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    future = loop.submit(scrape())
+    started.wait(timeout=5)
+    future.cancel()
+
+    assert cancelled.wait(timeout=5)
+
+
+def test_closing_cancels_running_scrapes_and_stops_the_loop(loop):
+    started = threading.Event()
+
+    async def scrape() -> None:
+        started.set()
+        await asyncio.sleep(5)
+
+    future = loop.submit(scrape())
+    started.wait(timeout=5)
+    client = loop.client
+    thread = loop._thread
+
+    loop.close()
+
+    assert future.cancelled()
+    assert client.is_closed
+    assert not thread.is_alive()
+
+
+def test_a_closed_loop_is_restarted_on_next_use(loop):
+    loop.run(asyncio.sleep(0))
+    loop.close()
+
+    assert loop.run(asyncio.sleep(0, result="ok")) == "ok"
+
+
+def test_closing_waits_for_worker_threads_up_to_the_timeout(loop):
+    started = threading.Event()
+    release = threading.Event()
+    finished = threading.Event()
+
+    def scrape() -> None:
+        started.set()
+        release.wait(timeout=5)
+        finished.set()
+
+    loop.submit(asyncio.to_thread(scrape))
+    started.wait(timeout=5)
+    executor = loop._executor
+
+    # A scraper that finishes in time is waited for...
+    threading.Timer(0.05, release.set).start()
+    loop.close(timeout=5)
+
+    assert finished.is_set()
+    assert executor._shutdown
+
+    # ...one that doesn't is left behind
+    started.clear()
+    release.clear()
+    finished.clear()
+    loop.submit(asyncio.to_thread(scrape))
+    started.wait(timeout=5)
+
+    loop.close(timeout=0.05)
+
+    assert not finished.is_set()
+    release.set()
@@ -0,0 +1,104 @@
+"""Tests for ranking scraper results incrementally as each scraper finishes."""
+
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+from RTN import ParsedData, Torrent
+
+from program.services import scrapers
+from program.services.scrapers import Scraping
+from program.settings import settings_manager
+
+BEST = "a" * 40
+GOOD = "b" * 40
+WORST = "c" * 40
+TRASH = "d" * 40
+
+RANKS = {BEST: 300, GOOD: 200, WORST: 100}
+
+
+def torrent(infohash: str) -> Torrent:
+    return Torrent(
+        raw_title=f"Movie.2020.{infohash}.mkv",
+        infohash=infohash,
+        data=ParsedData(parsed_title="Movie", raw_title=f"Movie.2020.{infohash}.mkv"),
+        fetch=True,
+        rank=RANKS[infohash],
+        lev_ratio=1.0,
+    )
+
+
+@pytest.fixture
+def ranked(monkeypatch) -> list[set[str]]:
+    """Rank results without RTN, recording each batch ranked. Unknown results are dropped."""
+
+    ranked = list[set[str]]()
+
+    def rank_results(_item, results: dict[str, str], **_kwargs) -> dict[str, Torrent]:
+        ranked.append(set(results))
+
+        return {
+            infohash: torrent(infohash) for infohash in results if infohash in RANKS
+        }
+
+    monkeypatch.setattr(settings_manager.settings.scraping, "async_scraping", False)
+    monkeypatch.setattr(scrapers, "rank_results", rank_results)
+
+    return ranked
+
+
+def make_scraping(*service_results: dict[str, str]) -> Scraping:
+    """Build scrapers that finish in the given order, each once the previous one's results were ranked."""
+
+    scraping = Scraping.__new__(Scraping)
+    scraping.initialized_services = []
+
+    finished = [threading.Event() for _ in service_results]
+
+    for index, results in enumerate(service_results):
+
+        def run(_item, index=index, results=results) -> dict[str, str]:
+            if index > 0:
+                finished[index - 1].wait(timeout=5)
+
+            finished[index].set()
+
+            return results
+
+        scraping.initialized_services.append(MagicMock(key=f"scraper{index}", run=run))
+
+    return scraping
+
+
+def test_only_results_no_earlier_scraper_returned_are_ranked(ranked):
+    scraping = make_scraping(
+        {GOOD: "Movie.2020.good", TRASH: "Movie.2020.trash"},
+        {GOOD: "Movie.2020.good", TRASH: "Movie.2020.trash", WORST: "Movie.2020.worst"},
+        {GOOD: "Movie.2020.good"},
+    )
+
+    list(scraping.scrape_streaming(MagicMock(), manual=True))
+
+    # Dropped results aren't ranked again either
+    assert ranked == [{GOOD, TRASH}, {WORST}]
+
+
+def test_each_stream_is_yielded_once_best_first(ranked):
+    scraping = make_scraping(
+        {WORST: "Movie.2020.worst", GOOD: "Movie.2020.good"},
+        {GOOD: "Movie.2020.good", BEST: "Movie.2020.best"},
+        {},
+    )
+
+    yielded = [
+        (service, list(streams))
+        for service, streams in scraping.scrape_streaming(MagicMock(), manual=True)
+    ]
+
+    assert yielded == [
+        ("scraper0", [GOOD, WORST]),
+        ("scraper1", [BEST]),
+        ("scraper2", []),
+    ]
+    assert len(ranked) == 2
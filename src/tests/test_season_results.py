@@ -0,0 +1,137 @@
+"""Tests for scrape results shared between the episodes of a season."""
+
+import sys
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from program.media.item import Episode, Season, Show
+from program.services.scrapers.season_results import SeasonResultStore
+from program.settings import settings_manager
+
+PACK = "Show.S01.1080p.WEB"
+EPISODE_2 = "Show.S01E02.1080p.WEB"
+
+
+@pytest.fixture
+def ttl(monkeypatch):
+    scraping = settings_manager.settings.scraping
+
+    monkeypatch.setattr(scraping, "shared_results_ttl_seconds", 60)
+
+    return scraping
+
+
+@pytest.fixture(autouse=True)
+def parsed():
+    titles = {
+        PACK: MagicMock(seasons=[1], episodes=[]),
+        EPISODE_2: MagicMock(seasons=[1], episodes=[2]),
+    }
+
+    # The package's `season_results` store shadows the module of the same name
+    with patch.object(
+        sys.modules["program.services.scrapers.season_results"],
+        "parse_titles",
+        side_effect=lambda raw_titles: {t: titles[t] for t in raw_titles},
+    ):
+        yield
+
+
+def make_episode(number: int) -> MagicMock:
+    show = MagicMock(spec=Show, imdb_id="tt1", tvdb_id=None)
+    # `parent` is a MagicMock constructor argument, so it's set afterwards
+    season = MagicMock(spec=Season, number=1)
+    season.parent = show
+    episode = MagicMock(spec=Episode, number=number)
+    episode.parent = season
+
+    return episode
+
+
+@pytest.mark.usefixtures("ttl")
+def test_episode_reuses_season_pack():
+    store = SeasonResultStore()
+    scrape = MagicMock(return_value={"a" * 40: PACK})
+
+    store.get_or_scrape("torrentio", make_episode(1), scrape)
+    results = store.get_or_scrape("torrentio", make_episode(2), scrape)
+
+    assert results == {"a" * 40: PACK}
+    scrape.assert_called_once()
+
+
+@pytest.mark.usefixtures("ttl")
+def test_episode_scrapes_when_results_dont_cover_it():
+    store = SeasonResultStore()
+    scrape = MagicMock(return_value={"b" * 40: EPISODE_2})
+
+    store.get_or_scrape("torrentio", make_episode(2), scrape)
+    store.get_or_scrape("torrentio", make_episode(3), scrape)
+
+    assert scrape.call_count == 2
+
+
+@pytest.mark.usefixtures("ttl")
+def test_results_are_kept_per_scraper():
+    store = SeasonResultStore()
+    scrape = MagicMock(return_value={"a" * 40: PACK})
+
+    store.get_or_scrape("torrentio", make_episode(1), scrape)
+    store.get_or_scrape("comet", make_episode(2), scrape)
+
+    assert scrape.call_count == 2
+
+
+def test_zero_ttl_disables_sharing(ttl, monkeypatch):
+    monkeypatch.setattr(ttl, "shared_results_ttl_seconds", 0)
+    store = SeasonResultStore()
+    scrape = MagicMock(return_value={"a" * 40: PACK})
+
+    store.get_or_scrape("torrentio", make_episode(1), scrape)
+    store.get_or_scrape("torrentio", make_episode(2), scrape)
+
+    assert scrape.call_count == 2
+
+
+@pytest.mark.usefixtures("ttl")
+def test_key_locks_are_kept_while_a_scrape_waits_for_them():
+    store = SeasonResultStore()
+    key = ("torrentio", "tt1", 1)
+    waiting = threading.Event()
+    release = threading.Event()
+    holding = list[int]()
+
+    def scrape() -> dict[str, str]:
+        holding.append(len(holding))
+        release.wait(timeout=5)
+
+        return {}
+
+    def hold() -> None:
+        waiting.set()
+        store.get_or_scrape("torrentio", make_episode(3), scrape)
+
+    with store._hold(key):
+        thread = threading.Thread(target=hold)
+        thread.start()
+        waiting.wait(timeout=5)
+
+        while store._holders[key] < 2:
+            time.sleep(0.001)
+
+    # The lock is free, but the waiting scrape already took it; it must not be dropped
+    store._purge(time.monotonic())
+
+    assert key in store._key_locks
+
+    release.set()
+    thread.join(timeout=5)
+    # Once its results expire too
+    store._purge(time.monotonic() + 60)
+
+    assert holding == [0]
+    assert key not in store._key_locks
+    assert not store._holders
@@ -0,0 +1,107 @@
+"""Tests for the segmented chunk store."""
+
+import pytest
+
+from program.services.streaming.stores.segment_store import SegmentChunkStore
+
+KB = 1024
+
+
+def make_store(cache_dir, max_size_bytes: int = 64 * KB) -> SegmentChunkStore:
+    return SegmentChunkStore(
+        cache_dir,
+        max_mappings=4,
+        max_size_bytes=max_size_bytes,
+        segment_size_bytes=4 * KB,
+    )
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = make_store(tmp_path)
+    store.load_entries()
+
+    yield store
+
+    store.close()
+
+
+def test_written_chunks_can_be_read(store):
+    store.write("a:0", "a", 0, b"x" * KB)
+    store.write("a:1024", "a", KB, b"y" * KB)
+
+    assert store.read("a:0") == b"x" * KB
+    assert store.read("a:1024", offset=10, size=4) == b"yyyy"
+    assert store.exists("a:0")
+    assert store.read("missing") is None
+
+
+def test_mapped_chunks_can_be_viewed(store):
+    store.write("a:0", "a", 0, b"0123456789")
+
+    assert store.map("a:0")
+    assert bytes(store.view("a:0", 2, 3)) == b"234"
+    assert store.view("a:0", 8, 4) is None
+
+
+def test_overwrite_replaces_data_without_touching_old_region(store):
+    store.write("a:0", "a", 0, b"old!")
+    store.map("a:0")
+    old_view = store.view("a:0", 0, 4)
+
+    store.write("a:0", "a", 0, b"new!")
+
+    assert store.read("a:0") == b"new!"
+    # Views handed out before the overwrite still see the old data
+    assert bytes(old_view) == b"old!"
+
+
+def test_entries_are_reloaded_after_restart(tmp_path):
+    store = make_store(tmp_path)
+    store.load_entries()
+    store.write("a:0", "a", 0, b"first")
+    store.write("a:0", "a", 0, b"second", pinned=True)
+    store.write("b:0", "b", 0, b"other")
+    store.close()
+
+    reopened = make_store(tmp_path)
+    entries = {entry.key: entry for entry in reopened.load_entries()}
+
+    assert set(entries) == {"a:0", "b:0"}
+    assert entries["a:0"].size == len(b"second")
+    assert entries["a:0"].pinned
+    assert reopened.read("a:0") == b"second"
+
+    # Appends continue after the reloaded data rather than overwriting it
+    reopened.write("c:0", "c", 0, b"third")
+
+    assert reopened.read("b:0") == b"other"
+    assert reopened.read("c:0") == b"third"
+
+    reopened.close()
+
+
+def test_full_store_drops_the_segment_with_fewest_live_bytes(tmp_path):
+    # Two segments of data plus a spare
+    store = make_store(tmp_path, max_size_bytes=8 * KB)
+    store.load_entries()
+
+    store.write("a:0", "a", 0, b"a" * 4 * KB)
+    store.write("b:0", "b", 0, b"b" * 4 * KB)
+    # Leaves too little room in its segment for the next chunk
+    store.write("c:0", "c", 0, b"c" * 2 * KB)
+    store.delete(["b:0"])
+
+    displaced = store.write("d:0", "d", 0, b"d" * 4 * KB)
+
+    assert displaced == []
+    assert store.exists("a:0") and store.exists("c:0")
+
+    displaced = store.write("e:0", "e", 0, b"e" * 4 * KB)
+
+    assert displaced == ["c:0"]
+    assert not store.exists("c:0")
+    assert store.read("a:0") == b"a" * 4 * KB
+    assert store.read("e:0") == b"e" * 4 * KB
+
+    store.close()
@@ -0,0 +1,100 @@
+"""Tests for the server-sent event manager."""
+
+import asyncio
+import json
+import threading
+from concurrent.futures import Future
+
+from program.managers import event_manager
+from program.managers.event_manager import EventManager, FutureWithEvent
+from program.managers.sse_manager import ServerSentEventManager
+from program.types import Event
+
+
+def test_subscribers_receive_snapshot_then_published_events():
+    manager = ServerSentEventManager()
+    manager.set_snapshot_provider("event_update", lambda: ("snapshot", 0))
+
+    async def run() -> list[str]:
+        stream = manager.subscribe("event_update")
+        received = [await anext(stream)]
+
+        assert manager.has_subscribers("event_update")
+
+        manager.publish_event("event_update", "delta")
+        received.append(await anext(stream))
+
+        await stream.aclose()
+
+        return received
+
+    assert asyncio.run(run()) == ["data: snapshot\n\n", "data: delta\n\n"]
+    assert not manager.has_subscribers("event_update")
+
+
+def test_changes_included_in_the_snapshot_are_skipped():
+    manager = ServerSentEventManager()
+
+    def snapshot() -> tuple[str, int]:
+        # A change published whilst the subscriber was registering, and included in the snapshot
+        manager.publish_event("event_update", "included", sequence=1)
+
+        return "snapshot", 1
+
+    manager.set_snapshot_provider("event_update", snapshot)
+
+    async def run() -> list[str]:
+        stream = manager.subscribe("event_update")
+        received = [await anext(stream)]
+
+        manager.publish_event("event_update", "delta", sequence=2)
+        received.append(await anext(stream))
+
+        await stream.aclose()
+
+        return received
+
+    assert asyncio.run(run()) == ["data: snapshot\n\n", "data: delta\n\n"]
+
+
+def test_has_subscribers_without_subscribers():
+    assert not ServerSentEventManager().has_subscribers("event_update")
+
+
+def test_event_updates_track_the_first_and_last_job_of_an_item(monkeypatch):
+    published = list[dict]()
+
+    monkeypatch.setattr(event_manager.sse_manager, "has_subscribers", lambda _: True)
+    monkeypatch.setattr(
+        event_manager.sse_manager,
+        "publish_event",
+        lambda _, data, sequence=None: published.append(json.loads(data)),
+    )
+
+    manager = EventManager()
+    jobs = [
+        FutureWithEvent(
+            future=Future(),
+            event=Event(emitted_by="Scraping", item_id=1),
+            cancellation_event=threading.Event(),
+        )
+        for _ in range(2)
+    ]
+
+    for job in jobs:
+        with manager._event_updates_lock:
+            manager._futures.append(job)
+            manager._publish_event_update(job.event)
+
+    for job in jobs:
+        manager._discard_future(job)
+
+    assert published == [
+        {"type": "delta", "seq": 1, "added": {"Scraping": [1]}, "removed": {}},
+        {"type": "delta", "seq": 2, "added": {}, "removed": {"Scraping": [1]}},
+    ]
+
+    snapshot, sequence = manager._get_event_update_snapshot()
+
+    assert sequence == 2
+    assert json.loads(snapshot)["seq"] == 2